@@ -37,6 +37,25 @@ def _init_db():
 
 _init_db()
 
+# LLM hız sınırları — süreç başına bir kez / LLM rate limits — once per process
+@st.cache_resource
+def _init_rate_limits():
+    from config.settings import settings
+    from src.ai_engine.rate_limiter import RateLimits, configure_rate_limits
+    configure_rate_limits("openai", RateLimits(
+        requests_per_minute=settings.OPENAI_REQUESTS_PER_MINUTE,
+        tokens_per_minute=settings.OPENAI_TOKENS_PER_MINUTE,
+        max_in_flight=settings.LLM_MAX_IN_FLIGHT,
+    ))
+    configure_rate_limits("gemini", RateLimits(
+        requests_per_minute=settings.GEMINI_REQUESTS_PER_MINUTE,
+        tokens_per_minute=settings.GEMINI_TOKENS_PER_MINUTE,
+        max_in_flight=settings.LLM_MAX_IN_FLIGHT,
+    ))
+    return True
+
+_init_rate_limits()
+
 # Session defaults
 _defaults = {
     "authenticated": False,
@@ -0,0 +1,6 @@
+"""
+TenderAI Performans Ölçümleri / Performance Benchmarks.
+
+Test paketinden ayrı çalışır: ``python -m benchmarks.<modül>``
+Runs separately from the test suite: ``python -m benchmarks.<module>``
+"""
@@ -0,0 +1,118 @@
+"""
+Metin Motoru Karşılaştırması / Text Backend Comparison.
+
+Sentetik ihale PDF'leri (benchmarks.tender_pdf) üzerinde "pdfplumber" ve
+"pdfium-fast" metin motorlarını karşılaştırır:
+
+    text   sayfa/sn, yalnızca metin (tables="never") / text only
+    parse  sayfa/sn, uçtan uca parse (tables="auto") / end-to-end parse
+
+ve pdfium-fast çıktısının pdfplumber'a eşdeğerliğini raporlar: birebir
+aynı sayfa oranı, en düşük sayfa benzerliği (difflib), bölüm ve tablo
+eşitliği.
+
+Compares the "pdfplumber" and "pdfium-fast" text backends on synthetic
+tender PDFs (benchmarks.tender_pdf) and reports how equivalent the
+pdfium-fast output is to pdfplumber: share of identical pages, lowest page
+similarity (difflib), section and table equality.
+
+Kullanım / Usage:
+    python -m benchmarks.bench_backends --pages 200 --seeds 0 1 2
+"""
+
+import argparse
+import difflib
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.tender_pdf import generate_tender_pdf
+from src.pdf_parser.parser import IhalePDFParser, ParsedDocument
+
+BACKENDS: tuple[str, ...] = ("pdfplumber", "pdfium-fast")
+
+
+def _best_of(func, repeat: int) -> tuple[float, object]:
+    """En iyi süre (sn) ve son sonuç / Best wall time (seconds) and the last result."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def compare(reference: ParsedDocument, candidate: ParsedDocument) -> dict[str, float | bool]:
+    """
+    İki parse sonucunun eşdeğerliği / Equivalence of two parse results.
+
+    Args:
+        reference: pdfplumber sonucu / pdfplumber result
+        candidate: Karşılaştırılan sonuç / Compared result
+
+    Returns:
+        identical (oran / share), min_ratio, sections, tables
+    """
+    identical = 0
+    min_ratio = 1.0
+    for ref_page, page in zip(reference.pages, candidate.pages):
+        if ref_page.text == page.text:
+            identical += 1
+            continue
+        min_ratio = min(min_ratio, difflib.SequenceMatcher(None, ref_page.text, page.text).ratio())
+    return {
+        "identical": identical / max(1, len(reference.pages)),
+        "min_ratio": min_ratio,
+        "sections": reference.sections == candidate.sections,
+        "tables": reference.tables == candidate.tables,
+    }
+
+
+def main() -> None:
+    """Ölçümü çalıştır / Run the benchmark."""
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--pages", type=int, default=200)
+    arg_parser.add_argument("--seeds", type=int, nargs="+", default=[0, 1, 2])
+    arg_parser.add_argument("--repeat", type=int, default=2)
+    arg_parser.add_argument("--workers", type=int, default=1)
+    args = arg_parser.parse_args()
+
+    totals = {backend: {"text": 0.0, "parse": 0.0} for backend in BACKENDS}
+    print(f"Sayfa / pages: {args.pages}, işçi / workers: {args.workers} (sayfa/sn / pages per second)")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for seed in args.seeds:
+            pdf_path = generate_tender_pdf(Path(tmp_dir) / f"sartname_{seed}.pdf", args.pages, seed)
+            results: dict[str, ParsedDocument] = {}
+            for backend in BACKENDS:
+                parser = IhalePDFParser(max_workers=args.workers, text_backend=backend)
+                text_time, _ = _best_of(lambda: parser.parse(pdf_path, tables="never"), args.repeat)
+                parse_time, results[backend] = _best_of(lambda: parser.parse(pdf_path), args.repeat)
+                totals[backend]["text"] += text_time
+                totals[backend]["parse"] += parse_time
+                print(
+                    f"  tohum / seed {seed} {backend:12}: text {args.pages / text_time:8.1f}, "
+                    f"parse {args.pages / parse_time:7.1f}"
+                )
+
+            equivalence = compare(results["pdfplumber"], results["pdfium-fast"])
+            print(
+                f"  tohum / seed {seed} eşdeğerlik / equivalence: "
+                f"aynı sayfa / identical pages {equivalence['identical']:.1%}, "
+                f"en düşük benzerlik / min similarity {equivalence['min_ratio']:.3f}, "
+                f"bölümler / sections {'=' if equivalence['sections'] else '≠'}, "
+                f"tablolar / tables {'=' if equivalence['tables'] else '≠'}"
+            )
+
+    pages = args.pages * len(args.seeds)
+    print("Toplam / total (sayfa/sn / pages per second):")
+    for backend in BACKENDS:
+        text = pages / totals[backend]["text"]
+        parse = pages / totals[backend]["parse"]
+        print(f"  {backend:12}: text {text:8.1f}, parse {parse:7.1f}")
+    speedup = {stage: totals["pdfplumber"][stage] / totals["pdfium-fast"][stage] for stage in ("text", "parse")}
+    print(f"  hızlanma / speedup: text x{speedup['text']:.1f}, parse x{speedup['parse']:.1f}")
+
+
+if __name__ == "__main__":
+    main()
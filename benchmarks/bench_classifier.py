@@ -0,0 +1,113 @@
+"""
+Bölüm Sınıflandırma Ölçümü / Section Classification Benchmark.
+
+Anahtar kelime otomatını (tekli ve toplu), eski yöntemle (her bölüm ve
+her anahtar kelime için ayrı alt dize araması) karşılaştırır ve
+etiketlerin birebir aynı olduğunu doğrular.
+
+Compares the keyword automaton (single and batch) against the previous
+approach (a separate substring search per section and per keyword) and
+checks that the labels are identical.
+
+Kullanım / Usage:
+    python -m benchmarks.bench_classifier --sections 5000
+"""
+
+import argparse
+import random
+import time
+
+from src.pdf_parser.classifier import SectionClassifier
+from src.pdf_parser.parser import SECTION_KEYWORDS
+
+_FILLER = [
+    "yüklenici", "işi", "sözleşme", "eki", "uygun", "olarak", "tamamlamakla",
+    "yükümlüdür", "idare", "tarafından", "belirlenen", "esaslara", "göre",
+]
+
+
+def build_sections(count: int, seed: int = 0) -> list[tuple[str, str]]:
+    """
+    Sentetik (başlık, içerik) çiftleri oluştur / Build synthetic (title, content) pairs.
+
+    Args:
+        count: Bölüm sayısı / Section count
+        seed: Rastgele tohum / Random seed
+
+    Returns:
+        (başlık, içerik) listesi / List of (title, content)
+    """
+    rng = random.Random(seed)
+    keywords = [keyword for words in SECTION_KEYWORDS.values() for keyword in words]
+    sections: list[tuple[str, str]] = []
+    for index in range(1, count + 1):
+        title = f"Madde {index} - {rng.choice(keywords).title()} {rng.choice(_FILLER)}"
+        words = [rng.choice(_FILLER) for _ in range(120)]
+        for _ in range(rng.randint(0, 4)):
+            words[rng.randrange(len(words))] = rng.choice(keywords)
+        sections.append((title, " ".join(words)))
+    return sections
+
+
+def legacy_classify(title: str, content: str) -> str:
+    """
+    Eski algoritma (referans): tip ve anahtar kelime başına alt dize araması.
+    Previous algorithm (reference): a substring search per type and keyword.
+    """
+    combined = f"{title} {content[:500]}".lower()
+    best_type = "genel"
+    best_score = 0
+    for section_type, keywords in SECTION_KEYWORDS.items():
+        if not keywords:
+            continue
+        score = 0
+        title_lower = title.lower()
+        for keyword in keywords:
+            if keyword in title_lower:
+                score += 3
+            elif keyword in combined:
+                score += 1
+        if score > best_score:
+            best_score = score
+            best_type = section_type
+    return best_type
+
+
+def _best_of(func, repeat: int) -> float:
+    """En iyi süre (sn) / Best wall time (seconds)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Ölçümü çalıştır / Run the benchmark."""
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--sections", type=int, default=5000)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    sections = build_sections(args.sections)
+    classifier = SectionClassifier(SECTION_KEYWORDS)
+
+    expected = [legacy_classify(title, content) for title, content in sections]
+    single_labels = [classifier.classify(title, content) for title, content in sections]
+    batch_labels = classifier.classify_many(sections)
+    if single_labels != expected or batch_labels != expected:
+        raise SystemExit("Etiketler farklı / Labels differ")
+
+    legacy = _best_of(lambda: [legacy_classify(t, c) for t, c in sections], args.repeat)
+    single = _best_of(lambda: [classifier.classify(t, c) for t, c in sections], args.repeat)
+    batch = _best_of(lambda: classifier.classify_many(sections), args.repeat)
+
+    print(f"Bölüm / sections: {args.sections} (etiketler aynı / labels identical)")
+    print(f"  Eski / legacy        : {legacy * 1000:9.1f} ms")
+    print(f"  Otomat / automaton   : {single * 1000:9.1f} ms ({legacy / single:.2f}x)")
+    print(f"  Toplu / batch        : {batch * 1000:9.1f} ms ({legacy / batch:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Doküman Bellek Ölçümü / Parsed Document Memory Benchmark.
+
+Sentetik bir PDF'i ayrıştırır ve ParsedDocument'in bellekte kapladığı
+alanı, sayfa ve bölüm metinlerinin ayrı kopyalar olarak tutulduğu eski
+düzenle karşılaştırır.
+
+Parses a synthetic PDF and compares the memory held by the ParsedDocument
+with the previous layout, where page and section texts were kept as
+separate copies.
+
+Kullanım / Usage:
+    python -m benchmarks.bench_document --pages 200
+"""
+
+import argparse
+import gc
+import sys
+import tempfile
+from pathlib import Path
+from types import FunctionType, ModuleType
+
+from benchmarks.bench_memory import build_pdf
+from src.pdf_parser.parser import IhalePDFParser, PageContent, Section
+
+
+def deep_size(root: object) -> int:
+    """
+    Nesneden erişilebilen tüm nesnelerin toplam boyutu (bayt).
+    Total size of all objects reachable from an object (bytes).
+
+    Args:
+        root: Kök nesne / Root object
+
+    Returns:
+        Bayt / Bytes
+    """
+    seen: set[int] = set()
+    stack = [root]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, (type, ModuleType, FunctionType)):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        stack.extend(gc.get_referents(obj))
+    return total
+
+
+def main() -> None:
+    """Ölçümü çalıştır / Run the benchmark."""
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--pages", type=int, default=200)
+    arg_parser.add_argument("--lines-per-page", type=int, default=12)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdf_path = build_pdf(Path(tmp_dir) / "synthetic.pdf", args.pages, args.lines_per_page)
+        document = IhalePDFParser(max_workers=1).parse(pdf_path)
+
+    # Eski düzen: her sayfa ve bölüm kendi metin kopyasını tutar
+    # Previous layout: every page and section holds its own copy of the text
+    copied = (
+        "".join(document.full_text),
+        [PageContent(**page.to_dict()) for page in document.pages],
+        [Section(**section.to_dict()) for section in document.sections],
+    )
+    compact = (document.full_text, document.pages, document.sections)
+
+    copied_size = deep_size(copied)
+    compact_size = deep_size(compact)
+    print(
+        f"Sayfa / pages: {len(document.pages)}, bölüm / sections: {len(document.sections)}, "
+        f"metin / text: {len(document.full_text) / 1024:.0f} KB"
+    )
+    print(f"  Kopyalı / copied   : {copied_size / 1024:9.0f} KB")
+    print(
+        f"  Kompakt / compact  : {compact_size / 1024:9.0f} KB "
+        f"(-%{100 * (1 - compact_size / copied_size):.0f})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Embedding Aşaması Ölçümü / Embedding Stage Benchmark.
+
+500 sayfalık bir şartnamenin chunk'larını, gecikmesi token sayısıyla
+artan sahte bir embedding modeliyle indeksler ve süreyi karşılaştırır:
+
+    from_texts  FAISS.from_texts (sıralı istekler) / sequential requests
+    stage xN    EmbeddingStage, N eşzamanlı parti / N concurrent batches
+
+İsteğe bağlı hata oranı, yalnızca hata veren partilerin yeniden
+denendiğini gösterir (from_texts hata alırsa baştan başlar).
+
+Indexes the chunks of a 500-page specification with a fake embedding model
+whose latency grows with token count and compares wall time. An optional
+failure rate shows that only failing batches are retried (from_texts starts
+over when it fails).
+
+Kullanım / Usage:
+    python -m benchmarks.bench_embedding --pages 500 --concurrency 1 4 8
+"""
+
+import argparse
+import random
+import threading
+import time
+
+from langchain_community.vectorstores import FAISS
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from src.ai_engine.embedding_stage import EmbeddingStage, plan_batches
+from src.ai_engine.rate_limiter import estimate_tokens
+
+# Sayfa başına ~3000 karakter, 1500 karakterlik chunk'lar
+# ~3000 characters per page, 1500-character chunks
+_CHUNKS_PER_PAGE: int = 2
+_CHUNK_CHARS: int = 1500
+
+# OpenAIEmbeddings istek sınırları / OpenAIEmbeddings request limits
+_MAX_TOKENS_PER_REQUEST: int = 300_000
+_MAX_TEXTS_PER_REQUEST: int = 1000
+
+# İstek sayacı kilidi / Request counter lock
+_LOCK = threading.Lock()
+
+_WORDS: tuple[str, ...] = (
+    "yüklenici", "idare", "madde", "sözleşme", "teminat", "ceza", "gün", "bedel",
+    "teknik", "şartname", "teslim", "kabul", "muayene", "hizmet", "personel",
+)
+
+
+class SimulatedEmbeddings(DeterministicFakeEmbedding):
+    """
+    Ağ gecikmesini taklit eden sahte model / Fake model simulating network latency.
+
+    OpenAIEmbeddings gibi girdiyi en fazla 300k token / 1000 metinlik
+    sıralı isteklere böler. İstek süresi = base_seconds + token / 1000 *
+    seconds_per_1k_tokens; her istek failure_rate olasılıkla hata verir.
+    Like OpenAIEmbeddings, splits the input into sequential requests of at
+    most 300k tokens / 1000 texts. Request time = base_seconds + tokens /
+    1000 * seconds_per_1k_tokens; each request fails with probability
+    failure_rate.
+    """
+
+    base_seconds: float = 0.1
+    seconds_per_1k_tokens: float = 0.01
+    failure_rate: float = 0.0
+    requests: int = 0
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        counts = [estimate_tokens(text) for text in texts]
+        for start, end in plan_batches(counts, _MAX_TOKENS_PER_REQUEST, _MAX_TEXTS_PER_REQUEST):
+            time.sleep(self.base_seconds + sum(counts[start:end]) / 1000 * self.seconds_per_1k_tokens)
+            with _LOCK:
+                self.requests += 1
+                failed = random.random() < self.failure_rate
+            if failed:
+                raise ConnectionError("simüle hata / simulated failure")
+        return super().embed_documents(texts)
+
+
+def make_chunks(pages: int, seed: int = 0) -> list[str]:
+    """Sentetik şartname chunk'ları / Synthetic specification chunks."""
+    rng = random.Random(seed)
+    chunks = []
+    for i in range(pages * _CHUNKS_PER_PAGE):
+        words = [f"Madde {i}"]
+        while sum(len(word) + 1 for word in words) < _CHUNK_CHARS:
+            words.append(rng.choice(_WORDS))
+        chunks.append(" ".join(words))
+    return chunks
+
+
+def _from_texts(chunks: list[str], embeddings: SimulatedEmbeddings, attempts: int = 4) -> float:
+    """Baştan yeniden deneyen from_texts / from_texts retrying from scratch."""
+    start = time.perf_counter()
+    for attempt in range(attempts):
+        try:
+            FAISS.from_texts(texts=chunks, embedding=embeddings)
+            break
+        except ConnectionError:
+            if attempt == attempts - 1:
+                raise
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Ölçümü çalıştır / Run the benchmark."""
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--pages", type=int, default=500)
+    arg_parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    arg_parser.add_argument("--batch-tokens", type=int, default=20_000)
+    arg_parser.add_argument("--failure-rate", type=float, default=0.0)
+    args = arg_parser.parse_args()
+
+    random.seed(0)
+    chunks = make_chunks(args.pages)
+    tokens = sum(estimate_tokens(chunk) for chunk in chunks)
+    print(f"Sayfa / pages: {args.pages}, chunk: {len(chunks)}, ~{tokens} token")
+
+    def model() -> SimulatedEmbeddings:
+        return SimulatedEmbeddings(size=256, failure_rate=args.failure_rate)
+
+    try:
+        baseline = _from_texts(chunks, model())
+        print(f"  {'from_texts':12}: {baseline:6.2f}s")
+    except ConnectionError:
+        baseline = None
+        print(f"  {'from_texts':12}: başarısız / failed")
+
+    for concurrency in args.concurrency:
+        stage = EmbeddingStage(
+            model(),
+            max_batch_tokens=args.batch_tokens,
+            max_concurrency=concurrency,
+            retry_base_seconds=0.1,
+        )
+        stage.build(chunks)
+        speedup = f", x{baseline / stage.stats.seconds:.1f}" if baseline else ""
+        print(
+            f"  {'stage x' + str(concurrency):12}: {stage.stats.seconds:6.2f}s{speedup} "
+            f"({stage.stats.batches} parti / batches, {stage.stats.retried_batches} yeniden / retried)"
+        )
+
+
+if __name__ == "__main__":
+    main()
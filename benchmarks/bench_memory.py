@@ -0,0 +1,130 @@
+"""
+Parse Bellek Ölçümü / Parse Memory Benchmark.
+
+Sentetik çok sayfalı bir PDF'i ayrı bir süreçte ayrıştırır ve en yüksek
+RSS değerini ölçer. Düşük bellek modunda tepe RSS eşiği aşarsa çıkış
+kodu 1 olur (CI'da kullanılabilir).
+
+Parses a synthetic multi-page PDF in a separate process and measures the
+peak RSS. In bounded-memory mode the exit code is 1 if the peak RSS
+exceeds the threshold (usable in CI).
+
+Kullanım / Usage:
+    python -m benchmarks.bench_memory --pages 1000 --max-rss-mb 250
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from fpdf import FPDF
+
+
+def build_pdf(path: Path, page_count: int, lines_per_page: int = 12) -> Path:
+    """
+    Sentetik şartname PDF'i oluştur / Build a synthetic specification PDF.
+
+    Args:
+        path: Çıktı yolu / Output path
+        page_count: Sayfa sayısı / Page count
+        lines_per_page: Sayfa başına satır / Lines per page
+
+    Returns:
+        PDF yolu / PDF path
+    """
+    pdf = FPDF()
+    pdf.set_font("Helvetica", size=9)
+    clause = 1
+    for page_num in range(1, page_count + 1):
+        pdf.add_page()
+        pdf.cell(0, 5, "T.C. ORNEK BELEDIYESI - IKN 2024/123456", new_x="LMARGIN", new_y="NEXT")
+        for line in range(lines_per_page):
+            if line % 4 == 0:
+                text = f"Madde {clause} - Yuklenicinin yukumlulukleri"
+                clause += 1
+            else:
+                text = (
+                    f"Yuklenici, isi sozlesme ve eki sartnamelere uygun olarak {line} gun "
+                    f"icinde tamamlamakla yukumludur. Gecikme halinde ceza uygulanir."
+                )
+            pdf.cell(0, 5, text, new_x="LMARGIN", new_y="NEXT")
+        pdf.cell(0, 5, f"Sayfa {page_num} / {page_count}", new_x="LMARGIN", new_y="NEXT")
+    pdf.output(str(path))
+    return path
+
+
+def _peak_rss_mb() -> float:
+    """Sürecin tepe RSS değeri (MB) / Peak RSS of this process (MB)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux'ta KB, macOS'ta bayt / KB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_child(pdf_path: str, low_memory: bool) -> None:
+    """
+    Alt süreç: dosyayı ayrıştır, sonucu JSON olarak yaz.
+    Child process: parse the file, print the result as JSON.
+    """
+    from src.pdf_parser.parser import IhalePDFParser
+
+    baseline = _peak_rss_mb()
+    start = time.perf_counter()
+    result = IhalePDFParser(max_workers=1, low_memory=low_memory).parse(pdf_path)
+    print(json.dumps({
+        "seconds": time.perf_counter() - start,
+        "baseline_mb": baseline,
+        "peak_mb": _peak_rss_mb(),
+        "pages": result.metadata.total_pages,
+        "chars": result.metadata.total_chars,
+    }))
+
+
+def measure(pdf_path: Path, low_memory: bool) -> dict:
+    """Ölçümü ayrı süreçte çalıştır / Run the measurement in a separate process."""
+    command = [sys.executable, "-m", "benchmarks.bench_memory", "--child", str(pdf_path)]
+    if low_memory:
+        command.append("--low-memory")
+    output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    """Ölçümü çalıştır / Run the benchmark."""
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--pages", type=int, default=1000)
+    arg_parser.add_argument("--lines-per-page", type=int, default=12)
+    arg_parser.add_argument("--max-rss-mb", type=float, default=250.0)
+    arg_parser.add_argument("--child", help=argparse.SUPPRESS)
+    arg_parser.add_argument("--low-memory", action="store_true", help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.low_memory)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdf_path = build_pdf(Path(tmp_dir) / "synthetic.pdf", args.pages, args.lines_per_page)
+        size_mb = pdf_path.stat().st_size / (1024 * 1024)
+        default = measure(pdf_path, low_memory=False)
+        bounded = measure(pdf_path, low_memory=True)
+
+    print(f"Sayfa / pages: {args.pages}, PDF: {size_mb:.1f} MB")
+    for label, result in (("Varsayılan / default", default), ("Düşük bellek / low", bounded)):
+        print(
+            f"  {label:22}: tepe / peak {result['peak_mb']:7.1f} MB "
+            f"(başlangıç / baseline {result['baseline_mb']:.1f} MB), {result['seconds']:.1f} sn"
+        )
+
+    if bounded["peak_mb"] > args.max_rss_mb:
+        print(f"HATA / FAIL: tepe RSS {bounded['peak_mb']:.1f} MB > {args.max_rss_mb:.1f} MB")
+        sys.exit(1)
+    print(f"OK: tepe RSS / peak RSS <= {args.max_rss_mb:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Parser Performans Paketi / Parser Benchmark Suite.
+
+Sentetik ihale PDF'i (benchmarks.tender_pdf) üzerinde parse hattının
+aşamalarını ölçer ve sayfa başına süreyi kayıtlı bir taban çizgisiyle
+karşılaştırır:
+
+    parse            IhalePDFParser.parse (uçtan uca / end to end)
+    detect_sections  IhalePDFParser.detect_sections (temiz metin / cleaned text)
+    clean_text       IhalePDFParser.clean_text (ham sayfa metinleri / raw page texts)
+    tables           IhalePDFParser.extract_tables (tables="always")
+
+Measures the stages of the parse pipeline on a synthetic tender PDF
+(benchmarks.tender_pdf) and compares the time per page against a stored
+baseline.
+
+Taban çizgisi makineye özgüdür; donanım değiştiğinde ``--save-baseline``
+ile yeniden kaydedin. ``--check`` bir aşama toleransın üzerinde
+yavaşladığında çıkış kodu 1 verir.
+The baseline is machine specific; re-record it with ``--save-baseline``
+when the hardware changes. ``--check`` exits with code 1 when a stage is
+slower than the tolerance allows.
+
+Kullanım / Usage:
+    python -m benchmarks.bench_parser --pages 200
+    python -m benchmarks.bench_parser --pages 200 --check --tolerance 0.25
+    python -m benchmarks.bench_parser --pages 200 --save-baseline
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pdfplumber
+
+from benchmarks.tender_pdf import generate_tender_pdf
+from src.pdf_parser.parser import IhalePDFParser
+
+# Kayıtlı taban çizgisi / Stored baseline
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline_parser.json"
+
+STAGES: tuple[str, ...] = ("parse", "detect_sections", "clean_text", "tables")
+
+
+def _best_of(func, repeat: int) -> float:
+    """En iyi süre (sn) / Best wall time (seconds)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(pdf_path: Path, repeat: int, workers: int) -> dict[str, float]:
+    """
+    Aşamaları ölç / Measure the stages.
+
+    Args:
+        pdf_path: Sentetik PDF / Synthetic PDF
+        repeat: Tekrar sayısı (en iyisi alınır) / Repetitions (best is kept)
+        workers: parse için işçi süreç sayısı / Worker processes for parse
+
+    Returns:
+        Aşama → sayfa başına ms / Stage → ms per page
+    """
+    parser = IhalePDFParser(max_workers=workers)
+    document = parser.parse(pdf_path)
+    with pdfplumber.open(pdf_path) as pdf:
+        raw_texts = [page.extract_text() or "" for page in pdf.pages]
+    page_count = len(raw_texts)
+
+    seconds = {
+        "parse": _best_of(lambda: parser.parse(pdf_path), repeat),
+        "detect_sections": _best_of(
+            lambda: parser.detect_sections(document.full_text, document.pages), repeat
+        ),
+        "clean_text": _best_of(lambda: [parser.clean_text(text) for text in raw_texts], repeat),
+        "tables": _best_of(lambda: parser.extract_tables(pdf_path, tables="always"), repeat),
+    }
+    return {stage: seconds[stage] * 1000 / page_count for stage in STAGES}
+
+
+def main() -> None:
+    """Ölçümü çalıştır / Run the benchmark."""
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--pages", type=int, default=200)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument("--workers", type=int, default=1)
+    arg_parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    arg_parser.add_argument("--save-baseline", action="store_true")
+    arg_parser.add_argument("--check", action="store_true")
+    arg_parser.add_argument("--tolerance", type=float, default=0.25)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdf_path = generate_tender_pdf(Path(tmp_dir) / "sartname.pdf", args.pages, args.seed)
+        current = measure(pdf_path, args.repeat, args.workers)
+
+    baseline: dict = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        if (baseline.get("pages"), baseline.get("workers")) != (args.pages, args.workers):
+            print(
+                f"Uyarı / Warning: taban çizgisi {baseline.get('pages')} sayfa, "
+                f"{baseline.get('workers')} işçi ile kaydedildi / baseline recorded with "
+                f"{baseline.get('pages')} pages, {baseline.get('workers')} workers"
+            )
+    base_times = baseline.get("ms_per_page", {})
+
+    print(f"Sayfa / pages: {args.pages}, işçi / workers: {args.workers} (ms / sayfa / ms per page)")
+    regressions: list[str] = []
+    for stage in STAGES:
+        line = f"  {stage:16}: {current[stage]:8.3f}"
+        if stage in base_times:
+            change = current[stage] / base_times[stage] - 1
+            line += f"  (taban / baseline {base_times[stage]:8.3f}, {change:+.0%})"
+            if change > args.tolerance:
+                regressions.append(stage)
+        print(line)
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps({
+            "pages": args.pages,
+            "seed": args.seed,
+            "workers": args.workers,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "ms_per_page": {stage: round(current[stage], 4) for stage in STAGES},
+        }, indent=2) + "\n", encoding="utf-8")
+        print(f"Taban çizgisi kaydedildi / Baseline saved: {args.baseline}")
+
+    if args.check and regressions:
+        print(
+            f"HATA / FAIL: %{args.tolerance * 100:.0f} toleransın üzerinde yavaşlama / "
+            f"slower than the tolerance: {', '.join(regressions)}"
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Bölüm Tespiti Ölçümü / Section Detection Benchmark.
+
+Tek geçişli birleşik kalıp + ikili arama ile sayfa bulmayı, eski
+yöntemle (kalıp başına ayrı tarama + her başlık için sayfaları baştan
+dolaşma) karşılaştırır.
+
+Compares the single-pass combined pattern + binary-search page lookup
+against the previous approach (one scan per pattern + walking the pages
+from the start for every heading).
+
+Kullanım / Usage:
+    python -m benchmarks.bench_sections --pages 500 --clauses-per-page 8
+"""
+
+import argparse
+import time
+
+from src.pdf_parser.parser import (
+    SECTION_PATTERNS,
+    IhalePDFParser,
+    PageContent,
+    _find_headings,
+    _page_at,
+)
+
+
+def build_pages(page_count: int, clauses_per_page: int) -> list[PageContent]:
+    """
+    Sentetik şartname sayfaları oluştur / Build synthetic specification pages.
+
+    Args:
+        page_count: Sayfa sayısı / Page count
+        clauses_per_page: Sayfa başına "Madde" başlığı / "Madde" headings per page
+
+    Returns:
+        Sayfa listesi / Page list
+    """
+    pages: list[PageContent] = []
+    clause = 1
+    for page_num in range(1, page_count + 1):
+        lines = ["T.C. ÖRNEK BELEDİYESİ    İKN: 2024/123456", ""]
+        if page_num % 50 == 1:
+            lines.append(f"BÖLÜM {page_num // 50 + 1} - Genel Hükümler")
+        for _ in range(clauses_per_page):
+            lines.append(f"Madde {clause} - Yüklenicinin yükümlülükleri")
+            lines.append("Yüklenici, işi sözleşme ve eki şartnamelere uygun olarak")
+            lines.append("süresi  içinde   tamamlamakla yükümlüdür.  Gecikme halinde ceza uygulanır.")
+            clause += 1
+        if page_num % 100 == 0:
+            lines.append(f"EK-{page_num // 100} Birim Fiyat Cetveli")
+        lines.append(f"Sayfa {page_num} / {page_count}")
+        pages.append(PageContent(page_num=page_num, text="\n".join(lines)))
+    return pages
+
+
+def legacy_locate(text: str, pages: list[PageContent]) -> list[tuple[int, int]]:
+    """
+    Eski algoritma (referans): kalıp başına ayrı tarama + sıralama, her
+    başlık için sayfaları baştan dolaşma. (pozisyon, sayfa) listesi döner.
+
+    Previous algorithm (reference): one scan per pattern + sort, walking
+    the pages from the start for every heading. Returns (position, page).
+    """
+    positions = sorted(
+        match.start() for pattern in SECTION_PATTERNS for match in pattern.finditer(text)
+    )
+    located: list[tuple[int, int]] = []
+    for pos in positions:
+        current = 0
+        page_num = pages[-1].page_num
+        for page in pages:
+            page_len = len(page.text) + 2
+            if current + page_len > pos:
+                page_num = page.page_num
+                break
+            current += page_len
+        located.append((pos, page_num))
+    return located
+
+
+def single_pass_locate(
+    parser: IhalePDFParser, text: str, pages: list[PageContent]
+) -> list[tuple[int, int]]:
+    """
+    Yeni algoritma: birleşik kalıpla tek geçiş + ofset dizisinde ikili arama.
+    New algorithm: single pass with the combined pattern + binary search
+    over the offset array.
+    """
+    offsets, page_nums = parser._page_offsets(pages)
+    return [(start, _page_at(offsets, page_nums, start)) for start, _end, _title in _find_headings(text)]
+
+
+def _best_of(func, repeat: int) -> float:
+    """En iyi süre (sn) / Best wall time (seconds)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Ölçümü çalıştır / Run the benchmark."""
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--pages", type=int, default=500)
+    arg_parser.add_argument("--clauses-per-page", type=int, default=8)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    parser = IhalePDFParser(max_workers=1)
+    pages = build_pages(args.pages, args.clauses_per_page)
+    full_text = "\n\n".join(
+        cleaned for cleaned in (parser.clean_text(page.text) for page in pages) if cleaned
+    )
+
+    legacy = _best_of(lambda: legacy_locate(full_text, pages), args.repeat)
+    current = _best_of(lambda: single_pass_locate(parser, full_text, pages), args.repeat)
+    full = _best_of(lambda: parser.detect_sections(full_text, pages), args.repeat)
+    section_count = len(single_pass_locate(parser, full_text, pages))
+
+    print(f"Sayfa / pages: {args.pages}, başlık / headings: {section_count}")
+    print("Başlık bulma + sayfa eşleme / heading matching + page mapping:")
+    print(f"  Eski / legacy        : {legacy * 1000:9.1f} ms")
+    print(f"  Tek geçiş / single   : {current * 1000:9.1f} ms")
+    print(f"  Hızlanma / speedup   : {legacy / current:9.2f}x")
+    print(f"detect_sections (sınıflandırma dahil / incl. classification): {full * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
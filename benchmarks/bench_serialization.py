@@ -0,0 +1,133 @@
+"""
+Doküman Serileştirme Ölçümü / Document Serialization Benchmark.
+
+ParsedDocument'in ikili biçimini (sıkıştırmasız, zlib, zstd) pickle ve
+JSON ile boyut, yazma, yükleme ve yükleme + tüm bölüm içeriklerini okuma
+süreleri açısından karşılaştırır; gidiş-dönüşün eşit olduğunu doğrular.
+
+Compares the ParsedDocument binary format (uncompressed, zlib, zstd)
+against pickle and JSON by size, dump time, load time, and load + reading
+every section content; checks that every round trip is equal.
+
+Kullanım / Usage:
+    python -m benchmarks.bench_serialization --pages 500
+"""
+
+import argparse
+import dataclasses
+import hashlib
+import json
+import pickle
+import time
+
+from benchmarks.bench_sections import build_pages
+from src.pdf_parser.parser import (
+    DocumentMetadata,
+    IhalePDFParser,
+    PageContent,
+    ParsedDocument,
+    Section,
+    TableContent,
+)
+from src.pdf_parser.serialization import _zstd
+
+
+def build_document(page_count: int, clauses_per_page: int) -> ParsedDocument:
+    """
+    Sentetik ayrıştırılmış doküman / Synthetic parsed document.
+
+    Args:
+        page_count: Sayfa sayısı / Page count
+        clauses_per_page: Sayfa başına "Madde" başlığı / "Madde" headings per page
+
+    Returns:
+        ParsedDocument
+    """
+    parser = IhalePDFParser()
+    pages = build_pages(page_count, clauses_per_page)
+    for page in pages:
+        page.text = parser.clean_text(page.text)
+        page.content_hash = hashlib.sha256(page.text.encode("utf-8")).hexdigest()
+    full_text, sections = parser._assemble(pages)
+    return ParsedDocument(
+        full_text=full_text,
+        pages=pages,
+        sections=sections,
+        metadata=DocumentMetadata(total_pages=len(pages), total_sections=len(sections)),
+    )
+
+
+def to_json(document: ParsedDocument) -> bytes:
+    """JSON (dataclasses.asdict düzeni) / JSON (dataclasses.asdict layout)."""
+    return json.dumps({
+        "full_text": document.full_text,
+        "pages": [page.to_dict() for page in document.pages],
+        "tables": [dataclasses.asdict(table) for table in document.tables],
+        "sections": [section.to_dict() for section in document.sections],
+        "metadata": dataclasses.asdict(document.metadata),
+    }, ensure_ascii=False).encode("utf-8")
+
+
+def from_json(data: bytes) -> ParsedDocument:
+    """JSON'dan doküman / Document from JSON."""
+    raw = json.loads(data)
+    return ParsedDocument(
+        full_text=raw["full_text"],
+        pages=[PageContent(**page) for page in raw["pages"]],
+        tables=[TableContent(**table) for table in raw["tables"]],
+        sections=[Section(**section) for section in raw["sections"]],
+        metadata=DocumentMetadata(**raw["metadata"]),
+    )
+
+
+def _best_of(func, repeat: int) -> float:
+    """En iyi süre (sn) / Best wall time (seconds)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Ölçümü çalıştır / Run the benchmark."""
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--pages", type=int, default=500)
+    arg_parser.add_argument("--clauses-per-page", type=int, default=8)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    document = build_document(args.pages, args.clauses_per_page)
+    formats = {
+        "pickle": (lambda doc: pickle.dumps(doc, pickle.HIGHEST_PROTOCOL), pickle.loads),
+        "json": (to_json, from_json),
+        "binary": (lambda doc: doc.to_bytes("none"), ParsedDocument.from_bytes),
+        "binary+zlib": (lambda doc: doc.to_bytes("zlib"), ParsedDocument.from_bytes),
+    }
+    if _zstd() is not None:
+        formats["binary+zstd"] = (lambda doc: doc.to_bytes("zstd"), ParsedDocument.from_bytes)
+
+    print(
+        f"Sayfa / pages: {len(document.pages)}, bölüm / sections: {len(document.sections)}, "
+        f"metin / text: {len(document.full_text) / 1024:.0f} KB"
+    )
+    print(f"  {'biçim / format':14} {'boyut / size':>12} {'yaz / dump':>11} {'yükle / load':>13} {'+ içerik / + read':>18}")
+    for name, (dump, load) in formats.items():
+        data = dump(document)
+        if load(data) != document:
+            raise SystemExit(f"Gidiş-dönüş farklı / Round trip differs: {name}")
+
+        dump_time = _best_of(lambda: dump(document), args.repeat)
+        load_time = _best_of(lambda: load(data), args.repeat)
+        read_time = _best_of(
+            lambda: [section.content for section in load(data).sections], args.repeat
+        )
+        print(
+            f"  {name:14} {len(data) / 1024:9.0f} KB {dump_time * 1000:8.1f} ms "
+            f"{load_time * 1000:10.1f} ms {read_time * 1000:15.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
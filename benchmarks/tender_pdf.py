@@ -0,0 +1,181 @@
+"""
+Sentetik İhale PDF Üreticisi / Synthetic Tender PDF Generator.
+
+fpdf2 ile gerçekçi Türkçe ihale şartnamesi PDF'leri üretir: tekrarlı
+sayfa başlığı ve altbilgisi, BÖLÜM / Madde / EK başlıkları, çok satırlı
+madde metinleri ve çerçeveli birim fiyat tabloları. Aynı tohum aynı
+dokümanı üretir.
+
+Generates realistic Turkish tender specification PDFs with fpdf2:
+repeated page header and footer, BÖLÜM / Madde / EK headings, multi-line
+clause texts and bordered unit price tables. The same seed produces the
+same document.
+
+Kullanım / Usage:
+    python -m benchmarks.tender_pdf --pages 200 --output sartname.pdf
+"""
+
+import argparse
+import random
+from pathlib import Path
+
+from fpdf import FPDF
+
+# Rapor üreticisiyle aynı Türkçe destekli font / Same Turkish-capable font as the report generator
+_FONTS_DIR = Path(__file__).resolve().parent.parent / "assets" / "fonts"
+
+_HEADER = "T.C. ÖRNEK BÜYÜKŞEHİR BELEDİYESİ - Fen İşleri Dairesi Başkanlığı"
+_SUBHEADER = "İKN: 2024/123456 - Teknik Şartname"
+
+_PARTS = [
+    "Genel Hükümler", "İdari Şartlar", "Teknik Şartlar", "Mali Hükümler", "Cezai Şartlar",
+]
+_CLAUSE_TITLES = [
+    "İşin konusu ve kapsamı", "Tanımlar", "Yüklenicinin yükümlülükleri",
+    "İşin süresi ve teslim tarihi", "Gecikme cezası", "Ödeme koşulları",
+    "Kesin teminat", "Sözleşme bedeli", "Malzeme ve teknik özellikler",
+    "Personel yeterliliği", "İş güvenliği", "Kabul işlemleri", "Garanti süresi",
+    "Fiyat farkı", "Alt yüklenici", "Sözleşmenin feshi", "Anlaşmazlıkların çözümü",
+]
+_SENTENCES = [
+    "Yüklenici, işi sözleşme ve eki şartnamelere uygun olarak eksiksiz tamamlamakla yükümlüdür.",
+    "İşin süresi yer tesliminden itibaren {days} (takvim) gündür.",
+    "Süresinde tamamlanmayan her gün için sözleşme bedelinin %0,{permille} oranında gecikme cezası uygulanır.",
+    "Hakedişler, idarece onaylanmasını müteakip {days} gün içinde yükleniciye ödenir.",
+    "Kesin teminat, sözleşme bedelinin %{percent}'i oranında alınır.",
+    "Kullanılacak malzemeler TSE standartlarına uygun ve birinci sınıf olacaktır.",
+    "Yüklenici, iş sağlığı ve güvenliği mevzuatına uymakla yükümlüdür.",
+    "İdare, gerekli gördüğü hallerde iş programında değişiklik yapabilir.",
+    "Teslim edilen ürünler için en az {years} yıl garanti verilecektir.",
+    "Yüklenici, çalıştıracağı personelin listesini işe başlamadan önce idareye bildirir.",
+    "Muayene ve kabul işlemleri idarece oluşturulacak komisyon tarafından yapılır.",
+    "Bu şartnamede yer almayan hususlarda 4734 ve 4735 sayılı Kanun hükümleri uygulanır.",
+]
+_TABLE_ITEMS = [
+    ("Beton C30/37", "m³"), ("İnşaat demiri", "ton"), ("Kalıp", "m²"), ("Kazı", "m³"),
+    ("Asfalt kaplama", "m²"), ("Bordür", "m"), ("Parke taşı", "m²"), ("Aydınlatma direği", "adet"),
+]
+
+
+def generate_tender_pdf(
+    path: str | Path,
+    page_count: int,
+    seed: int = 0,
+    clauses_per_page: int = 3,
+    table_every: int = 6,
+) -> Path:
+    """
+    Sentetik ihale şartnamesi PDF'i üret / Generate a synthetic tender specification PDF.
+
+    Args:
+        path: Çıktı yolu / Output path
+        page_count: Sayfa sayısı / Page count
+        seed: Rastgele tohum / Random seed
+        clauses_per_page: Sayfa başına "Madde" sayısı / "Madde" clauses per page
+        table_every: Kaç sayfada bir birim fiyat tablosu (0 = hiç) /
+                     A unit price table every N pages (0 = none)
+
+    Returns:
+        PDF yolu / PDF path
+    """
+    rng = random.Random(seed)
+    pdf = FPDF()
+    pdf.set_auto_page_break(False)
+    pdf.add_font("DejaVu", "", str(_FONTS_DIR / "DejaVuSans.ttf"))
+    pdf.add_font("DejaVu", "B", str(_FONTS_DIR / "DejaVuSans-Bold.ttf"))
+
+    annex_pages = max(1, page_count // 20)
+    part_every = max(1, (page_count - annex_pages) // len(_PARTS))
+    clause = 1
+    for page_num in range(1, page_count + 1):
+        pdf.add_page()
+        _page_header(pdf)
+
+        if page_num > page_count - annex_pages:
+            annex = page_num - (page_count - annex_pages)
+            _heading(pdf, f"EK-{annex} Birim Fiyat Cetveli")
+            _unit_price_table(pdf, rng)
+        else:
+            if (page_num - 1) % part_every == 0:
+                part = min((page_num - 1) // part_every, len(_PARTS) - 1)
+                _heading(pdf, f"BÖLÜM {part + 1} - {_PARTS[part]}")
+            for _ in range(clauses_per_page):
+                _heading(pdf, f"Madde {clause} - {rng.choice(_CLAUSE_TITLES)}")
+                pdf.set_font("DejaVu", "", 9)
+                pdf.multi_cell(0, 4.5, _paragraph(rng), new_x="LMARGIN", new_y="NEXT")
+                pdf.ln(1)
+                clause += 1
+            if table_every and page_num % table_every == 0:
+                _unit_price_table(pdf, rng)
+
+        _page_footer(pdf, page_num, page_count)
+
+    path = Path(path)
+    pdf.output(str(path))
+    return path
+
+
+def _page_header(pdf: FPDF) -> None:
+    """Tekrarlı sayfa başlığı / Repeated page header."""
+    pdf.set_font("DejaVu", "B", 8)
+    pdf.cell(0, 4, _HEADER, new_x="LMARGIN", new_y="NEXT")
+    pdf.set_font("DejaVu", "", 8)
+    pdf.cell(0, 4, _SUBHEADER, new_x="LMARGIN", new_y="NEXT")
+    pdf.ln(3)
+
+
+def _page_footer(pdf: FPDF, page_num: int, page_count: int) -> None:
+    """Tekrarlı altbilgi (sayfa numaralı) / Repeated footer (with page number)."""
+    pdf.set_y(-15)
+    pdf.set_font("DejaVu", "", 8)
+    pdf.cell(0, 4, f"Sayfa {page_num} / {page_count}", align="C")
+
+
+def _heading(pdf: FPDF, text: str) -> None:
+    """Bölüm/madde başlığı / Section/clause heading."""
+    pdf.set_font("DejaVu", "B", 10)
+    pdf.cell(0, 6, text, new_x="LMARGIN", new_y="NEXT")
+
+
+def _paragraph(rng: random.Random) -> str:
+    """Rastgele madde metni / Random clause text."""
+    return " ".join(
+        rng.choice(_SENTENCES).format(
+            days=rng.choice([30, 60, 90, 120, 180, 365]),
+            permille=rng.randint(1, 9),
+            percent=rng.choice([3, 6]),
+            years=rng.randint(1, 5),
+        )
+        for _ in range(rng.randint(2, 4))
+    )
+
+
+def _unit_price_table(pdf: FPDF, rng: random.Random) -> None:
+    """Çerçeveli birim fiyat tablosu / Bordered unit price table."""
+    pdf.ln(2)
+    pdf.set_font("DejaVu", "", 8)
+    with pdf.table(col_widths=(12, 60, 20, 25, 30, 30), text_align="LEFT") as table:
+        table.row(["Sıra", "İş Kalemi", "Birim", "Miktar", "Birim Fiyat (TL)", "Tutar (TL)"])
+        for index, (item, unit) in enumerate(rng.sample(_TABLE_ITEMS, 5), start=1):
+            quantity = rng.randint(10, 5000)
+            price = rng.randint(50, 20000)
+            table.row([
+                str(index), item, unit, f"{quantity:,}".replace(",", "."),
+                f"{price:,}".replace(",", "."), f"{quantity * price:,}".replace(",", "."),
+            ])
+
+
+def main() -> None:
+    """PDF üret / Generate a PDF."""
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--pages", type=int, default=200)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--output", default="sentetik_sartname.pdf")
+    args = arg_parser.parse_args()
+
+    path = generate_tender_pdf(args.output, args.pages, args.seed)
+    print(f"{path} ({args.pages} sayfa / pages)")
+
+
+if __name__ == "__main__":
+    main()
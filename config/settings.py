@@ -40,6 +40,19 @@ class Settings(BaseSettings):
     GEMINI_API_KEY: str = ""
     GEMINI_MODEL: str = "gemini-2.0-flash"
 
+    # === AI Analiz / AI Analysis ===
+    # Aynı anda çalışan analiz adımı sayısı (1 = sıralı)
+    # Analysis steps running at the same time (1 = sequential)
+    ANALYSIS_MAX_CONCURRENCY: int = 5
+
+    # === LLM Hız Sınırları (süreç geneli) / LLM Rate Limits (process-wide) ===
+    OPENAI_REQUESTS_PER_MINUTE: int = 500
+    OPENAI_TOKENS_PER_MINUTE: int = 200000
+    GEMINI_REQUESTS_PER_MINUTE: int = 15
+    GEMINI_TOKENS_PER_MINUTE: int = 1000000
+    # Sağlayıcı başına aynı anda süren çağrı / Calls in flight per provider
+    LLM_MAX_IN_FLIGHT: int = 8
+
     # === Veritabanı / Database ===
     DATABASE_URL: str = f"sqlite:///{BASE_DIR / 'tenderai.db'}"
 
@@ -59,6 +72,33 @@ class Settings(BaseSettings):
     MAX_FILE_SIZE_MB: int = 50
     ALLOWED_EXTENSIONS: list[str] = [".pdf"]
 
+    # === PDF Ayrıştırma / PDF Parsing ===
+    PARSE_CACHE_DIR: Path = BASE_DIR / "data" / "cache" / "parsed"
+    PARSE_CACHE_MAX_MB: int = 500
+    # Sınırlı bellek modu (çok büyük şartnameler) / Bounded-memory mode (very large specs)
+    PARSE_LOW_MEMORY: bool = False
+    PARSE_TEXT_BUDGET_MB: float = 64.0
+    # Metin motoru ("auto", "pdfplumber", "pdfium-fast") — "auto" büyük
+    # dokümanlarda pdfium-fast kullanır / Text backend — "auto" uses
+    # pdfium-fast for large documents
+    PARSE_TEXT_BACKEND: str = "auto"
+    PARSE_FAST_BACKEND_MIN_PAGES: int = 100
+
+    # === OCR (taranmış sayfalar / scanned pages) ===
+    OCR_ENABLED: bool = False
+    OCR_LANG: str = "tur"
+    OCR_CACHE_DIR: Path = BASE_DIR / "data" / "cache" / "ocr"
+
+    # === Vektör Önbelleği / Vector Cache ===
+    VECTOR_CACHE_DIR: Path = BASE_DIR / "data" / "cache" / "vectors"
+    VECTOR_CACHE_MAX_MB: int = 1000
+    # İhaleler arası chunk embedding'leri / Chunk embeddings shared across tenders
+    EMBEDDING_CACHE_PATH: Path = BASE_DIR / "data" / "cache" / "embeddings.sqlite3"
+    EMBEDDING_CACHE_MAX_MB: int = 1000
+    # Embedding partileri / Embedding batches
+    EMBEDDING_MAX_CONCURRENCY: int = 4
+    EMBEDDING_BATCH_TOKENS: int = 20000
+
     # === Bildirimler / Notifications ===
     NOTIFICATION_ENABLED: bool = True
     MAX_CHAT_MESSAGES_PER_DAY: int = 50
@@ -71,14 +71,17 @@ python3 -c "from src.database.db import DatabaseManager; DatabaseManager().init_
     exit 1
 }
 
-# 7. Mevcut port kontrol / Check port
+# 7. Vektör önbelleği temizliği / Vector cache cleanup (LRU)
+python3 -m src.ai_engine.vector_cache --prune >/dev/null 2>&1 || true
+
+# 8. Mevcut port kontrol / Check port
 if lsof -ti:8501 >/dev/null 2>&1; then
     echo -e "${YELLOW}⚠️  Port 8501 kullanılıyor, kapatılıyor...${NC}"
     lsof -ti:8501 | xargs kill -9 2>/dev/null
     sleep 1
 fi
 
-# 8. Streamlit başlat / Start Streamlit
+# 9. Streamlit başlat / Start Streamlit
 echo ""
 echo -e "${GREEN}🚀 TenderAI başlatılıyor...${NC}"
 echo -e "   ${CYAN}Local:    http://localhost:8501${NC}"
@@ -6,7 +6,18 @@ RAG + LLM-based tender analysis engine.
 """
 
 from src.ai_engine.analyzer import IhaleAnalizAI, AnalysisResult
+from src.ai_engine.embedding_cache import CachedEmbeddings, EmbeddingCache
+from src.ai_engine.embedding_stage import EmbeddingStage, EmbeddingStats
 from src.ai_engine.prompts import get_prompt, get_query, get_all_prompt_names, SYSTEM_ROLE
+from src.ai_engine.rate_limiter import (
+    LLMRateLimiter,
+    RateLimits,
+    RateLimitMetrics,
+    configure_rate_limits,
+    get_rate_limiter,
+    rate_limit_metrics,
+)
+from src.ai_engine.vector_cache import VectorStoreCache
 
 __all__ = [
     "IhaleAnalizAI",
@@ -15,4 +26,15 @@ __all__ = [
     "get_query",
     "get_all_prompt_names",
     "SYSTEM_ROLE",
+    "LLMRateLimiter",
+    "RateLimits",
+    "RateLimitMetrics",
+    "configure_rate_limits",
+    "get_rate_limiter",
+    "rate_limit_metrics",
+    "VectorStoreCache",
+    "EmbeddingCache",
+    "CachedEmbeddings",
+    "EmbeddingStage",
+    "EmbeddingStats",
 ]
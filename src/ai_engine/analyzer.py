@@ -13,10 +13,13 @@ Pipeline:
     Sorgu → Embedding → Benzer chunk bul → LLM → Analiz sonucu
 """
 
+import asyncio
+import hashlib
 import json
 import logging
 import re
 import time
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -33,6 +36,10 @@ from src.ai_engine.prompts import (
     get_all_prompt_names,
     EXECUTIVE_SUMMARY_PROMPT,
 )
+from src.ai_engine.embedding_cache import CachedEmbeddings, EmbeddingCache
+from src.ai_engine.embedding_stage import EmbeddingStage
+from src.ai_engine.rate_limiter import LLMRateLimiter, get_rate_limiter, is_rate_limit_error
+from src.ai_engine.vector_cache import VectorStoreCache
 from src.pdf_parser.parser import ParsedDocument
 
 logger = logging.getLogger(__name__)
@@ -86,6 +93,24 @@ _INPUT_COST_PER_1K: float = 0.005
 _OUTPUT_COST_PER_1K: float = 0.015
 
 
+# ============================================================
+# Eşzamanlılık / Concurrency
+# ============================================================
+
+# Aynı anda çalışan bağımsız analiz adımı sayısı (yönetici özeti hariç)
+# Independent analysis steps running at the same time (executive summary excluded)
+_MAX_CONCURRENCY: int = 5
+
+# Aynı anda gönderilen embedding partisi ve parti başına token
+# Embedding batches in flight at the same time and tokens per batch
+_EMBEDDING_CONCURRENCY: int = 4
+_EMBEDDING_BATCH_TOKENS: int = 20_000
+
+# Sağlayıcı 429 döndüğünde paylaşılan kuyruğun bekleme süresi (sn)
+# Shared queue wait when the provider returns 429 (seconds)
+_RATE_LIMIT_BACKOFF_SECONDS: float = 20.0
+
+
 # ============================================================
 # IhaleAnalizAI Sınıfı / IhaleAnalizAI Class
 # ============================================================
@@ -114,6 +139,12 @@ class IhaleAnalizAI:
         chunk_size: int = 1500,
         chunk_overlap: int = 200,
         top_k: int = 15,
+        max_concurrency: int = _MAX_CONCURRENCY,
+        rate_limiter: LLMRateLimiter | None = None,
+        vector_cache: VectorStoreCache | None = None,
+        embedding_cache: EmbeddingCache | None = None,
+        embedding_concurrency: int = _EMBEDDING_CONCURRENCY,
+        embedding_batch_tokens: int = _EMBEDDING_BATCH_TOKENS,
     ) -> None:
         """
         IhaleAnalizAI başlat / Initialize IhaleAnalizAI.
@@ -125,6 +156,18 @@ class IhaleAnalizAI:
             chunk_size: Metin parça boyutu / Text chunk size (karakter)
             chunk_overlap: Parça örtüşme miktarı / Chunk overlap (karakter)
             top_k: RAG'da çekilecek en alakalı parça sayısı / Top-K retrieval count
+            max_concurrency: Aynı anda çalışan analiz adımı sayısı (1 = sıralı) /
+                             Analysis steps running at the same time (1 = sequential)
+            rate_limiter: Hız sınırlayıcı (None = süreç geneli "openai" + model) /
+                          Rate limiter (None = process-wide "openai" + model)
+            vector_cache: FAISS indeks disk önbelleği (None = kapalı) /
+                          On-disk FAISS index cache (None = disabled)
+            embedding_cache: İhaleler arası chunk embedding önbelleği (None = kapalı) /
+                             Chunk embedding cache shared across tenders (None = disabled)
+            embedding_concurrency: Aynı anda gönderilen embedding partisi (1 = sıralı) /
+                                   Embedding batches in flight at the same time (1 = sequential)
+            embedding_batch_tokens: Embedding partisi başına token üst sınırı /
+                                    Token ceiling per embedding batch
         """
         self.api_key = openai_api_key
         self.model = model
@@ -132,6 +175,11 @@ class IhaleAnalizAI:
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         self.top_k = top_k
+        self.max_concurrency = max(1, max_concurrency)
+        self._rate_limiter = rate_limiter or get_rate_limiter("openai", model)
+        self._vector_cache = vector_cache
+        self.embedding_concurrency = max(1, embedding_concurrency)
+        self.embedding_batch_tokens = embedding_batch_tokens
 
         # Token takibi / Token tracking
         self._total_input_tokens: int = 0
@@ -145,23 +193,28 @@ class IhaleAnalizAI:
             max_tokens=4096,
         )
         self._embeddings = OpenAIEmbeddings(api_key=openai_api_key)
+        if embedding_cache is not None:
+            self._embeddings = CachedEmbeddings(
+                self._embeddings, embedding_cache, model=str(getattr(self._embeddings, "model", ""))
+            )
 
         # Metin bölücü — ihale şartname yapısına uygun separator'lar
         # Text splitter — separators suited for tender specification structure
+        self._separators = [
+            "\nMadde ",
+            "\nMADDE ",
+            "\nBÖLÜM ",
+            "\nBölüm ",
+            "\nEK-",
+            "\nEk ",
+            "\n\n",
+            "\n",
+            " ",
+        ]
         self._splitter = RecursiveCharacterTextSplitter(
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
-            separators=[
-                "\nMadde ",
-                "\nMADDE ",
-                "\nBÖLÜM ",
-                "\nBölüm ",
-                "\nEK-",
-                "\nEk ",
-                "\n\n",
-                "\n",
-                " ",
-            ],
+            separators=self._separators,
         )
 
         # tiktoken encoder (token sayımı için)
@@ -172,20 +225,33 @@ class IhaleAnalizAI:
 
         logger.info(
             f"IhaleAnalizAI başlatıldı / initialized: model={model}, "
-            f"chunk_size={chunk_size}, top_k={top_k}"
+            f"chunk_size={chunk_size}, top_k={top_k}, max_concurrency={self.max_concurrency}"
         )
 
     # ----------------------------------------------------------
     # Vektör Store Oluşturma / Vector Store Creation
     # ----------------------------------------------------------
 
-    def create_vector_store(self, text: str) -> FAISS:
+    def create_vector_store(self, text: str | ParsedDocument) -> FAISS:
         """
         Metni chunk'la ve in-memory FAISS vektör DB oluştur.
         Chunk text and create in-memory FAISS vector store.
 
+        ParsedDocument verilirse düşük bilgili sayfalar (kapak, imza, boş
+        sayfa) atlanır.
+        Given a ParsedDocument, low-information pages (cover, signature,
+        blank pages) are skipped.
+
+        vector_cache verilmişse aynı metin + chunk'lama + embedding modeli
+        için daha önce oluşturulan indeks diskten yüklenir, embedding
+        isteği yapılmaz.
+        With a vector_cache, the index built earlier for the same text +
+        chunker + embedding model is loaded from disk and no embedding
+        request is made.
+
         Args:
-            text: Doküman metni / Document text
+            text: Doküman metni veya ayrıştırılmış doküman /
+                  Document text or parsed document
 
         Returns:
             FAISS vektör store / FAISS vector store
@@ -193,17 +259,51 @@ class IhaleAnalizAI:
         Raises:
             ValueError: Metin boş olduğunda / When text is empty
         """
+        if isinstance(text, ParsedDocument):
+            document = text
+            text = document.indexable_text()
+            if not text.strip():
+                # Tüm sayfalar düşük bilgili — hiç yoktan iyidir
+                # Every page is low-information — better than nothing
+                text = document.full_text
+            elif document.metadata.low_info_pages:
+                logger.info(
+                    f"{len(document.metadata.low_info_pages)} düşük bilgili sayfa atlandı / "
+                    f"low-information pages skipped: {document.metadata.low_info_chars} karakter"
+                )
         if not text or not text.strip():
             raise ValueError("Vektör store için metin boş olamaz / Text cannot be empty for vector store")
 
+        cache_key = None
+        if self._vector_cache is not None:
+            cache_key = self._vector_cache.make_key(
+                hashlib.sha256(text.encode("utf-8")).hexdigest(),
+                embedding_model=str(getattr(self._embeddings, "model", "")),
+                chunker={
+                    "chunk_size": self.chunk_size,
+                    "chunk_overlap": self.chunk_overlap,
+                    "separators": self._separators,
+                },
+            )
+            cached = self._vector_cache.get(cache_key, self._embeddings)
+            if cached is not None:
+                return cached
+
         logger.info("Metin chunk'lanıyor / Chunking text...")
         chunks = self._splitter.split_text(text)
         logger.info(f"{len(chunks)} chunk oluşturuldu / chunks created")
 
         logger.info("FAISS vektör store oluşturuluyor / Creating FAISS vector store...")
-        vector_store = FAISS.from_texts(texts=chunks, embedding=self._embeddings)
+        vector_store = EmbeddingStage(
+            self._embeddings,
+            count_tokens=self._count_tokens,
+            max_batch_tokens=self.embedding_batch_tokens,
+            max_concurrency=self.embedding_concurrency,
+        ).build(chunks)
         logger.info("Vektör store hazır / Vector store ready")
 
+        if cache_key is not None:
+            self._vector_cache.put(cache_key, vector_store)
         return vector_store
 
     # ----------------------------------------------------------
@@ -218,7 +318,7 @@ class IhaleAnalizAI:
             f"Yeniden deneniyor / Retrying: attempt {retry_state.attempt_number}"
         ),
     )
-    def _query_with_prompt(
+    async def _query_with_prompt(
         self,
         vector_store: FAISS,
         prompt_template: str,
@@ -229,6 +329,14 @@ class IhaleAnalizAI:
         RAG sorgusu yap — ilgili chunk'ları bul + LLM'e gönder.
         Perform RAG query — find relevant chunks + send to LLM.
 
+        Arama ve LLM çağrısı asenkrondur (asimilarity_search / ainvoke);
+        bekleme sırasında diğer analiz adımları çalışır.
+        Retrieval and the LLM call are async (asimilarity_search / ainvoke);
+        other analysis steps run while this one waits.
+
+        LLM çağrısı süreç geneli hız sınırlayıcıdan geçer (bkz. rate_limiter).
+        The LLM call goes through the process-wide rate limiter (see rate_limiter).
+
         Args:
             vector_store: FAISS vektör store
             prompt_template: Prompt şablonu / Prompt template
@@ -239,7 +347,7 @@ class IhaleAnalizAI:
             LLM yanıtı (raw string) / LLM response (raw string)
         """
         # En alakalı chunk'ları çek / Retrieve most relevant chunks
-        docs = vector_store.similarity_search(query, k=self.top_k)
+        docs = await vector_store.asimilarity_search(query, k=self.top_k)
         context = "\n\n---\n\n".join(doc.page_content for doc in docs)
 
         # Prompt'u doldur / Fill prompt template
@@ -260,10 +368,19 @@ class IhaleAnalizAI:
             {"role": "system", "content": SYSTEM_ROLE},
             {"role": "user", "content": filled_prompt},
         ]
-        response = self._llm.invoke(messages)
+        try:
+            async with self._rate_limiter.acquire_async(input_tokens):
+                response = await self._llm.ainvoke(messages)
+        except Exception as e:
+            # Kota aşıldıysa tüm çağıranlar kuyrukta bekler; yeniden deneme tenacity'de
+            # On quota errors every caller waits in the queue; tenacity retries
+            if is_rate_limit_error(e):
+                self._rate_limiter.throttle(_RATE_LIMIT_BACKOFF_SECONDS)
+            raise
 
         # Token takibi / Track tokens
         output_tokens = self._count_tokens(response.content)
+        self._rate_limiter.consume_tokens(output_tokens)
         self._total_input_tokens += input_tokens
         self._total_output_tokens += output_tokens
         logger.info(f"LLM yanıtı alındı / Response received: ~{output_tokens} output tokens")
@@ -336,10 +453,16 @@ class IhaleAnalizAI:
 
         Adımlar / Steps:
             1. Vektör store oluştur / Create vector store
-            2. 6 analizi sırayla çalıştır / Run 6 analyses sequentially
+            2. 5 bağımsız analizi eşzamanlı, ardından yönetici özetini çalıştır /
+               Run the 5 independent analyses concurrently, then the executive summary
             3. Risk skoru hesapla / Calculate risk score
             4. Sonuçları birleştir / Combine results
 
+        Her adım kendi hatasını yakalar; başarısız adım ``{"error": ...}``
+        döner, diğerleri etkilenmez.
+        Every step catches its own errors; a failed step returns
+        ``{"error": ...}`` and the others are unaffected.
+
         Args:
             parsed_document: PDF parser'dan gelen doküman / Document from PDF parser
 
@@ -360,35 +483,30 @@ class IhaleAnalizAI:
             logger.warning("Doküman metni boş / Document text is empty")
             return AnalysisResult(analyzed_at=datetime.now())
 
-        vector_store = self.create_vector_store(text)
-
-        # 2. Analizleri sırayla çalıştır (rate limit'e dikkat)
-        # Run analyses sequentially (respecting rate limits)
-        logger.info("1/6 Risk analizi başlıyor / Risk analysis starting...")
-        risk_result = await self.risk_analysis(vector_store)
+        vector_store = self.create_vector_store(parsed_document)
 
-        logger.info("2/6 Gerekli belgeler analizi / Required documents analysis...")
-        docs_result = await self.required_documents(vector_store)
-
-        logger.info("3/6 Ceza maddeleri analizi / Penalty clauses analysis...")
-        penalty_result = await self.penalty_clauses(vector_store)
-
-        logger.info("4/6 Mali özet analizi / Financial summary analysis...")
-        financial_result = await self.financial_summary(vector_store)
-
-        logger.info("5/6 Süre analizi / Timeline analysis...")
-        timeline_result = await self.timeline_analysis(vector_store)
+        # 2. Bağımsız beş analizi eşzamanlı çalıştır (en fazla max_concurrency)
+        # Run the five independent analyses concurrently (at most max_concurrency)
+        steps = {
+            "risk_analysis": self.risk_analysis,
+            "required_documents": self.required_documents,
+            "penalty_clauses": self.penalty_clauses,
+            "financial_summary": self.financial_summary,
+            "timeline_analysis": self.timeline_analysis,
+        }
+        logger.info(
+            f"1-5/6 Analizler eşzamanlı başlıyor / Analyses starting concurrently "
+            f"(max_concurrency={self.max_concurrency})..."
+        )
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        results = await asyncio.gather(
+            *(self._run_step(semaphore, name, step, vector_store) for name, step in steps.items())
+        )
+        all_results = dict(zip(steps, results))
 
         # 6. Yönetici özeti — diğer tüm sonuçları bağlam olarak alır
         # Executive summary — uses all other results as context
         logger.info("6/6 Yönetici özeti / Executive summary...")
-        all_results = {
-            "risk_analysis": risk_result,
-            "required_documents": docs_result,
-            "penalty_clauses": penalty_result,
-            "financial_summary": financial_result,
-            "timeline_analysis": timeline_result,
-        }
         executive_result = await self.executive_summary(vector_store, all_results)
 
         # 3. Risk skoru hesapla / Calculate risk score
@@ -404,11 +522,7 @@ class IhaleAnalizAI:
         )
 
         result = AnalysisResult(
-            risk_analysis=risk_result,
-            required_documents=docs_result,
-            penalty_clauses=penalty_result,
-            financial_summary=financial_result,
-            timeline_analysis=timeline_result,
+            **all_results,
             executive_summary=executive_result,
             risk_score=risk_score,
             risk_level=risk_level,
@@ -428,6 +542,35 @@ class IhaleAnalizAI:
 
         return result
 
+    async def _run_step(
+        self,
+        semaphore: asyncio.Semaphore,
+        name: str,
+        step: Callable[[FAISS], Awaitable[dict]],
+        vector_store: FAISS,
+    ) -> dict:
+        """
+        Analiz adımını eşzamanlılık sınırı içinde çalıştır.
+        Run an analysis step within the concurrency limit.
+
+        Args:
+            semaphore: Eşzamanlılık sınırı / Concurrency limit
+            name: Adım adı / Step name
+            step: Analiz metodu / Analysis method
+            vector_store: FAISS vektör store
+
+        Returns:
+            Adım sonucu / Step result
+        """
+        async with semaphore:
+            step_start = time.time()
+            result = await step(vector_store)
+            logger.info(
+                f"{name} tamamlandı / completed: {time.time() - step_start:.1f}s"
+                + (" (hata / error)" if "error" in result else "")
+            )
+            return result
+
     # ----------------------------------------------------------
     # Bireysel Analiz Metodları / Individual Analysis Methods
     # ----------------------------------------------------------
@@ -445,7 +588,7 @@ class IhaleAnalizAI:
         try:
             prompt = get_prompt("risk_analysis")
             query = get_query("risk_analysis")
-            response = self._query_with_prompt(vector_store, prompt, query)
+            response = await self._query_with_prompt(vector_store, prompt, query)
             return self._parse_json_response(response)
         except Exception as e:
             logger.error(f"Risk analizi hatası / Risk analysis error: {e}", exc_info=True)
@@ -464,7 +607,7 @@ class IhaleAnalizAI:
         try:
             prompt = get_prompt("required_documents")
             query = get_query("required_documents")
-            response = self._query_with_prompt(vector_store, prompt, query)
+            response = await self._query_with_prompt(vector_store, prompt, query)
             return self._parse_json_response(response)
         except Exception as e:
             logger.error(f"Belge analizi hatası / Document analysis error: {e}", exc_info=True)
@@ -483,7 +626,7 @@ class IhaleAnalizAI:
         try:
             prompt = get_prompt("penalty_clauses")
             query = get_query("penalty_clauses")
-            response = self._query_with_prompt(vector_store, prompt, query)
+            response = await self._query_with_prompt(vector_store, prompt, query)
             return self._parse_json_response(response)
         except Exception as e:
             logger.error(f"Ceza analizi hatası / Penalty analysis error: {e}", exc_info=True)
@@ -502,7 +645,7 @@ class IhaleAnalizAI:
         try:
             prompt = get_prompt("financial_summary")
             query = get_query("financial_summary")
-            response = self._query_with_prompt(vector_store, prompt, query)
+            response = await self._query_with_prompt(vector_store, prompt, query)
             return self._parse_json_response(response)
         except Exception as e:
             logger.error(f"Mali analiz hatası / Financial analysis error: {e}", exc_info=True)
@@ -521,7 +664,7 @@ class IhaleAnalizAI:
         try:
             prompt = get_prompt("timeline_analysis")
             query = get_query("timeline_analysis")
-            response = self._query_with_prompt(vector_store, prompt, query)
+            response = await self._query_with_prompt(vector_store, prompt, query)
             return self._parse_json_response(response)
         except Exception as e:
             logger.error(f"Süre analizi hatası / Timeline analysis error: {e}", exc_info=True)
@@ -551,7 +694,7 @@ class IhaleAnalizAI:
             if len(results_text) > max_results_len:
                 results_text = results_text[:max_results_len] + "\n... (kısaltıldı / truncated)"
 
-            response = self._query_with_prompt(
+            response = await self._query_with_prompt(
                 vector_store, prompt, query, extra_context=results_text
             )
             return self._parse_json_response(response)
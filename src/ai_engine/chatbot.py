@@ -6,15 +6,26 @@ Yeni google-genai SDK kullanır. Fallback: demo yanıtlar.
 """
 
 import logging
-import time
 
 from google import genai
 from google.genai import types
 
+from src.ai_engine.rate_limiter import (
+    LLMRateLimiter,
+    estimate_tokens,
+    get_rate_limiter,
+    is_rate_limit_error,
+)
 from src.utils.demo_data import DEMO_CHAT_RESPONSES
 
 logger = logging.getLogger(__name__)
 
+_MODEL = "gemini-2.0-flash"
+
+# 429 sonrası paylaşılan kuyruğun bekleme süresi (sn), deneme sayısıyla artar
+# Shared queue wait after a 429 (seconds), grows with the attempt number
+_RATE_LIMIT_BACKOFF_SECONDS: float = 30.0
+
 _SYSTEM_PROMPT = """Sen Türkiye kamu ihale mevzuatında (4734 ve 4735 sayılı kanunlar) uzman bir ihale danışmanısın.
 Sana verilen ihale şartnamesi dokümanına dayanarak soruları yanıtlıyorsun.
 
@@ -41,11 +52,18 @@ SUGGESTED_QUESTIONS: list[str] = [
 class IhaleChatbot:
     """İhale şartnamesine soru-cevap chatbot."""
 
-    def __init__(self, gemini_api_key: str = "", openai_api_key: str = "") -> None:
+    def __init__(
+        self,
+        gemini_api_key: str = "",
+        openai_api_key: str = "",
+        rate_limiter: LLMRateLimiter | None = None,
+    ) -> None:
         """Init — google-genai SDK veya demo mod."""
         self._context: str = ""
         self._use_ai = False
         self._client = None
+        # Süreç geneli paylaşılan sınırlayıcı / Process-wide shared limiter
+        self._rate_limiter = rate_limiter or get_rate_limiter("gemini", _MODEL)
 
         if gemini_api_key and len(gemini_api_key) > 5:
             try:
@@ -86,26 +104,28 @@ class IhaleChatbot:
                 prompt += f"ÖNCEKİ KONUŞMA:\n{history_text}\n\n"
             prompt += f"KULLANICI SORUSU: {question}\n\nYANIT:"
 
-            # Retry logic for rate limits
+            # Rate limit: sınırlayıcı kuyruğunda bekle, 429'da kuyruğu durdurup tekrar dene
+            # Rate limit: wait in the limiter queue, on 429 pause the queue and retry
             max_retries = 2
             for attempt in range(max_retries + 1):
                 try:
-                    response = self._client.models.generate_content(
-                        model="gemini-2.0-flash",
-                        contents=prompt,
-                        config=types.GenerateContentConfig(
-                            temperature=0.2,
-                            max_output_tokens=1024,
-                        ),
-                    )
-                    return response.text or "Yanıt alınamadı."
+                    with self._rate_limiter.acquire(estimate_tokens(prompt)):
+                        response = self._client.models.generate_content(
+                            model=_MODEL,
+                            contents=prompt,
+                            config=types.GenerateContentConfig(
+                                temperature=0.2,
+                                max_output_tokens=1024,
+                            ),
+                        )
+                    answer = response.text or ""
+                    self._rate_limiter.consume_tokens(estimate_tokens(answer))
+                    return answer or "Yanıt alınamadı."
                 except Exception as e:
-                    err_str = str(e)
-                    if "429" in err_str or "RESOURCE_EXHAUSTED" in err_str:
+                    if is_rate_limit_error(e):
                         if attempt < max_retries:
-                            wait = 30 * (attempt + 1)
-                            logger.warning(f"Gemini rate limit, {wait}s bekleniyor... (deneme {attempt + 1})")
-                            time.sleep(wait)
+                            logger.warning(f"Gemini rate limit, kuyrukta bekleniyor... (deneme {attempt + 1})")
+                            self._rate_limiter.throttle(_RATE_LIMIT_BACKOFF_SECONDS * (attempt + 1))
                             continue
                         else:
                             logger.warning("Gemini rate limit aşıldı, demo yanıt kullanılıyor")
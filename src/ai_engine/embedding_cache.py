@@ -0,0 +1,295 @@
+"""
+TenderAI Embedding Önbelleği / Embedding Cache.
+
+Chunk embedding'lerini ihaleler arasında paylaşılan yerel bir SQLite
+veritabanında saklar. KİK standart şartname maddeleri, 4734/4735 mevzuat
+metinleri ve ceza hükümleri pek çok ihalede aynen geçtiği için yeni bir
+ihalenin chunk'larının çoğu önceden embed edilmiştir.
+Anahtar: normalize edilmiş chunk metninin SHA-256 özeti + embedding modeli.
+Vektörler float32 blob olarak saklanır.
+
+Stores chunk embeddings in a local SQLite database shared across tenders.
+KİK standard clauses, 4734/4735 legal text and penalty wording recur
+verbatim across tenders, so most chunks of a new tender have been embedded
+before.
+Key: SHA-256 of the normalized chunk text + the embedding model.
+Vectors are stored as float32 blobs.
+"""
+
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+# Normalizasyon: ardışık boşluklar tek boşluk / Normalization: whitespace runs collapse
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# SQLite tek sorguda en fazla bu kadar parametre / Max parameters per SQLite query
+_MAX_QUERY_PARAMS: int = 500
+
+_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    key TEXT PRIMARY KEY,
+    vector BLOB NOT NULL,
+    last_used REAL NOT NULL
+)
+"""
+
+
+def normalize_chunk(text: str) -> str:
+    """
+    Anahtar için chunk metnini normalize et (NFC, boşluklar).
+    Normalize chunk text for the key (NFC, whitespace).
+
+    Args:
+        text: Chunk metni / Chunk text
+
+    Returns:
+        Normalize metin / Normalized text
+    """
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+class EmbeddingCache:
+    """
+    SQLite tabanlı, boyut sınırlı embedding önbelleği.
+    SQLite-backed, size-bounded embedding cache.
+
+    Bağlantı iş parçacıkları arasında paylaşılır (kilitli); WAL kipi
+    sayesinde aynı dosyayı kullanan süreçler birbirini engellemez.
+    Boyut sınırı aşıldığında en uzun süredir kullanılmayan vektörler
+    silinir (LRU).
+
+    The connection is shared across threads (locked); WAL mode keeps
+    processes using the same file from blocking each other. When the size
+    limit is exceeded, the least recently used vectors are evicted (LRU).
+    """
+
+    def __init__(self, db_path: str | Path, max_size_mb: float = 1000.0) -> None:
+        """
+        EmbeddingCache başlat / Initialize EmbeddingCache.
+
+        Args:
+            db_path: SQLite dosyası / SQLite file
+            max_size_mb: Vektörlerin toplam boyut sınırı (MB) / Total vector size limit (MB)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+        logger.info(f"EmbeddingCache başlatıldı / initialized: {self.db_path} ({max_size_mb} MB)")
+
+    # ----------------------------------------------------------
+    # Anahtar / Key
+    # ----------------------------------------------------------
+
+    @staticmethod
+    def make_key(text: str, model: str, kind: str = "document") -> str:
+        """
+        Önbellek anahtarı oluştur / Build a cache key.
+
+        Args:
+            text: Chunk veya sorgu metni / Chunk or query text
+            model: Embedding modeli / Embedding model
+            kind: "document" veya "query" / "document" or "query"
+
+        Returns:
+            Önbellek anahtarı / Cache key
+        """
+        payload = f"{model}\0{kind}\0{normalize_chunk(text)}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    # ----------------------------------------------------------
+    # Okuma / Yazma — Read / Write
+    # ----------------------------------------------------------
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        """
+        Önbellekteki vektörleri oku / Read cached vectors.
+
+        Args:
+            keys: Önbellek anahtarları / Cache keys
+
+        Returns:
+            Anahtar → vektör (yalnızca isabetler; veritabanı hatasında o ana
+            kadar bulunanlar) / Key → vector (hits only; on a database error,
+            the hits found so far)
+        """
+        found: dict[str, list[float]] = {}
+        unique = list(dict.fromkeys(keys))
+        try:
+            with self._lock:
+                for start in range(0, len(unique), _MAX_QUERY_PARAMS):
+                    batch = unique[start:start + _MAX_QUERY_PARAMS]
+                    placeholders = ",".join("?" * len(batch))
+                    rows = self._conn.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", batch
+                    ).fetchall()
+                    for key, blob in rows:
+                        found[key] = np.frombuffer(blob, dtype=np.float32).tolist()
+
+                # LRU: erişim zamanını güncelle / Refresh access time
+                if found:
+                    now = time.time()
+                    self._conn.executemany(
+                        "UPDATE embeddings SET last_used = ? WHERE key = ?",
+                        [(now, key) for key in found],
+                    )
+                    self._conn.commit()
+        except sqlite3.Error as e:
+            # Kilitli/bozuk veritabanı analizi durdurmaz; eksikler embed edilir
+            # A locked/corrupt database does not stop the analysis; misses get embedded
+            logger.warning(f"Embedding önbelleği okunamadı / Could not read embedding cache: {e}")
+        return found
+
+    def put_many(self, items: dict[str, list[float]]) -> None:
+        """
+        Vektörleri yaz ve gerekirse eski kayıtları sil.
+        Write vectors and evict old entries if needed.
+
+        Args:
+            items: Anahtar → vektör / Key → vector
+        """
+        if not items:
+            return
+        now = time.time()
+        rows = [
+            (key, np.asarray(vector, dtype=np.float32).tobytes(), now)
+            for key, vector in items.items()
+        ]
+        try:
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector, last_used) VALUES (?, ?, ?)", rows
+                )
+                self._conn.commit()
+                self._evict()
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding önbelleğine yazılamadı / Could not write embedding cache: {e}")
+
+    def clear(self) -> int:
+        """
+        Tüm kayıtları sil / Remove all entries.
+
+        Returns:
+            Silinen kayıt sayısı / Number of removed entries
+        """
+        with self._lock:
+            removed = self._conn.execute("DELETE FROM embeddings").rowcount
+            self._conn.commit()
+        return removed
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    # ----------------------------------------------------------
+    # Dahili / Internal
+    # ----------------------------------------------------------
+
+    def _evict(self) -> None:
+        """
+        Boyut sınırı aşılmışsa en eski vektörleri sil (kilit alınmış olmalı).
+        Evict the oldest vectors while over the size limit (lock must be held).
+        """
+        total, count = self._conn.execute(
+            "SELECT COALESCE(SUM(LENGTH(vector)), 0), COUNT(*) FROM embeddings"
+        ).fetchone()
+        if total <= self.max_size_bytes or not count:
+            return
+
+        # Vektör boyutları aynı model için sabittir / Vector size is fixed per model
+        excess = int((total - self.max_size_bytes) / (total / count)) + 1
+        self._conn.execute(
+            "DELETE FROM embeddings WHERE key IN "
+            "(SELECT key FROM embeddings ORDER BY last_used LIMIT ?)",
+            (excess,),
+        )
+        self._conn.commit()
+        logger.info(f"{excess} embedding silindi (LRU) / embeddings evicted")
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Embedding isteğinden önce EmbeddingCache'e bakan sarmalayıcı.
+    Wrapper that consults EmbeddingCache before any embedding request.
+
+    Yalnızca önbellekte olmayan (ve belge içinde tekrarlanmayan) metinler
+    alttaki modele gönderilir.
+    Only texts missing from the cache (deduplicated within the call) are
+    sent to the underlying model.
+    """
+
+    def __init__(self, embeddings: Embeddings, cache: EmbeddingCache, model: str) -> None:
+        """
+        CachedEmbeddings başlat / Initialize CachedEmbeddings.
+
+        Args:
+            embeddings: Asıl embedding modeli / Underlying embedding model
+            cache: Embedding önbelleği / Embedding cache
+            model: Anahtardaki model adı / Model name used in the key
+        """
+        self.embeddings = embeddings
+        self.cache = cache
+        self.model = model
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """
+        Chunk'ları embed et, isabetleri önbellekten al.
+        Embed chunks, serving hits from the cache.
+
+        Args:
+            texts: Chunk metinleri / Chunk texts
+
+        Returns:
+            Vektörler (texts sırasıyla) / Vectors (in texts order)
+        """
+        keys = [self.cache.make_key(text, self.model) for text in texts]
+        vectors = self.cache.get_many(keys)
+
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in vectors:
+                missing.setdefault(key, text)
+
+        logger.info(
+            f"Embedding önbelleği / Embedding cache: {len(texts) - len(missing)}/{len(texts)} isabet / hits"
+        )
+        if missing:
+            new_vectors = dict(zip(missing, self.embeddings.embed_documents(list(missing.values()))))
+            self.cache.put_many(new_vectors)
+            vectors.update(new_vectors)
+
+        return [vectors[key] for key in keys]
+
+    def embed_query(self, text: str) -> list[float]:
+        """
+        Sorguyu embed et (analiz sorguları sabittir, önbelleğe alınır).
+        Embed a query (analysis queries are fixed, so they are cached).
+
+        Args:
+            text: Sorgu metni / Query text
+
+        Returns:
+            Vektör / Vector
+        """
+        key = self.cache.make_key(text, self.model, kind="query")
+        cached = self.cache.get_many([key])
+        if key in cached:
+            return cached[key]
+        vector = self.embeddings.embed_query(text)
+        self.cache.put_many({key: vector})
+        return vector
@@ -0,0 +1,256 @@
+"""
+TenderAI Embedding Aşaması / Embedding Stage.
+
+Chunk'ları token sayısına göre boyutlanan partilere böler, partileri
+sınırlı sayıda eşzamanlı istekle embed eder ve FAISS indeksini partiler
+geldikçe (chunk sırasıyla) artımlı olarak kurar. Hata veren parti yalnız
+başına yeniden denenir; diğer partilerin sonuçları korunur.
+
+Splits chunks into batches sized by token count, embeds the batches with a
+bounded number of concurrent requests and builds the FAISS index
+incrementally as batches arrive (in chunk order). A failing batch is
+retried on its own; the results of the other batches are kept.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+
+from langchain_community.vectorstores import FAISS
+from langchain_core.embeddings import Embeddings
+
+from src.ai_engine.rate_limiter import estimate_tokens, is_rate_limit_error
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# Varsayılanlar / Defaults
+# ============================================================
+
+# Parti başına token üst sınırı / Token ceiling per batch
+_MAX_BATCH_TOKENS: int = 20_000
+
+# Parti başına chunk üst sınırı (OpenAI istek sınırının altında)
+# Chunk ceiling per batch (below the OpenAI per-request limit)
+_MAX_BATCH_SIZE: int = 256
+
+# Aynı anda gönderilen parti sayısı / Batches in flight at the same time
+_MAX_CONCURRENCY: int = 4
+
+# Parti başına deneme sayısı / Attempts per batch
+_MAX_ATTEMPTS: int = 4
+
+# Yeniden deneme bekleme tabanı (sn, üstel) / Retry backoff base (seconds, exponential)
+_RETRY_BASE_SECONDS: float = 2.0
+
+# 429 sonrası bekleme çarpanı / Backoff multiplier after a 429
+_RATE_LIMIT_BACKOFF_FACTOR: float = 5.0
+
+
+@dataclass
+class EmbeddingStats:
+    """
+    Son build() çağrısının istatistikleri / Statistics of the last build() call.
+
+    Attributes:
+        chunks: Embed edilen chunk sayısı / Chunks embedded
+        batches: Parti sayısı / Number of batches
+        retried_batches: En az bir kez yeniden denenen parti / Batches retried at least once
+        failed_attempts: Başarısız istek sayısı / Failed requests
+        seconds: Toplam süre / Total wall time
+    """
+
+    chunks: int = 0
+    batches: int = 0
+    retried_batches: int = 0
+    failed_attempts: int = 0
+    seconds: float = 0.0
+
+
+def plan_batches(token_counts: list[int], max_tokens: int, max_size: int) -> list[tuple[int, int]]:
+    """
+    Chunk'ları token bütçesine göre ardışık partilere böl.
+    Split chunks into consecutive batches by token budget.
+
+    Tek başına bütçeyi aşan chunk kendi partisini oluşturur.
+    A chunk over the budget on its own gets a batch of its own.
+
+    Args:
+        token_counts: Chunk başına token / Tokens per chunk
+        max_tokens: Parti başına token üst sınırı / Token ceiling per batch
+        max_size: Parti başına chunk üst sınırı / Chunk ceiling per batch
+
+    Returns:
+        (başlangıç, bitiş) aralıkları / (start, end) ranges
+    """
+    batches: list[tuple[int, int]] = []
+    start = 0
+    tokens = 0
+    for index, count in enumerate(token_counts):
+        if index > start and (tokens + count > max_tokens or index - start >= max_size):
+            batches.append((start, index))
+            start, tokens = index, 0
+        tokens += count
+    if start < len(token_counts):
+        batches.append((start, len(token_counts)))
+    return batches
+
+
+class EmbeddingStage:
+    """
+    Token bütçeli, eşzamanlı ve hataya dayanıklı FAISS indeks kurucu.
+    Token-budgeted, concurrent, failure-tolerant FAISS index builder.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        count_tokens: Callable[[str], int] = estimate_tokens,
+        max_batch_tokens: int = _MAX_BATCH_TOKENS,
+        max_batch_size: int = _MAX_BATCH_SIZE,
+        max_concurrency: int = _MAX_CONCURRENCY,
+        max_attempts: int = _MAX_ATTEMPTS,
+        retry_base_seconds: float = _RETRY_BASE_SECONDS,
+    ) -> None:
+        """
+        EmbeddingStage başlat / Initialize EmbeddingStage.
+
+        Args:
+            embeddings: Embedding modeli (önbellekli olabilir) / Embedding model (may be cached)
+            count_tokens: Token sayacı / Token counter
+            max_batch_tokens: Parti başına token üst sınırı / Token ceiling per batch
+            max_batch_size: Parti başına chunk üst sınırı / Chunk ceiling per batch
+            max_concurrency: Aynı anda gönderilen parti (1 = sıralı) /
+                             Batches in flight at the same time (1 = sequential)
+            max_attempts: Parti başına deneme sayısı / Attempts per batch
+            retry_base_seconds: Yeniden deneme bekleme tabanı / Retry backoff base
+        """
+        self.embeddings = embeddings
+        self.count_tokens = count_tokens
+        self.max_batch_tokens = max(1, max_batch_tokens)
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_attempts = max(1, max_attempts)
+        self.retry_base_seconds = retry_base_seconds
+        self.stats = EmbeddingStats()
+        self._stats_lock = threading.Lock()
+
+    # ----------------------------------------------------------
+    # İndeks Kurma / Index Building
+    # ----------------------------------------------------------
+
+    def build(self, texts: list[str]) -> FAISS:
+        """
+        Chunk'ları embed et ve FAISS indeksini artımlı kur.
+        Embed chunks and build the FAISS index incrementally.
+
+        Partiler tamamlandıkça, önündeki tüm partiler eklenmişse indekse
+        eklenir; böylece indeks sırası chunk sırasıyla aynıdır.
+        Batches are added to the index as they complete, once every batch
+        before them is in; the index order therefore matches chunk order.
+
+        Args:
+            texts: Chunk metinleri / Chunk texts
+
+        Returns:
+            FAISS vektör store / FAISS vector store
+
+        Raises:
+            ValueError: Chunk yoksa / When there are no chunks
+            RuntimeError: Bir parti tüm denemelerde başarısız olursa /
+                          When a batch fails on every attempt
+        """
+        if not texts:
+            raise ValueError("Embed edilecek chunk yok / No chunks to embed")
+
+        start_time = time.perf_counter()
+        batches = plan_batches(
+            [self.count_tokens(text) for text in texts], self.max_batch_tokens, self.max_batch_size
+        )
+        self.stats = EmbeddingStats(chunks=len(texts), batches=len(batches))
+        logger.info(
+            f"{len(texts)} chunk, {len(batches)} parti / batches "
+            f"(eşzamanlı / concurrent: {self.max_concurrency})"
+        )
+
+        vector_store: FAISS | None = None
+        done: dict[int, list[list[float]]] = {}
+        next_batch = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            futures: dict[Future, int] = {
+                executor.submit(self._embed_batch, index, texts[start:end]): index
+                for index, (start, end) in enumerate(batches)
+            }
+            pending = set(futures)
+            try:
+                while pending:
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        done[futures[future]] = future.result()
+
+                    # Sıradaki ardışık partileri indekse ekle / Append the next consecutive batches
+                    while next_batch in done:
+                        start, end = batches[next_batch]
+                        pairs = list(zip(texts[start:end], done.pop(next_batch)))
+                        if vector_store is None:
+                            vector_store = FAISS.from_embeddings(pairs, self.embeddings)
+                        else:
+                            vector_store.add_embeddings(pairs)
+                        next_batch += 1
+            except Exception:
+                for future in pending:
+                    future.cancel()
+                raise
+
+        self.stats.seconds = time.perf_counter() - start_time
+        logger.info(
+            f"Embedding tamamlandı / Embedding done: {self.stats.seconds:.1f}s, "
+            f"{self.stats.retried_batches} parti yeniden denendi / batches retried"
+        )
+        return vector_store
+
+    # ----------------------------------------------------------
+    # Dahili / Internal
+    # ----------------------------------------------------------
+
+    def _embed_batch(self, index: int, texts: list[str]) -> list[list[float]]:
+        """
+        Tek partiyi embed et; hata verirse yalnızca bu partiyi yeniden dene.
+        Embed one batch; on failure, retry only this batch.
+
+        Args:
+            index: Parti sırası / Batch index
+            texts: Partinin chunk'ları / Chunks of the batch
+
+        Returns:
+            Vektörler / Vectors
+        """
+        attempt = 1
+        while True:
+            try:
+                vectors = self.embeddings.embed_documents(texts)
+                if len(vectors) != len(texts):
+                    raise ValueError(f"{len(texts)} chunk için {len(vectors)} vektör / vectors for chunks")
+                return vectors
+            except Exception as e:
+                with self._stats_lock:
+                    self.stats.failed_attempts += 1
+                    self.stats.retried_batches += attempt == 1
+                if attempt >= self.max_attempts:
+                    raise RuntimeError(
+                        f"Embedding partisi {index} başarısız / Embedding batch {index} failed: {e}"
+                    ) from e
+                delay = self.retry_base_seconds * 2 ** (attempt - 1)
+                if is_rate_limit_error(e):
+                    delay *= _RATE_LIMIT_BACKOFF_FACTOR
+                attempt += 1
+                logger.warning(
+                    f"Parti {index} yeniden deneniyor / Retrying batch {index}: "
+                    f"attempt {attempt}, {delay:.1f}s ({e})"
+                )
+                time.sleep(delay)
@@ -13,6 +13,12 @@ import time
 from google import genai
 from google.genai import types
 
+from src.ai_engine.rate_limiter import (
+    LLMRateLimiter,
+    estimate_tokens,
+    get_rate_limiter,
+    is_rate_limit_error,
+)
 from src.ai_engine.prompts import (
     RISK_ANALYSIS_PROMPT,
     REQUIRED_DOCUMENTS_PROMPT,
@@ -24,6 +30,10 @@ from src.ai_engine.prompts import (
 
 logger = logging.getLogger(__name__)
 
+# 429 sonrası paylaşılan kuyruğun bekleme süresi (sn), deneme sayısıyla artar
+# Shared queue wait after a 429 (seconds), grows with the attempt number
+_RATE_LIMIT_BACKOFF_SECONDS: float = 30.0
+
 
 class GeminiAnalizAI:
     """
@@ -36,10 +46,13 @@ class GeminiAnalizAI:
         gemini_api_key: str,
         model: str = "gemini-2.0-flash",
         temperature: float = 0.1,
+        rate_limiter: LLMRateLimiter | None = None,
     ) -> None:
         self._client = genai.Client(api_key=gemini_api_key)
         self._model = model
         self._temperature = temperature
+        # Süreç geneli paylaşılan sınırlayıcı / Process-wide shared limiter
+        self._rate_limiter = rate_limiter or get_rate_limiter("gemini", model)
         self._total_tokens = 0
         logger.info(f"GeminiAnalizAI başlatıldı: model={model} (google-genai SDK)")
 
@@ -101,31 +114,31 @@ class GeminiAnalizAI:
                 f"Başka açıklama ekleme."
             )
 
-            # Retry for rate limits
+            # Rate limit: sınırlayıcı kuyruğunda bekle, 429'da kuyruğu durdurup tekrar dene
+            # Rate limit: wait in the limiter queue, on 429 pause the queue and retry
             max_retries = 2
             for attempt in range(max_retries + 1):
                 try:
-                    response = self._client.models.generate_content(
-                        model=self._model,
-                        contents=full_prompt,
-                        config=types.GenerateContentConfig(
-                            temperature=self._temperature,
-                            max_output_tokens=4096,
-                        ),
-                    )
+                    with self._rate_limiter.acquire(estimate_tokens(full_prompt)):
+                        response = self._client.models.generate_content(
+                            model=self._model,
+                            contents=full_prompt,
+                            config=types.GenerateContentConfig(
+                                temperature=self._temperature,
+                                max_output_tokens=4096,
+                            ),
+                        )
 
                     raw = response.text or ""
+                    self._rate_limiter.consume_tokens(estimate_tokens(raw))
                     self._total_tokens += len(raw.split()) * 2
                     return self._parse_json(raw)
 
                 except Exception as e:
-                    err_str = str(e)
-                    if "429" in err_str or "RESOURCE_EXHAUSTED" in err_str:
-                        if attempt < max_retries:
-                            wait = 30 * (attempt + 1)
-                            logger.warning(f"Gemini rate limit ({name}), {wait}s bekleniyor...")
-                            time.sleep(wait)
-                            continue
+                    if is_rate_limit_error(e) and attempt < max_retries:
+                        logger.warning(f"Gemini rate limit ({name}), kuyrukta bekleniyor...")
+                        self._rate_limiter.throttle(_RATE_LIMIT_BACKOFF_SECONDS * (attempt + 1))
+                        continue
                     raise
 
         except Exception as e:
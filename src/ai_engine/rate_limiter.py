@@ -0,0 +1,497 @@
+"""
+TenderAI LLM Hız Sınırlayıcı / LLM Rate Limiter.
+
+Süreç genelinde paylaşılan, sağlayıcı + model başına hız sınırlayıcı.
+IhaleAnalizAI, GeminiAnalizAI ve IhaleChatbot aynı sınırlayıcıyı kullanır;
+böylece tüm Streamlit oturumları sağlayıcı kotasını birlikte paylaşır.
+
+Process-wide rate limiter, one per provider + model. IhaleAnalizAI,
+GeminiAnalizAI and IhaleChatbot share the same limiter, so every Streamlit
+session shares the provider quota.
+
+Her çağrı / Every call:
+    1. İstek/dk ve token/dk kovalarından rezervasyon yapar — kova boşsa
+       sırasını bekler (FIFO) / Reserves from the requests/min and
+       tokens/min buckets — waits its turn (FIFO) when they are empty
+    2. Eşzamanlı çağrı kapısından geçer / Passes the in-flight call gate
+
+Senkron (``acquire``) ve asenkron (``acquire_async``) çağıranlar aynı
+kovaları ve kapıyı paylaşır; kapı iş parçacıkları ve olay döngüleri
+arasında çalışır.
+Sync (``acquire``) and async (``acquire_async``) callers share the same
+buckets and gate; the gate works across threads and event loops.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# Sabitler / Constants
+# ============================================================
+
+# Token tahmini için karakter/token oranı / Chars per token for estimates
+_CHARS_PER_TOKEN: int = 4
+
+# Bu süreden uzun bekleyen çağrılar loglanır (sn)
+# Calls waiting longer than this are logged (seconds)
+_LOG_WAIT_SECONDS: float = 1.0
+
+
+# ============================================================
+# Dataclass Tanımları / Dataclass Definitions
+# ============================================================
+
+
+@dataclass(frozen=True)
+class RateLimits:
+    """
+    Sağlayıcı kota sınırları / Provider quota limits.
+
+    Attributes:
+        requests_per_minute: Dakika başına istek / Requests per minute
+        tokens_per_minute: Dakika başına token / Tokens per minute
+        max_in_flight: Aynı anda süren çağrı sayısı / Calls in flight at the same time
+    """
+
+    requests_per_minute: float
+    tokens_per_minute: float
+    max_in_flight: int
+
+
+@dataclass
+class RateLimitMetrics:
+    """
+    Sınırlayıcı ölçümleri (anlık görüntü) / Limiter metrics (snapshot).
+
+    Attributes:
+        provider: Sağlayıcı / Provider
+        model: Model adı / Model name
+        calls: Tamamlanan çağrı sayısı / Completed calls
+        queue_depth: Şu an kuyrukta bekleyen çağrı / Calls currently waiting in the queue
+        in_flight: Şu an süren çağrı / Calls currently in flight
+        waited_calls: Beklemek zorunda kalan çağrı / Calls that had to wait
+        total_wait_seconds: Toplam bekleme (sn) / Total wait (seconds)
+        max_wait_seconds: En uzun bekleme (sn) / Longest wait (seconds)
+        throttled: Sağlayıcının 429 yanıt sayısı / Provider 429 responses
+    """
+
+    provider: str
+    model: str
+    calls: int = 0
+    queue_depth: int = 0
+    in_flight: int = 0
+    waited_calls: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    throttled: int = 0
+
+    @property
+    def avg_wait_seconds(self) -> float:
+        """Çağrı başına ortalama bekleme (sn) / Average wait per call (seconds)."""
+        return self.total_wait_seconds / self.calls if self.calls else 0.0
+
+
+# ============================================================
+# Token Kovası / Token Bucket
+# ============================================================
+
+
+class TokenBucket:
+    """
+    Rezervasyonlu token kovası / Token bucket with reservations.
+
+    Kova dakikada ``per_minute`` dolar, en fazla bir dakikalık birikir.
+    ``reserve`` miktarı hemen düşer (seviye eksiye inebilir) ve çağıranın
+    beklemesi gereken süreyi döner; sonraki rezervasyonlar açığı devralır,
+    böylece bekleyenler geliş sırasıyla geçer.
+
+    The bucket refills ``per_minute`` per minute and holds at most one
+    minute's worth. ``reserve`` debits the amount at once (the level may go
+    negative) and returns how long the caller must wait; later reservations
+    inherit the deficit, so waiters pass in arrival order.
+    """
+
+    def __init__(self, per_minute: float, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Args:
+            per_minute: Dakikalık kapasite / Capacity per minute
+            clock: Monoton saat (testler için) / Monotonic clock (for tests)
+        """
+        self._rate = per_minute / 60.0
+        self._capacity = float(per_minute)
+        self._level = self._capacity
+        self._clock = clock
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._level = min(self._capacity, self._level + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def reserve(self, amount: float) -> float:
+        """
+        Miktarı rezerve et / Reserve an amount.
+
+        Args:
+            amount: İstek veya token miktarı / Request or token amount
+
+        Returns:
+            Beklenecek süre (sn, 0 = hemen) / Seconds to wait (0 = now)
+        """
+        with self._lock:
+            self._refill()
+            self._level -= amount
+            return max(0.0, -self._level / self._rate)
+
+    def drain(self, seconds: float) -> None:
+        """
+        Kovayı boşalt: sonraki rezervasyonlar en az ``seconds`` bekler.
+        Drain the bucket: later reservations wait at least ``seconds``.
+        """
+        with self._lock:
+            self._refill()
+            self._level = min(self._level, -seconds * self._rate)
+
+
+# ============================================================
+# Eşzamanlı Çağrı Kapısı / In-Flight Gate
+# ============================================================
+
+
+class _Waiter:
+    """Kapıda bekleyen çağıran / Caller waiting at the gate."""
+
+    __slots__ = ("wake", "granted")
+
+    def __init__(self, wake: Callable[[], None]) -> None:
+        self.wake = wake
+        self.granted = False
+
+
+class _InFlightGate:
+    """
+    İş parçacıkları ve olay döngüleri arasında çalışan FIFO semafor.
+    FIFO semaphore working across threads and event loops.
+
+    ``asyncio.Semaphore`` tek bir olay döngüsüne bağlıdır; Streamlit her
+    çalıştırmada yeni döngü açtığından kapı ``threading.Lock`` ile korunur ve
+    asenkron bekleyenler ``call_soon_threadsafe`` ile uyandırılır.
+    ``asyncio.Semaphore`` is bound to a single event loop; since Streamlit
+    opens a new loop per run, the gate is guarded by a ``threading.Lock`` and
+    async waiters are woken with ``call_soon_threadsafe``.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self._limit = max(1, limit)
+        self._active = 0
+        self._waiters: deque[_Waiter] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    def _try_enter(self) -> bool:
+        """Kilit altında: boş yer varsa gir / Under the lock: enter if a slot is free."""
+        if self._active < self._limit and not self._waiters:
+            self._active += 1
+            return True
+        return False
+
+    def acquire(self) -> None:
+        """Yer açılana kadar bekle (senkron) / Wait for a slot (sync)."""
+        with self._lock:
+            if self._try_enter():
+                return
+            event = threading.Event()
+            self._waiters.append(_Waiter(event.set))
+        event.wait()
+
+    async def acquire_async(self) -> None:
+        """Yer açılana kadar bekle (asenkron) / Wait for a slot (async)."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def resolve() -> None:
+            if not future.done():
+                future.set_result(None)
+
+        with self._lock:
+            if self._try_enter():
+                return
+            waiter = _Waiter(lambda: loop.call_soon_threadsafe(resolve))
+            self._waiters.append(waiter)
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Verilen yer kullanılmadan iade edilir / A granted slot is handed back unused
+            with self._lock:
+                granted = waiter.granted
+                if not granted:
+                    self._waiters.remove(waiter)
+            if granted:
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Yeri bırak; sıradaki bekleyene devret / Release the slot; hand it to the next waiter."""
+        with self._lock:
+            if not self._waiters:
+                self._active -= 1
+                return
+            waiter = self._waiters.popleft()
+            waiter.granted = True
+        waiter.wake()
+
+
+# ============================================================
+# LLMRateLimiter Sınıfı / LLMRateLimiter Class
+# ============================================================
+
+
+class LLMRateLimiter:
+    """
+    Sağlayıcı + model için hız sınırlayıcı / Rate limiter for a provider + model.
+
+    Kullanım / Usage::
+
+        limiter = get_rate_limiter("openai", "gpt-4o")
+        async with limiter.acquire_async(input_tokens):
+            response = await llm.ainvoke(messages)
+        limiter.consume_tokens(output_tokens)
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        model: str,
+        limits: RateLimits,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            provider: Sağlayıcı ("openai", "gemini") / Provider
+            model: Model adı / Model name
+            limits: Kota sınırları / Quota limits
+            clock: Monoton saat (testler için) / Monotonic clock (for tests)
+        """
+        self.provider = provider
+        self.model = model
+        self.limits = limits
+        self._clock = clock
+        self._requests = TokenBucket(limits.requests_per_minute, clock)
+        self._tokens = TokenBucket(limits.tokens_per_minute, clock)
+        self._gate = _InFlightGate(limits.max_in_flight)
+        self._lock = threading.Lock()
+        self._metrics = RateLimitMetrics(provider=provider, model=model)
+        self._queued = 0
+
+    # ----------------------------------------------------------
+    # Çağrı Yuvası / Call Slot
+    # ----------------------------------------------------------
+
+    @contextmanager
+    def acquire(self, tokens: int = 0) -> Iterator[None]:
+        """
+        Çağrı yuvası al (senkron) — kota ve kapı için sırada bekler.
+        Acquire a call slot (sync) — waits in the queue for quota and the gate.
+
+        Args:
+            tokens: Tahmini girdi tokenı / Estimated input tokens
+        """
+        start = self._enqueue()
+        try:
+            delay = self._reserve(tokens)
+            if delay > 0:
+                time.sleep(delay)
+            self._gate.acquire()
+        finally:
+            self._dequeue(start)
+        try:
+            yield
+        finally:
+            self._gate.release()
+
+    @asynccontextmanager
+    async def acquire_async(self, tokens: int = 0) -> AsyncIterator[None]:
+        """
+        Çağrı yuvası al (asenkron) — bekleme olay döngüsünü bloklamaz.
+        Acquire a call slot (async) — waiting does not block the event loop.
+
+        Args:
+            tokens: Tahmini girdi tokenı / Estimated input tokens
+        """
+        start = self._enqueue()
+        try:
+            delay = self._reserve(tokens)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await self._gate.acquire_async()
+        finally:
+            self._dequeue(start)
+        try:
+            yield
+        finally:
+            self._gate.release()
+
+    def consume_tokens(self, tokens: int) -> None:
+        """
+        Yanıt tokenlarını kotadan düş (beklemeden) / Debit response tokens (without waiting).
+
+        Args:
+            tokens: Çıktı tokenı / Output tokens
+        """
+        if tokens > 0:
+            self._tokens.reserve(tokens)
+
+    def throttle(self, seconds: float) -> None:
+        """
+        Sağlayıcı 429 döndüğünde çağır: sonraki tüm çağrılar en az
+        ``seconds`` kuyrukta bekler.
+        Call when the provider returns 429: every following call waits in
+        the queue for at least ``seconds``.
+
+        Args:
+            seconds: Bekleme süresi / Wait time
+        """
+        self._requests.drain(seconds)
+        with self._lock:
+            self._metrics.throttled += 1
+        logger.warning(
+            f"{self.provider}/{self.model} hız sınırı — çağrılar {seconds:.0f}sn kuyrukta bekleyecek / "
+            f"rate limited — calls will wait {seconds:.0f}s in the queue"
+        )
+
+    # ----------------------------------------------------------
+    # Ölçümler / Metrics
+    # ----------------------------------------------------------
+
+    def metrics(self) -> RateLimitMetrics:
+        """Ölçümlerin anlık görüntüsü / Snapshot of the metrics."""
+        with self._lock:
+            return RateLimitMetrics(
+                provider=self.provider,
+                model=self.model,
+                calls=self._metrics.calls,
+                queue_depth=self._queued,
+                in_flight=self._gate.active,
+                waited_calls=self._metrics.waited_calls,
+                total_wait_seconds=round(self._metrics.total_wait_seconds, 3),
+                max_wait_seconds=round(self._metrics.max_wait_seconds, 3),
+                throttled=self._metrics.throttled,
+            )
+
+    # ----------------------------------------------------------
+    # Dahili / Internal
+    # ----------------------------------------------------------
+
+    def _reserve(self, tokens: int) -> float:
+        """İstek ve token kovalarından rezervasyon / Reserve from both buckets."""
+        return max(self._requests.reserve(1), self._tokens.reserve(max(0, tokens)))
+
+    def _enqueue(self) -> float:
+        with self._lock:
+            self._queued += 1
+        return self._clock()
+
+    def _dequeue(self, start: float) -> None:
+        waited = self._clock() - start
+        with self._lock:
+            self._queued -= 1
+            self._metrics.calls += 1
+            self._metrics.total_wait_seconds += waited
+            self._metrics.max_wait_seconds = max(self._metrics.max_wait_seconds, waited)
+            if waited > 0.001:
+                self._metrics.waited_calls += 1
+        if waited > _LOG_WAIT_SECONDS:
+            logger.info(
+                f"{self.provider}/{self.model} kuyrukta bekledi / waited in queue: {waited:.1f}s"
+            )
+
+
+# ============================================================
+# Süreç Geneli Kayıt / Process-Wide Registry
+# ============================================================
+
+# Sağlayıcı varsayılanları — configure_rate_limits ile değiştirilir
+# Provider defaults — changed with configure_rate_limits
+DEFAULT_RATE_LIMITS: dict[str, RateLimits] = {
+    "openai": RateLimits(requests_per_minute=500, tokens_per_minute=200_000, max_in_flight=8),
+    "gemini": RateLimits(requests_per_minute=15, tokens_per_minute=1_000_000, max_in_flight=4),
+}
+
+_provider_limits: dict[str, RateLimits] = dict(DEFAULT_RATE_LIMITS)
+_limiters: dict[tuple[str, str], LLMRateLimiter] = {}
+_registry_lock = threading.Lock()
+
+
+def configure_rate_limits(provider: str, limits: RateLimits) -> None:
+    """
+    Sağlayıcının sınırlarını ayarla; o sağlayıcının mevcut sınırlayıcıları
+    bir sonraki ``get_rate_limiter`` çağrısında yeni sınırlarla yenilenir.
+    Set a provider's limits; its existing limiters are renewed with the new
+    limits on the next ``get_rate_limiter`` call.
+
+    Args:
+        provider: Sağlayıcı / Provider
+        limits: Kota sınırları / Quota limits
+    """
+    with _registry_lock:
+        _provider_limits[provider] = limits
+
+
+def get_rate_limiter(provider: str, model: str) -> LLMRateLimiter:
+    """
+    Sağlayıcı + model için paylaşılan sınırlayıcı / Shared limiter for a provider + model.
+
+    Args:
+        provider: Sağlayıcı ("openai", "gemini") / Provider
+        model: Model adı / Model name
+
+    Returns:
+        LLMRateLimiter
+    """
+    limits = _provider_limits.get(provider) or DEFAULT_RATE_LIMITS["openai"]
+    with _registry_lock:
+        limiter = _limiters.get((provider, model))
+        if limiter is None or limiter.limits != limits:
+            limiter = LLMRateLimiter(provider, model, limits)
+            _limiters[(provider, model)] = limiter
+        return limiter
+
+
+def rate_limit_metrics() -> list[RateLimitMetrics]:
+    """Tüm sınırlayıcıların ölçümleri / Metrics of every limiter."""
+    with _registry_lock:
+        limiters = list(_limiters.values())
+    return [limiter.metrics() for limiter in limiters]
+
+
+def estimate_tokens(text: str) -> int:
+    """Yaklaşık token sayısı (~4 karakter/token) / Approximate token count (~4 chars/token)."""
+    return len(text) // _CHARS_PER_TOKEN
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """
+    Hata sağlayıcı hız sınırı mı (HTTP 429 / RESOURCE_EXHAUSTED)?
+    Is the error a provider rate limit (HTTP 429 / RESOURCE_EXHAUSTED)?
+    """
+    if getattr(error, "status_code", None) == 429 or getattr(error, "code", None) == 429:
+        return True
+    message = str(error)
+    return "429" in message or "RESOURCE_EXHAUSTED" in message
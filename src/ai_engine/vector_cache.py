@@ -0,0 +1,314 @@
+"""
+TenderAI Vektör Önbelleği / Vector Store Cache.
+
+Dokümanların FAISS indekslerini ve chunk metinlerini diskte saklar;
+aynı ihale yeniden analiz edildiğinde embedding isteği yapılmaz.
+Anahtar: indekslenen metnin SHA-256 özeti + chunk'lama ve embedding
+modeli ayarlarının parmak izi. Toplam boyut sınırı aşıldığında en uzun
+süredir kullanılmayan kayıtlar silinir (LRU).
+
+Stores each document's FAISS index and chunk texts on disk, so a known
+tender is analyzed again without any embedding request.
+Key: SHA-256 digest of the indexed text + a fingerprint of the chunker
+and embedding-model settings. When the total size limit is exceeded, the
+least recently used entries are evicted (LRU).
+
+Temizlik / Cleanup:
+    python -m src.ai_engine.vector_cache --prune
+    python -m src.ai_engine.vector_cache --clear
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import faiss
+from langchain_community.docstore.in_memory import InMemoryDocstore
+from langchain_community.vectorstores import FAISS
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+# Kayıt biçimi sürümü — değişirse eski kayıtlar kullanılmaz
+# Entry format version — old entries are ignored when it changes
+VECTOR_CACHE_VERSION: int = 1
+
+# Kayıt dosyaları / Entry files
+_INDEX_FILE: str = "index.faiss"
+_CHUNKS_FILE: str = "chunks.json"
+
+# Yarım kalmış yazma dizinleri / Half-written entry directories
+_TMP_SUFFIX: str = ".tmp"
+
+# Bu süreden eski geçici dizinler temizlikte silinir (sn)
+# Temp directories older than this are removed on prune (seconds)
+_STALE_TMP_SECONDS: float = 3600.0
+
+
+class VectorStoreCache:
+    """
+    İçerik adresli, boyut sınırlı FAISS indeks disk önbelleği.
+    Content-addressed, size-bounded on-disk FAISS index cache.
+
+    Her kayıt bir dizindir: ham FAISS indeksi (faiss.write_index) ve
+    chunk metinleri (JSON, indeks sırasıyla). Pickle kullanılmaz, bu
+    yüzden yükleme güvenlidir. Yazma atomiktir (geçici dizin + rename).
+
+    Each entry is a directory: the raw FAISS index (faiss.write_index) and
+    the chunk texts (JSON, in index order). No pickle is involved, so
+    loading is safe. Writes are atomic (temp directory + rename).
+    """
+
+    def __init__(self, cache_dir: str | Path, max_size_mb: float = 1000.0) -> None:
+        """
+        VectorStoreCache başlat / Initialize VectorStoreCache.
+
+        Args:
+            cache_dir: Önbellek dizini / Cache directory
+            max_size_mb: Toplam boyut sınırı (MB) / Total size limit (MB)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        logger.info(f"VectorStoreCache başlatıldı / initialized: {self.cache_dir} ({max_size_mb} MB)")
+
+    # ----------------------------------------------------------
+    # Anahtar / Key
+    # ----------------------------------------------------------
+
+    @staticmethod
+    def make_key(content_hash: str, embedding_model: str, chunker: dict) -> str:
+        """
+        Önbellek anahtarı oluştur / Build a cache key.
+
+        Args:
+            content_hash: İndekslenen metnin SHA-256 özeti / SHA-256 of the indexed text
+            embedding_model: Embedding modeli adı / Embedding model name
+            chunker: Chunk'lama ayarları (boyut, örtüşme, ayırıcılar) /
+                     Chunker settings (size, overlap, separators)
+
+        Returns:
+            Önbellek anahtarı / Cache key
+        """
+        settings = json.dumps(
+            {"version": VECTOR_CACHE_VERSION, "model": embedding_model, "chunker": chunker},
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        fingerprint = hashlib.sha256(settings.encode("utf-8")).hexdigest()[:16]
+        return f"{content_hash}-{fingerprint}"
+
+    # ----------------------------------------------------------
+    # Okuma / Yazma — Read / Write
+    # ----------------------------------------------------------
+
+    def get(self, key: str, embeddings: Embeddings) -> FAISS | None:
+        """
+        Önbellekten vektör store yükle / Load a vector store from the cache.
+
+        Args:
+            key: Önbellek anahtarı / Cache key
+            embeddings: Sorgular için embedding modeli / Embedding model for queries
+
+        Returns:
+            FAISS veya None (kayıt yoksa/bozuksa) /
+            FAISS or None (missing/corrupt entry)
+        """
+        entry = self._path_for(key)
+        try:
+            chunks = json.loads((entry / _CHUNKS_FILE).read_text(encoding="utf-8"))
+            index = faiss.read_index(str(entry / _INDEX_FILE))
+            if not isinstance(chunks, list) or index.ntotal != len(chunks):
+                raise ValueError(f"{index.ntotal} vektör, {len(chunks)} chunk / vectors, chunks")
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, RuntimeError) as e:
+            logger.warning(f"Bozuk vektör önbelleği kaydı siliniyor / Removing corrupt vector cache entry: {e}")
+            shutil.rmtree(entry, ignore_errors=True)
+            return None
+
+        ids = [str(i) for i in range(len(chunks))]
+        vector_store = FAISS(
+            embedding_function=embeddings,
+            index=index,
+            docstore=InMemoryDocstore({
+                doc_id: Document(page_content=chunk) for doc_id, chunk in zip(ids, chunks)
+            }),
+            index_to_docstore_id=dict(enumerate(ids)),
+        )
+
+        # LRU: erişim zamanını güncelle / Refresh access time
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+
+        logger.info(f"Vektör önbelleği isabeti / Vector cache hit: {key[:16]} ({len(chunks)} chunk)")
+        return vector_store
+
+    def put(self, key: str, vector_store: FAISS) -> None:
+        """
+        Vektör store'u önbelleğe yaz ve gerekirse eski kayıtları sil.
+        Write a vector store to the cache and evict old entries if needed.
+
+        Args:
+            key: Önbellek anahtarı / Cache key
+            vector_store: FAISS vektör store
+        """
+        entry = self._path_for(key)
+        chunks = [
+            vector_store.docstore.search(vector_store.index_to_docstore_id[i]).page_content
+            for i in range(vector_store.index.ntotal)
+        ]
+        tmp_dir: Path | None = None
+        try:
+            tmp_dir = Path(tempfile.mkdtemp(dir=self.cache_dir, suffix=_TMP_SUFFIX))
+            faiss.write_index(vector_store.index, str(tmp_dir / _INDEX_FILE))
+            (tmp_dir / _CHUNKS_FILE).write_text(json.dumps(chunks, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_dir, entry)
+        except (OSError, RuntimeError) as e:
+            # Başka bir oturum aynı kaydı yazmış olabilir / Another session may have written it
+            if not entry.is_dir():
+                logger.warning(f"Vektör önbelleğine yazılamadı / Could not write vector cache entry: {e}")
+            if tmp_dir is not None:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+            return
+
+        self._evict(keep=entry)
+
+    # ----------------------------------------------------------
+    # Temizlik / Cleanup
+    # ----------------------------------------------------------
+
+    def prune(self) -> int:
+        """
+        Boyut sınırını uygula ve yarım kalmış yazmaları sil.
+        Enforce the size limit and remove abandoned writes.
+
+        Returns:
+            Silinen kayıt sayısı / Number of removed entries
+        """
+        removed = 0
+        cutoff = time.time() - _STALE_TMP_SECONDS
+        for path in self.cache_dir.glob(f"*{_TMP_SUFFIX}"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    shutil.rmtree(path, ignore_errors=True)
+                    removed += 1
+            except FileNotFoundError:
+                continue
+        return removed + self._evict(keep=None)
+
+    def clear(self) -> int:
+        """
+        Tüm kayıtları sil / Remove all entries.
+
+        Returns:
+            Silinen kayıt sayısı / Number of removed entries
+        """
+        removed = 0
+        for path in self._entries():
+            shutil.rmtree(path, ignore_errors=True)
+            removed += 1
+        return removed
+
+    def size_bytes(self) -> int:
+        """Kayıtların toplam boyutu / Total size of all entries."""
+        return sum(self._entry_size(path) for path in self._entries())
+
+    # ----------------------------------------------------------
+    # Dahili / Internal
+    # ----------------------------------------------------------
+
+    def _path_for(self, key: str) -> Path:
+        """Anahtarın kayıt dizini / Entry directory for a key."""
+        return self.cache_dir / key
+
+    def _entries(self) -> list[Path]:
+        """Tamamlanmış kayıt dizinleri / Completed entry directories."""
+        return [
+            path for path in self.cache_dir.iterdir()
+            if path.is_dir() and not path.name.endswith(_TMP_SUFFIX)
+        ]
+
+    @staticmethod
+    def _entry_size(entry: Path) -> int:
+        """Kayıt dizininin boyutu / Size of an entry directory."""
+        size = 0
+        for path in entry.iterdir():
+            try:
+                size += path.stat().st_size
+            except FileNotFoundError:
+                continue
+        return size
+
+    def _evict(self, keep: Path | None) -> int:
+        """
+        Boyut sınırı aşılmışsa en eski kayıtları sil.
+        Evict the oldest entries while over the size limit.
+
+        Args:
+            keep: Yeni yazılan, silinmeyecek kayıt / Just-written entry that is never evicted
+
+        Returns:
+            Silinen kayıt sayısı / Number of evicted entries
+        """
+        entries: list[tuple[float, int, Path]] = []
+        for path in self._entries():
+            try:
+                entries.append((path.stat().st_mtime, self._entry_size(path), path))
+            except FileNotFoundError:
+                continue
+
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_size_bytes:
+            return 0
+
+        removed = 0
+        entries.sort(key=lambda entry: entry[0])
+        for _mtime, size, path in entries:
+            if total <= self.max_size_bytes:
+                break
+            if path == keep:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+            removed += 1
+            logger.info(f"Vektör önbelleği kaydı silindi (LRU) / Vector cache entry evicted: {path.name[:16]}")
+        return removed
+
+
+# ============================================================
+# Komut Satırı / Command Line
+# ============================================================
+
+
+def main() -> None:
+    """Önbellek temizliği / Cache cleanup."""
+    from config.settings import settings
+
+    arg_parser = argparse.ArgumentParser(description="Vektör önbelleği temizliği / Vector cache cleanup")
+    arg_parser.add_argument("--cache-dir", type=Path, default=settings.VECTOR_CACHE_DIR)
+    arg_parser.add_argument("--max-mb", type=float, default=settings.VECTOR_CACHE_MAX_MB)
+    action = arg_parser.add_mutually_exclusive_group()
+    action.add_argument("--prune", action="store_true", help="Boyut sınırını uygula / Enforce the size limit")
+    action.add_argument("--clear", action="store_true", help="Tüm kayıtları sil / Remove all entries")
+    args = arg_parser.parse_args()
+
+    cache = VectorStoreCache(args.cache_dir, max_size_mb=args.max_mb)
+    if args.clear:
+        print(f"Silinen kayıt / removed entries: {cache.clear()}")
+    elif args.prune:
+        print(f"Silinen kayıt / removed entries: {cache.prune()}")
+    print(f"Önbellek boyutu / cache size: {cache.size_bytes() / (1024 * 1024):.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,15 @@ from src.pdf_parser.parser import (
     TableContent,
     Section,
     DocumentMetadata,
+    PARSER_VERSION,
+    TABLE_MODES,
+    TEXT_BACKENDS,
 )
+from src.pdf_parser.backends import PdfiumFastBackend, PdfplumberBackend, TextBackend
+from src.pdf_parser.cache import ParseCache
+from src.pdf_parser.classifier import SectionClassifier
+from src.pdf_parser.ocr import OCRBackend, OCRCache, OCRStage, TesseractOCRBackend
+from src.pdf_parser.package import DOCUMENT_ROLES, PackageDocument, TenderPackage
 
 __all__ = [
     "IhalePDFParser",
@@ -21,4 +29,19 @@ __all__ = [
     "TableContent",
     "Section",
     "DocumentMetadata",
+    "PARSER_VERSION",
+    "TABLE_MODES",
+    "TEXT_BACKENDS",
+    "TextBackend",
+    "PdfplumberBackend",
+    "PdfiumFastBackend",
+    "ParseCache",
+    "SectionClassifier",
+    "OCRBackend",
+    "OCRCache",
+    "OCRStage",
+    "TesseractOCRBackend",
+    "DOCUMENT_ROLES",
+    "PackageDocument",
+    "TenderPackage",
 ]
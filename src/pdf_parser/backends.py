@@ -0,0 +1,353 @@
+"""
+TenderAI Metin Çıkarma Motorları / Text Extraction Backends.
+
+Sayfa metin katmanını okuyan motor değiştirilebilir:
+
+    pdfplumber   Varsayılan; metin, tablo ön filtresi ve taranmışlık
+                 kontrolü pdfplumber/pdfminer ile yapılır.
+    pdfium-fast  Metin katmanı PDFium (pypdfium2) ile yerel olarak okunur;
+                 pdfplumber yalnızca çizim (path) nesnesi olan, yani tablo
+                 barındırabilecek sayfalarda kullanılır.
+    auto         Sayfa sayısı eşiğin altındaysa pdfplumber, üzerindeyse
+                 pdfium-fast.
+
+The engine that reads the page text layer is pluggable:
+
+    pdfplumber   Default; text, the table prefilter and the scanned check
+                 run on pdfplumber/pdfminer.
+    pdfium-fast  The text layer is read natively with PDFium (pypdfium2);
+                 pdfplumber is used only on pages with path objects, i.e.
+                 pages that can hold a table.
+    auto         pdfplumber below the page count threshold, pdfium-fast at
+                 or above it.
+
+Sayfa içerik özeti her iki motorda da pdfminer akışlarından hesaplanır;
+böylece artımlı parse ve OCR önbelleği motordan bağımsızdır.
+The page content hash is computed from the pdfminer streams with both
+engines, so incremental parsing and the OCR cache are engine independent.
+
+Opsiyonel bağımlılık / Optional dependency: pypdfium2
+"""
+
+import logging
+from typing import BinaryIO
+
+from src.pdf_parser.parser import (
+    _FAST_BACKEND_MIN_PAGES,
+    _SCANNED_IMAGE_COVERAGE,
+    _SCANNED_PDF_CHAR_THRESHOLD,
+    TEXT_BACKENDS,
+    _BufferReader,
+    _is_scanned_page,
+    _is_table_candidate,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# Metin Katmanları / Text Layers
+# ============================================================
+
+
+class TextLayer:
+    """
+    Açık bir dokümanın sayfa bazlı metin katmanı / Per-page text layer of an open document.
+
+    Metodlar aynı sayfanın pdfplumber Page nesnesini ve indeksini alır;
+    motor hangisini kullanacağını seçer. Bağlam yöneticisi olarak kullanılır.
+    Methods receive the pdfplumber Page object of the same page and its
+    index; the engine chooses which to use. Used as a context manager.
+    """
+
+    def page_text(self, page, index: int) -> str:
+        """
+        Sayfanın ham metni / Raw text of the page.
+
+        Args:
+            page: pdfplumber Page nesnesi / pdfplumber Page object
+            index: Sayfa indeksi (0-indexed) / Page index (0-indexed)
+
+        Returns:
+            Ham metin (temizlenmemiş) / Raw text (not cleaned)
+        """
+        raise NotImplementedError
+
+    def is_table_candidate(self, page, index: int) -> bool:
+        """Sayfa tablo barındırabilir mi / Can the page hold a table."""
+        return _is_table_candidate(page)
+
+    def is_scanned(self, page, index: int, text_chars: int) -> bool:
+        """Sayfa yalnızca görüntüden mi oluşuyor / Is the page image-only."""
+        return _is_scanned_page(page, text_chars)
+
+    def close(self) -> None:
+        """Motor kaynaklarını bırak / Release engine resources."""
+
+    def __enter__(self) -> "TextLayer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class PdfplumberTextLayer(TextLayer):
+    """pdfplumber metin katmanı (mevcut davranış) / pdfplumber text layer (existing behaviour)."""
+
+    def page_text(self, page, index: int) -> str:
+        return page.extract_text() or ""
+
+
+class PdfiumTextLayer(TextLayer):
+    """
+    PDFium metin katmanı / PDFium text layer.
+
+    Aynı sayfa için art arda gelen çağrılar tek bir PDFium sayfasını paylaşır.
+    Consecutive calls for the same page share a single PDFium page.
+    """
+
+    def __init__(self, document) -> None:
+        """
+        Args:
+            document: Açık pypdfium2 PdfDocument / Open pypdfium2 PdfDocument
+        """
+        self._document = document
+        self._page = None
+        self._index = -1
+
+    def _pdfium_page(self, index: int):
+        """İndeksteki PDFium sayfası (önceki kapatılır) / PDFium page at the index (the previous is closed)."""
+        if index != self._index:
+            if self._page is not None:
+                self._page.close()
+            self._page = self._document[index]
+            self._index = index
+        return self._page
+
+    def page_text(self, page, index: int) -> str:
+        text_page = self._pdfium_page(index).get_textpage()
+        try:
+            return _restore_line_breaks(text_page, text_page.get_text_range())
+        finally:
+            text_page.close()
+
+    def is_table_candidate(self, page, index: int) -> bool:
+        """
+        Çizim nesnesi olmayan sayfa tablo barındıramaz; pdfplumber yalnızca
+        çizim nesnesi olan sayfalarda açılır.
+        A page without path objects cannot hold a table; pdfplumber is
+        opened only on pages with path objects.
+        """
+        import pypdfium2.raw as pdfium_c
+
+        pdfium_page = self._pdfium_page(index)
+        for _ in pdfium_page.get_objects(filter=(pdfium_c.FPDF_PAGEOBJ_PATH,)):
+            return _is_table_candidate(page)
+        return False
+
+    def is_scanned(self, page, index: int, text_chars: int) -> bool:
+        if text_chars >= _SCANNED_PDF_CHAR_THRESHOLD:
+            return False
+        return self._image_coverage(index) >= _SCANNED_IMAGE_COVERAGE
+
+    def _image_coverage(self, index: int) -> float:
+        """
+        Görüntülerin kapladığı sayfa alanı oranı (PDFium nesne sınırları).
+        Share of page area covered by images (PDFium object bounds).
+        """
+        import pypdfium2.raw as pdfium_c
+
+        pdfium_page = self._pdfium_page(index)
+        left, bottom, right, top = pdfium_page.get_bbox()
+        page_area = float((right - left) * (top - bottom))
+        if page_area <= 0:
+            return 0.0
+
+        covered = 0.0
+        for image in pdfium_page.get_objects(filter=(pdfium_c.FPDF_PAGEOBJ_IMAGE,)):
+            x0, y0, x1, y1 = image.get_bounds()
+            width = min(x1, right) - max(x0, left)
+            height = min(y1, top) - max(y0, bottom)
+            if width > 0 and height > 0:
+                covered += width * height
+        return min(covered / page_area, 1.0)
+
+    def close(self) -> None:
+        if self._page is not None:
+            self._page.close()
+            self._page = None
+        self._document.close()
+
+
+def _restore_line_breaks(text_page, text: str) -> str:
+    """
+    PDFium'un satır geçişinde ürettiği boşlukları satır sonuna çevir.
+    Turn the spaces PDFium generates at a line change into line breaks.
+
+    Ayrı metin nesnelerinden oluşan satırlarda (hücreler, sütunlar) PDFium
+    alt satıra geçişi "\\r\\n" yerine üretilmiş bir boşlukla birleştirir.
+    Üretilmiş boşluğun iki yanındaki karakterler dikeyde yarım karakter
+    yüksekliğinden fazla ayrıksa boşluk satır sonu olur — pdfplumber'ın
+    satır gruplamasıyla aynı sonuç.
+    On lines built from separate text objects (cells, columns) PDFium joins
+    the move to the next line with a generated space instead of "\\r\\n".
+    If the characters on both sides of a generated space are vertically
+    apart by more than half a character height, the space becomes a line
+    break — the same result as pdfplumber's line grouping.
+
+    Args:
+        text_page: pypdfium2 PdfTextPage
+        text: ``text_page.get_text_range()`` (karakter indeksleriyle hizalı /
+              aligned with the character indices)
+
+    Returns:
+        Satır sonları düzeltilmiş metin / Text with restored line breaks
+    """
+    import pypdfium2.raw as pdfium_c
+
+    # Vekil çiftler indeksleri kaydırır; bu nadir durumda metin olduğu gibi kalır
+    # Surrogate pairs shift the indices; in that rare case the text is kept as is
+    if len(text) != text_page.count_chars():
+        return text
+
+    breaks: list[int] = []
+    position = text.find(" ", 1)
+    while 0 < position < len(text) - 1:
+        if pdfium_c.FPDFText_IsGenerated(text_page, position) == 1:
+            _, prev_bottom, _, prev_top = text_page.get_charbox(position - 1)
+            _, next_bottom, _, next_top = text_page.get_charbox(position + 1)
+            half_height = max(prev_top - prev_bottom, next_top - next_bottom) / 2
+            if abs((prev_top + prev_bottom) - (next_top + next_bottom)) / 2 > half_height:
+                breaks.append(position)
+        position = text.find(" ", position + 1)
+
+    if not breaks:
+        return text
+    chars = list(text)
+    for position in breaks:
+        chars[position] = "\n"
+    return "".join(chars)
+
+
+# ============================================================
+# Metin Motorları / Text Backends
+# ============================================================
+
+
+class TextBackend:
+    """
+    Metin çıkarma motoru arayüzü / Text extraction backend interface.
+
+    Alt sınıflar ``open`` metodunu uygular. Motorlar süreç havuzuna
+    gönderildiği için pickle edilebilir olmalıdır (yalnızca basit alanlar).
+    Subclasses implement ``open``. Backends are sent to the process pool,
+    so they must be picklable (plain attributes only).
+    """
+
+    name: str = "base"
+
+    def is_available(self) -> bool:
+        """Motor bu ortamda çalışabilir mi / Can the backend run in this environment."""
+        return True
+
+    def open(self, pdf_source: str | BinaryIO) -> TextLayer:
+        """
+        Doküman için metin katmanı aç / Open a text layer for a document.
+
+        Args:
+            pdf_source: PDF dosya yolu veya dosya nesnesi / PDF file path or file object
+
+        Returns:
+            TextLayer (kapatılmalı / must be closed)
+        """
+        raise NotImplementedError
+
+
+class PdfplumberBackend(TextBackend):
+    """pdfplumber motoru / pdfplumber backend."""
+
+    name = "pdfplumber"
+
+    def open(self, pdf_source: str | BinaryIO) -> TextLayer:
+        return PdfplumberTextLayer()
+
+
+class PdfiumFastBackend(TextBackend):
+    """
+    PDFium (pypdfium2) metin motoru / PDFium (pypdfium2) text backend.
+    """
+
+    name = "pdfium-fast"
+
+    def is_available(self) -> bool:
+        """pypdfium2 kurulu mu / Is pypdfium2 installed."""
+        try:
+            import pypdfium2  # noqa: F401
+
+            return True
+        except ImportError:
+            logger.warning("pypdfium2 yüklü değil / pypdfium2 not installed")
+        return False
+
+    def open(self, pdf_source: str | BinaryIO) -> TextLayer:
+        """
+        Dosya nesneleri pdfminer ile paylaşılmaz: PDFium aynı tampon üzerinde
+        kendi okuyucusunu kullanır (kopyalanmaz).
+        File objects are not shared with pdfminer: PDFium gets its own
+        reader over the same buffer (not copied).
+        """
+        import pypdfium2 as pdfium
+
+        if not isinstance(pdf_source, str):
+            pdf_source = _BufferReader(pdf_source.getbuffer())
+        return PdfiumTextLayer(pdfium.PdfDocument(pdf_source))
+
+
+_BACKENDS: dict[str, type[TextBackend]] = {
+    PdfplumberBackend.name: PdfplumberBackend,
+    PdfiumFastBackend.name: PdfiumFastBackend,
+}
+
+
+def select_text_backend(
+    backend: str | TextBackend,
+    total_pages: int,
+    fast_min_pages: int = _FAST_BACKEND_MIN_PAGES,
+) -> TextBackend:
+    """
+    Doküman için metin motorunu seç / Select the text backend for a document.
+
+    "auto", sayfa sayısı ``fast_min_pages`` ve üzerindeyse pdfium-fast'i
+    seçer. Seçilen motor bu ortamda çalışamıyorsa pdfplumber kullanılır.
+    "auto" picks pdfium-fast when the page count is at least
+    ``fast_min_pages``. If the selected backend cannot run in this
+    environment, pdfplumber is used.
+
+    Args:
+        backend: Motor adı veya örneği / Backend name or instance
+        total_pages: Dokümanın sayfa sayısı / Page count of the document
+        fast_min_pages: "auto" için sayfa eşiği / Page threshold for "auto"
+
+    Returns:
+        TextBackend
+
+    Raises:
+        ValueError: Bilinmeyen motor adı / Unknown backend name
+    """
+    if isinstance(backend, str):
+        if backend == "auto":
+            backend = PdfiumFastBackend.name if total_pages >= fast_min_pages else PdfplumberBackend.name
+        if backend not in _BACKENDS:
+            raise ValueError(
+                f"Geçersiz metin motoru / Invalid text backend: {backend!r} "
+                f"(beklenen / expected: {', '.join(TEXT_BACKENDS)})"
+            )
+        backend = _BACKENDS[backend]()
+
+    if not backend.is_available():
+        logger.warning(
+            f"{backend.name} kullanılamıyor, pdfplumber kullanılıyor / "
+            f"{backend.name} unavailable, using pdfplumber"
+        )
+        return PdfplumberBackend()
+    return backend
@@ -0,0 +1,184 @@
+"""
+TenderAI Ayrıştırma Önbelleği / Parse Cache.
+
+Ayrıştırılmış dokümanları içerik adresli olarak diskte saklar.
+Anahtar: dosya içeriğinin SHA-256 özeti + parser sürümü.
+Toplam boyut sınırı aşıldığında en uzun süredir kullanılmayan
+kayıtlar silinir (LRU).
+
+Stores parsed documents on disk, content-addressed.
+Key: SHA-256 digest of the file content + parser version.
+When the total size limit is exceeded, the least recently used
+entries are evicted (LRU).
+"""
+
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from src.pdf_parser.parser import PARSER_VERSION, ParsedDocument
+
+logger = logging.getLogger(__name__)
+
+# Önbellek dosya uzantısı / Cache file suffix
+_CACHE_SUFFIX: str = ".tpd"
+
+
+class ParseCache:
+    """
+    İçerik adresli, boyut sınırlı ParsedDocument disk önbelleği.
+    Content-addressed, size-bounded on-disk ParsedDocument cache.
+
+    Kayıtlar sıkıştırılmış ikili doküman biçiminde yazılır (bkz.
+    serialization modülü); yazma atomiktir (geçici dosya + rename), bu
+    yüzden eşzamanlı oturumlar yarım yazılmış kayıt okumaz.
+
+    Entries are written in the compressed binary document format (see the
+    serialization module); writes are atomic
+    (temp file + rename), so concurrent sessions never read a
+    half-written entry.
+    """
+
+    def __init__(self, cache_dir: str | Path, max_size_mb: float = 500.0) -> None:
+        """
+        ParseCache başlat / Initialize ParseCache.
+
+        Args:
+            cache_dir: Önbellek dizini / Cache directory
+            max_size_mb: Toplam boyut sınırı (MB) / Total size limit (MB)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        logger.info(f"ParseCache başlatıldı / initialized: {self.cache_dir} ({max_size_mb} MB)")
+
+    # ----------------------------------------------------------
+    # Anahtar / Key
+    # ----------------------------------------------------------
+
+    @staticmethod
+    def make_key(content_hash: str, variant: str = "") -> str:
+        """
+        Önbellek anahtarı oluştur / Build a cache key.
+
+        Args:
+            content_hash: Dosya içeriğinin SHA-256 özeti / SHA-256 of the file content
+            variant: Çıktıyı etkileyen parse seçenekleri / Parse options that affect output
+
+        Returns:
+            Önbellek anahtarı / Cache key
+        """
+        key = f"{content_hash}-v{PARSER_VERSION}"
+        return f"{key}-{variant}" if variant else key
+
+    # ----------------------------------------------------------
+    # Okuma / Yazma — Read / Write
+    # ----------------------------------------------------------
+
+    def get(self, key: str) -> ParsedDocument | None:
+        """
+        Önbellekten doküman oku / Read a document from the cache.
+
+        Args:
+            key: Önbellek anahtarı / Cache key
+
+        Returns:
+            ParsedDocument veya None (kayıt yoksa/bozuksa) /
+            ParsedDocument or None (missing/corrupt entry)
+        """
+        path = self._path_for(key)
+        try:
+            document = ParsedDocument.from_bytes(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Bozuk önbellek kaydı siliniyor / Removing corrupt cache entry: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        # LRU: erişim zamanını güncelle / Refresh access time
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        logger.info(f"Parse önbelleği isabeti / Parse cache hit: {key[:16]}")
+        return document
+
+    def put(self, key: str, document: ParsedDocument) -> None:
+        """
+        Dokümanı önbelleğe yaz ve gerekirse eski kayıtları sil.
+        Write a document to the cache and evict old entries if needed.
+
+        Args:
+            key: Önbellek anahtarı / Cache key
+            document: Ayrıştırılmış doküman / Parsed document
+        """
+        path = self._path_for(key)
+        tmp_path: Path | None = None
+        try:
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            tmp_path = Path(tmp_name)
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(document.to_bytes())
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Önbelleğe yazılamadı / Could not write cache entry: {e}")
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+            return
+
+        self._evict(keep=path)
+
+    def clear(self) -> int:
+        """
+        Tüm kayıtları sil / Remove all entries.
+
+        Returns:
+            Silinen kayıt sayısı / Number of removed entries
+        """
+        removed = 0
+        for path in self.cache_dir.glob(f"*{_CACHE_SUFFIX}"):
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+    # ----------------------------------------------------------
+    # Dahili / Internal
+    # ----------------------------------------------------------
+
+    def _path_for(self, key: str) -> Path:
+        """Anahtarın dosya yolu / File path for a key."""
+        return self.cache_dir / f"{key}{_CACHE_SUFFIX}"
+
+    def _evict(self, keep: Path) -> None:
+        """
+        Boyut sınırı aşılmışsa en eski kayıtları sil.
+        Evict the oldest entries while over the size limit.
+
+        Args:
+            keep: Yeni yazılan, silinmeyecek kayıt / Just-written entry that is never evicted
+        """
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.cache_dir.glob(f"*{_CACHE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_size_bytes:
+            return
+
+        entries.sort(key=lambda entry: entry[0])
+        for _mtime, size, path in entries:
+            if total <= self.max_size_bytes:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
+            logger.info(f"Önbellek kaydı silindi (LRU) / Cache entry evicted: {path.name[:16]}")
+
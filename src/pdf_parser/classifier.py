@@ -0,0 +1,257 @@
+"""
+TenderAI Bölüm Sınıflandırıcı / Section Classifier.
+
+Bölüm tipini anahtar kelime puanlamasıyla belirler. Tüm anahtar kelimeler
+bir kez tek bir çok-desenli otomata derlenir; her bölüm (veya dokümanın
+tüm bölümleri birlikte) tek bir taramayla puanlanır.
+
+Classifies section types by keyword scoring. All keywords are compiled once
+into a single multi-pattern automaton; every section (or all sections of a
+document together) is scored in one scan.
+"""
+
+import re
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+
+# Başlık ve içerik eşleşme puanları / Title and content match scores
+_TITLE_SCORE: int = 3
+_CONTENT_SCORE: int = 1
+
+# Sınıflandırmada bakılan içerik uzunluğu (karakter)
+# Content length considered for classification (chars)
+_CONTENT_CHARS: int = 500
+
+# Toplu taramada bölümleri ayıran karakter — anahtar kelimelerde geçmez
+# Separator between sections in a batch scan — never part of a keyword
+_BATCH_SEPARATOR: str = "\x00"
+
+
+class SectionClassifier:
+    """
+    Anahtar kelime otomatı ile bölüm tipi sınıflandırıcı.
+    Section type classifier backed by a keyword automaton.
+
+    Anahtar kelimeler bir trie'ye, trie de tek bir düzenli ifadeye derlenir
+    (her pozisyonda en uzun eşleşme). Bir eşleşmenin içinde kalan diğer
+    anahtar kelimeler (önekler, iç kelimeler) derleme sırasında hesaplanır;
+    eşleşmeyle kısmen çakışan anahtar kelime varsa tarama eşleşmenin içinden
+    sürdürülür. Böylece her metin tek geçişte, eksiksiz taranır.
+
+    Keywords are compiled into a trie and the trie into a single regular
+    expression (longest match at each position). Other keywords inside a
+    match (prefixes, inner words) are computed at build time; if a keyword
+    can partially overlap a match, scanning resumes inside the match. Every
+    text is thus scanned completely in a single pass.
+
+    Puanlama / Scoring: başlıkta eşleşen her anahtar kelime 3, yalnızca
+    içerikte (ilk 500 karakter) eşleşen 1 puan; en yüksek puanlı tip kazanır,
+    eşitlikte sözlük sırası korunur, puan yoksa varsayılan tip döner.
+    Each keyword found in the title scores 3, found only in the content
+    (first 500 chars) scores 1; the highest scoring type wins, ties keep
+    dictionary order, and the default type is returned without any score.
+    """
+
+    def __init__(self, keywords: dict[str, list[str]], default: str = "genel") -> None:
+        """
+        SectionClassifier başlat / Initialize SectionClassifier.
+
+        Args:
+            keywords: Bölüm tipi → küçük harfli anahtar kelimeler /
+                      Section type → lower-case keywords
+            default: Eşleşme yoksa dönen tip / Type returned without matches
+        """
+        self.default = default
+        self._labels: list[str] = [label for label, words in keywords.items() if words]
+
+        # Anahtar kelime → etiket indeksleri (tekrarlar puanı katlar)
+        # Keyword → label indices (repeats multiply the score)
+        self._keyword_labels: dict[str, list[int]] = {}
+        for index, label in enumerate(self._labels):
+            for keyword in keywords[label]:
+                if keyword:
+                    self._keyword_labels.setdefault(keyword, []).append(index)
+
+        words = list(self._keyword_labels)
+        # Eşleşme → içindeki tüm anahtar kelimeler (ofset, kelime)
+        # Match → every keyword inside it (offset, keyword)
+        self._contained: dict[str, list[tuple[int, str]]] = {
+            match: [
+                (offset, word)
+                for offset in range(len(match))
+                for word in words
+                if match.startswith(word, offset)
+            ]
+            for match in words
+        }
+        # Eşleşme → taramanın sürdürüleceği ofset (kısmi çakışma yoksa uzunluk)
+        # Match → offset to resume scanning at (its length without partial overlaps)
+        self._resume: dict[str, int] = {
+            match: next(
+                (
+                    offset
+                    for offset in range(1, len(match))
+                    if any(
+                        len(word) > len(match) - offset and word.startswith(match[offset:])
+                        for word in words
+                    )
+                ),
+                len(match),
+            )
+            for match in words
+        }
+        self._overlapping = any(
+            resume < len(match) for match, resume in self._resume.items()
+        )
+        self._pattern: re.Pattern | None = (
+            re.compile(_trie_pattern(words)) if words else None
+        )
+
+    # ----------------------------------------------------------
+    # Genel API / Public API
+    # ----------------------------------------------------------
+
+    def classify(self, title: str, content: str) -> str:
+        """
+        Tek bölümü sınıflandır / Classify a single section.
+
+        Args:
+            title: Bölüm başlığı / Section title
+            content: Bölüm içeriği / Section content
+
+        Returns:
+            Bölüm tipi / Section type
+        """
+        if self._pattern is None:
+            return self.default
+        title_lower = title.lower()
+        combined = f"{title_lower} {content[:_CONTENT_CHARS].lower()}"
+        return self._best_label(list(self._scan(combined)), len(title_lower))
+
+    def classify_many(self, sections: Iterable[tuple[str, str]]) -> list[str]:
+        """
+        Bir dokümanın tüm bölümlerini tek taramada sınıflandır.
+        Classify all sections of a document in a single scan.
+
+        Args:
+            sections: (başlık, içerik) çiftleri / (title, content) pairs
+
+        Returns:
+            Girdiyle aynı sırada bölüm tipleri / Section types in input order
+        """
+        title_lens: list[int] = []
+        texts: list[str] = []
+        for title, content in sections:
+            title_lower = title.lower()
+            title_lens.append(len(title_lower))
+            texts.append(f"{title_lower} {content[:_CONTENT_CHARS].lower()}")
+        if self._pattern is None or not texts:
+            return [self.default] * len(texts)
+
+        # Bölüm başlangıç ofsetleri birleşik metinde / Section starts in the joined text
+        starts: list[int] = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + len(_BATCH_SEPARATOR)
+
+        hits: list[list[tuple[int, str]]] = [[] for _ in texts]
+        for position, match in self._scan(_BATCH_SEPARATOR.join(texts)):
+            index = bisect_right(starts, position) - 1
+            hits[index].append((position - starts[index], match))
+
+        return [
+            self._best_label(section_hits, title_len)
+            for section_hits, title_len in zip(hits, title_lens)
+        ]
+
+    # ----------------------------------------------------------
+    # Dahili / Internal
+    # ----------------------------------------------------------
+
+    def _scan(self, text: str) -> Iterator[tuple[int, str]]:
+        """
+        Metni tek geçişte tara / Scan the text in a single pass.
+
+        Args:
+            text: Küçük harfli metin / Lower-case text
+
+        Yields:
+            (pozisyon, en uzun eşleşme) / (position, longest match)
+        """
+        if not self._overlapping:
+            for found in self._pattern.finditer(text):
+                yield found.start(), found.group()
+            return
+
+        search = self._pattern.search
+        found = search(text)
+        while found is not None:
+            match = found.group()
+            yield found.start(), match
+            found = search(text, found.start() + self._resume[match])
+
+    def _best_label(self, hits: list[tuple[int, str]], title_len: int) -> str:
+        """
+        Eşleşmelerden en yüksek puanlı tipi seç.
+        Pick the highest scoring type from the matches.
+
+        Args:
+            hits: (pozisyon, en uzun eşleşme) listesi / List of (position, longest match)
+            title_len: Küçük harfli başlık uzunluğu / Lower-case title length
+
+        Returns:
+            Bölüm tipi / Section type
+        """
+        if not hits:
+            return self.default
+
+        in_title: set[str] = set()
+        in_content: set[str] = set()
+        for position, match in hits:
+            for offset, keyword in self._contained[match]:
+                if position + offset + len(keyword) <= title_len:
+                    in_title.add(keyword)
+                else:
+                    in_content.add(keyword)
+
+        scores = [0] * len(self._labels)
+        for keyword in in_title:
+            for index in self._keyword_labels[keyword]:
+                scores[index] += _TITLE_SCORE
+        for keyword in in_content - in_title:
+            for index in self._keyword_labels[keyword]:
+                scores[index] += _CONTENT_SCORE
+
+        best_score = max(scores)
+        return self._labels[scores.index(best_score)] if best_score > 0 else self.default
+
+
+def _trie_pattern(words: list[str]) -> str:
+    """
+    Kelimeleri trie biçimli düzenli ifadeye derle (en uzun eşleşme önce).
+    Compile words into a trie-shaped regular expression (longest match first).
+
+    Args:
+        words: Anahtar kelimeler / Keywords
+
+    Returns:
+        Düzenli ifade kaynağı / Regular expression source
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Kelime burada bitebiliyorsa devamı isteğe bağlıdır (açgözlü — en uzun önce)
+        # If a word can end here the rest is optional (greedy — longest first)
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
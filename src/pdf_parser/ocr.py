@@ -0,0 +1,355 @@
+"""
+TenderAI OCR Aşaması / OCR Stage.
+
+Taranmış (yalnızca görüntü) sayfaları görüntüye çevirip metin tanıma
+uygular. Tanıma motoru değiştirilebilir; varsayılan yerel Tesseract'tır.
+Sonuçlar sayfa içeriği özetine göre önbelleğe alınır.
+
+Renders scanned (image-only) pages and runs text recognition on them.
+The recognition engine is pluggable; the default is local Tesseract.
+Results are cached by page content hash.
+
+Opsiyonel bağımlılık / Optional dependency: pytesseract (+ tesseract binary)
+"""
+
+import io
+import logging
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
+
+import pdfplumber
+
+from src.pdf_parser.parser import _page_hash, _worker_path
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+# Varsayılan görüntüleme çözünürlüğü (DPI) / Default render resolution (DPI)
+_OCR_RESOLUTION: int = 300
+
+# Önbellek dosya uzantısı / Cache file suffix
+_OCR_CACHE_SUFFIX: str = ".txt"
+
+
+# ============================================================
+# OCR Motorları / OCR Backends
+# ============================================================
+
+
+class OCRBackend:
+    """
+    OCR motoru arayüzü / OCR backend interface.
+
+    Alt sınıflar ``recognize`` metodunu uygular. Motorlar süreç havuzuna
+    gönderildiği için pickle edilebilir olmalıdır (yalnızca basit alanlar).
+    Subclasses implement ``recognize``. Backends are sent to the process
+    pool, so they must be picklable (plain attributes only).
+    """
+
+    name: str = "base"
+
+    @property
+    def cache_id(self) -> str:
+        """
+        Önbellek anahtarına eklenen motor kimliği / Backend id added to cache keys.
+
+        Çıktıyı etkileyen ayarlar (dil vb.) burada yer almalıdır.
+        Settings that affect the output (language etc.) belong here.
+        """
+        return self.name
+
+    def is_available(self) -> bool:
+        """Motor bu ortamda çalışabilir mi / Can the backend run in this environment."""
+        return True
+
+    def recognize(self, image: "Image.Image") -> str:
+        """
+        Görüntüdeki metni tanı / Recognise the text in an image.
+
+        Args:
+            image: Sayfa görüntüsü (PIL) / Page image (PIL)
+
+        Returns:
+            Tanınan metin / Recognised text
+        """
+        raise NotImplementedError
+
+
+class TesseractOCRBackend(OCRBackend):
+    """
+    Yerel Tesseract motoru (pytesseract) / Local Tesseract engine (pytesseract).
+    """
+
+    name = "tesseract"
+
+    def __init__(self, lang: str = "tur", config: str = "") -> None:
+        """
+        TesseractOCRBackend başlat / Initialize TesseractOCRBackend.
+
+        Args:
+            lang: Tesseract dil kodu (örn. "tur", "tur+eng") / Tesseract language code
+            config: Ek tesseract parametreleri / Extra tesseract parameters
+        """
+        self.lang = lang
+        self.config = config
+
+    @property
+    def cache_id(self) -> str:
+        """Motor + dil kimliği / Backend + language id."""
+        return f"{self.name}-{self.lang.replace('+', '_')}"
+
+    def is_available(self) -> bool:
+        """pytesseract ve tesseract ikilisi kurulu mu / Are pytesseract and the binary installed."""
+        try:
+            import pytesseract
+
+            pytesseract.get_tesseract_version()
+            return True
+        except ImportError:
+            logger.warning("pytesseract yüklü değil / pytesseract not installed")
+        except Exception as e:
+            logger.warning(f"Tesseract bulunamadı / Tesseract not found: {e}")
+        return False
+
+    def recognize(self, image: "Image.Image") -> str:
+        """Görüntüdeki metni Tesseract ile tanı / Recognise text with Tesseract."""
+        import pytesseract
+
+        return pytesseract.image_to_string(image, lang=self.lang, config=self.config)
+
+
+# ============================================================
+# OCR Önbelleği / OCR Cache
+# ============================================================
+
+
+class OCRCache:
+    """
+    Sayfa özetine göre OCR metni önbelleği / OCR text cache keyed by page hash.
+
+    Her kayıt tek bir düz metin dosyasıdır; yazma atomiktir.
+    Each entry is a single plain text file; writes are atomic.
+    """
+
+    def __init__(self, cache_dir: str | Path) -> None:
+        """
+        OCRCache başlat / Initialize OCRCache.
+
+        Args:
+            cache_dir: Önbellek dizini / Cache directory
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> str | None:
+        """
+        Önbellekten OCR metni oku / Read OCR text from the cache.
+
+        Args:
+            key: Önbellek anahtarı / Cache key
+
+        Returns:
+            Metin veya None / Text or None
+        """
+        try:
+            return (self.cache_dir / f"{key}{_OCR_CACHE_SUFFIX}").read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"OCR önbelleği okunamadı / Could not read OCR cache: {e}")
+            return None
+
+    def put(self, key: str, text: str) -> None:
+        """
+        OCR metnini önbelleğe yaz / Write OCR text to the cache.
+
+        Args:
+            key: Önbellek anahtarı / Cache key
+            text: Tanınan metin / Recognised text
+        """
+        tmp_path: Path | None = None
+        try:
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            tmp_path = Path(tmp_name)
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(text)
+            os.replace(tmp_path, self.cache_dir / f"{key}{_OCR_CACHE_SUFFIX}")
+        except OSError as e:
+            logger.warning(f"OCR önbelleğine yazılamadı / Could not write OCR cache: {e}")
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+
+
+# ============================================================
+# OCR Aşaması / OCR Stage
+# ============================================================
+
+
+class OCRStage:
+    """
+    Taranmış sayfalar için toplu OCR aşaması / Batched OCR stage for scanned pages.
+
+    Yalnızca istenen sayfaları işler: önce önbelleğe bakar, kalan sayfaları
+    süreç havuzunda görüntüleyip tanır.
+    Processes only the requested pages: checks the cache first, then
+    renders and recognises the remaining pages in a process pool.
+    """
+
+    def __init__(
+        self,
+        backend: OCRBackend | None = None,
+        cache: OCRCache | None = None,
+        max_workers: int | None = None,
+        resolution: int = _OCR_RESOLUTION,
+    ) -> None:
+        """
+        OCRStage başlat / Initialize OCRStage.
+
+        Args:
+            backend: OCR motoru (None = Tesseract) / OCR backend (None = Tesseract)
+            cache: Sayfa bazlı OCR önbelleği (opsiyonel) / Per-page OCR cache (optional)
+            max_workers: Süreç sayısı (None = CPU sayısı) / Process count (None = CPU count)
+            resolution: Görüntüleme çözünürlüğü (DPI) / Render resolution (DPI)
+        """
+        self.backend = backend if backend is not None else TesseractOCRBackend()
+        self.cache = cache
+        self.max_workers = max(1, max_workers if max_workers is not None else (os.cpu_count() or 1))
+        self.resolution = resolution
+
+    def run(self, pdf_source: str | BinaryIO, page_nums: list[int]) -> dict[int, str]:
+        """
+        Verilen sayfalara OCR uygula / Run OCR on the given pages.
+
+        Args:
+            pdf_source: PDF dosya yolu veya dosya nesnesi / PDF file path or file object
+            page_nums: Sayfa numaraları (1-indexed) / Page numbers (1-indexed)
+
+        Returns:
+            Sayfa numarası → tanınan metin / Page number → recognised text
+        """
+        if not page_nums:
+            return {}
+        if not self.backend.is_available():
+            logger.warning(
+                f"OCR motoru kullanılamıyor, {len(page_nums)} sayfa atlandı / "
+                f"OCR backend unavailable, {len(page_nums)} pages skipped"
+            )
+            return {}
+
+        results: dict[int, str] = {}
+        pending_keys: dict[int, str] = {}
+
+        # Önbellek kontrolü / Cache lookup
+        with pdfplumber.open(pdf_source) as pdf:
+            for page_num in page_nums:
+                page = pdf.pages[page_num - 1]
+                key = f"{_page_hash(page)}-{self.backend.cache_id}"
+                page.close()
+                cached = self.cache.get(key) if self.cache is not None else None
+                if cached is not None:
+                    results[page_num] = cached
+                else:
+                    pending_keys[page_num] = key
+
+        logger.info(
+            f"OCR: {len(page_nums)} sayfa, {len(results)} önbellekten / "
+            f"{len(page_nums)} pages, {len(results)} from cache"
+        )
+
+        for page_num, text in self._recognize(pdf_source, sorted(pending_keys)):
+            results[page_num] = text
+            if self.cache is not None and text:
+                self.cache.put(pending_keys[page_num], text)
+
+        return results
+
+    def _recognize(
+        self, pdf_source: str | BinaryIO, page_nums: list[int]
+    ) -> list[tuple[int, str]]:
+        """
+        Sayfaları görüntüle ve tanı — gerekirse süreç havuzunda.
+        Render and recognise pages — in a process pool if worthwhile.
+
+        Args:
+            pdf_source: PDF dosya yolu veya dosya nesnesi / PDF file path or file object
+            page_nums: Tanınacak sayfalar / Pages to recognise
+
+        Returns:
+            (sayfa_numarası, metin) listesi / List of (page_num, text)
+        """
+        if not page_nums:
+            return []
+
+        workers = min(self.max_workers, len(page_nums))
+        if workers <= 1:
+            return _ocr_page_batch(pdf_source, page_nums, self.backend, self.resolution)
+
+        batches = [page_nums[i::workers] for i in range(workers)]
+        try:
+            with _worker_path(pdf_source) as worker_source, \
+                    ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        _ocr_page_batch, worker_source, batch, self.backend, self.resolution
+                    )
+                    for batch in batches
+                ]
+                results = [item for future in futures for item in future.result()]
+        except Exception as e:
+            logger.warning(
+                f"Paralel OCR başarısız, seri moda geçiliyor / "
+                f"Parallel OCR failed, falling back to serial: {e}"
+            )
+            return _ocr_page_batch(pdf_source, page_nums, self.backend, self.resolution)
+
+        return sorted(results)
+
+
+# ============================================================
+# Yardımcılar / Helpers
+# ============================================================
+# Modül seviyesinde tanımlıdır — süreç havuzu worker'larına pickle ile
+# gönderilebilmeleri için.
+# Defined at module level so they can be pickled to process pool workers.
+
+
+def _ocr_page_batch(
+    pdf_source: str | bytes | BinaryIO,
+    page_nums: list[int],
+    backend: OCRBackend,
+    resolution: int,
+) -> list[tuple[int, str]]:
+    """
+    Worker giriş noktası — sayfaları görüntüler ve tanır.
+    Worker entry point — renders and recognises pages.
+
+    Args:
+        pdf_source: PDF dosya yolu, bytes veya dosya nesnesi / PDF file path, bytes or file object
+        page_nums: Sayfa numaraları (1-indexed) / Page numbers (1-indexed)
+        backend: OCR motoru / OCR backend
+        resolution: Görüntüleme çözünürlüğü (DPI) / Render resolution (DPI)
+
+    Returns:
+        (sayfa_numarası, metin) listesi / List of (page_num, text)
+    """
+    source = io.BytesIO(pdf_source) if isinstance(pdf_source, bytes) else pdf_source
+    results: list[tuple[int, str]] = []
+    with pdfplumber.open(source) as pdf:
+        for page_num in page_nums:
+            page = pdf.pages[page_num - 1]
+            try:
+                image = page.to_image(resolution=resolution).original
+                results.append((page_num, backend.recognize(image).strip()))
+            except Exception as e:
+                logger.warning(
+                    f"Sayfa {page_num} OCR hatası / Page {page_num} OCR error: {e}"
+                )
+                results.append((page_num, ""))
+            finally:
+                page.close()
+    return results
@@ -0,0 +1,419 @@
+"""
+TenderAI İhale Paketi / Tender Package Ingestion.
+
+EKAP'tan indirilen ihale dokümanları genellikle tek bir ZIP içinde gelir
+(idari şartname, teknik şartname, sözleşme tasarısı, ekler). Bu modül
+ZIP'i açmadan üyeleri tek tek akıtır, PDF üyelerini süreç havuzunda
+paralel ayrıştırır ve sonuçları doküman rolüne göre gruplar.
+
+Tender documents downloaded from EKAP usually come in a single ZIP
+(administrative specification, technical specification, draft contract,
+annexes). This module streams the members one by one without extracting
+the archive, parses the PDF members in parallel in a process pool and
+groups the results by document role.
+
+Arşiv belleğe alınmaz: her üye parça parça geçici bir dosyaya kopyalanır,
+ayrıştırılır ve silinir. Worker sonuçları ikili doküman biçimiyle
+(serialization) geri taşınır.
+The archive is never loaded into memory: each member is copied in chunks
+to a temp file, parsed and removed. Worker results travel back in the
+binary document format (serialization).
+"""
+
+import io
+import logging
+import shutil
+import tempfile
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO
+
+from src.pdf_parser.classifier import SectionClassifier
+from src.pdf_parser.parser import IhalePDFParser, ParsedDocument, PDFInput, _BufferReader
+
+logger = logging.getLogger(__name__)
+
+# Doküman rolü anahtar kelimeleri (ASCII'ye indirgenmiş, küçük harf) —
+# dosya adında eşleşme 3, ilk sayfa metninde 1 puan
+# Document role keywords (ASCII-folded, lower case) — a match in the file
+# name scores 3, in the first page text 1
+DOCUMENT_ROLES: dict[str, list[str]] = {
+    "idari_sartname": ["idari sartname", "idari sart", "isteklilere talimat"],
+    "teknik_sartname": ["teknik sartname", "teknik sart", "teknik ozellik"],
+    "sozlesme_tasarisi": ["sozlesme tasarisi", "sozlesme taslagi", "tip sozlesme"],
+    "zeyilname": ["zeyilname", "zeyil"],
+    "birim_fiyat": ["birim fiyat", "fiyat cetveli", "kesif", "metraj"],
+}
+# Eşleşme yoksa rol / Role without any match
+DEFAULT_ROLE: str = "ek"
+
+# Türkçe karakterleri ASCII'ye indir, ayraçları boşluğa çevir
+# Fold Turkish characters to ASCII, turn separators into spaces
+_FOLD_TABLE: dict[int, str] = str.maketrans(
+    "İIıŞşĞğÜüÖöÇç_-.", "iiissgguuoocc   "
+)
+_ROLE_CLASSIFIER: SectionClassifier = SectionClassifier(DOCUMENT_ROLES, default=DEFAULT_ROLE)
+
+# Üye kopyalama parça boyutu / Member copy chunk size
+_COPY_CHUNK_BYTES: int = 1024 * 1024
+
+# ZIP genel amaçlı bayrağı: dosya adı UTF-8 / ZIP general purpose flag: file name is UTF-8
+_ZIP_UTF8_FLAG: int = 0x800
+
+
+# ============================================================
+# Dataclass Tanımları / Dataclass Definitions
+# ============================================================
+
+
+@dataclass
+class PackageDocument:
+    """
+    Paketteki tek bir PDF / A single PDF in the package.
+
+    Attributes:
+        name: ZIP içindeki yol / Path inside the ZIP
+        role: Doküman rolü (DOCUMENT_ROLES anahtarı veya DEFAULT_ROLE) /
+              Document role (a DOCUMENT_ROLES key or DEFAULT_ROLE)
+        document: Ayrıştırılmış doküman (hata varsa None) /
+                  Parsed document (None on error)
+        error: Ayrıştırma hatası / Parse error
+    """
+
+    name: str
+    role: str = DEFAULT_ROLE
+    document: ParsedDocument | None = None
+    error: str = ""
+
+
+@dataclass
+class TenderPackage:
+    """
+    Ayrıştırılmış ihale paketi / Parsed tender package.
+
+    Attributes:
+        file_name: ZIP dosya adı / ZIP file name
+        documents: PDF üyeleri (arşiv sırasıyla) / PDF members (in archive order)
+        skipped: PDF olmayan veya sınırı aşan üyeler / Non-PDF or oversized members
+        parse_time_seconds: Toplam süre / Total time
+    """
+
+    file_name: str = ""
+    documents: list[PackageDocument] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    parse_time_seconds: float = 0.0
+
+    def by_role(self) -> dict[str, list[ParsedDocument]]:
+        """
+        Başarıyla ayrıştırılan dokümanları role göre grupla.
+        Group the successfully parsed documents by role.
+
+        Returns:
+            Rol → dokümanlar (DOCUMENT_ROLES sırası, sonra DEFAULT_ROLE;
+            boş roller yer almaz) / Role → documents (DOCUMENT_ROLES order,
+            then DEFAULT_ROLE; empty roles are left out)
+        """
+        groups: dict[str, list[ParsedDocument]] = {}
+        for role in (*DOCUMENT_ROLES, DEFAULT_ROLE):
+            documents = [
+                item.document for item in self.documents
+                if item.role == role and item.document is not None
+            ]
+            if documents:
+                groups[role] = documents
+        return groups
+
+    @property
+    def failed(self) -> list[PackageDocument]:
+        """Ayrıştırılamayan üyeler / Members that could not be parsed."""
+        return [item for item in self.documents if item.document is None]
+
+
+# ============================================================
+# Paket Ayrıştırma / Package Parsing
+# ============================================================
+
+
+def parse_package(
+    parser: IhalePDFParser,
+    zip_path_or_bytes: PDFInput,
+    max_member_mb: float | None = None,
+) -> TenderPackage:
+    """
+    ZIP ihale paketini ayrıştır / Parse a ZIP tender package.
+
+    Üyeler arşiv sırasıyla akıtılır; birden fazla PDF varsa ve parser
+    birden fazla worker'a izin veriyorsa her PDF ayrı bir süreçte
+    ayrıştırılır (worker içinde sayfa paralelliği kapalıdır). Bir üyenin
+    hatası paketi durdurmaz; ``PackageDocument.error`` alanına yazılır.
+
+    Members are streamed in archive order; with more than one PDF and a
+    parser allowing more than one worker, every PDF is parsed in its own
+    process (page parallelism is off inside the worker). A failing member
+    does not stop the package; it is recorded in ``PackageDocument.error``.
+
+    Args:
+        parser: Ayarları kullanılacak parser / Parser whose settings are used
+        zip_path_or_bytes: ZIP dosya yolu veya bytes benzeri tampon /
+                           ZIP file path or bytes-like buffer
+        max_member_mb: Bu boyutu (açılmış) aşan üyeler atlanır (None = sınırsız) /
+                       Members larger than this (uncompressed) are skipped (None = no limit)
+
+    Returns:
+        TenderPackage
+
+    Raises:
+        FileNotFoundError: Dosya bulunamadığında / When file not found
+        ValueError: Girdi geçerli bir ZIP değilse / When the input is not a valid ZIP
+    """
+    start_time = time.time()
+    file_name, source = _open_source(zip_path_or_bytes)
+    package = TenderPackage(file_name=file_name)
+
+    try:
+        archive = zipfile.ZipFile(source)
+    except zipfile.BadZipFile as e:
+        raise ValueError(f"Geçersiz ZIP dosyası / Invalid ZIP file: {e}") from e
+
+    with archive, tempfile.TemporaryDirectory(prefix="tenderai_zip_") as tmp_dir:
+        members: list[tuple[PackageDocument, zipfile.ZipInfo]] = []
+        for info in archive.infolist():
+            name = _member_name(info)
+            if info.is_dir() or name.startswith("__MACOSX/"):
+                continue
+            if not name.lower().endswith(".pdf"):
+                package.skipped.append(name)
+                continue
+            if max_member_mb is not None and info.file_size > max_member_mb * 1024 * 1024:
+                logger.warning(
+                    f"Üye boyut sınırını aşıyor, atlandı / Member exceeds the size limit, "
+                    f"skipped: {name} ({info.file_size / (1024 * 1024):.1f} MB)"
+                )
+                package.skipped.append(name)
+                continue
+            members.append((PackageDocument(name=name), info))
+
+        workers = min(parser.max_workers, len(members))
+        logger.info(
+            f"ZIP paketi / ZIP package: {file_name}, {len(members)} PDF, "
+            f"{len(package.skipped)} atlandı / skipped, {workers} worker"
+        )
+
+        if workers > 1:
+            try:
+                _parse_parallel(parser, archive, members, Path(tmp_dir), workers)
+            except Exception as e:
+                # Süreç havuzu başarısız olursa tamamlanmayan üyeler seri işlenir
+                # If the process pool fails, unfinished members are processed serially
+                logger.warning(
+                    f"Paralel paket ayrıştırma başarısız, seri moda geçiliyor / "
+                    f"Parallel package parsing failed, falling back to serial: {e}"
+                )
+                workers = 1
+        if workers <= 1:
+            for index, (item, info) in enumerate(members):
+                if item.document is None and not item.error:
+                    _parse_serial(parser, archive, item, info, Path(tmp_dir) / f"member_{index:04d}.pdf")
+
+    for item, _ in members:
+        if item.document is not None:
+            metadata = item.document.metadata
+            metadata.file_name = Path(item.name).name
+            # Tekrarlı başlıklar (örn. "İDARİ ŞARTNAME") metinden silinmiş olabilir
+            # Repeated headers (e.g. "İDARİ ŞARTNAME") may have been stripped from the text
+            item.role = classify_role(
+                item.name, "\n".join([*metadata.header_lines, item.document.full_text[:500]])
+            )
+        package.documents.append(item)
+
+    package.parse_time_seconds = round(time.time() - start_time, 3)
+    logger.info(
+        f"ZIP paketi ayrıştırıldı / ZIP package parsed: {len(package.documents)} PDF, "
+        f"{len(package.failed)} hata / errors, {package.parse_time_seconds:.2f}sn"
+    )
+    return package
+
+
+def classify_role(member_name: str, text: str) -> str:
+    """
+    Dosya adı ve ilk sayfa metninden doküman rolünü belirle.
+    Determine the document role from the file name and the first page text.
+
+    Args:
+        member_name: ZIP içindeki yol / Path inside the ZIP
+        text: Doküman metni (ilk 500 karakter kullanılır) /
+              Document text (the first 500 chars are used)
+
+    Returns:
+        Rol / Role
+    """
+    stem = Path(member_name).stem
+    return _ROLE_CLASSIFIER.classify(stem.translate(_FOLD_TABLE), text[:500].translate(_FOLD_TABLE))
+
+
+# ============================================================
+# Yardımcılar / Helpers
+# ============================================================
+
+
+def _open_source(zip_path_or_bytes: PDFInput) -> tuple[str, str | BinaryIO]:
+    """
+    ZIP girdisini aç (tamponlar kopyalanmaz) / Open the ZIP input (buffers are not copied).
+
+    Args:
+        zip_path_or_bytes: Dosya yolu veya bytes benzeri tampon /
+                           File path or bytes-like buffer
+
+    Returns:
+        (dosya_adı, kaynak) / (file name, source)
+
+    Raises:
+        FileNotFoundError: Dosya bulunamadığında / When file not found
+    """
+    if isinstance(zip_path_or_bytes, bytes):
+        return "bytes_input.zip", io.BytesIO(zip_path_or_bytes)
+    if isinstance(zip_path_or_bytes, (bytearray, memoryview)):
+        return "bytes_input.zip", _BufferReader(memoryview(zip_path_or_bytes).cast("B"))
+
+    file_path = Path(zip_path_or_bytes)
+    if not file_path.exists():
+        raise FileNotFoundError(f"ZIP dosyası bulunamadı / ZIP file not found: {file_path}")
+    return file_path.name, str(file_path)
+
+
+def _member_name(info: zipfile.ZipInfo) -> str:
+    """
+    Üye adı — UTF-8 bayrağı olmayan adlar Türkçe OEM (DOS) kod sayfasıyla (cp857) çözülür.
+    Member name — names without the UTF-8 flag are decoded with the Turkish
+    OEM (DOS) code page (cp857).
+    """
+    if info.flag_bits & _ZIP_UTF8_FLAG:
+        return info.filename
+    try:
+        return info.filename.encode("cp437").decode("cp857")
+    except UnicodeError:
+        return info.filename
+
+
+def _spool_member(archive: zipfile.ZipFile, info: zipfile.ZipInfo, path: Path) -> Path:
+    """
+    Üyeyi parça parça geçici dosyaya kopyala / Copy a member to a temp file in chunks.
+
+    Returns:
+        Geçici PDF yolu / Temp PDF path
+    """
+    with archive.open(info) as member, open(path, "wb") as fh:
+        shutil.copyfileobj(member, fh, _COPY_CHUNK_BYTES)
+    return path
+
+
+def _parse_serial(
+    parser: IhalePDFParser,
+    archive: zipfile.ZipFile,
+    item: PackageDocument,
+    info: zipfile.ZipInfo,
+    path: Path,
+) -> None:
+    """Üyeyi bu süreçte ayrıştır (sayfa paralelliği açık) / Parse a member in this process (page parallelism on)."""
+    try:
+        item.document = parser.parse(_spool_member(archive, info, path))
+    except Exception as e:
+        logger.warning(f"Paket üyesi ayrıştırılamadı / Package member could not be parsed: {item.name}: {e}")
+        item.error = str(e)
+    finally:
+        path.unlink(missing_ok=True)
+
+
+def _parse_parallel(
+    parser: IhalePDFParser,
+    archive: zipfile.ZipFile,
+    members: list[tuple[PackageDocument, zipfile.ZipInfo]],
+    tmp_dir: Path,
+    workers: int,
+) -> None:
+    """
+    Üyeleri akıtırken süreç havuzuna gönder; sonuçları üyelere yaz.
+    Submit members to the process pool while streaming; store the results on the members.
+
+    Aynı anda en fazla `workers` üye diske kopyalanmış olur; her geçici
+    dosya sonucu okunur okunmaz silinir.
+    At most `workers` members are copied to disk at a time; each temp file
+    is deleted as soon as its result is read.
+
+    Worker hatası yalnızca o üyeyi etkiler; havuzun kendisi çökerse istisna
+    yükseltilir ve tamamlanmayan üyeler seri işlenir.
+    A worker error only affects that member; if the pool itself breaks the
+    exception propagates and unfinished members are processed serially.
+    """
+    from concurrent.futures.process import BrokenProcessPool
+
+    in_flight: dict[Future, tuple[PackageDocument, Path]] = {}
+
+    def collect(done: set[Future]) -> None:
+        """Biten üyelerin sonucunu yaz, geçici dosyasını sil / Store finished results, delete their temp files."""
+        for future in done:
+            item, path = in_flight.pop(future)
+            try:
+                item.document = ParsedDocument.from_bytes(future.result())
+            except BrokenProcessPool:
+                raise
+            except Exception as e:
+                logger.warning(
+                    f"Paket üyesi ayrıştırılamadı / Package member could not be parsed: {item.name}: {e}"
+                )
+                item.error = str(e)
+            finally:
+                path.unlink(missing_ok=True)
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for index, (item, info) in enumerate(members):
+                # Diskte en fazla `workers` üye bulunur / At most `workers` members are on disk
+                while len(in_flight) >= workers:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    collect(done)
+
+                path = tmp_dir / f"member_{index:04d}.pdf"
+                try:
+                    _spool_member(archive, info, path)
+                except Exception as e:
+                    logger.warning(f"Paket üyesi okunamadı / Package member could not be read: {item.name}: {e}")
+                    item.error = str(e)
+                    path.unlink(missing_ok=True)
+                    continue
+                try:
+                    future = executor.submit(_parse_member, parser, str(path))
+                except Exception:
+                    path.unlink(missing_ok=True)
+                    raise
+                in_flight[future] = (item, path)
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                collect(done)
+    finally:
+        # Havuz çökerse okunmamış üyelerin geçici dosyaları da silinir (seri işlenecekler)
+        # If the pool breaks, temp files of unread members are deleted too (they go serial)
+        for _item, path in in_flight.values():
+            path.unlink(missing_ok=True)
+
+
+def _parse_member(parser: IhalePDFParser, pdf_path: str) -> bytes:
+    """
+    Worker giriş noktası — üyeyi ayrıştırır, ikili doküman biçiminde döner.
+    Worker entry point — parses a member and returns it in the binary document format.
+
+    Args:
+        parser: Pickle ile gelen parser kopyası / Pickled parser copy
+        pdf_path: Geçici PDF yolu / Temp PDF path
+
+    Returns:
+        document_to_bytes() çıktısı (sıkıştırmasız) / output (uncompressed)
+    """
+    # Paralellik üye düzeyinde; worker içinde süreç açılmaz
+    # Parallelism is per member; no processes are spawned inside the worker
+    parser.max_workers = 1
+    return parser.parse(pdf_path).to_bytes("none")
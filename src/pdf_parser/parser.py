@@ -13,37 +13,187 @@ Primary library: pdfplumber
 Fallback table library: camelot
 """
 
+import copy
+import dataclasses
+import hashlib
 import io
 import logging
+import math
+import mmap
+import os
 import re
+import tempfile
 import time
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
 
 import pdfplumber
+from pdfminer.pdftypes import PDFStream, resolve1
+
+from src.pdf_parser.classifier import SectionClassifier
+from src.utils.security import hash_file
+
+if TYPE_CHECKING:
+    from src.pdf_parser.backends import TextBackend, TextLayer
+    from src.pdf_parser.cache import ParseCache
+    from src.pdf_parser.ocr import OCRStage
+    from src.pdf_parser.package import TenderPackage
 
 logger = logging.getLogger(__name__)
 
+# Parser çıktı sürümü — çıktıyı değiştiren her değişiklikte artırılır
+# (önbellek anahtarlarının parçasıdır).
+# Parser output version — bump on every change that alters the output
+# (part of the cache keys).
+PARSER_VERSION: int = 10
+
+# Kabul edilen PDF girdileri: dosya yolu veya bytes benzeri tampon.
+# Tamponlar kopyalanmadan okunur.
+# Accepted PDF inputs: a file path or a bytes-like buffer.
+# Buffers are read without copying.
+PDFInput = str | Path | bytes | bytearray | memoryview
+
 
 # ============================================================
 # Dataclass Tanımları / Dataclass Definitions
 # ============================================================
 
 
-@dataclass
-class PageContent:
+class _TextSpan:
+    """
+    Ortak bir metin tamponunda (başlangıç, bitiş) aralığı olarak tutulan kayıt.
+    Record whose text is held as a (start, end) range of a shared text buffer.
+
+    Tek başına oluşturulan kayıt kendi metnini tampon olarak kullanır;
+    ``ParsedDocument`` kayıtları ``full_text``'e bağlar, böylece metin
+    yalnızca bir kez saklanır ve her erişimde dilimlenir.
+
+    A standalone record uses its own text as the buffer; ``ParsedDocument``
+    binds the records to ``full_text``, so the text is stored only once and
+    sliced on every access.
+    """
+
+    __slots__ = ("_buffer", "_start", "_end")
+
+    # Alt sınıfın alan adları, yapıcı sırasıyla / Subclass field names, in constructor order
+    _fields: tuple[str, ...] = ()
+
+    def _span_text(self) -> str:
+        """Aralıktaki metin (UTF-8 tamponda çözülür) / Text in the range (decoded from UTF-8 buffers)."""
+        text = self._buffer[self._start:self._end]
+        return text if type(text) is str else text.decode("utf-8")
+
+    def _set_span_text(self, text: str) -> None:
+        """Kaydı kendi metnine bağla / Bind the record to its own text."""
+        self._buffer = text
+        self._start = 0
+        self._end = len(text)
+
+    def bind(self, buffer: str, start: int, end: int) -> None:
+        """
+        Metni ortak tampondaki bir aralığa bağla / Bind the text to a range of a shared buffer.
+
+        Args:
+            buffer: Ortak metin / Shared text
+            start: Başlangıç ofseti / Start offset
+            end: Bitiş ofseti / End offset
+        """
+        self._buffer = buffer
+        self._start = start
+        self._end = end
+
+    def replace(self, **changes) -> "_TextSpan":
+        """
+        Değiştirilmiş kopya (dataclasses.replace karşılığı); tampon paylaşılır.
+        Modified copy (counterpart of dataclasses.replace); the buffer is shared.
+
+        Args:
+            **changes: Değişecek alanlar / Fields to change
+
+        Returns:
+            Yeni kayıt / New record
+        """
+        clone = copy.copy(self)
+        for name, value in changes.items():
+            setattr(clone, name, value)
+        return clone
+
+    def to_dict(self) -> dict:
+        """Alan adı → değer (dataclasses.asdict karşılığı) / Field name → value."""
+        return {name: getattr(self, name) for name in self._fields}
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self._fields)
+
+    __hash__ = None  # Değiştirilebilir kayıt (dataclass gibi) / Mutable record (like a dataclass)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({fields})"
+
+
+class PageContent(_TextSpan):
     """
     Tek bir sayfanın içeriği / Content of a single page.
 
+    ``ParsedDocument`` içinde ``text``, ``full_text``'teki sayfa aralığıdır
+    (temizlenmiş ve başlık/altbilgisi silinmiş metin).
+    Inside a ``ParsedDocument`` ``text`` is the page's range of ``full_text``
+    (cleaned text with headers/footers removed).
+
     Attributes:
         page_num: Sayfa numarası (1-indexed) / Page number
         text: Sayfadaki metin / Text on the page
         has_table: Sayfada tablo var mı / Does the page contain a table
+        is_scanned: Sayfa yalnızca görüntü mü (metin katmanı yok) /
+                    Is the page image-only (no text layer)
+        content_hash: Sayfa içerik akışının özeti (artımlı parse için) /
+                      Digest of the page content stream (for incremental parse)
+        info_score: Bilgi içeriği puanı (0-1) / Information content score (0-1)
+        is_low_info: Düşük bilgili sayfa mı (kapak, imza, boş sayfa) —
+                     vektör indeksine alınmaz / Is it a low-information page
+                     (cover, signature, blank page) — left out of the vector index
     """
 
-    page_num: int = 0
-    text: str = ""
-    has_table: bool = False
+    __slots__ = ("page_num", "has_table", "is_scanned", "content_hash", "info_score", "is_low_info")
+    _fields = (
+        "page_num", "text", "has_table", "is_scanned", "content_hash", "info_score", "is_low_info",
+    )
+
+    def __init__(
+        self,
+        page_num: int = 0,
+        text: str = "",
+        has_table: bool = False,
+        is_scanned: bool = False,
+        content_hash: str = "",
+        info_score: float = 1.0,
+        is_low_info: bool = False,
+    ) -> None:
+        self.page_num = page_num
+        self._set_span_text(text)
+        self.has_table = has_table
+        self.is_scanned = is_scanned
+        self.content_hash = content_hash
+        self.info_score = info_score
+        self.is_low_info = is_low_info
+
+    @property
+    def text(self) -> str:
+        """Sayfadaki metin / Text on the page."""
+        return self._span_text()
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self._set_span_text(value)
 
 
 @dataclass
@@ -64,12 +214,14 @@ class TableContent:
     raw_data: list = field(default_factory=list)
 
 
-@dataclass
-class Section:
+class Section(_TextSpan):
     """
     Tespit edilen şartname bölümü / maddesi.
     Detected specification section / clause.
 
+    ``ParsedDocument`` içinde ``content``, ``full_text``'teki bölüm aralığıdır.
+    Inside a ``ParsedDocument`` ``content`` is the section's range of ``full_text``.
+
     Attributes:
         title: Bölüm başlığı / Section title (örn: "Madde 5 - Ceza Hükümleri")
         content: Bölüm içeriği / Section content
@@ -77,10 +229,29 @@ class Section:
         section_type: Bölüm tipi / Section type ("idari", "teknik", "ceza", "mali", "sure", "genel")
     """
 
-    title: str = ""
-    content: str = ""
-    page_num: int = 0
-    section_type: str = "genel"
+    __slots__ = ("title", "page_num", "section_type")
+    _fields = ("title", "content", "page_num", "section_type")
+
+    def __init__(
+        self,
+        title: str = "",
+        content: str = "",
+        page_num: int = 0,
+        section_type: str = "genel",
+    ) -> None:
+        self.title = title
+        self._set_span_text(content)
+        self.page_num = page_num
+        self.section_type = section_type
+
+    @property
+    def content(self) -> str:
+        """Bölüm içeriği / Section content."""
+        return self._span_text()
+
+    @content.setter
+    def content(self, value: str) -> None:
+        self._set_span_text(value)
 
 
 @dataclass
@@ -97,6 +268,30 @@ class DocumentMetadata:
         file_size_mb: Dosya boyutu (MB) / File size (MB)
         is_scanned: Taranmış PDF mi (OCR gerekir) / Is scanned PDF (OCR needed)
         parse_time_seconds: Ayrıştırma süresi (sn) / Parse time (seconds)
+        cache_hit: Sonuç önbellekten mi geldi / Was the result served from cache
+        table_pages_skipped: Tablo ön filtresinin atladığı sayfa sayısı /
+                             Pages skipped by the table prefilter
+        scanned_pages: Taranmış (yalnızca görüntü) sayfa numaraları /
+                       Numbers of scanned (image-only) pages
+        ocr_pages: Metni OCR ile elde edilen sayfa numaraları /
+                   Numbers of pages whose text came from OCR
+        changed_pages: Artımlı parse'ta yeniden çıkarılan sayfalar /
+                       Pages re-extracted by an incremental parse
+        changed_sections: Artımlı parse'ta değişen bölümlerin indeksleri /
+                          Indices of sections changed by an incremental parse
+        reused_pages: Artımlı parse'ta önceki sonuçtan alınan sayfa sayısı /
+                      Pages reused from the previous result by an incremental parse
+        header_lines: Sayfa başlarından silinen tekrarlı satırlar (normalize) /
+                      Repeated lines removed from page tops (normalised)
+        footer_lines: Sayfa sonlarından silinen tekrarlı satırlar (normalize) /
+                      Repeated lines removed from page bottoms (normalised)
+        header_footer_bytes_removed: Silinen başlık/altbilgi metni (UTF-8 bayt) /
+                                     Removed header/footer text (UTF-8 bytes)
+        header_footer_tokens_saved: Tahmini token tasarrufu (~4 karakter/token) /
+                                    Estimated token savings (~4 chars/token)
+        low_info_pages: Düşük bilgili sayfa numaraları / Numbers of low-information pages
+        low_info_chars: Düşük bilgili sayfaların karakter sayısı (indeks dışı) /
+                        Characters on low-information pages (left out of the index)
     """
 
     total_pages: int = 0
@@ -107,6 +302,19 @@ class DocumentMetadata:
     file_size_mb: float = 0.0
     is_scanned: bool = False
     parse_time_seconds: float = 0.0
+    cache_hit: bool = False
+    table_pages_skipped: int = 0
+    scanned_pages: list[int] = field(default_factory=list)
+    ocr_pages: list[int] = field(default_factory=list)
+    changed_pages: list[int] = field(default_factory=list)
+    changed_sections: list[int] = field(default_factory=list)
+    reused_pages: int = 0
+    header_lines: list[str] = field(default_factory=list)
+    footer_lines: list[str] = field(default_factory=list)
+    header_footer_bytes_removed: int = 0
+    header_footer_tokens_saved: int = 0
+    low_info_pages: list[int] = field(default_factory=list)
+    low_info_chars: int = 0
 
 
 @dataclass
@@ -114,6 +322,13 @@ class ParsedDocument:
     """
     Ayrıştırılmış PDF dokümanı / Fully parsed PDF document.
 
+    Metin yalnızca ``full_text``'te saklanır: sayfa metinleri ve bölüm
+    içerikleri oluşturulurken ``full_text``'te bulunursa o aralığa bağlanır
+    ve erişimde dilimlenir (bulunamayanlar kendi metnini tutar).
+    Text is stored only in ``full_text``: page texts and section contents
+    found in ``full_text`` at construction are bound to that range and
+    sliced on access (those not found keep their own text).
+
     Attributes:
         full_text: Tüm temizlenmiş metin / All cleaned text
         pages: Sayfa bazlı içerik / Page-based content
@@ -122,12 +337,132 @@ class ParsedDocument:
         metadata: Doküman meta verileri / Document metadata
     """
 
-    full_text: str = ""
+    # default_factory: sınıf özniteliği oluşmaz, tembel full_text __getattr__'a düşer
+    # default_factory: no class attribute, so a lazy full_text reaches __getattr__
+    full_text: str = field(default_factory=str)
     pages: list[PageContent] = field(default_factory=list)
     tables: list[TableContent] = field(default_factory=list)
     sections: list[Section] = field(default_factory=list)
     metadata: DocumentMetadata = field(default_factory=DocumentMetadata)
 
+    def __post_init__(self) -> None:
+        _bind_spans(self.full_text, self.pages)
+        _bind_spans(self.full_text, self.sections)
+
+    def __getattr__(self, name: str):
+        # Yalnızca from_bytes ile yüklenmiş dokümanda: full_text ilk erişimde
+        # çözülür ve kayıtlar çözülen metne yeniden bağlanır.
+        # Only for documents loaded with from_bytes: full_text is decoded on
+        # first access and the records are re-bound to the decoded text.
+        if name == "full_text" and "_encoded_text" in self.__dict__:
+            self.full_text = self.__dict__.pop("_encoded_text").decode("utf-8")
+            self.__post_init__()
+            return self.full_text
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    @classmethod
+    def _lazy(cls, encoded_text: bytes, **fields) -> "ParsedDocument":
+        """
+        full_text'i henüz çözülmemiş doküman oluştur (from_bytes için).
+        Build a document whose full_text is not decoded yet (for from_bytes).
+
+        Args:
+            encoded_text: UTF-8 full_text / UTF-8 encoded full_text
+            **fields: Diğer alanlar / Other fields
+
+        Returns:
+            ParsedDocument
+        """
+        document = cls.__new__(cls)
+        document.__dict__.update(fields, _encoded_text=encoded_text)
+        return document
+
+    # ----------------------------------------------------------
+    # İndekslenecek Metin / Indexable Text
+    # ----------------------------------------------------------
+
+    def indexable_text(self) -> str:
+        """
+        Düşük bilgili sayfalar çıkarılmış tam metin (vektör indeksi için).
+        Full text without the low-information pages (for the vector index).
+
+        Returns:
+            Düşük bilgili sayfa yoksa ``full_text`` / ``full_text`` if no page is low-information
+        """
+        if not any(page.is_low_info for page in self.pages):
+            return self.full_text
+        return "\n\n".join(page.text for page in self.pages if page.text and not page.is_low_info)
+
+    # ----------------------------------------------------------
+    # İkili Biçim / Binary Format
+    # ----------------------------------------------------------
+
+    def to_bytes(self, compression: str = "zlib") -> bytes:
+        """
+        Sürümlü ikili biçime çevir (bkz. serialization modülü).
+        Serialize to the versioned binary format (see the serialization module).
+
+        Args:
+            compression: "none", "zlib" veya "zstd" / "none", "zlib" or "zstd"
+
+        Returns:
+            İkili veri / Binary data
+        """
+        from src.pdf_parser.serialization import document_to_bytes
+
+        return document_to_bytes(self, compression)
+
+    @classmethod
+    def from_bytes(cls, data: bytes | bytearray | memoryview) -> "ParsedDocument":
+        """
+        İkili biçimden yükle; sayfa/bölüm metinleri erişildiğinde çözülür.
+        Load from the binary format; page/section texts are decoded on access.
+
+        Args:
+            data: to_bytes() çıktısı / output
+
+        Returns:
+            ParsedDocument
+
+        Raises:
+            ValueError: Geçersiz veya bozuk veri / Invalid or corrupt data
+        """
+        from src.pdf_parser.serialization import document_from_bytes
+
+        return document_from_bytes(data)
+
+
+def _bind_spans(buffer: str, records: list[_TextSpan]) -> None:
+    """
+    Kayıtları sırayla ortak metindeki ilk eşleşen aralığa bağla.
+    Bind records, in order, to the first matching range of the shared text.
+
+    Aynı metnin herhangi bir kopyasına bağlanmak sonucu değiştirmez; arama
+    bir önceki kaydın sonundan başladığından toplam maliyet doğrusaldır.
+    Binding to any copy of the same text gives the same result; since each
+    search starts at the end of the previous record the total cost is linear.
+
+    Args:
+        buffer: Ortak metin / Shared text
+        records: Sayfalar veya bölümler / Pages or sections
+    """
+    cursor = 0
+    for record in records:
+        if record._buffer is buffer:
+            cursor = max(cursor, record._end)
+            continue
+        text = record._span_text()
+        if not text:
+            record.bind(buffer, cursor, cursor)
+            continue
+        start = buffer.find(text, cursor)
+        if start < 0:
+            if type(record._buffer) is not str:
+                record._set_span_text(text)
+            continue
+        cursor = start + len(text)
+        record.bind(buffer, start, cursor)
+
 
 # ============================================================
 # Section Detection Sabitleri / Section Detection Constants
@@ -153,6 +488,17 @@ SECTION_PATTERNS: list[re.Pattern] = [
     ),
 ]
 
+# Üç kalıbın tek geçişte aranan birleşik hali. Her alternatif kendi
+# (önek, numara, başlık) grup üçlüsünü taşır: 1-3, 4-6, 7-9.
+# The three patterns combined for a single pass. Each alternative keeps its
+# own (prefix, number, rest) group triple: 1-3, 4-6, 7-9.
+_SECTION_HEADING_RE: re.Pattern = re.compile(
+    "^(?:"
+    + "|".join(f"(?:{pattern.pattern.removeprefix('^')})" for pattern in SECTION_PATTERNS)
+    + ")",
+    re.MULTILINE,
+)
+
 # Bölüm tipi anahtar kelimeleri / Section type keywords
 SECTION_KEYWORDS: dict[str, list[str]] = {
     "ceza": ["ceza", "yaptırım", "gecikme", "müeyyide", "cezai"],
@@ -163,11 +509,123 @@ SECTION_KEYWORDS: dict[str, list[str]] = {
     "genel": [],
 }
 
+# Anahtar kelimeler bir kez derlenir / Keywords are compiled once
+_SECTION_CLASSIFIER: SectionClassifier = SectionClassifier(SECTION_KEYWORDS)
+
 # Taranmış PDF tespiti eşik değeri / Scanned PDF detection threshold
 # Sayfa başına ortalama bu kadar karakterden az metin çıkıyorsa,
 # PDF muhtemelen taranmıştır.
 _SCANNED_PDF_CHAR_THRESHOLD: int = 50
 
+# Bir sayfanın taranmış sayılması için görüntülerin kaplaması gereken
+# minimum alan oranı / Minimum share of the page area covered by images
+# for a page to count as scanned
+_SCANNED_IMAGE_COVERAGE: float = 0.5
+
+# Tam çıkarmadan önce örneklenen sayfa sayısı — hepsi taranmışsa çıkarma
+# atlanır / Pages sampled before full extraction — if all are scanned,
+# extraction is skipped
+_SCAN_SAMPLE_PAGES: int = 5
+
+# Paralel çıkarma ayarları / Parallel extraction settings
+# Bu sayfa sayısının altındaki dokümanlar seri işlenir — süreç başlatma
+# maliyeti küçük dokümanlarda kazancı aşar.
+# Documents below this page count are processed serially — process
+# start-up cost outweighs the gain on small documents.
+_PARALLEL_MIN_PAGES: int = 40
+
+# Worker başına sayfa aralığı sayısı (yük dengeleme için)
+# Page ranges per worker (for load balancing)
+_RANGES_PER_WORKER: int = 2
+
+# Tekrarlı başlık/altbilgi tespiti / Repeated header/footer detection
+# Sayfanın başında ve sonunda incelenen boş olmayan satır sayısı
+# Non-blank lines examined at the top and bottom of each page
+_HEADER_ZONE_LINES: int = 3
+# Bir satırın tekrarlı sayılması için geçtiği sayfa oranı ve minimum sayfa sayısı
+# Share of pages, and minimum page count, a line must appear on to count as repeated
+_HEADER_MIN_PAGE_SHARE: float = 0.5
+_HEADER_MIN_PAGES: int = 3
+# Tekrarlı satırların öğrenildiği ilk sayfa penceresi (akışta tamponlanır)
+# Leading page window the repeated lines are learned from (buffered in the stream)
+_HEADER_LEARN_PAGES: int = 30
+# Token tahmini için karakter/token oranı / Chars per token for estimates
+_CHARS_PER_TOKEN: int = 4
+
+# Düşük bilgili sayfa filtresi / Low-information page filter
+# Tam puan için gereken bilgi taşıyan (kalıp olmayan) karakter sayısı
+# Informative (non-boilerplate) characters needed for a full score
+_INFO_FULL_CHARS: int = 400
+# Bu puanın altındaki sayfalar düşük bilgilidir / Pages scoring below this are low-information
+_LOW_INFO_THRESHOLD: float = 0.25
+# Gövdede bu kadar sayfada tekrarlanan satırlar kalıp metin sayılır (imza blokları vb.)
+# Body lines repeated on this many pages count as boilerplate (signature blocks etc.)
+_BOILERPLATE_MIN_PAGES: int = 3
+# Küçük harfe çevrilmiş Türkçe harflerin ASCII karşılıkları (str.replace zinciri,
+# str.translate'ten hızlı) / ASCII counterparts of lower-cased Turkish letters
+# (a str.replace chain, faster than str.translate)
+_FOLD_PAIRS: tuple[tuple[str, str], ...] = (
+    ("i\u0307", "i"), ("ı", "i"), ("ş", "s"), ("ğ", "g"), ("ü", "u"), ("ö", "o"), ("ç", "c"),
+)
+# Kalıp satırlar (normalize metinde): imza/kaşe etiketleri, yalnızca noktalama/rakam
+# Boilerplate lines (on normalised text): signature/stamp labels, punctuation/digits only
+_BOILERPLATE_LINE_RE: re.Pattern = re.compile(
+    r"^[^a-z\n]*(?:imza|kase|muhur|adi soyadi|unvani?|tarih|onaylayan|hazirlayan|kontrol eden)"
+    r"(?:[^a-z\n]+(?:imza|kase|muhur|tarih))*[^a-z\n]*$"
+    r"|^[^a-z\n]+$",
+    re.MULTILINE,
+)
+# Boş sayfa notları; bulunduğu satır kalıp sayılır / Blank page notices; their line counts as boilerplate
+_BLANK_PAGE_NOTICE_RE: re.Pattern = re.compile(r"bos birakilmistir|left blank|sayfa bostur")
+
+_DIGITS_RE: re.Pattern = re.compile(r"\d+")
+_WHITESPACE_RE: re.Pattern = re.compile(r"\s+")
+
+# Metin temizleme — bir kez derlenir, worker süreçlerinde de kullanılır
+# Text cleaning — compiled once, also used inside worker processes
+# NUL ve kontrol karakterleri (newline/tab/CR hariç) / NUL and control chars (except newline/tab/CR)
+_CONTROL_CHARS: str = "".join(map(chr, [*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F]))
+_CONTROL_CHARS_RE: re.Pattern = re.compile(f"[{re.escape(_CONTROL_CHARS)}]")
+_CONTROL_CHARS_TABLE: dict[int, None] = str.maketrans("", "", _CONTROL_CHARS)
+# Tek boşluk olmayan satır içi boşluk dizileri / Inline whitespace runs other than a single space
+_INLINE_WHITESPACE_RE: re.Pattern = re.compile(r"(?: [^\S\n]|[^\S \n])[^\S\n]*")
+# Satır başı/sonundaki boşluk / Space at a line start or end
+_LINE_EDGE_SPACE_RE: re.Pattern = re.compile(r" \n ?|\n ")
+# 3+ ardışık satır sonu / 3+ consecutive newlines
+_BLANK_LINES_RE: re.Pattern = re.compile(r"\n{3,}")
+
+# Düşük bellek modunda bellekte tutulan sayfa metni bütçesi (MB) — aşılınca
+# metin geçici dosyaya yazılır / Page text budget kept in memory in
+# low-memory mode (MB) — text beyond it is spilled to a temp file
+_TEXT_BUDGET_MB: float = 64.0
+
+# Tablo çıkarma modları / Table extraction modes
+#   auto:   yalnızca ön filtreden geçen sayfalarda çıkar / only on pages passing the prefilter
+#   always: her sayfada çıkar / on every page
+#   never:  hiç çıkarma / never
+TABLE_MODES: tuple[str, ...] = ("auto", "always", "never")
+
+# Metin çıkarma motorları (bkz. src.pdf_parser.backends) / Text extraction backends
+#   pdfplumber:  mevcut davranış / existing behaviour
+#   pdfium-fast: metin katmanı PDFium ile, pdfplumber yalnızca tablo sayfalarında /
+#                text layer with PDFium, pdfplumber only on table pages
+#   auto:        sayfa sayısına göre / by page count
+TEXT_BACKENDS: tuple[str, ...] = ("auto", "pdfplumber", "pdfium-fast")
+# "auto" modunda pdfium-fast'e geçilen minimum sayfa sayısı
+# Minimum page count for "auto" to switch to pdfium-fast
+_FAST_BACKEND_MIN_PAGES: int = 100
+
+# Tablo ön filtresi ayarları / Table prefilter settings
+# Çizgi/kenar konumları bu toleransla gruplanır (pdfplumber snap_tolerance varsayılanı)
+# Rule/edge positions are grouped with this tolerance (pdfplumber snap_tolerance default)
+_TABLE_EDGE_TOLERANCE: float = 3.0
+# Karakterler arası bu boşluktan (pt) geniş aralık sütun sınırı sayılır
+# A gap between characters wider than this (pt) counts as a column boundary
+_TABLE_COLUMN_GAP: float = 6.0
+# Bir sütun başlangıcının hizalı sayılması için gereken satır sayısı
+# Rows needed for a column start to count as aligned
+_TABLE_ALIGNED_ROWS: int = 3
+
 
 # ============================================================
 # IhalePDFParser Sınıfı / IhalePDFParser Class
@@ -182,29 +640,145 @@ class IhalePDFParser:
     Desteklenen formatlar / Supported formats:
         - Normal metin bazlı PDF'ler (kopyalanabilir metin)
         - Tablo içeren PDF'ler
-        - Taranmış PDF'ler (tespit eder, uyarır — OCR dışarıda yapılmalı)
+        - Taranmış PDF'ler (tespit eder; OCR aşaması tanımlıysa metni tanır)
         - Çok sayfalı PDF'ler (200+ sayfa, sayfa sayfa işler)
 
+    Büyük dokümanlar sayfa aralıklarına bölünüp süreç havuzunda paralel
+    işlenir; küçük dokümanlar seri işlenir.
+    Large documents are split into page ranges and processed in a process
+    pool; small documents are processed serially.
+
     Birincil kütüphane: pdfplumber
     Yedek tablo kütüphanesi: camelot-py
     """
 
-    def __init__(self) -> None:
-        """IhalePDFParser başlat / Initialize IhalePDFParser."""
-        logger.info("IhalePDFParser başlatıldı / initialized")
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        parallel_min_pages: int = _PARALLEL_MIN_PAGES,
+        cache: "ParseCache | None" = None,
+        tables: str = "auto",
+        scan_sample_pages: int = _SCAN_SAMPLE_PAGES,
+        ocr: "OCRStage | None" = None,
+        strip_headers: bool = True,
+        low_memory: bool = False,
+        text_budget_mb: float = _TEXT_BUDGET_MB,
+        keep_raw_tables: bool | None = None,
+        text_backend: "str | TextBackend" = "pdfplumber",
+        fast_backend_min_pages: int = _FAST_BACKEND_MIN_PAGES,
+    ) -> None:
+        """
+        IhalePDFParser başlat / Initialize IhalePDFParser.
+
+        Args:
+            max_workers: Paralel çıkarma için süreç sayısı (None = CPU sayısı,
+                         1 = her zaman seri) / Process count for parallel
+                         extraction (None = CPU count, 1 = always serial)
+            parallel_min_pages: Paralel moda geçmek için minimum sayfa sayısı /
+                                Minimum page count to switch to parallel mode
+            cache: İçerik adresli parse önbelleği (opsiyonel) /
+                   Content-addressed parse cache (optional)
+            tables: Varsayılan tablo çıkarma modu ("auto", "always", "never") /
+                    Default table extraction mode
+            scan_sample_pages: Taranmış PDF ön kontrolünde örneklenen sayfa
+                               sayısı (0 = kapalı) / Pages sampled by the
+                               scanned-PDF pre-check (0 = disabled)
+            ocr: Taranmış sayfalar için OCR aşaması (None = kapalı) /
+                 OCR stage for scanned pages (None = disabled)
+            strip_headers: Sayfalarda tekrarlanan başlık/altbilgi satırlarını sil /
+                           Remove header/footer lines repeated across pages
+            low_memory: Sınırlı bellek modu — her sayfadan sonra pdfplumber/pdfminer
+                        önbellekleri boşaltılır, bütçeyi aşan sayfa metni geçici
+                        dosyaya yazılır / Bounded-memory mode — pdfplumber/pdfminer
+                        caches are flushed after each page, page text beyond the
+                        budget is spilled to a temp file
+            text_budget_mb: Düşük bellek modunda bellekte tutulan metin (MB) /
+                            Text kept in memory in low-memory mode (MB)
+            keep_raw_tables: TableContent.raw_data doldurulsun mu
+                             (None = düşük bellek modunda hayır) /
+                             Fill TableContent.raw_data (None = not in low-memory mode)
+            text_backend: Varsayılan metin motoru ("auto", "pdfplumber", "pdfium-fast"
+                          veya TextBackend örneği) / Default text backend
+                          (or a TextBackend instance)
+            fast_backend_min_pages: "auto" motorunun pdfium-fast'e geçtiği sayfa
+                                    sayısı / Page count at which the "auto"
+                                    backend switches to pdfium-fast
+
+        Raises:
+            ValueError: Geçersiz tablo modunda veya metin motorunda /
+                        When the table mode or the text backend is invalid
+        """
+        self.tables = self._resolve_table_mode(tables)
+        self.text_backend = self._resolve_text_backend(text_backend)
+        self.fast_backend_min_pages = fast_backend_min_pages
+        self.max_workers = max(1, max_workers if max_workers is not None else (os.cpu_count() or 1))
+        self.parallel_min_pages = parallel_min_pages
+        self.cache = cache
+        self.scan_sample_pages = scan_sample_pages
+        self.ocr = ocr
+        self.strip_headers = strip_headers
+        self.low_memory = low_memory
+        self.text_budget_bytes = int(text_budget_mb * 1024 * 1024)
+        self.keep_raw_tables = not low_memory if keep_raw_tables is None else keep_raw_tables
+        logger.info(
+            f"IhalePDFParser başlatıldı / initialized: max_workers={self.max_workers}, "
+            f"tables={self.tables}, low_memory={self.low_memory}, "
+            f"text_backend={getattr(self.text_backend, 'name', self.text_backend)}"
+        )
 
     # ----------------------------------------------------------
     # Ana Parse Metodu / Main Parse Method
     # ----------------------------------------------------------
 
-    def parse(self, file_path_or_bytes: str | Path | bytes) -> ParsedDocument:
+    def parse(
+        self,
+        file_path_or_bytes: PDFInput,
+        tables: str | None = None,
+        pages: Iterable[int] | None = None,
+        text_backend: "str | TextBackend | None" = None,
+    ) -> ParsedDocument:
         """
         Ana parse metodu — PDF dosyasını alır, yapılandırılmış çıktı verir.
         Main parse method — takes a PDF file, returns structured output.
 
+        Önbellek tanımlıysa aynı içerik için önceki sonuç döner. Örneklenen
+        sayfaların tümü taranmışsa tam çıkarma yapılmaz; tüm sayfaları
+        taranmış işaretli bir sonuç döner.
+        If a cache is configured, the previous result for the same content is
+        returned. If every sampled page is scanned, full extraction is skipped
+        and a result with all pages flagged as scanned is returned.
+
+        ``strip_headers`` açıksa sayfalarda tekrarlanan başlık/altbilgi
+        satırları ``full_text`` ve bölümler oluşturulmadan önce silinir;
+        satırlar ilk ``_HEADER_LEARN_PAGES`` sayfadan öğrenilir (``iter_sections``
+        ile aynı akış).
+        With ``strip_headers`` enabled, header/footer lines repeated across
+        pages are removed before ``full_text`` and the sections are built; the
+        lines are learned from the first ``_HEADER_LEARN_PAGES`` pages (the
+        same stream as ``iter_sections``).
+
+        ``pages`` verilirse yalnızca o sayfalar açılır ve işlenir (örn.
+        ``parse(pdf, pages=range(0, 3))``); sonuç önbelleğe yazılmaz ve
+        ``metadata.total_pages`` işlenen sayfa sayısıdır.
+        If ``pages`` is given, only those pages are opened and processed (e.g.
+        ``parse(pdf, pages=range(0, 3))``); the result is not cached and
+        ``metadata.total_pages`` is the number of processed pages.
+
         Args:
-            file_path_or_bytes: PDF dosya yolu veya bytes verisi
-                                PDF file path or bytes data
+            file_path_or_bytes: PDF dosya yolu veya bytes/memoryview verisi
+                                PDF file path or bytes/memoryview data
+            tables: Tablo çıkarma modu (None = parser varsayılanı) —
+                    "auto" yalnızca tablo barındırabilecek sayfalarda çıkarır /
+                    Table extraction mode (None = parser default) —
+                    "auto" extracts only on pages that can hold tables
+            pages: İşlenecek sayfa indeksleri (0-indexed, None = tümü);
+                   aralık dışındakiler yok sayılır /
+                   Page indices to process (0-indexed, None = all);
+                   out-of-range indices are ignored
+            text_backend: Metin motoru (None = parser varsayılanı) — "auto"
+                          büyük dokümanlarda pdfium-fast'i seçer /
+                          Text backend (None = parser default) — "auto"
+                          picks pdfium-fast for large documents
 
         Returns:
             ParsedDocument: Ayrıştırılmış doküman / Parsed document
@@ -217,28 +791,109 @@ class IhalePDFParser:
         logger.info("PDF parse işlemi başlıyor / PDF parsing started")
 
         try:
+            table_mode = self._resolve_table_mode(tables)
+            text_backend = self._resolve_text_backend(text_backend)
+            page_indices = None if pages is None else sorted(set(pages))
+
             # Giriş tipini belirle / Determine input type
             file_name, file_size_mb, pdf_source = self._resolve_input(file_path_or_bytes)
 
-            # Sayfa bazlı metin ve tablo çıkarma / Page-based text and table extraction
-            pages, tables = self._extract_all(pdf_source)
-
-            # Tam metin oluştur / Build full text
-            raw_full_text = "\n\n".join(page.text for page in pages if page.text)
+            # Önbellek kontrolü — yalnızca tam doküman / Cache lookup — full document only
+            cache_key = None
+            if self.cache is not None and page_indices is None:
+                cache_key = self._cache_key(file_path_or_bytes, table_mode, text_backend)
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    cached.metadata.file_name = file_name
+                    cached.metadata.file_size_mb = file_size_mb
+                    cached.metadata.cache_hit = True
+                    cached.metadata.parse_time_seconds = round(time.time() - start_time, 3)
+                    return cached
+
+            pages: list[PageContent] = []
+            tables: list[TableContent] = []
+            sections: list[Section] = []
+            table_pages_skipped = 0
+            header_filter = self._header_filter()
+
+            # Örnekleme ön kontrolü — taranmış dokümanda tam çıkarmayı atla
+            # Sampling pre-check — skip full extraction for scanned documents
+            scanned_page_count = None if page_indices is not None else self._sample_scanned(pdf_source)
+            if scanned_page_count is not None:
+                pages = [
+                    PageContent(page_num=page_num, is_scanned=True)
+                    for page_num in range(1, scanned_page_count + 1)
+                ]
+            else:
+                # Akış sayfaları başlık/altbilgiden arındırır ve bölümleri tespit eder
+                # (düşük bellek modunda bölümler PDF kapandıktan sonra kurulur)
+                # The stream strips headers/footers and detects sections
+                # (in low-memory mode sections are built after the PDF is closed)
+                pages, tables, table_pages_skipped, sections = self._collect(
+                    pdf_source, table_mode, page_indices, text_backend,
+                    header_filter=header_filter, detect_sections=not self.low_memory,
+                )
 
-            # Metin temizleme / Clean text
-            cleaned_text = self.clean_text(raw_full_text)
+            # OCR — tanınan metin sayfalara eklenir, aynı satırlar silinir
+            # OCR — recognised text is merged into the pages, the same lines are removed
+            ocr_pages = self._apply_ocr(pdf_source, pages)
+            for page in pages:
+                if page.page_num in ocr_pages:
+                    page.text = self.clean_text(page.text)
+            if header_filter is not None:
+                if scanned_page_count is not None:
+                    # Akış çalışmadı; satırlar OCR metninden öğrenilir
+                    # The stream did not run; lines are learned from the OCR text
+                    header_filter.learn(pages)
+                else:
+                    for page in pages:
+                        if page.page_num in ocr_pages:
+                            header_filter.strip(page)
+
+            header_lines = header_filter.header_lines if header_filter is not None else []
+            footer_lines = header_filter.footer_lines if header_filter is not None else []
+            removed_bytes = header_filter.removed_bytes if header_filter is not None else 0
+            removed_chars = header_filter.removed_chars if header_filter is not None else 0
+
+            # Metin; OCR sayfaları değiştirdiyse veya akış bölüm tespit etmediyse bölümler yeniden kurulur
+            # Text; sections are rebuilt if OCR changed pages or the stream did not detect them
+            if ocr_pages or scanned_page_count is not None or self.low_memory:
+                cleaned_text, sections = self._assemble(pages)
+            else:
+                cleaned_text = "\n\n".join(page.text for page in pages if page.text)
+            low_info_pages, low_info_chars = _mark_low_info_pages(pages)
 
-            # Bölüm tespiti / Section detection
-            sections = self.detect_sections(cleaned_text, pages)
+            logger.info(f"{len(sections)} bölüm tespit edildi / sections detected")
+            if table_pages_skipped:
+                logger.info(
+                    f"Tablo ön filtresi {table_pages_skipped} sayfayı atladı / "
+                    f"Table prefilter skipped {table_pages_skipped} pages"
+                )
 
             # Taranmış PDF tespiti / Scanned PDF detection
             is_scanned = self._detect_scanned_pdf(pages)
-            if is_scanned:
+            scanned_pages = [page.page_num for page in pages if page.is_scanned]
+            if ocr_pages:
+                logger.info(
+                    f"{len(ocr_pages)} taranmış sayfa OCR ile okundu / "
+                    f"{len(ocr_pages)} scanned pages read with OCR"
+                )
+            elif is_scanned:
                 logger.warning(
                     "Bu PDF taranmış görünüyor — OCR gerekebilir / "
                     "This PDF appears scanned — OCR may be needed"
                 )
+            elif scanned_pages:
+                logger.warning(
+                    f"{len(scanned_pages)} sayfa taranmış görünüyor — OCR gerekebilir / "
+                    f"{len(scanned_pages)} pages appear scanned — OCR may be needed"
+                )
+            if removed_bytes:
+                logger.info(
+                    f"Tekrarlı başlık/altbilgi silindi / Repeated header/footer removed: "
+                    f"{removed_bytes} bayt, ~{removed_chars // _CHARS_PER_TOKEN} token"
+                )
+            _log_low_info_pages(low_info_pages, low_info_chars)
 
             # Metadata oluştur / Build metadata
             parse_time = time.time() - start_time
@@ -251,6 +906,15 @@ class IhalePDFParser:
                 file_size_mb=file_size_mb,
                 is_scanned=is_scanned,
                 parse_time_seconds=round(parse_time, 3),
+                table_pages_skipped=table_pages_skipped,
+                scanned_pages=scanned_pages,
+                ocr_pages=ocr_pages,
+                header_lines=header_lines,
+                footer_lines=footer_lines,
+                header_footer_bytes_removed=removed_bytes,
+                header_footer_tokens_saved=removed_chars // _CHARS_PER_TOKEN,
+                low_info_pages=low_info_pages,
+                low_info_chars=low_info_chars,
             )
 
             result = ParsedDocument(
@@ -261,6 +925,9 @@ class IhalePDFParser:
                 metadata=metadata,
             )
 
+            if cache_key is not None:
+                self.cache.put(cache_key, result)
+
             logger.info(
                 "PDF parse tamamlandı / completed: "
                 f"{metadata.total_pages} sayfa, {metadata.total_tables} tablo, "
@@ -274,11 +941,406 @@ class IhalePDFParser:
             logger.error(f"PDF parse hatası / error: {e}", exc_info=True)
             raise RuntimeError(f"PDF ayrıştırılamadı / Could not parse PDF: {e}") from e
 
+    # ----------------------------------------------------------
+    # Artımlı Parse / Incremental Parse
+    # ----------------------------------------------------------
+
+    def parse_incremental(
+        self,
+        file_path_or_bytes: PDFInput,
+        previous: ParsedDocument,
+    ) -> ParsedDocument:
+        """
+        Revize doküman için artımlı parse (zeyilname, revize şartname).
+        Incremental parse for a revised document (addendum, revised spec).
+
+        Her sayfanın içerik akışı özetlenir; özeti önceki sonuçta bulunan
+        sayfaların PageContent/TableContent'i yeniden kullanılır, yalnızca
+        değişen sayfalar çıkarılır. Bölüm tespiti yalnızca değişen sayfaları
+        kapsayan bölgede yeniden çalışır; öncesindeki ve sonrasındaki bölümler
+        korunur (sonrakilerin sayfa numarası kaydırılır).
+
+        Each page's content stream is hashed; pages whose hash appears in the
+        previous result reuse its PageContent/TableContent, and only changed
+        pages are extracted. Section detection re-runs only over the region
+        covering the changed pages; sections before and after it are kept
+        (later ones with shifted page numbers).
+
+        Değişen sayfa ve bölümler ``metadata.changed_pages`` ve
+        ``metadata.changed_sections`` alanlarında raporlanır.
+        Changed pages and sections are reported in ``metadata.changed_pages``
+        and ``metadata.changed_sections``.
+
+        Tekrarlı başlık/altbilgi satırları önceki sonuçtan alınır ve değişen
+        sayfalara uygulanır; yalnızca hiçbir sayfa yeniden kullanılmadığında
+        baştan hesaplanır.
+        Repeated header/footer lines are taken from the previous result and
+        applied to the changed pages; they are recomputed only when no page
+        is reused.
+
+        Args:
+            file_path_or_bytes: Revize PDF / Revised PDF
+            previous: Önceki sürümün parse sonucu / Parse result of the previous version
+
+        Returns:
+            ParsedDocument: Tam parse ile aynı içerikte doküman /
+                            Document with the same content as a full parse
+
+        Raises:
+            FileNotFoundError: Dosya bulunamadığında / When file not found
+            ValueError: Geçersiz dosya formatında / When invalid file format
+        """
+        if not previous.pages or not all(page.content_hash for page in previous.pages):
+            logger.info(
+                "Önceki sonuçta sayfa özeti yok, tam parse yapılıyor / "
+                "Previous result has no page hashes, running a full parse"
+            )
+            return self.parse(file_path_or_bytes)
+
+        start_time = time.time()
+        logger.info("Artımlı PDF parse başlıyor / Incremental PDF parsing started")
+
+        try:
+            file_name, file_size_mb, pdf_source = self._resolve_input(file_path_or_bytes)
+
+            # Önceki sayfalar ve tablolar, özete göre / Previous pages and tables, by hash
+            old_hashes = [page.content_hash for page in previous.pages]
+            reusable: dict[str, PageContent] = {}
+            for page in previous.pages:
+                reusable.setdefault(page.content_hash, page)
+            old_tables: dict[int, list[TableContent]] = {}
+            for table in previous.tables:
+                old_tables.setdefault(table.page_num, []).append(table)
+            old_ocr_pages = set(previous.metadata.ocr_pages)
+
+            pages: list[PageContent] = []
+            tables: list[TableContent] = []
+            extracted_pages: list[PageContent] = []
+            ocr_pages: list[int] = []
+            table_pages_skipped = 0
+
+            with pdfplumber.open(pdf_source) as pdf, _open_text_layer(
+                self._select_text_backend(None, len(pdf.pages)), pdf_source
+            ) as text_layer:
+                new_hashes = [_page_hash(page) for page in pdf.pages]
+                for index, content_hash in enumerate(new_hashes):
+                    page_num = index + 1
+                    old_page = reusable.get(content_hash)
+
+                    # Değişmeyen sayfa — önceki sonucu kullan / Unchanged page — reuse
+                    if old_page is not None:
+                        pages.append(old_page.replace(page_num=page_num))
+                        tables.extend(
+                            dataclasses.replace(table, page_num=page_num)
+                            for table in old_tables.get(old_page.page_num, [])
+                        )
+                        if old_page.page_num in old_ocr_pages:
+                            ocr_pages.append(page_num)
+                        continue
+
+                    # Değişen sayfa — yeniden çıkar / Changed page — re-extract
+                    extracted = next(_iter_pages(
+                        pdf, index, index + 1, True, self.tables, *self._page_options(),
+                        text_layer=text_layer,
+                    ))
+                    pages.append(extracted.page)
+                    tables.extend(extracted.tables)
+                    table_pages_skipped += extracted.tables_skipped
+                    extracted_pages.append(extracted.page)
+
+            ocr_pages = sorted(ocr_pages + self._apply_ocr(pdf_source, extracted_pages))
+            changed_pages = [page.page_num for page in extracted_pages]
+
+            # Başlık/altbilgi: yeniden kullanılan sayfalar önceki satırlarla
+            # temizlenmiştir; değişen sayfalara aynı satırlar uygulanır. Hiç
+            # sayfa yeniden kullanılmadıysa satırlar baştan hesaplanır.
+            # Header/footer: reused pages were cleaned with the previous lines;
+            # the same lines are applied to changed pages. If no page was
+            # reused, the lines are computed from scratch.
+            header_lines: list[str] = []
+            footer_lines: list[str] = []
+            removed_bytes = removed_chars = 0
+            if self.strip_headers:
+                reused_share = (len(pages) - len(extracted_pages)) / len(previous.pages)
+                if extracted_pages and len(extracted_pages) == len(pages):
+                    header_lines, footer_lines = _find_repeated_lines(
+                        [page.text for page in pages[:_HEADER_LEARN_PAGES]]
+                    )
+                else:
+                    header_lines = previous.metadata.header_lines
+                    footer_lines = previous.metadata.footer_lines
+                _, removed_bytes, removed_chars = self._strip_headers_footers(
+                    extracted_pages, header_lines, footer_lines
+                )
+                # Yeniden kullanılan sayfaların payı önceki toplamdan tahmin edilir
+                # The reused pages' share is estimated from the previous totals
+                removed_bytes += round(previous.metadata.header_footer_bytes_removed * reused_share)
+                removed_chars += round(
+                    previous.metadata.header_footer_tokens_saved * _CHARS_PER_TOKEN * reused_share
+                )
+
+            # Temiz metin ve sayfa ofsetleri / Cleaned text and page offsets
+            text_parts: list[str] = []
+            page_offsets: list[int] = []
+            page_nums: list[int] = []
+            position = 0
+            for page in pages:
+                cleaned = self.clean_text(page.text)
+                page.text = cleaned
+                if not cleaned:
+                    continue
+                text_parts.append(cleaned)
+                page_offsets.append(position)
+                page_nums.append(page.page_num)
+                position += len(cleaned) + 2
+            cleaned_text = "\n\n".join(text_parts)
+            low_info_pages, low_info_chars = _mark_low_info_pages(pages)
+            _log_low_info_pages(low_info_pages, low_info_chars)
+
+            # Bölümler — yalnızca etkilenen bölgede / Sections — affected region only
+            prefix, suffix = _common_affixes(old_hashes, new_hashes)
+            sections, changed_sections = self._redetect_sections(
+                previous.sections, cleaned_text, page_offsets, page_nums,
+                prefix, suffix, len(old_hashes), len(new_hashes),
+            )
+
+            is_scanned = self._detect_scanned_pdf(pages)
+            parse_time = time.time() - start_time
+            metadata = DocumentMetadata(
+                total_pages=len(pages),
+                total_tables=len(tables),
+                total_chars=len(cleaned_text),
+                total_sections=len(sections),
+                file_name=file_name,
+                file_size_mb=file_size_mb,
+                is_scanned=is_scanned,
+                parse_time_seconds=round(parse_time, 3),
+                table_pages_skipped=table_pages_skipped,
+                scanned_pages=[page.page_num for page in pages if page.is_scanned],
+                ocr_pages=ocr_pages,
+                changed_pages=changed_pages,
+                changed_sections=changed_sections,
+                reused_pages=len(pages) - len(changed_pages),
+                header_lines=header_lines,
+                footer_lines=footer_lines,
+                header_footer_bytes_removed=removed_bytes,
+                header_footer_tokens_saved=removed_chars // _CHARS_PER_TOKEN,
+                low_info_pages=low_info_pages,
+                low_info_chars=low_info_chars,
+            )
+
+            result = ParsedDocument(
+                full_text=cleaned_text,
+                pages=pages,
+                tables=tables,
+                sections=sections,
+                metadata=metadata,
+            )
+
+            if self.cache is not None:
+                self.cache.put(self._cache_key(file_path_or_bytes, self.tables, self.text_backend), result)
+
+            logger.info(
+                "Artımlı parse tamamlandı / Incremental parse completed: "
+                f"{len(changed_pages)}/{len(pages)} sayfa, "
+                f"{len(changed_sections)} bölüm değişti, {parse_time:.2f}sn"
+            )
+            return result
+
+        except (FileNotFoundError, ValueError):
+            raise
+        except Exception as e:
+            logger.error(f"Artımlı parse hatası / Incremental parse error: {e}", exc_info=True)
+            raise RuntimeError(f"PDF ayrıştırılamadı / Could not parse PDF: {e}") from e
+
+    def _redetect_sections(
+        self,
+        old_sections: list[Section],
+        text: str,
+        page_offsets: list[int],
+        page_nums: list[int],
+        prefix: int,
+        suffix: int,
+        old_count: int,
+        new_count: int,
+    ) -> tuple[list[Section], list[int]]:
+        """
+        Bölümleri yalnızca değişen sayfaları kapsayan bölgede yeniden tespit et.
+        Re-detect sections only in the region covering the changed pages.
+
+        Bölge, önekteki son bölümün sayfa başından başlar (o bölümün içeriği
+        değişen sayfalara uzanabilir) ve sonekin ikinci sayfasından itibaren
+        başlayan ilk bölümün başlığında biter. Bölge dışındaki bölümler
+        önceki sonuçtan alınır.
+
+        The region starts at the page start of the last section in the common
+        prefix (its content may run into the changed pages) and ends at the
+        heading of the first section starting on the second suffix page or
+        later. Sections outside the region are taken from the previous result.
+
+        Args:
+            old_sections: Önceki bölümler / Previous sections
+            text: Yeni temizlenmiş metin / New cleaned text
+            page_offsets: Yeni sayfa başlangıç ofsetleri / New page start offsets
+            page_nums: Ofsetlere karşılık gelen sayfa numaraları / Matching page numbers
+            prefix: Değişmeyen baş sayfa sayısı / Unchanged leading page count
+            suffix: Değişmeyen son sayfa sayısı / Unchanged trailing page count
+            old_count: Önceki sayfa sayısı / Previous page count
+            new_count: Yeni sayfa sayısı / New page count
+
+        Returns:
+            (bölümler, değişen bölüm indeksleri) / (sections, changed section indices)
+        """
+        if prefix == old_count == new_count:
+            return [section.replace() for section in old_sections], []
+
+        # Baş / Head
+        head_end = 0
+        region_start = 0
+        prefix_sections = [s for s in old_sections if 0 < s.page_num <= prefix]
+        if prefix_sections:
+            region_page = prefix_sections[-1].page_num
+            head_end = next(
+                i for i, section in enumerate(old_sections) if section.page_num >= region_page
+            )
+            region_start = _page_start(page_offsets, page_nums, region_page, len(text))
+
+        # Son / Tail
+        tail_start = len(old_sections)
+        region_end = len(text)
+        delta = new_count - old_count
+        first_tail_page = old_count - suffix + 2
+        if suffix >= 2:
+            for i in range(head_end, len(old_sections)):
+                section = old_sections[i]
+                if section.page_num < first_tail_page:
+                    continue
+                new_page = section.page_num + delta
+                page_begin = _page_start(page_offsets, page_nums, new_page, len(text))
+                page_end = _page_start(page_offsets, page_nums, new_page + 1, len(text))
+                headings = _find_headings(text, page_begin, page_end)
+                # Güvenlik: başlık beklenen yerde değilse sona kadar yeniden tara
+                # Safety: if the heading is not where expected, rescan to the end
+                if headings and headings[0][2].strip() == section.title:
+                    tail_start = i
+                    region_end = headings[0][0]
+                break
+
+        matches = _find_headings(text, region_start, region_end)
+        region = self._build_sections(text, matches, page_offsets, page_nums, region_end)
+
+        head = [section.replace() for section in old_sections[:head_end]]
+        tail = [
+            section.replace(page_num=section.page_num + delta)
+            for section in old_sections[tail_start:]
+        ]
+        old_region = {(s.title, s.content) for s in old_sections[head_end:tail_start]}
+        changed = [
+            head_end + i
+            for i, section in enumerate(region)
+            if (section.title, section.content) not in old_region
+        ]
+        return head + region + tail, changed
+
+    # ----------------------------------------------------------
+    # ZIP İhale Paketi / ZIP Tender Package
+    # ----------------------------------------------------------
+
+    def parse_package(
+        self,
+        zip_path_or_bytes: PDFInput,
+        max_member_mb: float | None = None,
+    ) -> "TenderPackage":
+        """
+        EKAP ZIP paketindeki tüm PDF'leri ayrıştır ve role göre grupla.
+        Parse every PDF in an EKAP ZIP package and group them by role.
+
+        Arşiv açılmaz; üyeler tek tek akıtılır ve PDF'ler süreç havuzunda
+        paralel ayrıştırılır (bkz. src.pdf_parser.package).
+        The archive is not extracted; members are streamed one by one and
+        the PDFs are parsed in parallel in a process pool (see
+        src.pdf_parser.package).
+
+        Args:
+            zip_path_or_bytes: ZIP dosya yolu veya bytes benzeri tampon /
+                               ZIP file path or bytes-like buffer
+            max_member_mb: Bu boyutu aşan üyeler atlanır (None = sınırsız) /
+                           Members larger than this are skipped (None = no limit)
+
+        Returns:
+            TenderPackage: ``by_role()`` ile role göre dokümanlar /
+                           documents by role via ``by_role()``
+
+        Raises:
+            FileNotFoundError: Dosya bulunamadığında / When file not found
+            ValueError: Girdi geçerli bir ZIP değilse / When the input is not a valid ZIP
+        """
+        from src.pdf_parser.package import parse_package
+
+        return parse_package(self, zip_path_or_bytes, max_member_mb)
+
+    # ----------------------------------------------------------
+    # Akış API'si / Streaming API
+    # ----------------------------------------------------------
+
+    def iter_pages(
+        self,
+        file_path_or_bytes: PDFInput,
+        extract_tables: bool = True,
+    ) -> Iterator[PageContent]:
+        """
+        Sayfaları çıkarıldıkça sırayla üretir / Yields pages in order as they are extracted.
+
+        Sonraki aşamalar (chunk'lama, embedding, arayüz ilerlemesi) ilk sayfa
+        hazır olduğunda başlayabilir; dokümanın tamamı beklenmez.
+        Later stages (chunking, embedding, UI progress) can start as soon as
+        the first page is ready, without waiting for the whole document.
+
+        Args:
+            file_path_or_bytes: PDF dosya yolu veya bytes / PDF file path or bytes
+            extract_tables: Tablo çıkarsın mı (has_table alanı için) /
+                            Should extract tables (for the has_table field)
+
+        Yields:
+            PageContent: Sayfa içeriği (temiz metinle) / Page content (with cleaned text)
+        """
+        _, _, pdf_source = self._resolve_input(file_path_or_bytes)
+        table_mode = self.tables if extract_tables else "never"
+        for extracted in self._iter_extracted(pdf_source, tables=table_mode):
+            yield extracted.page
+
+    def iter_sections(self, file_path_or_bytes: PDFInput) -> Iterator[Section]:
+        """
+        Bölümleri tamamlandıkça sırayla üretir / Yields sections in order as they complete.
+
+        Bir bölüm, bir sonraki başlık görüldüğünde (veya doküman bittiğinde)
+        tamamlanmış sayılır.
+        A section is complete once the next heading is seen (or the document ends).
+
+        ``strip_headers`` açıksa sayfalar ``parse`` ile aynı şekilde tekrarlı
+        başlık/altbilgi satırlarından arındırılır; bunun için ilk
+        ``_HEADER_LEARN_PAGES`` sayfa tamponlanır, ilk bölümler pencere
+        dolunca gelir.
+        With ``strip_headers`` enabled, pages are stripped of repeated
+        header/footer lines exactly as in ``parse``; the first
+        ``_HEADER_LEARN_PAGES`` pages are buffered for that, so the first
+        sections arrive once the window fills.
+
+        Args:
+            file_path_or_bytes: PDF dosya yolu veya bytes / PDF file path or bytes
+
+        Yields:
+            Section: Tespit edilen bölüm / Detected section
+        """
+        _, _, pdf_source = self._resolve_input(file_path_or_bytes)
+        for item in self._stream(pdf_source, tables="never", header_filter=self._header_filter()):
+            yield from item.sections
+
     # ----------------------------------------------------------
     # Metin Çıkarma / Text Extraction
     # ----------------------------------------------------------
 
-    def extract_text(self, file_path_or_bytes: str | Path | bytes) -> str:
+    def extract_text(self, file_path_or_bytes: PDFInput) -> str:
         """
         PDF'den tüm metni çıkarır / Extract all text from PDF.
 
@@ -293,7 +1355,7 @@ class IhalePDFParser:
         """
         try:
             _, _, pdf_source = self._resolve_input(file_path_or_bytes)
-            pages, _ = self._extract_all(pdf_source, extract_tables=False)
+            pages, _ = self._extract_all(pdf_source, tables="never")
             return "\n\n".join(page.text for page in pages if page.text)
         except Exception as e:
             logger.error(f"Metin çıkarma hatası / Text extraction error: {e}", exc_info=True)
@@ -303,7 +1365,11 @@ class IhalePDFParser:
     # Tablo Çıkarma / Table Extraction
     # ----------------------------------------------------------
 
-    def extract_tables(self, file_path_or_bytes: str | Path | bytes) -> list[TableContent]:
+    def extract_tables(
+        self,
+        file_path_or_bytes: PDFInput,
+        tables: str | None = None,
+    ) -> list[TableContent]:
         """
         PDF'deki tabloları çıkarır / Extract tables from PDF.
 
@@ -312,14 +1378,17 @@ class IhalePDFParser:
 
         Args:
             file_path_or_bytes: PDF dosya yolu veya bytes / PDF file path or bytes
+            tables: Tablo çıkarma modu (None = parser varsayılanı) /
+                    Table extraction mode (None = parser default)
 
         Returns:
             Tablo listesi / List of tables
         """
         try:
+            table_mode = self._resolve_table_mode(tables)
             _, _, pdf_source = self._resolve_input(file_path_or_bytes)
-            _, tables = self._extract_all(pdf_source, extract_text=False)
-            return tables
+            _, extracted = self._extract_all(pdf_source, extract_text=False, tables=table_mode)
+            return extracted
         except Exception as e:
             logger.error(f"Tablo çıkarma hatası / Table extraction error: {e}", exc_info=True)
             raise
@@ -328,7 +1397,7 @@ class IhalePDFParser:
     # Metadata Çıkarma / Metadata Extraction
     # ----------------------------------------------------------
 
-    def extract_metadata(self, file_path_or_bytes: str | Path | bytes) -> dict:
+    def extract_metadata(self, file_path_or_bytes: PDFInput) -> dict:
         """
         PDF meta verilerini çıkarır / Extract PDF metadata.
 
@@ -341,22 +1410,46 @@ class IhalePDFParser:
         try:
             file_name, file_size_mb, pdf_source = self._resolve_input(file_path_or_bytes)
             with pdfplumber.open(pdf_source) as pdf:
-                info = pdf.metadata or {}
-                return {
-                    "file_name": file_name,
-                    "file_size_mb": file_size_mb,
-                    "total_pages": len(pdf.pages),
-                    "author": info.get("Author", ""),
-                    "creator": info.get("Creator", ""),
-                    "producer": info.get("Producer", ""),
-                    "title": info.get("Title", ""),
-                    "subject": info.get("Subject", ""),
-                    "creation_date": info.get("CreationDate", ""),
-                }
+                return _metadata_dict(pdf, file_name, file_size_mb)
         except Exception as e:
             logger.error(f"Metadata çıkarma hatası / Metadata extraction error: {e}", exc_info=True)
             raise
 
+    def quick_preview(self, file_path_or_bytes: PDFInput, preview_pages: int = 1) -> dict:
+        """
+        Hızlı ön izleme — sayfa sayısı, PDF meta verisi ve ilk sayfa metni.
+        Quick preview — page count, PDF metadata and first page text.
+
+        Yalnızca ilk ``preview_pages`` sayfanın metni çıkarılır; tablo,
+        bölüm, OCR ve önbellek adımları çalışmaz. Büyük dosyalarda da
+        süre sayfa sayısından bağımsızdır.
+        Only the text of the first ``preview_pages`` pages is extracted;
+        table, section, OCR and cache steps do not run. The time does not
+        depend on the page count, even for large files.
+
+        Args:
+            file_path_or_bytes: PDF dosya yolu veya bytes/memoryview verisi /
+                                PDF file path or bytes/memoryview data
+            preview_pages: Metni çıkarılacak sayfa sayısı / Pages to extract text from
+
+        Returns:
+            ``extract_metadata`` alanları + "preview_text" /
+            ``extract_metadata`` fields + "preview_text"
+
+        Raises:
+            FileNotFoundError: Dosya bulunamadığında / When file not found
+            ValueError: Geçersiz dosya formatında / When invalid file format
+        """
+        file_name, file_size_mb, pdf_source = self._resolve_input(file_path_or_bytes)
+        texts: list[str] = []
+        with pdfplumber.open(pdf_source) as pdf:
+            preview = _metadata_dict(pdf, file_name, file_size_mb)
+            for page in pdf.pages[:max(0, preview_pages)]:
+                texts.append(self.clean_text(page.extract_text() or ""))
+                page.close()
+        preview["preview_text"] = "\n\n".join(text for text in texts if text)
+        return preview
+
     # ----------------------------------------------------------
     # Bölüm Tespiti / Section Detection
     # ----------------------------------------------------------
@@ -375,9 +1468,18 @@ class IhalePDFParser:
             - "BÖLÜM X" veya "Bölüm X"
             - "EK-X" veya "Ek X"
 
+        Üç kalıp birleşik tek bir ifadeyle tek geçişte aranır; sayfa
+        numarası, temizlenmiş metindeki sayfa ofsetleri üzerinde ikili
+        aramayla bulunur (O(log sayfa)).
+        The three patterns are matched in a single pass with one combined
+        expression; the page number is found by binary search over page
+        offsets in the cleaned text (O(log pages)).
+
         Args:
-            text: Temizlenmiş doküman metni / Cleaned document text
-            pages: Sayfa listesi (sayfa numarası tespiti için) / Page list (for page number detection)
+            text: Temizlenmiş doküman metni (parse çıktısı full_text) /
+                  Cleaned document text (full_text from parse)
+            pages: Ham sayfa listesi (sayfa numarası tespiti için) /
+                   Raw page list (for page number detection)
 
         Returns:
             Tespit edilen bölüm listesi / List of detected sections
@@ -386,51 +1488,17 @@ class IhalePDFParser:
             return []
 
         try:
-            # Tüm eşleşmeleri bul / Find all matches
-            matches: list[tuple[int, str, str]] = []  # (position, full_title, rest_of_title)
-
-            for pattern in SECTION_PATTERNS:
-                for match in pattern.finditer(text):
-                    prefix = match.group(1)  # "Madde", "BÖLÜM", "EK"
-                    number = match.group(2)  # "5", "III", "1"
-                    rest = match.group(3).strip() if match.group(3) else ""
-
-                    if rest:
-                        full_title = f"{prefix} {number} - {rest}"
-                    else:
-                        full_title = f"{prefix} {number}"
-
-                    matches.append((match.start(), full_title, rest))
+            # Tüm başlıkları tek geçişte bul / Find all headings in a single pass
+            matches = _find_headings(text)
 
             if not matches:
                 return []
 
-            # Pozisyona göre sırala / Sort by position
-            matches.sort(key=lambda x: x[0])
+            # Temizlenmiş metindeki sayfa başlangıç ofsetleri (ikili arama için)
+            # Page start offsets in the cleaned text (for binary search)
+            page_offsets, page_nums = self._page_offsets(pages) if pages else ([], [])
 
-            # Her bölümün içeriğini çıkar / Extract content for each section
-            sections: list[Section] = []
-            for i, (pos, title, _rest) in enumerate(matches):
-                # İçerik: bu bölümün sonundan bir sonraki bölümün başına kadar
-                # Content: from end of this heading to start of next heading
-                content_start = pos + len(title)
-                content_end = matches[i + 1][0] if i + 1 < len(matches) else len(text)
-                content = text[content_start:content_end].strip()
-
-                # Sayfa numarası tespiti / Page number detection
-                page_num = self._find_page_for_position(text, pos, pages)
-
-                # Bölüm tipi tahmini / Section type classification
-                section_type = self._classify_section_type(title, content)
-
-                sections.append(
-                    Section(
-                        title=title.strip(),
-                        content=content,
-                        page_num=page_num,
-                        section_type=section_type,
-                    )
-                )
+            sections = self._build_sections(text, matches, page_offsets, page_nums, len(text))
 
             logger.info(f"{len(sections)} bölüm tespit edildi / sections detected")
             return sections
@@ -439,15 +1507,64 @@ class IhalePDFParser:
             logger.error(f"Bölüm tespiti hatası / Section detection error: {e}", exc_info=True)
             return []
 
-    # ----------------------------------------------------------
-    # Metin Temizleme / Text Cleaning
-    # ----------------------------------------------------------
-
-    def clean_text(self, text: str) -> str:
+    def _build_sections(
+        self,
+        text: str,
+        matches: list[tuple[int, int, str]],
+        page_offsets: list[int],
+        page_nums: list[int],
+        text_end: int,
+    ) -> list[Section]:
+        """
+        Başlık eşleşmelerinden Section listesi kur.
+        Build the Section list from heading matches.
+
+        Args:
+            text: Temizlenmiş doküman metni / Cleaned document text
+            matches: (başlangıç, bitiş, başlık) listesi / List of (start, end, title)
+            page_offsets: Artan sayfa başlangıç ofsetleri / Ascending page start offsets
+            page_nums: Ofsetlere karşılık gelen sayfa numaraları / Matching page numbers
+            text_end: Son bölümün içerik sonu / Content end of the last section
+
+        Returns:
+            Bölüm listesi / List of sections
+        """
+        # İçerik: bu başlığın sonundan bir sonraki başlığın başına kadar
+        # Content: from end of this heading to start of next heading
+        contents = [
+            text[end:matches[i + 1][0] if i + 1 < len(matches) else text_end].strip()
+            for i, (_pos, end, _title) in enumerate(matches)
+        ]
+        # Bölüm tipi tahmini — tek taramada / Section type classification — one scan
+        section_types = self.classify_sections(
+            [(title, content) for (_pos, _end, title), content in zip(matches, contents)]
+        )
+
+        return [
+            Section(
+                title=title.strip(),
+                content=content,
+                # Sayfa numarası tespiti / Page number detection
+                page_num=_page_at(page_offsets, page_nums, pos),
+                section_type=section_type,
+            )
+            for (pos, _end, title), content, section_type in zip(matches, contents, section_types)
+        ]
+
+    # ----------------------------------------------------------
+    # Metin Temizleme / Text Cleaning
+    # ----------------------------------------------------------
+
+    def clean_text(self, text: str) -> str:
         """
         Gereksiz karakterleri ve header/footer tekrarlarını temizler.
         Cleans unnecessary characters and header/footer repeats.
 
+        Sayfa başına çalışır; çıkarma sırasında worker'larda aynı
+        ``_clean_text`` fonksiyonu uygulanır.
+        Works per page; extraction applies the same ``_clean_text`` function
+        inside the workers.
+
         İşlemler / Operations:
             1. NUL ve kontrol karakterlerini kaldır
             2. Ardışık boşlukları normalleştir
@@ -460,27 +1577,8 @@ class IhalePDFParser:
         Returns:
             Temizlenmiş metin / Cleaned text
         """
-        if not text:
-            return ""
-
         try:
-            # NUL ve kontrol karakterleri kaldır (newline/tab hariç)
-            # Remove NUL and control chars (except newline/tab)
-            cleaned = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]", "", text)
-
-            # Ardışık boşlukları tek boşluğa çevir (newline'lar hariç)
-            # Collapse consecutive spaces (not newlines)
-            cleaned = re.sub(r"[^\S\n]+", " ", cleaned)
-
-            # Satır başı/sonu boşlukları temizle / Strip line whitespace
-            lines = [line.strip() for line in cleaned.split("\n")]
-            cleaned = "\n".join(lines)
-
-            # 3+ ardışık boş satırı 2'ye düşür / Reduce 3+ blank lines to 2
-            cleaned = re.sub(r"\n{3,}", "\n\n", cleaned)
-
-            return cleaned.strip()
-
+            return _clean_text(text)
         except Exception as e:
             logger.error(f"Metin temizleme hatası / Text cleaning error: {e}", exc_info=True)
             return text
@@ -489,14 +1587,89 @@ class IhalePDFParser:
     # Dahili Yardımcı Metodlar / Internal Helper Methods
     # ----------------------------------------------------------
 
+    def _resolve_table_mode(self, tables: str | None) -> str:
+        """
+        Tablo modunu doğrula; None ise parser varsayılanını kullan.
+        Validate the table mode; fall back to the parser default on None.
+
+        Args:
+            tables: "auto", "always", "never" veya None / or None
+
+        Returns:
+            Geçerli tablo modu / Valid table mode
+
+        Raises:
+            ValueError: Geçersiz modda / When the mode is invalid
+        """
+        mode = self.tables if tables is None else tables
+        if mode not in TABLE_MODES:
+            raise ValueError(
+                f"Geçersiz tablo modu / Invalid table mode: {mode!r} "
+                f"(beklenen / expected: {', '.join(TABLE_MODES)})"
+            )
+        return mode
+
+    def _resolve_text_backend(
+        self, text_backend: "str | TextBackend | None"
+    ) -> "str | TextBackend":
+        """
+        Metin motorunu doğrula; None ise parser varsayılanını kullan.
+        Validate the text backend; fall back to the parser default on None.
+
+        Args:
+            text_backend: Motor adı, TextBackend örneği veya None /
+                          Backend name, TextBackend instance or None
+
+        Returns:
+            Geçerli motor adı veya örneği / Valid backend name or instance
+
+        Raises:
+            ValueError: Bilinmeyen motor adında / When the backend name is unknown
+        """
+        backend = self.text_backend if text_backend is None else text_backend
+        if isinstance(backend, str) and backend not in TEXT_BACKENDS:
+            raise ValueError(
+                f"Geçersiz metin motoru / Invalid text backend: {backend!r} "
+                f"(beklenen / expected: {', '.join(TEXT_BACKENDS)})"
+            )
+        return backend
+
+    def _select_text_backend(
+        self, text_backend: "str | TextBackend | None", total_pages: int
+    ) -> "TextBackend":
+        """
+        Doküman için metin motorunu seç ("auto" sayfa sayısına göre).
+        Select the text backend for a document ("auto" by page count).
+
+        Args:
+            text_backend: Motor (None = parser varsayılanı) / Backend (None = parser default)
+            total_pages: Dokümanın sayfa sayısı / Page count of the document
+
+        Returns:
+            TextBackend
+        """
+        from src.pdf_parser.backends import select_text_backend
+
+        return select_text_backend(
+            self._resolve_text_backend(text_backend), total_pages, self.fast_backend_min_pages
+        )
+
     def _resolve_input(
-        self, file_path_or_bytes: str | Path | bytes
-    ) -> tuple[str, float, str | io.BytesIO]:
+        self, file_path_or_bytes: PDFInput
+    ) -> tuple[str, float, str | BinaryIO]:
         """
         Giriş tipini belirle ve doğrula / Resolve and validate input type.
 
+        Tamponlar kopyalanmaz: bytes, BytesIO ile paylaşılır; bytearray ve
+        memoryview doğrudan bellek görünümü üzerinden okunur. Uzantısı .pdf
+        olmayan yollar (örn. geçici dosyalar) PDF imzası taşıyorsa kabul edilir.
+        Buffers are not copied: bytes are shared with BytesIO; bytearray and
+        memoryview are read straight through a memory view. Paths without a
+        .pdf suffix (e.g. temp files) are accepted if they carry the PDF signature.
+
         Args:
-            file_path_or_bytes: Dosya yolu veya bytes / File path or bytes
+            file_path_or_bytes: Dosya yolu veya bytes benzeri tampon /
+                                File path or bytes-like buffer
 
         Returns:
             (dosya_adı, boyut_mb, pdf_kaynak) / (filename, size_mb, pdf_source)
@@ -505,10 +1678,16 @@ class IhalePDFParser:
             FileNotFoundError: Dosya bulunamadığında
             ValueError: Geçersiz dosya formatında
         """
-        if isinstance(file_path_or_bytes, bytes):
+        if isinstance(file_path_or_bytes, (bytes, bytearray, memoryview)):
             file_name = "bytes_input.pdf"
-            file_size_mb = round(len(file_path_or_bytes) / (1024 * 1024), 3)
-            pdf_source = io.BytesIO(file_path_or_bytes)
+            if isinstance(file_path_or_bytes, bytes):
+                pdf_source: BinaryIO = io.BytesIO(file_path_or_bytes)
+                size = len(file_path_or_bytes)
+            else:
+                buffer = memoryview(file_path_or_bytes).cast("B")
+                pdf_source = _BufferReader(buffer)
+                size = buffer.nbytes
+            file_size_mb = round(size / (1024 * 1024), 3)
             logger.info(f"Bytes girdi alındı / Bytes input received: {file_size_mb:.3f} MB")
             return file_name, file_size_mb, pdf_source
 
@@ -519,7 +1698,7 @@ class IhalePDFParser:
                 f"PDF dosyası bulunamadı / PDF file not found: {file_path}"
             )
 
-        if file_path.suffix.lower() != ".pdf":
+        if file_path.suffix.lower() != ".pdf" and not _has_pdf_signature(file_path):
             raise ValueError(
                 f"Geçersiz dosya uzantısı / Invalid file extension: {file_path.suffix}"
             )
@@ -529,64 +1708,485 @@ class IhalePDFParser:
         logger.info(f"PDF dosyası: {file_name} ({file_size_mb:.3f} MB)")
         return file_name, file_size_mb, str(file_path)
 
+    def _stream(
+        self,
+        pdf_source: str | BinaryIO,
+        tables: str = "auto",
+        detect_sections: bool = True,
+        pages: list[int] | None = None,
+        text_backend: "str | TextBackend | None" = None,
+        header_filter: "_HeaderFooterFilter | None" = None,
+    ) -> Iterator["_StreamItem"]:
+        """
+        Sayfa sayfa ayrıştırma akışı — parse ve iter_* metodlarının ortak çekirdeği.
+        Page-by-page parse stream — shared core of parse and the iter_* methods.
+
+        Her sayfa için sayfayı (temizlenmiş metniyle), çıkarılan tabloları ve
+        o sayfayla tamamlanan bölümleri üretir. Son öğe (page=None) doküman
+        sonunda kapanan bölümleri taşır.
+
+        Yields, for each page, the page (with its cleaned text), the extracted
+        tables and the sections completed by that page. The final item (page=None) carries
+        the sections closed by the end of the document.
+
+        ``header_filter`` verilirse sayfalar bölüm tespitinden önce tekrarlı
+        başlık/altbilgi satırlarından arındırılır (ilk pencere tamponlanır).
+        With a ``header_filter``, pages are stripped of repeated header/footer
+        lines before section detection (the first window is buffered).
+
+        Args:
+            pdf_source: PDF dosya yolu veya dosya nesnesi / PDF file path or file object
+            tables: Tablo çıkarma modu / Table extraction mode
+            detect_sections: Bölüm tespiti yapılsın mı / Should detect sections
+            pages: Yalnızca bu sayfa indeksleri (None = tümü) /
+                   Only these page indices (None = all)
+            text_backend: Metin motoru (None = parser varsayılanı) /
+                          Text backend (None = parser default)
+            header_filter: Başlık/altbilgi süzgeci (None = silme yok) /
+                           Header/footer filter (None = no removal)
+
+        Yields:
+            _StreamItem: Sayfa sonucu / Page result
+        """
+        detector = _SectionDetector(self._classify_section_type)
+
+        def item(extracted) -> _StreamItem:
+            page = extracted.page
+            return _StreamItem(
+                page=page,
+                tables=extracted.tables,
+                tables_skipped=extracted.tables_skipped,
+                sections=detector.feed(page.text, page.page_num) if detect_sections else [],
+            )
+
+        for extracted in self._iter_extracted(
+            pdf_source, tables=tables, pages=pages, text_backend=text_backend
+        ):
+            ready = header_filter.feed(extracted) if header_filter is not None else [extracted]
+            for ready_extracted in ready:
+                yield item(ready_extracted)
+        if header_filter is not None:
+            for ready_extracted in header_filter.finish():
+                yield item(ready_extracted)
+
+        yield _StreamItem(sections=detector.finish() if detect_sections else [])
+
+    def _collect(
+        self,
+        pdf_source: str | BinaryIO,
+        tables: str,
+        pages: list[int] | None,
+        text_backend: "str | TextBackend | None" = None,
+        header_filter: "_HeaderFooterFilter | None" = None,
+        detect_sections: bool = True,
+    ) -> tuple[list[PageContent], list[TableContent], int, list[Section]]:
+        """
+        Akışı topla: sayfalar (temiz ve başlık/altbilgiden arındırılmış
+        metinleriyle), tablolar ve bölümler.
+        Collect the stream: pages (with their cleaned, header/footer-stripped
+        text), tables and sections.
+
+        Düşük bellek modunda sayfa metinleri çıkarma süresince bir metin
+        deposunda tutulur (bütçe aşılınca geçici dosyada) ve PDF kapandıktan
+        sonra geri yüklenir; böylece metin ve pdfplumber nesneleri aynı anda
+        bellekte büyümez.
+        In low-memory mode page texts are held in a text spool during
+        extraction (in a temp file beyond the budget) and restored after the
+        PDF is closed, so the text and the pdfplumber objects do not grow in
+        memory at the same time.
+
+        Args:
+            pdf_source: PDF dosya yolu veya dosya nesnesi / PDF file path or file object
+            tables: Tablo çıkarma modu / Table extraction mode
+            pages: Yalnızca bu sayfa indeksleri (None = tümü) /
+                   Only these page indices (None = all)
+            text_backend: Metin motoru (None = parser varsayılanı) /
+                          Text backend (None = parser default)
+            header_filter: Başlık/altbilgi süzgeci / Header/footer filter
+            detect_sections: Bölümler akışta tespit edilsin mi /
+                             Should sections be detected in the stream
+
+        Returns:
+            (sayfalar, tablolar, atlanan tablo sayfası, bölümler) /
+            (pages, tables, table pages skipped, sections)
+        """
+        collected: list[PageContent] = []
+        collected_tables: list[TableContent] = []
+        sections: list[Section] = []
+        tables_skipped = 0
+        spool = _TextSpool(self.text_budget_bytes) if self.low_memory else None
+
+        try:
+            for item in self._stream(
+                pdf_source, tables=tables, detect_sections=detect_sections, pages=pages,
+                text_backend=text_backend, header_filter=header_filter,
+            ):
+                sections.extend(item.sections)
+                if item.page is None:
+                    continue
+                collected_tables.extend(item.tables)
+                tables_skipped += item.tables_skipped
+                if spool is not None:
+                    spool.put(len(collected), item.page.text)
+                    item.page.text = ""
+                collected.append(item.page)
+
+            if spool is not None:
+                if spool.spilled_bytes:
+                    logger.info(
+                        f"Sayfa metni geçici dosyaya taşındı / Page text spilled to temp file: "
+                        f"{spool.spilled_bytes / (1024 * 1024):.1f} MB"
+                    )
+                for index, page in enumerate(collected):
+                    page.text = spool.take(index)
+        finally:
+            if spool is not None:
+                spool.close()
+
+        return collected, collected_tables, tables_skipped, sections
+
+    def _assemble(self, pages: list[PageContent]) -> tuple[str, list[Section]]:
+        """
+        Temizlenmiş sayfalardan tam metni ve bölümleri kur.
+        Build the full text and the sections from cleaned pages.
+
+        Args:
+            pages: Temiz metinli sayfa listesi / Page list with cleaned texts
+
+        Returns:
+            (tam_metin, bölümler) / (full_text, sections)
+        """
+        detector = _SectionDetector(self._classify_section_type)
+        sections: list[Section] = []
+        for page in pages:
+            sections.extend(detector.feed(page.text, page.page_num))
+        sections.extend(detector.finish())
+        return "\n\n".join(page.text for page in pages if page.text), sections
+
+    def _header_filter(self) -> "_HeaderFooterFilter | None":
+        """Akış için başlık/altbilgi süzgeci (strip_headers kapalıysa None) / Stream header/footer filter."""
+        return _HeaderFooterFilter(self.clean_text) if self.strip_headers else None
+
+    def _strip_headers_footers(
+        self,
+        pages: list[PageContent],
+        header_lines: list[str],
+        footer_lines: list[str],
+    ) -> tuple[list[int], int, int]:
+        """
+        Tekrarlı başlık/altbilgi satırlarını sayfa metinlerinden sil (yerinde).
+        Remove repeated header/footer lines from page texts (in place).
+
+        Args:
+            pages: Sayfa listesi / Page list
+            header_lines: Normalize başlık satırları / Normalised header lines
+            footer_lines: Normalize altbilgi satırları / Normalised footer lines
+
+        Returns:
+            (değişen sayfa numaraları, silinen bayt, silinen karakter) /
+            (modified page numbers, removed bytes, removed chars)
+        """
+        if not header_lines and not footer_lines:
+            return [], 0, 0
+
+        headers, footers = set(header_lines), set(footer_lines)
+        modified: list[int] = []
+        removed_bytes = removed_chars = 0
+        for page in pages:
+            text, removed = _strip_repeated_lines(page.text, headers, footers)
+            if not removed:
+                continue
+            page.text = text
+            modified.append(page.page_num)
+            removed_chars += sum(len(line) for line in removed)
+            removed_bytes += sum(len(line.encode("utf-8")) for line in removed)
+        return modified, removed_bytes, removed_chars
+
+    def _cache_key(
+        self,
+        file_path_or_bytes: PDFInput,
+        table_mode: str,
+        text_backend: "str | TextBackend" = "pdfplumber",
+    ) -> str:
+        """
+        Girdi ve çıktıyı etkileyen seçeneklerden önbellek anahtarı oluştur.
+        Build the cache key from the input and the output-affecting options.
+
+        Args:
+            file_path_or_bytes: Doğrulanmış girdi / Validated input
+            table_mode: Tablo çıkarma modu / Table extraction mode
+            text_backend: Metin motoru / Text backend
+
+        Returns:
+            Önbellek anahtarı / Cache key
+        """
+        variant = f"tables-{table_mode}"
+        backend_name = getattr(text_backend, "name", text_backend)
+        if backend_name != "pdfplumber":
+            variant += f"-text-{backend_name}"
+        if self.ocr is not None:
+            variant += f"-ocr-{self.ocr.backend.cache_id}"
+        if not self.strip_headers:
+            variant += "-keephf"
+        if not self.keep_raw_tables:
+            variant += "-noraw"
+        return self.cache.make_key(self._content_hash(file_path_or_bytes), variant=variant)
+
+    @staticmethod
+    def _content_hash(file_path_or_bytes: PDFInput) -> str:
+        """
+        Girdinin SHA-256 özeti (önbellek anahtarı için).
+        SHA-256 digest of the input (for the cache key).
+
+        Tamponlar yerinde özetlenir; dosyalar belleğe eşlenir (mmap), yani
+        dosya içeriği Python belleğine kopyalanmaz.
+        Buffers are hashed in place; files are memory-mapped (mmap), so the
+        file content is never copied into Python memory.
+
+        Args:
+            file_path_or_bytes: Doğrulanmış dosya yolu veya tampon / Validated file path or buffer
+
+        Returns:
+            Hex özet / Hex digest
+        """
+        if isinstance(file_path_or_bytes, (bytes, bytearray, memoryview)):
+            return hash_file(file_path_or_bytes)
+        with _mapped_file(file_path_or_bytes) as mapped:
+            return hash_file(mapped)
+
     def _extract_all(
         self,
-        pdf_source: str | io.BytesIO,
+        pdf_source: str | BinaryIO,
         extract_text: bool = True,
-        extract_tables: bool = True,
+        tables: str = "auto",
     ) -> tuple[list[PageContent], list[TableContent]]:
         """
         pdfplumber ile sayfa sayfa metin ve tablo çıkar.
         Extract text and tables page by page with pdfplumber.
 
-        Bellek dostu: her sayfa ayrı işlenir, büyük PDF'lerde
-        tüm sayfalar belleğe alınmaz.
-
-        Memory-efficient: each page is processed separately.
-
         Args:
-            pdf_source: PDF dosya yolu veya BytesIO / PDF file path or BytesIO
+            pdf_source: PDF dosya yolu veya dosya nesnesi / PDF file path or file object
             extract_text: Metin çıkarsın mı / Should extract text
-            extract_tables: Tablo çıkarsın mı / Should extract tables
+            tables: Tablo çıkarma modu / Table extraction mode
 
         Returns:
             (sayfa_listesi, tablo_listesi) / (pages, tables)
         """
         pages: list[PageContent] = []
-        tables: list[TableContent] = []
+        all_tables: list[TableContent] = []
+        for extracted in self._iter_extracted(pdf_source, extract_text, tables):
+            pages.append(extracted.page)
+            all_tables.extend(extracted.tables)
+        return pages, all_tables
+
+    def _iter_extracted(
+        self,
+        pdf_source: str | BinaryIO,
+        extract_text: bool = True,
+        tables: str = "auto",
+        pages: list[int] | None = None,
+        text_backend: "str | TextBackend | None" = None,
+    ) -> Iterator["_ExtractedPage"]:
+        """
+        Sayfaları sırayla çıkarıp üretir / Extract and yield pages in order.
+
+        Sayfa sayısı ``parallel_min_pages`` ve üzerindeyse doküman sayfa
+        aralıklarına bölünür ve süreç havuzunda paralel işlenir; aksi halde
+        seri işlenir. Her iki modda da sayfalar sırayla üretilir. Sayfa
+        seçimi verilirse yalnızca seçilen sayfalar seri işlenir.
 
+        If the page count is at least ``parallel_min_pages``, the document
+        is split into page ranges processed in a process pool; otherwise
+        it is processed serially. Pages are yielded in order in both modes.
+        With a page selection, only the selected pages are processed serially.
+
+        Args:
+            pdf_source: PDF dosya yolu veya dosya nesnesi / PDF file path or file object
+            extract_text: Metin çıkarsın mı / Should extract text
+            tables: Tablo çıkarma modu / Table extraction mode
+            pages: Artan sayfa indeksleri (0-indexed, None = tümü) /
+                   Ascending page indices (0-indexed, None = all)
+            text_backend: Metin motoru (None = parser varsayılanı; "auto" toplam
+                          sayfa sayısına göre seçer) / Text backend (None =
+                          parser default; "auto" selects by total page count)
+
+        Yields:
+            _ExtractedPage: Sayfa ve tabloları / Page and its tables
+        """
         with pdfplumber.open(pdf_source) as pdf:
             total_pages = len(pdf.pages)
-            logger.info(f"Toplam {total_pages} sayfa işlenecek / pages to process")
-
-            for i, page in enumerate(pdf.pages, start=1):
-                page_text = ""
-                page_has_table = False
-
-                # Metin çıkarma / Text extraction
-                if extract_text:
-                    raw_text = page.extract_text() or ""
-                    page_text = raw_text
-
-                # Tablo çıkarma / Table extraction
-                if extract_tables:
-                    page_tables = self._extract_tables_from_page(page, i)
-                    if page_tables:
-                        page_has_table = True
-                        tables.extend(page_tables)
-
-                pages.append(
-                    PageContent(page_num=i, text=page_text, has_table=page_has_table)
+            backend = self._select_text_backend(text_backend, total_pages)
+            if pages is not None:
+                selected = [index for index in pages if 0 <= index < total_pages]
+                logger.info(
+                    f"{total_pages} sayfadan {len(selected)} sayfa işlenecek / "
+                    f"{len(selected)} of {total_pages} pages to process"
+                )
+                with _open_text_layer(backend, pdf_source) as text_layer:
+                    for index in selected:
+                        yield from _iter_pages(
+                            pdf, index, index + 1, extract_text, tables, *self._page_options(),
+                            text_layer=text_layer,
+                        )
+                return
+
+            logger.info(
+                f"Toplam {total_pages} sayfa işlenecek / pages to process "
+                f"(metin motoru / text backend: {backend.name})"
+            )
+
+            workers = self._resolve_worker_count(total_pages)
+            if workers <= 1:
+                with _open_text_layer(backend, pdf_source) as text_layer:
+                    yield from _iter_pages(
+                        pdf, 0, total_pages, extract_text, tables, *self._page_options(),
+                        text_layer=text_layer,
+                    )
+                return
+
+        next_index = 0
+        try:
+            for extracted in self._iter_parallel(
+                pdf_source, total_pages, workers, extract_text, tables, backend
+            ):
+                yield extracted
+                next_index = extracted.page.page_num
+        except Exception as e:
+            # Süreç havuzu başarısız olursa kalan sayfalar seri işlenir
+            # If the process pool fails, the remaining pages are processed serially
+            logger.warning(
+                f"Paralel çıkarma başarısız, seri moda geçiliyor / "
+                f"Parallel extraction failed, falling back to serial: {e}"
+            )
+            with pdfplumber.open(pdf_source) as pdf, _open_text_layer(backend, pdf_source) as text_layer:
+                yield from _iter_pages(
+                    pdf, next_index, total_pages, extract_text, tables, *self._page_options(),
+                    text_layer=text_layer,
                 )
 
-                # Her 50 sayfada ilerleme logu / Progress log every 50 pages
-                if i % 50 == 0:
-                    logger.info(f"İlerleme / Progress: {i}/{total_pages} sayfa işlendi")
+    def _resolve_worker_count(self, total_pages: int) -> int:
+        """
+        Doküman için kullanılacak worker sayısını belirle.
+        Determine the worker count to use for a document.
+
+        Args:
+            total_pages: Toplam sayfa / Total pages
+
+        Returns:
+            Worker sayısı (1 = seri) / Worker count (1 = serial)
+        """
+        if self.max_workers <= 1 or total_pages < max(2, self.parallel_min_pages):
+            return 1
+        return min(self.max_workers, total_pages)
+
+    def _iter_parallel(
+        self,
+        pdf_source: str | BinaryIO,
+        total_pages: int,
+        workers: int,
+        extract_text: bool,
+        tables: str,
+        text_backend: "TextBackend | None" = None,
+    ) -> Iterator["_ExtractedPage"]:
+        """
+        Sayfa aralıklarını süreç havuzunda paralel işle.
+        Process page ranges in parallel in a process pool.
 
-        return pages, tables
+        Her worker PDF'i kendisi açar; sonuçlar sayfa sırasıyla üretilir.
+        Bir aralık hazır olur olmaz sayfaları tüketiciye verilir.
+        Each worker opens the PDF itself; results are yielded in page order
+        as soon as each range is ready.
 
+        Args:
+            pdf_source: PDF dosya yolu veya dosya nesnesi / PDF file path or file object
+            total_pages: Toplam sayfa / Total pages
+            workers: Süreç sayısı / Process count
+            extract_text: Metin çıkarsın mı / Should extract text
+            tables: Tablo çıkarma modu / Table extraction mode
+            text_backend: Seçilmiş metin motoru (None = pdfplumber) /
+                          Selected text backend (None = pdfplumber)
+
+        Yields:
+            _ExtractedPage: Sayfa ve tabloları / Page and its tables
+        """
+        ranges = _split_page_ranges(total_pages, workers * _RANGES_PER_WORKER)
+        logger.info(
+            f"Paralel çıkarma / Parallel extraction: {workers} worker, "
+            f"{len(ranges)} sayfa aralığı / page ranges"
+        )
+
+        # Tampon her aralık için ayrı pickle edilmek yerine bir kez geçici
+        # dosyaya yazılır; worker'lar yolu açar.
+        # Instead of pickling the buffer once per range, it is written to a
+        # temp file once; workers open the path.
+        with _worker_path(pdf_source) as worker_source:
+            yield from self._run_ranges(worker_source, ranges, total_pages, workers,
+                                        extract_text, tables, *self._page_options(),
+                                        text_backend=text_backend)
+
+    def _page_options(self) -> tuple[bool, bool]:
+        """
+        Sayfa çıkarmaya aktarılan bellek seçenekleri.
+        Memory options passed to page extraction.
+
+        Returns:
+            (keep_raw_tables, low_memory)
+        """
+        return self.keep_raw_tables, self.low_memory
+
+    @staticmethod
+    def _run_ranges(
+        worker_source: str,
+        ranges: list[tuple[int, int]],
+        total_pages: int,
+        workers: int,
+        extract_text: bool,
+        tables: str,
+        keep_raw_tables: bool = True,
+        low_memory: bool = False,
+        text_backend: "TextBackend | None" = None,
+    ) -> Iterator["_ExtractedPage"]:
+        """
+        Aralıkları süreç havuzuna gönder, sonuçları sırayla üret.
+        Submit ranges to the process pool and yield results in order.
+
+        Args:
+            worker_source: PDF dosya yolu / PDF file path
+            ranges: (başlangıç, bitiş) aralıkları / (start, end) ranges
+            total_pages: Toplam sayfa / Total pages
+            workers: Süreç sayısı / Process count
+            extract_text: Metin çıkarsın mı / Should extract text
+            tables: Tablo çıkarma modu / Table extraction mode
+            keep_raw_tables: Ham tablo verisi tutulsun mu / Keep raw table data
+            low_memory: Sayfa başına önbellek boşaltma / Flush caches per page
+            text_backend: Metin motoru (worker'lara pickle ile gönderilir) /
+                          Text backend (pickled to the workers)
+
+        Yields:
+            _ExtractedPage: Sayfa ve tabloları / Page and its tables
+        """
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = [
+                executor.submit(
+                    _extract_page_range, worker_source, first, last,
+                    extract_text, tables, keep_raw_tables, low_memory, text_backend,
+                )
+                for first, last in ranges
+            ]
+            # Gönderim sırasıyla topla → sayfa sırası korunur
+            # Collect in submission order → page order is preserved
+            for future, (_, last) in zip(futures, ranges):
+                yield from future.result()
+                logger.info(f"İlerleme / Progress: {last}/{total_pages} sayfa işlendi")
+        finally:
+            # Tüketici erken durursa bekleyen aralıkları iptal et
+            # Cancel pending ranges if the consumer stops early
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
     def _extract_tables_from_page(
-        self, page, page_num: int
+        page, page_num: int, keep_raw: bool = True
     ) -> list[TableContent]:
         """
         Tek bir sayfadan tabloları çıkar / Extract tables from a single page.
@@ -596,6 +2196,7 @@ class IhalePDFParser:
         Args:
             page: pdfplumber Page nesnesi / pdfplumber Page object
             page_num: Sayfa numarası / Page number
+            keep_raw: ``raw_data`` doldurulsun mu / Should fill ``raw_data``
 
         Returns:
             Tablo listesi / List of tables
@@ -627,7 +2228,7 @@ class IhalePDFParser:
                         page_num=page_num,
                         headers=headers,
                         rows=rows,
-                        raw_data=raw_table,
+                        raw_data=raw_table if keep_raw else [],
                     )
                 )
 
@@ -639,6 +2240,76 @@ class IhalePDFParser:
 
         return extracted
 
+    def _sample_scanned(self, pdf_source: str | BinaryIO) -> int | None:
+        """
+        Birkaç yayılmış sayfayı örnekleyerek taranmış dokümanı erken tespit et.
+        Detect a scanned document early by sampling a few spread-out pages.
+
+        Yalnızca metin katmanı yoğunluğu (karakter sayısı) ve görüntü kaplama
+        oranı okunur — metin ve tablo çıkarılmaz, bu yüzden kontrol büyük
+        dokümanlarda da bir saniyenin çok altında kalır.
+        Only text-layer density (char count) and image coverage are read —
+        no text or table extraction — so the check stays well under a
+        second even on large documents.
+
+        Args:
+            pdf_source: PDF dosya yolu veya dosya nesnesi / PDF file path or file object
+
+        Returns:
+            Örneklenen tüm sayfalar taranmışsa toplam sayfa sayısı, aksi halde None /
+            Total page count if every sampled page is scanned, otherwise None
+        """
+        if self.scan_sample_pages <= 0:
+            return None
+
+        start_time = time.time()
+        with pdfplumber.open(pdf_source) as pdf:
+            total_pages = len(pdf.pages)
+            indices = _sample_indices(total_pages, self.scan_sample_pages)
+            if not indices:
+                return None
+            for index in indices:
+                page = pdf.pages[index]
+                scanned = _is_scanned_page(page, len(page.chars))
+                page.close()
+                if not scanned:
+                    return None
+
+        logger.info(
+            f"Örneklenen {len(indices)} sayfanın tümü taranmış, tam çıkarma atlandı "
+            f"({time.time() - start_time:.3f}sn) / All {len(indices)} sampled pages "
+            "are scanned, full extraction skipped"
+        )
+        return total_pages
+
+    def _apply_ocr(self, pdf_source: str | BinaryIO, pages: list[PageContent]) -> list[int]:
+        """
+        Taranmış işaretli sayfalara OCR uygula ve metni sayfalara ekle.
+        Run OCR on pages flagged as scanned and merge the text into them.
+
+        Args:
+            pdf_source: PDF dosya yolu veya dosya nesnesi / PDF file path or file object
+            pages: Sayfa listesi (yerinde güncellenir) / Page list (updated in place)
+
+        Returns:
+            Metni OCR ile güncellenen sayfa numaraları /
+            Numbers of pages updated with OCR text
+        """
+        if self.ocr is None:
+            return []
+
+        scanned = [page.page_num for page in pages if page.is_scanned]
+        recognised = self.ocr.run(pdf_source, scanned)
+
+        ocr_pages: list[int] = []
+        for page in pages:
+            text = recognised.get(page.page_num, "")
+            if not text:
+                continue
+            page.text = "\n".join(part for part in (page.text.strip(), text) if part)
+            ocr_pages.append(page.page_num)
+        return ocr_pages
+
     def _detect_scanned_pdf(self, pages: list[PageContent]) -> bool:
         """
         Taranmış PDF'leri tespit eder / Detect scanned PDFs.
@@ -649,6 +2320,14 @@ class IhalePDFParser:
         If average characters per page is below threshold,
         the PDF is considered scanned.
 
+        Sayfa bazlı taranmış işaretleri varsa ortalama yerine onlar
+        kullanılır: sayfaların en az yarısı taranmışsa doküman taranmıştır.
+        Böylece birkaç taranmış eki olan karışık dokümanlar taranmış sayılmaz.
+        If per-page scanned flags are present they are used instead of the
+        average: the document is scanned if at least half of its pages are.
+        Mixed documents with a few scanned annexes are therefore not
+        considered scanned.
+
         Args:
             pages: Sayfa listesi / List of pages
 
@@ -658,6 +2337,10 @@ class IhalePDFParser:
         if not pages:
             return False
 
+        scanned_count = sum(1 for page in pages if page.is_scanned)
+        if scanned_count:
+            return scanned_count * 2 >= len(pages)
+
         total_chars = sum(len(page.text) for page in pages)
         avg_chars_per_page = total_chars / len(pages)
 
@@ -684,58 +2367,1277 @@ class IhalePDFParser:
         Returns:
             Bölüm tipi / Section type
         """
-        combined = f"{title} {content[:500]}".lower()
+        # Başlıkta eşleşme 3 puan, içerikte 1 puan
+        # Title match = 3 points, content match = 1 point
+        return _SECTION_CLASSIFIER.classify(title, content)
 
-        best_type = "genel"
-        best_score = 0
+    def classify_sections(self, sections: list[tuple[str, str]]) -> list[str]:
+        """
+        Bir dokümanın tüm bölümlerini birlikte sınıflandırır.
+        Classifies all sections of a document together.
+
+        ``_classify_section_type`` ile aynı etiketleri verir; tüm bölümler
+        tek bir otomat taramasıyla puanlanır.
+        Gives the same labels as ``_classify_section_type``; all sections
+        are scored in a single automaton scan.
+
+        Args:
+            sections: (başlık, içerik) çiftleri / (title, content) pairs
 
-        for section_type, keywords in SECTION_KEYWORDS.items():
-            if not keywords:
+        Returns:
+            Bölüm tipleri / Section types
+        """
+        return _SECTION_CLASSIFIER.classify_many(sections)
+
+    def _page_offsets(self, pages: list[PageContent]) -> tuple[list[int], list[int]]:
+        """
+        Sayfaların temizlenmiş tam metindeki başlangıç ofsetlerini hesapla.
+        Compute page start offsets within the cleaned full text.
+
+        Ofsetler parse'ın tam metni kurduğu şekilde hesaplanır: her sayfa
+        ayrı temizlenir, boş sayfalar atlanır, sayfalar "\\n\\n" ile birleşir.
+        Böylece clean_text metni kısaltsa da ofsetler doğru kalır.
+
+        Offsets follow how parse builds the full text: each page is cleaned
+        separately, empty pages are skipped, pages are joined with "\\n\\n".
+        Offsets therefore stay correct even though clean_text shortens text.
+
+        Args:
+            pages: Ham sayfa listesi / Raw page list
+
+        Returns:
+            (artan ofsetler, sayfa numaraları) / (ascending offsets, page numbers)
+        """
+        offsets: list[int] = []
+        page_nums: list[int] = []
+        position = 0
+        for page in pages:
+            cleaned = self.clean_text(page.text)
+            if not cleaned:
                 continue
+            offsets.append(position)
+            page_nums.append(page.page_num)
+            position += len(cleaned) + 2  # +2: "\n\n" ayırıcı / separator
+        return offsets, page_nums
+
+
+# ============================================================
+# Metin Temizleme / Text Cleaning
+# ============================================================
 
-            score = 0
-            title_lower = title.lower()
 
-            for keyword in keywords:
-                # Başlıkta eşleşme 3 puan, içerikte 1 puan
-                # Title match = 3 points, content match = 1 point
-                if keyword in title_lower:
-                    score += 3
-                elif keyword in combined:
-                    score += 1
+def _clean_text(text: str) -> str:
+    """
+    Sayfa metnini temizle (IhalePDFParser.clean_text'in çekirdeği).
+    Clean a page text (core of IhalePDFParser.clean_text).
+
+    Önceden derlenmiş kalıplar yalnızca değişiklik gereken yerlerde eşleşir;
+    eşleşme yoksa ``re.sub`` aynı nesneyi döndürür, böylece tipik bir sayfa
+    en fazla bir kez kopyalanır. Kontrol karakterleri ``str.translate`` ile
+    silinir — Türkçe (ASCII olmayan) metinde yavaş olduğu için yalnızca
+    kontrol karakteri bulunduğunda.
+    The precompiled patterns only match where a change is needed; without
+    a match ``re.sub`` returns the same object, so a typical page is copied
+    at most once. Control characters are deleted with ``str.translate`` —
+    only when one is present, as it is slow on Turkish (non-ASCII) text.
+
+    Args:
+        text: Ham sayfa metni / Raw page text
+
+    Returns:
+        Temizlenmiş metin / Cleaned text
+    """
+    if not text:
+        return ""
+    if _CONTROL_CHARS_RE.search(text):
+        text = text.translate(_CONTROL_CHARS_TABLE)
+    text = _INLINE_WHITESPACE_RE.sub(" ", text)
+    text = _LINE_EDGE_SPACE_RE.sub("\n", text)
+    text = _BLANK_LINES_RE.sub("\n\n", text)
+    return text.strip()
+
 
-            if score > best_score:
-                best_score = score
-                best_type = section_type
+# ============================================================
+# Sayfa Çıkarma Yardımcıları / Page Extraction Helpers
+# ============================================================
+# Modül seviyesinde tanımlıdır — süreç havuzu worker'larına pickle ile
+# gönderilebilmeleri için.
+# Defined at module level so they can be pickled to process pool workers.
 
-        return best_type
 
-    def _find_page_for_position(
-        self,
-        full_text: str,
-        position: int,
-        pages: list[PageContent] | None,
-    ) -> int:
+def _metadata_dict(pdf, file_name: str, file_size_mb: float) -> dict:
+    """
+    Açık PDF'in meta veri sözlüğü / Metadata dictionary of an open PDF.
+
+    Args:
+        pdf: Açık pdfplumber PDF nesnesi / Open pdfplumber PDF object
+        file_name: Dosya adı / File name
+        file_size_mb: Dosya boyutu (MB) / File size (MB)
+
+    Returns:
+        PDF meta veri sözlüğü / PDF metadata dictionary
+    """
+    info = pdf.metadata or {}
+    return {
+        "file_name": file_name,
+        "file_size_mb": file_size_mb,
+        "total_pages": len(pdf.pages),
+        "author": info.get("Author", ""),
+        "creator": info.get("Creator", ""),
+        "producer": info.get("Producer", ""),
+        "title": info.get("Title", ""),
+        "subject": info.get("Subject", ""),
+        "creation_date": info.get("CreationDate", ""),
+    }
+
+
+def _iter_pages(
+    pdf,
+    first_page: int,
+    last_page: int,
+    extract_text: bool,
+    tables: str,
+    keep_raw_tables: bool = True,
+    low_memory: bool = False,
+    text_layer: "TextLayer | None" = None,
+) -> Iterator["_ExtractedPage"]:
+    """
+    Açık bir PDF'in [first_page, last_page) aralığındaki sayfalarını işle.
+    Process pages [first_page, last_page) of an open PDF.
+
+    Sayfa metni burada (worker içinde) temizlenir. Her sayfa işlendikten
+    sonra pdfplumber sayfa önbellekleri (karakterler, düzen nesneleri)
+    boşaltılır; düşük bellek modunda pdfminer'ın doküman nesne önbelleği de
+    temizlenir. Metin, tablo ön filtresi ve taranmışlık kontrolü metin
+    katmanından gelir; pdfplumber sayfası tembeldir, motorun dokunmadığı
+    sayfa yorumlanmaz.
+    The page text is cleaned here (inside the worker). After each page
+    pdfplumber's page caches (chars, layout objects) are flushed; in
+    low-memory mode pdfminer's document object cache is cleared as well.
+    Text, the table prefilter and the scanned check come from the text
+    layer; the pdfplumber page is lazy, so a page the engine does not touch
+    is never interpreted.
+
+    Args:
+        pdf: Açık pdfplumber PDF nesnesi / Open pdfplumber PDF object
+        first_page: İlk sayfa indeksi (0-indexed, dahil) / First page index (inclusive)
+        last_page: Son sayfa indeksi (0-indexed, hariç) / Last page index (exclusive)
+        extract_text: Metin çıkarsın mı / Should extract text
+        tables: Tablo çıkarma modu / Table extraction mode
+        keep_raw_tables: Ham tablo verisi tutulsun mu / Keep raw table data
+        low_memory: Doküman önbelleği de boşaltılsın mı / Also flush the document cache
+        text_layer: Metin katmanı (None = pdfplumber) / Text layer (None = pdfplumber)
+
+    Yields:
+        _ExtractedPage: Sayfa ve tabloları / Page and its tables
+    """
+    if text_layer is None:
+        from src.pdf_parser.backends import PdfplumberTextLayer
+
+        text_layer = PdfplumberTextLayer()
+    total_pages = len(pdf.pages)
+
+    for index in range(first_page, last_page):
+        page = pdf.pages[index]
+        page_num = index + 1
+        page_text = ""
+        page_tables: list[TableContent] = []
+        tables_skipped = False
+
+        # Metin çıkarma / Text extraction
+        if extract_text:
+            page_text = text_layer.page_text(page, index)
+
+        # Tablo çıkarma — "auto" modunda ucuz ön filtre tablo barındıramayacak
+        # sayfaları atlar / Table extraction — in "auto" mode a cheap prefilter
+        # skips pages that cannot hold a table
+        if tables == "always" or (tables == "auto" and text_layer.is_table_candidate(page, index)):
+            page_tables = IhalePDFParser._extract_tables_from_page(
+                page, page_num, keep_raw_tables
+            )
+        elif tables == "auto":
+            tables_skipped = True
+
+        # Sayfa bazlı taranmışlık / Per-page scanned flag
+        is_scanned = extract_text and text_layer.is_scanned(page, index, len(page_text.strip()))
+
+        extracted = _ExtractedPage(
+            page=PageContent(
+                page_num=page_num,
+                # Temizleme worker'da yapılır; ham metin süreçler arası taşınmaz
+                # Cleaning happens in the worker; the raw text never crosses processes
+                text=_clean_text(page_text),
+                has_table=bool(page_tables),
+                is_scanned=is_scanned,
+                content_hash=_page_hash(page),
+            ),
+            tables=page_tables,
+            tables_skipped=tables_skipped,
+        )
+
+        # Sayfa önbelleklerini boşalt / Flush page caches
+        page.close()
+        if low_memory:
+            _flush_document_cache(pdf)
+
+        yield extracted
+
+        # Her 50 sayfada ilerleme logu / Progress log every 50 pages
+        if page_num % 50 == 0:
+            logger.info(f"İlerleme / Progress: {page_num}/{total_pages} sayfa işlendi")
+
+
+def _flush_document_cache(pdf) -> None:
+    """
+    pdfminer'ın çözülmüş nesne önbelleklerini temizle (içerik akışları dahil).
+    Clear pdfminer's resolved object caches (content streams included).
+
+    Args:
+        pdf: Açık pdfplumber PDF nesnesi / Open pdfplumber PDF object
+    """
+    for name in ("_cached_objs", "_parsed_objs"):
+        cache = getattr(pdf.doc, name, None)
+        if isinstance(cache, dict):
+            cache.clear()
+
+
+def _extract_page_range(
+    pdf_source: str | bytes,
+    first_page: int,
+    last_page: int,
+    extract_text: bool,
+    tables: str,
+    keep_raw_tables: bool = True,
+    low_memory: bool = False,
+    text_backend: "TextBackend | None" = None,
+) -> list["_ExtractedPage"]:
+    """
+    Worker giriş noktası — PDF'i kendisi açar ve sayfa aralığını işler.
+    Worker entry point — opens the PDF itself and processes a page range.
+
+    Args:
+        pdf_source: PDF dosya yolu veya bytes / PDF file path or bytes
+        first_page: İlk sayfa indeksi (dahil) / First page index (inclusive)
+        last_page: Son sayfa indeksi (hariç) / Last page index (exclusive)
+        extract_text: Metin çıkarsın mı / Should extract text
+        tables: Tablo çıkarma modu / Table extraction mode
+        keep_raw_tables: Ham tablo verisi tutulsun mu / Keep raw table data
+        low_memory: Doküman önbelleği de boşaltılsın mı / Also flush the document cache
+        text_backend: Metin motoru (None = pdfplumber) / Text backend (None = pdfplumber)
+
+    Returns:
+        Çıkarılan sayfalar / Extracted pages
+    """
+    source = io.BytesIO(pdf_source) if isinstance(pdf_source, bytes) else pdf_source
+    with pdfplumber.open(source) as pdf, _open_text_layer(text_backend, source) as text_layer:
+        return list(_iter_pages(
+            pdf, first_page, last_page, extract_text, tables, keep_raw_tables, low_memory,
+            text_layer,
+        ))
+
+
+def _open_text_layer(backend: "TextBackend | None", pdf_source: str | BinaryIO) -> "TextLayer":
+    """
+    Motorun metin katmanını aç; motor dokümanı açamazsa pdfplumber katmanı döner.
+    Open the backend's text layer; if the backend cannot open the document,
+    the pdfplumber layer is returned.
+
+    Args:
+        backend: Metin motoru (None = pdfplumber) / Text backend (None = pdfplumber)
+        pdf_source: PDF dosya yolu veya dosya nesnesi / PDF file path or file object
+
+    Returns:
+        TextLayer (bağlam yöneticisi / context manager)
+    """
+    from src.pdf_parser.backends import PdfplumberTextLayer
+
+    if backend is None:
+        return PdfplumberTextLayer()
+    try:
+        return backend.open(pdf_source)
+    except Exception as e:
+        logger.warning(
+            f"{backend.name} dokümanı açamadı, pdfplumber kullanılıyor / "
+            f"{backend.name} could not open the document, using pdfplumber: {e}"
+        )
+        return PdfplumberTextLayer()
+
+
+def _split_page_ranges(total_pages: int, range_count: int) -> list[tuple[int, int]]:
+    """
+    Sayfaları ardışık, yaklaşık eşit aralıklara böl.
+    Split pages into contiguous, roughly equal ranges.
+
+    Args:
+        total_pages: Toplam sayfa / Total pages
+        range_count: İstenen aralık sayısı / Desired range count
+
+    Returns:
+        (başlangıç, bitiş) çiftleri, 0-indexed, bitiş hariç /
+        (start, end) pairs, 0-indexed, end exclusive
+    """
+    range_count = max(1, min(range_count, total_pages))
+    base, extra = divmod(total_pages, range_count)
+    ranges: list[tuple[int, int]] = []
+    start = 0
+    for i in range(range_count):
+        end = start + base + (1 if i < extra else 0)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+# ============================================================
+# Kopyasız Girdi Yardımcıları / Zero-Copy Input Helpers
+# ============================================================
+
+
+class _BufferReader(io.RawIOBase):
+    """
+    Bellek görünümü üzerinde salt okunur, aranabilir dosya nesnesi.
+    Read-only, seekable file object over a memory view.
+
+    io.BytesIO'dan farklı olarak bytearray/memoryview girdisini kopyalamaz;
+    yalnızca okuyucunun istediği parçalar kopyalanır.
+    Unlike io.BytesIO it does not copy bytearray/memoryview input; only the
+    chunks requested by the reader are copied.
+    """
+
+    def __init__(self, buffer: memoryview) -> None:
+        """
+        Args:
+            buffer: Bayt görünümü (format "B") / Byte view (format "B")
+        """
+        super().__init__()
+        self._buffer = buffer
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, target) -> int:
+        chunk = self._buffer[self._position:self._position + len(target)]
+        size = len(chunk)
+        target[:size] = chunk
+        self._position += size
+        return size
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        else:
+            position = len(self._buffer) + offset
+        if position < 0:
+            raise ValueError(f"Negatif konum / Negative position: {position}")
+        self._position = position
+        return position
+
+    def tell(self) -> int:
+        return self._position
+
+    def getbuffer(self) -> memoryview:
+        """Alttaki görünüm (BytesIO ile uyumlu) / Underlying view (BytesIO compatible)."""
+        return self._buffer
+
+
+@contextmanager
+def _mapped_file(file_path: str | Path) -> Iterator[mmap.mmap | bytes]:
+    """
+    Dosyayı salt okunur olarak belleğe eşle / Memory-map a file read-only.
+
+    Args:
+        file_path: Dosya yolu / File path
+
+    Yields:
+        Eşlenmiş dosya (boş dosyada b"") / Mapped file (b"" for an empty file)
+    """
+    with open(file_path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def _has_pdf_signature(file_path: str | Path) -> bool:
+    """Dosya PDF imzasıyla mı başlıyor / Does the file start with the PDF signature."""
+    with open(file_path, "rb") as fh:
+        return fh.read(5) == b"%PDF-"
+
+
+@contextmanager
+def _worker_path(pdf_source: str | BinaryIO) -> Iterator[str]:
+    """
+    Süreç havuzu worker'ları için PDF dosya yolu sağla.
+    Provide a PDF file path for process pool workers.
+
+    Yol girdileri olduğu gibi kullanılır; bellek tamponları bir kez geçici
+    dosyaya yazılır ve iş bitince silinir.
+    Path inputs are used as is; in-memory buffers are written to a temp
+    file once and removed afterwards.
+
+    Args:
+        pdf_source: PDF dosya yolu veya tampon nesnesi / PDF file path or buffer object
+
+    Yields:
+        PDF dosya yolu / PDF file path
+    """
+    if isinstance(pdf_source, str):
+        yield pdf_source
+        return
+
+    fd, tmp_name = tempfile.mkstemp(suffix=".pdf")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(pdf_source.getbuffer())
+        yield tmp_name
+    finally:
+        Path(tmp_name).unlink(missing_ok=True)
+
+
+@dataclass
+class _ExtractedPage:
+    """
+    Tek sayfanın çıkarma sonucu / Extraction result of a single page.
+
+    Attributes:
+        page: Sayfa içeriği / Page content
+        tables: Sayfanın tabloları / Tables of the page
+        tables_skipped: Tablo ön filtresi sayfayı atladı mı /
+                        Did the table prefilter skip the page
+    """
+
+    page: PageContent
+    tables: list[TableContent] = field(default_factory=list)
+    tables_skipped: bool = False
+
+
+# ============================================================
+# Tablo Ön Filtresi / Table Prefilter
+# ============================================================
+
+
+def _is_table_candidate(page) -> bool:
+    """
+    Sayfa tablo barındırabilir mi — extract_tables'tan çok daha ucuz kontrol.
+    Can the page hold a table — a check far cheaper than extract_tables.
+
+    pdfplumber'ın varsayılan "lines" stratejisi hücreleri çizgi ve dikdörtgen
+    kenarlarından kurar; en az iki satırlı bir tablo için en az üç yatay ve
+    iki dikey kenar konumu gerekir. Yalnızca iki dikey kenarı olan tek
+    sütunlu kutular (çerçeve, not kutusu) ancak içindeki metin sütunlara
+    hizalıysa aday sayılır.
+
+    pdfplumber's default "lines" strategy builds cells from line and
+    rectangle edges; a table with at least two rows needs at least three
+    horizontal and two vertical edge positions. Single-column boxes with
+    only two vertical edges (frames, note boxes) count as candidates only
+    if the text inside is aligned in columns.
+
+    Args:
+        page: pdfplumber Page nesnesi / pdfplumber Page object
+
+    Returns:
+        Tablo adayı mı / Is a table candidate
+    """
+    rows: set[int] = set()
+    columns: set[int] = set()
+    for edge in page.edges:
+        if edge["orientation"] == "h":
+            rows.add(round(edge["top"] / _TABLE_EDGE_TOLERANCE))
+        else:
+            columns.add(round(edge["x0"] / _TABLE_EDGE_TOLERANCE))
+
+    if len(rows) < 3 or len(columns) < 2:
+        return False
+    if len(columns) >= 3:
+        return True
+    return _has_aligned_columns(page.chars)
+
+
+def _has_aligned_columns(chars: list[dict]) -> bool:
+    """
+    Karakter ızgarası hizalaması — metin sütunlara dizilmiş mi?
+    Character-grid alignment — is the text laid out in columns?
+
+    Her satırda geniş bir boşluktan sonra başlayan karakterlerin x konumu
+    sayılır; aynı konum en az ``_TABLE_ALIGNED_ROWS`` satırda tekrarlanıyorsa
+    metin sütunlu kabul edilir.
+
+    For each line, the x position of characters that start after a wide
+    gap is counted; if the same position recurs on at least
+    ``_TABLE_ALIGNED_ROWS`` lines, the text is considered columnar.
+
+    Args:
+        chars: pdfplumber karakter nesneleri / pdfplumber char objects
+
+    Returns:
+        Hizalı sütun var mı / Are there aligned columns
+    """
+    lines: dict[int, list[dict]] = {}
+    for char in chars:
+        if not char["text"].isspace():
+            lines.setdefault(round(char["top"]), []).append(char)
+
+    column_starts: Counter[int] = Counter()
+    for line_chars in lines.values():
+        line_chars.sort(key=lambda char: char["x0"])
+        for prev, char in zip(line_chars, line_chars[1:]):
+            if char["x0"] - prev["x1"] >= _TABLE_COLUMN_GAP:
+                column_starts[round(char["x0"] / _TABLE_EDGE_TOLERANCE)] += 1
+
+    return any(count >= _TABLE_ALIGNED_ROWS for count in column_starts.values())
+
+
+def _page_hash(page) -> str:
+    """
+    Sayfa içeriğinin SHA-256 özeti (içerik akışları + XObject verisi).
+    SHA-256 digest of the page content (content streams + XObject data).
+
+    Sayfa yorumlanmaz, yalnızca akış verisi okunur; bu yüzden ucuzdur.
+    Taranmış sayfaların içerik akışı çoğunlukla aynıdır ("görüntüyü çiz"),
+    bu yüzden görüntü (XObject) verisi de özete katılır.
+    The page is not interpreted, only stream data is read, so it is cheap.
+    Content streams of scanned pages are usually identical ("draw the
+    image"), so the image (XObject) data is hashed as well.
+
+    Args:
+        page: pdfplumber Page nesnesi / pdfplumber Page object
+
+    Returns:
+        Hex özet / Hex digest
+    """
+    digest = hashlib.sha256()
+    page_obj = page.page_obj
+    for stream in page_obj.contents:
+        stream = resolve1(stream)
+        if isinstance(stream, PDFStream):
+            digest.update(stream.get_data() or b"")
+
+    xobjects = resolve1((page_obj.resources or {}).get("XObject")) or {}
+    for name in sorted(xobjects, key=str):
+        xobject = resolve1(xobjects[name])
+        if isinstance(xobject, PDFStream):
+            digest.update(str(name).encode())
+            digest.update(xobject.get_data() or b"")
+    return digest.hexdigest()
+
+
+def _common_affixes(old: list[str], new: list[str]) -> tuple[int, int]:
+    """
+    İki özet dizisinin ortak önek ve sonek uzunlukları (çakışmasız).
+    Common prefix and suffix lengths of two hash sequences (non-overlapping).
+
+    Args:
+        old: Önceki sayfa özetleri / Previous page hashes
+        new: Yeni sayfa özetleri / New page hashes
+
+    Returns:
+        (önek, sonek) / (prefix, suffix)
+    """
+    limit = min(len(old), len(new))
+    prefix = 0
+    while prefix < limit and old[prefix] == new[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and old[-1 - suffix] == new[-1 - suffix]:
+        suffix += 1
+    return prefix, suffix
+
+
+# ============================================================
+# Başlık/Altbilgi Tespiti / Header/Footer Detection
+# ============================================================
+
+
+def _normalize_line(line: str) -> str:
+    """
+    Karşılaştırma için satırı normalize et: küçük harf, rakamlar "#",
+    tek boşluk. "Sayfa 3 / 12" ve "Sayfa 4 / 12" aynı satır sayılır.
+    Normalise a line for comparison: lower case, digits as "#", single
+    spaces. "Sayfa 3 / 12" and "Sayfa 4 / 12" count as the same line.
+    """
+    return _WHITESPACE_RE.sub(" ", _DIGITS_RE.sub("#", line.strip().lower()))
+
+
+def _zone_indices(lines: list[str]) -> tuple[list[int], list[int]]:
+    """
+    Sayfanın üst ve alt bölgesindeki boş olmayan satır indeksleri.
+    Indices of non-blank lines in the top and bottom zones of a page.
+    """
+    non_blank = [i for i, line in enumerate(lines) if line.strip()]
+    return non_blank[:_HEADER_ZONE_LINES], non_blank[-_HEADER_ZONE_LINES:]
+
+
+def _find_repeated_lines(page_texts: list[str]) -> tuple[list[str], list[str]]:
+    """
+    Sayfaların başında/sonunda tekrarlanan satırları frekansla bul.
+    Find lines repeated at the top/bottom of pages by frequency counts.
+
+    Her sayfanın üst ve alt ``_HEADER_ZONE_LINES`` satırı normalize edilip
+    sayılır; metinli sayfaların en az ``_HEADER_MIN_PAGE_SHARE`` kadarında
+    (ve en az ``_HEADER_MIN_PAGES`` sayfada) geçen satırlar tekrarlıdır.
+    Bölüm başlığı kalıbına uyan satırlar hiçbir zaman silinmez.
+
+    The top and bottom ``_HEADER_ZONE_LINES`` lines of every page are
+    normalised and counted; lines found on at least ``_HEADER_MIN_PAGE_SHARE``
+    of the pages with text (and on at least ``_HEADER_MIN_PAGES`` pages)
+    are repeated. Lines matching a section heading pattern are never removed.
+
+    Args:
+        page_texts: Temiz sayfa metinleri / Cleaned page texts
+
+    Returns:
+        (başlık satırları, altbilgi satırları), normalize ve sıralı /
+        (header lines, footer lines), normalised and sorted
+    """
+    top_counts: Counter[str] = Counter()
+    bottom_counts: Counter[str] = Counter()
+    pages_with_text = 0
+
+    for text in page_texts:
+        lines = text.split("\n")
+        top, bottom = _zone_indices(lines)
+        if not top:
+            continue
+        pages_with_text += 1
+        for zone, counts in ((top, top_counts), (bottom, bottom_counts)):
+            counts.update({
+                _normalize_line(lines[i])
+                for i in zone
+                if not _SECTION_HEADING_RE.match(lines[i].strip())
+            })
+
+    if pages_with_text < _HEADER_MIN_PAGES:
+        return [], []
+
+    min_pages = max(_HEADER_MIN_PAGES, math.ceil(pages_with_text * _HEADER_MIN_PAGE_SHARE))
+    headers = sorted(line for line, count in top_counts.items() if count >= min_pages)
+    footers = sorted(line for line, count in bottom_counts.items() if count >= min_pages)
+    return headers, footers
+
+
+def _strip_repeated_lines(
+    text: str, headers: set[str], footers: set[str]
+) -> tuple[str, list[str]]:
+    """
+    Sayfanın üst/alt bölgesinden tekrarlı satırları sil.
+    Remove repeated lines from the top/bottom zone of a page.
+
+    Args:
+        text: Temiz sayfa metni / Cleaned page text
+        headers: Normalize başlık satırları / Normalised header lines
+        footers: Normalize altbilgi satırları / Normalised footer lines
+
+    Returns:
+        (yeni metin, silinen satırlar) / (new text, removed lines)
+    """
+    lines = text.split("\n")
+    top, bottom = _zone_indices(lines)
+    drop: set[int] = set()
+    # Kenardan içeri doğru yalnızca kesintisiz tekrarlı satırlar silinir
+    # Only an unbroken run of repeated lines from the page edge is removed
+    for zone, repeated in ((top, headers), (reversed(bottom), footers)):
+        for i in zone:
+            if _normalize_line(lines[i]) not in repeated:
+                break
+            drop.add(i)
+    # Sayfanın tüm içeriği silinmez — tek satırlık sayfalar gövde sayılır
+    # Never remove a page's whole content — single-line pages count as body
+    if not drop or len(drop) >= sum(1 for line in lines if line.strip()):
+        return text, []
+    removed = [lines[i] for i in sorted(drop)]
+    return "\n".join(line for i, line in enumerate(lines) if i not in drop), removed
+
+
+# ============================================================
+# Düşük Bilgili Sayfa Filtresi / Low-Information Page Filter
+# ============================================================
+
+
+def _log_low_info_pages(low_info_pages: list[int], low_info_chars: int) -> None:
+    """Dışarıda kalan metni raporla / Report the excluded text."""
+    if low_info_pages:
+        logger.info(
+            f"{len(low_info_pages)} düşük bilgili sayfa indeks dışı / "
+            f"{len(low_info_pages)} low-information pages left out of the index: "
+            f"{low_info_chars} karakter, ~{low_info_chars // _CHARS_PER_TOKEN} token"
+        )
+
+
+def _normalize_page(text: str) -> str:
+    """
+    Puanlama için sayfayı normalize et: Türkçe harfler ASCII'ye, küçük harf,
+    rakamlar "#", tek boşluk. Satır yapısı korunur.
+    Normalise a page for scoring: Turkish letters to ASCII, lower case,
+    digits as "#", single spaces. The line structure is kept.
+    """
+    text = text.lower()
+    for letter, ascii_letter in _FOLD_PAIRS:
+        text = text.replace(letter, ascii_letter)
+    return _INLINE_WHITESPACE_RE.sub(" ", _DIGITS_RE.sub("#", text))
+
+
+def _repeated_body_lines(normalized_pages: list[str]) -> set[str]:
+    """
+    En az ``_BOILERPLATE_MIN_PAGES`` sayfada geçen satırlar.
+    Lines found on at least ``_BOILERPLATE_MIN_PAGES`` pages.
+
+    Başlık/altbilgiden farklı olarak sayfanın her yerine bakılır; her ekin
+    sonundaki imza blokları gibi kalıplar böyle bulunur.
+    Unlike headers/footers the whole page is examined, which finds
+    boilerplate such as the signature block closing every annex.
+
+    Args:
+        normalized_pages: ``_normalize_page`` çıktıları / ``_normalize_page`` outputs
+
+    Returns:
+        Tekrarlı satırlar / Repeated lines
+    """
+    counts: Counter[str] = Counter()
+    for text in normalized_pages:
+        counts.update(set(map(str.strip, text.split("\n"))))
+    counts.pop("", None)
+    return {line for line, count in counts.items() if count >= _BOILERPLATE_MIN_PAGES}
+
+
+def _information_score(normalized: str, repeated_lines: set[str]) -> float:
+    """
+    Sayfanın bilgi içeriği puanı (0-1).
+    Information content score of a page (0-1).
+
+    Kalıp satırlar (boş sayfa notları, imza/kaşe etiketleri, dokümanda
+    tekrarlanan satırlar) dışındaki karakter sayısı ``_INFO_FULL_CHARS``'a
+    oranlanır ve token çeşitliliğiyle (farklı/toplam kelime)
+    ağırlıklandırılır: aynı etiketlerin tekrarlandığı sayfa, aynı
+    uzunluktaki düz metinden düşük puan alır.
+
+    The number of characters outside boilerplate lines (blank page notices,
+    signature/stamp labels, lines repeated across the document) is scaled by
+    ``_INFO_FULL_CHARS`` and weighted by token diversity (distinct/total
+    tokens): a page repeating the same labels scores lower than plain text of
+    the same length.
+
+    Args:
+        normalized: ``_normalize_page`` çıktısı / ``_normalize_page`` output
+        repeated_lines: Tekrarlı satırlar / Repeated lines
+
+    Returns:
+        Puan / Score
+    """
+    # Kalıp satırların başlangıç ofsetleri / Start offsets of boilerplate lines
+    boilerplate_starts = {match.start() for match in _BOILERPLATE_LINE_RE.finditer(normalized)}
+    boilerplate_starts.update(
+        normalized.rfind("\n", 0, match.start()) + 1
+        for match in _BLANK_PAGE_NOTICE_RE.finditer(normalized)
+    )
+
+    total_chars = boilerplate_chars = 0
+    offset = 0
+    for line in normalized.split("\n"):
+        stripped = line.strip()
+        if stripped:
+            total_chars += len(stripped)
+            if offset in boilerplate_starts or stripped in repeated_lines:
+                boilerplate_chars += len(stripped)
+        offset += len(line) + 1
+    if not total_chars:
+        return 0.0
+
+    words = normalized.split()
+    diversity = len(set(words)) / len(words) if words else 0.0
+    amount = min(1.0, (total_chars - boilerplate_chars) / _INFO_FULL_CHARS)
+    return round(amount * (0.5 + 0.5 * diversity), 3)
+
+
+def _mark_low_info_pages(pages: list[PageContent]) -> tuple[list[int], int]:
+    """
+    Sayfaları puanla ve düşük bilgili olanları işaretle (``is_low_info``).
+    Score the pages and flag the low-information ones (``is_low_info``).
+
+    Tablo veya bölüm başlığı içeren sayfalar ve metni okunamamış taranmış
+    sayfalar puanı ne olursa olsun işaretlenmez.
+    Pages holding a table or a section heading, and scanned pages whose text
+    could not be read, are never flagged whatever their score.
+
+    Args:
+        pages: Temiz metinli sayfalar / Pages with cleaned texts
+
+    Returns:
+        (düşük bilgili sayfa numaraları, karakter sayısı) /
+        (low-information page numbers, character count)
+    """
+    texts = [page.text for page in pages]
+    normalized_pages = [_normalize_page(text) for text in texts]
+    repeated_lines = _repeated_body_lines(normalized_pages)
+    low_info_pages: list[int] = []
+    low_info_chars = 0
+    for page, text, normalized in zip(pages, texts, normalized_pages):
+        page.info_score = _information_score(normalized, repeated_lines)
+        page.is_low_info = (
+            page.info_score < _LOW_INFO_THRESHOLD
+            and not page.has_table
+            and not (page.is_scanned and not text)
+            and not _SECTION_HEADING_RE.search(text)
+        )
+        if page.is_low_info:
+            low_info_pages.append(page.page_num)
+            low_info_chars += len(text)
+    return low_info_pages, low_info_chars
+
+
+# ============================================================
+# Taranmış Sayfa Tespiti / Scanned Page Detection
+# ============================================================
+
+
+def _is_scanned_page(page, text_chars: int) -> bool:
+    """
+    Sayfa yalnızca görüntüden mi oluşuyor / Is the page image-only?
+
+    Metin katmanı eşik değerinin altındaysa ve görüntüler sayfanın en az
+    ``_SCANNED_IMAGE_COVERAGE`` kadarını kaplıyorsa sayfa taranmıştır.
+    Boş sayfalar (metin de görüntü de yok) taranmış sayılmaz.
+    A page is scanned if its text layer is below the threshold and images
+    cover at least ``_SCANNED_IMAGE_COVERAGE`` of it. Blank pages (no text,
+    no images) do not count as scanned.
+
+    Args:
+        page: pdfplumber Page nesnesi / pdfplumber Page object
+        text_chars: Sayfanın metin katmanındaki karakter sayısı /
+                    Character count of the page's text layer
+
+    Returns:
+        Taranmış mı / Is scanned
+    """
+    if text_chars >= _SCANNED_PDF_CHAR_THRESHOLD:
+        return False
+    return _image_coverage(page) >= _SCANNED_IMAGE_COVERAGE
+
+
+def _image_coverage(page) -> float:
+    """
+    Görüntülerin kapladığı sayfa alanı oranı / Share of page area covered by images.
+
+    Args:
+        page: pdfplumber Page nesnesi / pdfplumber Page object
+
+    Returns:
+        0.0-1.0 arası oran (çakışmalar ayıklanmaz) /
+        Ratio between 0.0 and 1.0 (overlaps are not deduplicated)
+    """
+    page_area = float(page.width * page.height)
+    if page_area <= 0:
+        return 0.0
+
+    covered = 0.0
+    for image in page.images:
+        width = min(image["x1"], page.bbox[2]) - max(image["x0"], page.bbox[0])
+        height = min(image["bottom"], page.bbox[3]) - max(image["top"], page.bbox[1])
+        if width > 0 and height > 0:
+            covered += width * height
+    return min(covered / page_area, 1.0)
+
+
+def _sample_indices(total_pages: int, sample_size: int) -> list[int]:
+    """
+    Doküman boyunca eşit aralıklı örnek sayfa indeksleri.
+    Evenly spread sample page indices across the document.
+
+    Args:
+        total_pages: Toplam sayfa / Total pages
+        sample_size: İstenen örnek sayısı / Desired sample size
+
+    Returns:
+        Artan, tekrarsız 0-indexed sayfa indeksleri /
+        Ascending, unique 0-indexed page indices
+    """
+    if total_pages <= 0 or sample_size <= 0:
+        return []
+    if total_pages <= sample_size:
+        return list(range(total_pages))
+    if sample_size == 1:
+        return [0]
+    step = (total_pages - 1) / (sample_size - 1)
+    return sorted({round(i * step) for i in range(sample_size)})
+
+
+# ============================================================
+# Bölüm Akışı Yardımcıları / Section Stream Helpers
+# ============================================================
+
+
+def _find_headings(
+    text: str, start: int = 0, end: int | None = None
+) -> list[tuple[int, int, str]]:
+    """
+    Metindeki bölüm başlıklarını tek geçişte bul.
+    Find section headings in text in a single pass.
+
+    Her satır başı en fazla bir kez denenir. Bir eşleşmeden sonra arama,
+    eşleşmenin sonundan değil başladığı satırın sonundan sürer; böylece
+    sonraki satıra taşan bir başlık (örn. "BÖLÜM 2" + alt satırdaki
+    "Madde 3 - ...") alttaki başlığı gizlemez.
+
+    Each line start is tried at most once. After a match, the search
+    resumes at the end of the line the match started on rather than at
+    the match end, so a heading spilling onto the next line (e.g.
+    "BÖLÜM 2" + "Madde 3 - ..." below) does not hide the heading below.
+
+    Args:
+        text: Aranacak metin / Text to search
+        start: Aramanın başlayacağı pozisyon (satır başı olmalı) /
+               Position to start searching from (must be a line start)
+        end: Bu pozisyonda veya sonrasında başlayan başlıklar alınmaz
+             (None = metin sonu). Başlıklar yine tam metinle eşleşir. /
+             Headings starting at or after this position are not returned
+             (None = end of text). Headings still match against the full text.
+
+    Returns:
+        Pozisyona göre sıralı (başlangıç, bitiş, başlık) listesi /
+        List of (start, end, title) sorted by position
+    """
+    matches: list[tuple[int, int, str]] = []
+    search = _SECTION_HEADING_RE.search
+    text_len = len(text) if end is None else min(end, len(text))
+    pos = start
+
+    while pos < text_len:
+        match = search(text, pos)
+        if match is None or match.start() >= text_len:
+            break
+
+        # Eşleşen alternatifin grup üçlüsü / Group triple of the matched alternative
+        base = 1
+        while match.group(base) is None:
+            base += 3
+        prefix = match.group(base)  # "Madde", "BÖLÜM", "EK"
+        number = match.group(base + 1)  # "5", "III", "1"
+        rest = match.group(base + 2).strip() if match.group(base + 2) else ""
+
+        if rest:
+            full_title = f"{prefix} {number} - {rest}"
+        else:
+            full_title = f"{prefix} {number}"
+
+        matches.append((match.start(), match.end(), full_title))
+
+        line_end = text.find("\n", match.start())
+        if line_end == -1:
+            break
+        pos = line_end + 1
+
+    return matches
+
+
+class _TextSpool:
+    """
+    Bellek bütçeli metin deposu / Memory-budgeted text spool.
+
+    Metinler bütçe dolana kadar bellekte tutulur; sonrakiler UTF-8 olarak
+    isimsiz bir geçici dosyaya eklenir ve (ofset, uzunluk) ile geri okunur.
+    Texts are kept in memory until the budget is used up; later ones are
+    appended as UTF-8 to an anonymous temp file and read back by
+    (offset, length).
+    """
+
+    def __init__(self, budget_bytes: int) -> None:
+        """
+        Args:
+            budget_bytes: Bellekte tutulacak metin (UTF-8 bayt) /
+                          Text kept in memory (UTF-8 bytes)
         """
-        Metin pozisyonuna göre sayfa numarası bul.
-        Find page number for a text position.
+        self.budget_bytes = budget_bytes
+        self.spilled_bytes = 0
+        self._memory: dict = {}
+        self._memory_bytes = 0
+        self._spilled: dict = {}  # anahtar → (ofset, uzunluk) / key → (offset, length)
+        self._file = None
+
+    def put(self, key, text: str) -> None:
+        """Metni sakla / Store a text."""
+        data = text.encode("utf-8")
+        if self._memory_bytes + len(data) <= self.budget_bytes:
+            self._memory[key] = text
+            self._memory_bytes += len(data)
+            return
+
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(prefix="tenderai-text-")
+        offset = self._file.seek(0, os.SEEK_END)
+        self._file.write(data)
+        self._spilled[key] = (offset, len(data))
+        self.spilled_bytes += len(data)
+
+    def take(self, key) -> str:
+        """Metni geri al ve depodan çıkar / Return a text and remove it from the spool."""
+        if key in self._memory:
+            text = self._memory.pop(key)
+            self._memory_bytes -= len(text.encode("utf-8"))
+            return text
+        offset, length = self._spilled.pop(key)
+        self._file.seek(offset)
+        return self._file.read(length).decode("utf-8")
+
+    def close(self) -> None:
+        """Geçici dosyayı kapat (silinir) / Close the temp file (it is deleted)."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._memory.clear()
+        self._spilled.clear()
 
+
+@dataclass
+class _StreamItem:
+    """
+    Ayrıştırma akışının tek öğesi / A single item of the parse stream.
+
+    Attributes:
+        page: Sayfa içeriği (son öğede None) / Page content (None for the final item)
+        tables: Sayfanın tabloları / Tables of the page
+        tables_skipped: Tablo ön filtresi sayfayı atladı mı /
+                        Did the table prefilter skip the page
+        sections: Bu öğeyle tamamlanan bölümler / Sections completed by this item
+    """
+
+    page: PageContent | None = None
+    tables: list[TableContent] = field(default_factory=list)
+    tables_skipped: bool = False
+    sections: list[Section] = field(default_factory=list)
+
+
+class _HeaderFooterFilter:
+    """
+    Akış içinde tekrarlı başlık/altbilgi silme / In-stream header/footer removal.
+
+    İlk ``window`` sayfa tamponlanır ve tekrarlı satırlar bu pencereden
+    öğrenilir (``_find_repeated_lines``); pencere sayfaları ve sonraki her
+    sayfa, bölüm tespitinden önce bu satırlardan arındırılıp yeniden
+    temizlenir. Bellek maliyeti pencere kadar sayfadır; ilk bölümler pencere
+    dolunca üretilir. Yalnızca pencereden sonra başlayan başlıklar silinmez.
+
+    The first ``window`` pages are buffered and the repeated lines are
+    learned from that window (``_find_repeated_lines``); the window pages and
+    every later page are stripped of those lines and re-cleaned before
+    section detection. The memory cost is one window of pages; the first
+    sections are yielded once the window fills. Only headers that first
+    appear after the window are not removed.
+    """
+
+    def __init__(self, clean, window: int = _HEADER_LEARN_PAGES) -> None:
+        """
         Args:
-            full_text: Tam metin / Full text
-            position: Karakter pozisyonu / Character position
-            pages: Sayfa listesi / Page list
+            clean: Sayfa metni temizleyici / Page text cleaner
+            window: Öğrenme penceresi (sayfa) / Learning window (pages)
+        """
+        self._clean = clean
+        self._window = max(1, window)
+        self._buffer: list = []
+        self._learned = False
+        self._headers: set[str] = set()
+        self._footers: set[str] = set()
+        self.header_lines: list[str] = []
+        self.footer_lines: list[str] = []
+        self.removed_bytes = 0
+        self.removed_chars = 0
+
+    def feed(self, extracted) -> list:
+        """
+        Çıkarılan sayfayı ekle; bölüm tespitine hazır olanları döndür.
+        Add an extracted page; return those ready for section detection.
+
+        Args:
+            extracted: ``page`` alanı olan çıkarma sonucu / Extraction result with a ``page``
 
         Returns:
-            Sayfa numarası / Page number (1-indexed, 0 if unknown)
+            Sırayla, arındırılmış sonuçlar / Stripped results, in order
         """
-        if not pages:
-            return 0
+        if self._learned:
+            self.strip(extracted.page)
+            return [extracted]
+        self._buffer.append(extracted)
+        return self._flush() if len(self._buffer) >= self._window else []
+
+    def finish(self) -> list:
+        """Doküman sonu — tamponu boşalt / End of document — flush the buffer."""
+        return [] if self._learned else self._flush()
 
-        current_pos = 0
+    def strip(self, page: PageContent) -> None:
+        """
+        Öğrenilen satırları sayfadan sil ve metni yeniden temizle (yerinde).
+        Remove the learned lines from a page and re-clean its text (in place).
+        """
+        if not self._headers and not self._footers:
+            return
+        text, removed = _strip_repeated_lines(page.text, self._headers, self._footers)
+        if not removed:
+            return
+        page.text = self._clean(text)
+        self.removed_chars += sum(len(line) for line in removed)
+        self.removed_bytes += sum(len(line.encode("utf-8")) for line in removed)
+
+    def learn(self, pages: list[PageContent]) -> None:
+        """
+        Satırları ilk pencereden öğren ve tüm sayfaları arındır (akış dışı kullanım).
+        Learn the lines from the first window and strip every page (outside the stream).
+
+        Args:
+            pages: Temiz metinli sayfalar / Pages with cleaned text
+        """
+        self._learned = True
+        self.header_lines, self.footer_lines = _find_repeated_lines(
+            [page.text for page in pages[:self._window]]
+        )
+        self._headers, self._footers = set(self.header_lines), set(self.footer_lines)
         for page in pages:
-            page_len = len(page.text) + 2  # +2 for "\n\n" separator
-            if current_pos + page_len > position:
-                return page.page_num
-            current_pos += page_len
+            self.strip(page)
+
+    def _flush(self) -> list:
+        """Tampondan öğren, arındırıp döndür / Learn from the buffer, strip and return it."""
+        ready, self._buffer = self._buffer, []
+        self.learn([extracted.page for extracted in ready])
+        return ready
+
+
+class _SectionDetector:
+    """
+    Artımlı bölüm tespiti / Incremental section detection.
+
+    Temizlenmiş sayfa metinleri sırayla beslenir; bir bölüm, sonraki başlık
+    görüldüğünde tamamlanır. Yalnızca bekleyen başlıktan itibaren metin
+    tutulur, böylece bellek kullanımı en uzun bölümle sınırlı kalır.
+
+    Cleaned page texts are fed in order; a section completes when the next
+    heading is seen. Only the text from the pending heading onwards is
+    kept, so memory use is bounded by the longest section.
+    """
+
+    def __init__(self, classify) -> None:
+        """
+        Args:
+            classify: (başlık, içerik) -> bölüm tipi / (title, content) -> section type
+        """
+        self._classify = classify
+        self._buffer: str = ""
+        self._base: int = 0  # Tamponun tam metindeki başlangıcı / Buffer start in full text
+        self._scan_from: int = 0  # Sonraki taramanın başlangıcı (mutlak) / Next scan start
+        self._pending: tuple[int, int, str] | None = None  # (başlangıç, bitiş, başlık)
+        self._page_offsets: list[int] = []  # Sayfa başlangıçları (mutlak) / Page starts
+        self._page_nums: list[int] = []
+
+    def feed(self, text: str, page_num: int) -> list[Section]:
+        """
+        Bir sayfanın temizlenmiş metnini ekle / Add the cleaned text of a page.
+
+        Args:
+            text: Temizlenmiş sayfa metni / Cleaned page text
+            page_num: Sayfa numarası / Page number
+
+        Returns:
+            Bu sayfayla tamamlanan bölümler / Sections completed by this page
+        """
+        if not text:
+            return []
+
+        if self._page_offsets:
+            self._buffer += "\n\n"
+        self._page_offsets.append(self._base + len(self._buffer))
+        self._page_nums.append(page_num)
+        self._buffer += text
+        return self._scan(final=False)
 
-        return pages[-1].page_num if pages else 0
+    def finish(self) -> list[Section]:
+        """
+        Doküman sonu — bekleyen bölümü kapat / End of document — close the pending section.
+
+        Returns:
+            Kalan bölümler / Remaining sections
+        """
+        return self._scan(final=True)
+
+    def _scan(self, final: bool) -> list[Section]:
+        """Tamponu tara, tamamlanan bölümleri döndür / Scan buffer, return completed sections."""
+        completed: list[Section] = []
+        buffer_end = self._base + len(self._buffer)
+
+        for start, end, title in _find_headings(self._buffer, self._scan_from - self._base):
+            start += self._base
+            end += self._base
+            if self._pending and start > self._pending[0]:
+                completed.append(self._build_section(self._pending, start))
+            self._pending = (start, end, title)
+
+        if final:
+            if self._pending:
+                completed.append(self._build_section(self._pending, buffer_end))
+                self._pending = None
+            return completed
+
+        # Bekleyen başlık tamponun sonuna dayanıyorsa sonraki sayfayla
+        # değişebilir — bir sonraki taramada yeniden değerlendirilir.
+        # A pending heading that reaches the buffer end may change with the
+        # next page — it is re-evaluated on the next scan.
+        if self._pending and not self._buffer[self._pending[1] - self._base:].strip():
+            self._scan_from = self._pending[0]
+        else:
+            last_line = self._buffer.rstrip().rfind("\n") + 1
+            self._scan_from = self._base + last_line
+
+        keep_from = self._pending[0] if self._pending else self._scan_from
+        self._buffer = self._buffer[keep_from - self._base:]
+        self._base = keep_from
+        return completed
+
+    def _build_section(self, heading: tuple[int, int, str], content_end: int) -> Section:
+        """Başlık ve içerik sınırından Section oluştur / Build a Section from heading and bound."""
+        start, end, title = heading
+        content = self._buffer[end - self._base:content_end - self._base].strip()
+        return Section(
+            title=title.strip(),
+            content=content,
+            page_num=_page_at(self._page_offsets, self._page_nums, start),
+            section_type=self._classify(title, content),
+        )
+
+
+def _page_at(page_offsets: list[int], page_nums: list[int], position: int) -> int:
+    """
+    Pozisyonun düştüğü sayfayı ikili aramayla bul.
+    Find the page containing a position by binary search.
+
+    Args:
+        page_offsets: Artan sayfa başlangıç ofsetleri / Ascending page start offsets
+        page_nums: Ofsetlere karşılık gelen sayfa numaraları / Matching page numbers
+        position: Karakter pozisyonu / Character position
+
+    Returns:
+        Sayfa numarası (1-indexed, bilinmiyorsa 0) / Page number (0 if unknown)
+    """
+    if not page_offsets:
+        return 0
+    index = bisect_right(page_offsets, position) - 1
+    return page_nums[max(index, 0)]
+
+
+def _page_start(page_offsets: list[int], page_nums: list[int], page_num: int, text_len: int) -> int:
+    """
+    Sayfanın (veya sonraki ilk boş olmayan sayfanın) metindeki başlangıcı.
+    Start offset of a page (or the next non-empty page) in the text.
+
+    Args:
+        page_offsets: Artan sayfa başlangıç ofsetleri / Ascending page start offsets
+        page_nums: Ofsetlere karşılık gelen sayfa numaraları / Matching page numbers
+        page_num: Sayfa numarası / Page number
+        text_len: Metin uzunluğu (sayfa yoksa) / Text length (if no such page)
+
+    Returns:
+        Karakter ofseti / Character offset
+    """
+    index = bisect_left(page_nums, page_num)
+    return page_offsets[index] if index < len(page_offsets) else text_len
@@ -0,0 +1,305 @@
+"""
+TenderAI Doküman Serileştirme / Document Serialization.
+
+ParsedDocument için sürümlü, kompakt ikili biçim. Süreçler arası aktarım
+(işçi havuzları) ve disk önbelleği için pickle/JSON yerine kullanılır.
+
+Versioned, compact binary format for ParsedDocument. Used instead of
+pickle/JSON for transfer between processes (worker pools) and the on-disk
+cache.
+
+Biçim / Layout::
+
+    "TPD1" | sürüm u8 / version u8 | codec u8 | gövde / body
+    gövde / body (codec ile sıkıştırılmış / compressed with the codec):
+        [u32 uzunluk / length | çerçeve / frame] x 4
+        0: başlık (JSON) — meta veri, tablolar, sayfa/bölüm alanları
+           header (JSON) — metadata, tables, page/section fields
+        1: metin (UTF-8) — full_text + full_text dışındaki kayıt metinleri
+           text (UTF-8) — full_text + record texts outside full_text
+        2: sayfa bayt aralıkları (int64 LE, başlangıç/bitiş çiftleri)
+           page byte ranges (int64 LE, start/end pairs)
+        3: bölüm bayt aralıkları / section byte ranges
+
+Yükleme tembeldir: sayfa ve bölüm metinleri UTF-8 metin çerçevesindeki
+aralıklara bağlanır ve yalnızca erişildiğinde çözülür; ``full_text`` ilk
+erişimde çözülür.
+
+Loading is lazy: page and section texts are bound to ranges of the UTF-8
+text frame and decoded only when accessed; ``full_text`` is decoded on
+first access.
+"""
+
+import dataclasses
+import json
+import logging
+import struct
+import sys
+import zlib
+from array import array
+
+from src.pdf_parser.parser import (
+    DocumentMetadata,
+    PageContent,
+    ParsedDocument,
+    Section,
+    TableContent,
+    _TextSpan,
+)
+
+logger = logging.getLogger(__name__)
+
+# Biçim sürümü — düzen değiştiğinde artırılır
+# Format version — bump whenever the layout changes
+FORMAT_VERSION: int = 2
+
+_MAGIC: bytes = b"TPD1"
+_PREAMBLE = struct.Struct("<4sBB")
+_FRAME_LENGTH = struct.Struct("<I")
+_FRAME_COUNT: int = 4
+
+# Sıkıştırma codec'leri / Compression codecs
+CODECS: tuple[str, ...] = ("none", "zlib", "zstd")
+_CODEC_IDS: dict[str, int] = {name: index for index, name in enumerate(CODECS)}
+_ZLIB_LEVEL: int = 6
+_ZSTD_LEVEL: int = 3
+
+
+# ============================================================
+# Yazma / Write
+# ============================================================
+
+
+def document_to_bytes(document: ParsedDocument, compression: str = "zlib") -> bytes:
+    """
+    Dokümanı ikili biçime çevir / Serialize a document to the binary format.
+
+    Args:
+        document: Ayrıştırılmış doküman / Parsed document
+        compression: "none", "zlib" veya "zstd" (zstandard yoksa zlib) /
+                     "none", "zlib" or "zstd" (zlib without zstandard)
+
+    Returns:
+        İkili veri / Binary data
+
+    Raises:
+        ValueError: Bilinmeyen codec / Unknown codec
+    """
+    if compression not in _CODEC_IDS:
+        raise ValueError(
+            f"Geçersiz sıkıştırma / Invalid compression: {compression!r} "
+            f"(seçenekler / options: {', '.join(CODECS)})"
+        )
+    if compression == "zstd" and _zstd() is None:
+        logger.warning("zstandard yüklü değil, zlib kullanılıyor / zstandard not installed, using zlib")
+        compression = "zlib"
+
+    full_text = document.full_text
+    text = full_text.encode("utf-8")
+    extras: list[bytes] = []
+    extra_start = len(text)
+
+    def ranges(records: list[_TextSpan]) -> array:
+        """Kayıtların metin çerçevesindeki bayt aralıkları / Byte ranges in the text frame."""
+        nonlocal extra_start
+        offsets = array("q")
+        to_bytes = _ByteOffsets(full_text)
+        for record in records:
+            if record._buffer is full_text:
+                offsets.append(to_bytes(record._start))
+                offsets.append(to_bytes(record._end))
+                continue
+            # full_text dışındaki metin çerçevenin sonuna eklenir
+            # Text outside full_text is appended to the end of the frame
+            encoded = record._span_text().encode("utf-8")
+            extras.append(encoded)
+            offsets.append(extra_start)
+            offsets.append(extra_start + len(encoded))
+            extra_start += len(encoded)
+        return offsets
+
+    page_ranges = ranges(document.pages)
+    section_ranges = ranges(document.sections)
+
+    header = {
+        "text_bytes": len(text),
+        "metadata": dataclasses.asdict(document.metadata),
+        "tables": [dataclasses.asdict(table) for table in document.tables],
+        "pages": [
+            [
+                page.page_num, page.has_table, page.is_scanned, page.content_hash,
+                page.info_score, page.is_low_info,
+            ]
+            for page in document.pages
+        ],
+        "sections": [
+            [section.title, section.page_num, section.section_type]
+            for section in document.sections
+        ],
+    }
+    frames = [
+        json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+        b"".join([text, *extras]),
+        _array_bytes(page_ranges),
+        _array_bytes(section_ranges),
+    ]
+    body = b"".join(part for frame in frames for part in (_FRAME_LENGTH.pack(len(frame)), frame))
+
+    if compression == "zlib":
+        body = zlib.compress(body, _ZLIB_LEVEL)
+    elif compression == "zstd":
+        body = _zstd().ZstdCompressor(level=_ZSTD_LEVEL).compress(body)
+    return _PREAMBLE.pack(_MAGIC, FORMAT_VERSION, _CODEC_IDS[compression]) + body
+
+
+# ============================================================
+# Okuma / Read
+# ============================================================
+
+
+def document_from_bytes(data: bytes | bytearray | memoryview) -> ParsedDocument:
+    """
+    İkili biçimden doküman yükle (metinler tembel çözülür).
+    Load a document from the binary format (texts are decoded lazily).
+
+    Args:
+        data: document_to_bytes() çıktısı / output
+
+    Returns:
+        ParsedDocument
+
+    Raises:
+        ValueError: Geçersiz, bozuk veya desteklenmeyen veri /
+                    Invalid, corrupt or unsupported data
+        RuntimeError: zstd verisi için zstandard yüklü değil /
+                      zstandard not installed for zstd data
+    """
+    view = memoryview(data)
+    if len(view) < _PREAMBLE.size:
+        raise ValueError("Geçersiz doküman verisi / Invalid document data")
+    magic, version, codec = _PREAMBLE.unpack_from(view)
+    if magic != _MAGIC:
+        raise ValueError("Geçersiz doküman verisi / Invalid document data")
+    if version != FORMAT_VERSION:
+        raise ValueError(
+            f"Desteklenmeyen biçim sürümü / Unsupported format version: {version}"
+        )
+
+    body = view[_PREAMBLE.size:]
+    try:
+        if codec == _CODEC_IDS["zlib"]:
+            body = memoryview(zlib.decompress(body))
+        elif codec == _CODEC_IDS["zstd"]:
+            zstd = _zstd()
+            if zstd is None:
+                raise RuntimeError(
+                    "zstd verisi için zstandard gerekli / zstandard is required for zstd data"
+                )
+            body = memoryview(zstd.ZstdDecompressor().decompressobj().decompress(bytes(body)))
+        elif codec != _CODEC_IDS["none"]:
+            raise ValueError(f"Bilinmeyen codec / Unknown codec: {codec}")
+
+        frames: list[memoryview] = []
+        position = 0
+        for _ in range(_FRAME_COUNT):
+            (length,) = _FRAME_LENGTH.unpack_from(body, position)
+            position += _FRAME_LENGTH.size
+            if position + length > len(body):
+                raise ValueError("Kesik doküman verisi / Truncated document data")
+            frames.append(body[position:position + length])
+            position += length
+
+        header = json.loads(str(frames[0], "utf-8"))
+        # Metin çerçevesi kopyalanır; sıkıştırılmış/ham gövde serbest kalır
+        # The text frame is copied; the compressed/raw body can be released
+        text = bytes(frames[1])
+        page_ranges = _bytes_array(frames[2])
+        section_ranges = _bytes_array(frames[3])
+
+        pages = [
+            PageContent(
+                page_num=page_num, has_table=has_table, is_scanned=is_scanned,
+                content_hash=content_hash, info_score=info_score, is_low_info=is_low_info,
+            )
+            for page_num, has_table, is_scanned, content_hash, info_score, is_low_info in header["pages"]
+        ]
+        sections = [
+            Section(title=title, page_num=page_num, section_type=section_type)
+            for title, page_num, section_type in header["sections"]
+        ]
+        for records, ranges in ((pages, page_ranges), (sections, section_ranges)):
+            if len(ranges) != 2 * len(records):
+                raise ValueError("Bozuk doküman verisi / Corrupt document data")
+            for index, record in enumerate(records):
+                record.bind(text, ranges[2 * index], ranges[2 * index + 1])
+        tables = [TableContent(**table) for table in header["tables"]]
+        metadata = DocumentMetadata(**header["metadata"])
+    except (zlib.error, struct.error, UnicodeDecodeError, KeyError, TypeError) as e:
+        raise ValueError(f"Bozuk doküman verisi / Corrupt document data: {e}") from e
+
+    return ParsedDocument._lazy(
+        encoded_text=text[:header["text_bytes"]],
+        pages=pages,
+        tables=tables,
+        sections=sections,
+        metadata=metadata,
+    )
+
+
+# ============================================================
+# Yardımcılar / Helpers
+# ============================================================
+
+
+class _ByteOffsets:
+    """
+    Artan karakter ofsetlerini UTF-8 bayt ofsetlerine çevirir.
+    Converts ascending character offsets to UTF-8 byte offsets.
+
+    Yalnızca son konumdan itibaren kodlama yapılır; ASCII metinde ofsetler
+    aynıdır.
+    Only the text since the last position is encoded; for ASCII text the
+    offsets are identical.
+    """
+
+    def __init__(self, text: str) -> None:
+        self._text = text
+        self._ascii = text.isascii()
+        self._chars = 0
+        self._bytes = 0
+
+    def __call__(self, offset: int) -> int:
+        if self._ascii:
+            return offset
+        if offset < self._chars:
+            self._chars = self._bytes = 0
+        self._bytes += len(self._text[self._chars:offset].encode("utf-8"))
+        self._chars = offset
+        return self._bytes
+
+
+def _array_bytes(values: array) -> bytes:
+    """int64 dizisini küçük-uçlu baytlara çevir / int64 array to little-endian bytes."""
+    if sys.byteorder == "big":
+        values = array("q", values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _bytes_array(frame: memoryview) -> array:
+    """Küçük-uçlu baytlardan int64 dizisi / int64 array from little-endian bytes."""
+    values = array("q")
+    values.frombytes(frame)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _zstd():
+    """zstandard modülü (yüklü değilse None) / zstandard module (None if not installed)."""
+    try:
+        import zstandard
+
+        return zstandard
+    except ImportError:
+        return None
@@ -73,7 +73,7 @@ def check_sql_injection(text: str) -> bool:
     return bool(_SQL_RE.search(text))
 
 
-def validate_file_magic(file_bytes: bytes, expected_mime: str = "application/pdf") -> bool:
+def validate_file_magic(file_bytes: bytes | memoryview, expected_mime: str = "application/pdf") -> bool:
     """Magic bytes ile dosya tipini doğrula."""
     if not file_bytes or len(file_bytes) < 4:
         return False
@@ -85,20 +85,21 @@ def validate_file_magic(file_bytes: bytes, expected_mime: str = "application/pdf
     return False
 
 
-def validate_file_size(file_bytes: bytes, max_mb: float = 50.0) -> bool:
+def validate_file_size(file_bytes: bytes | memoryview, max_mb: float = 50.0) -> bool:
     """Dosya boyutunu kontrol et."""
     max_bytes = int(max_mb * 1024 * 1024)
     return len(file_bytes) <= max_bytes
 
 
-def hash_file(file_bytes: bytes) -> str:
-    """Dosyanın SHA-256 hash'ini döndür."""
+def hash_file(file_bytes: bytes | memoryview) -> str:
+    """Dosyanın SHA-256 hash'ini döndür (tampon kopyalanmaz)."""
     return hashlib.sha256(file_bytes).hexdigest()
 
 
-def validate_upload(file_bytes: bytes, filename: str, max_mb: float = 50.0) -> tuple[bool, str]:
+def validate_upload(file_bytes: bytes | memoryview, filename: str, max_mb: float = 50.0) -> tuple[bool, str]:
     """
     Dosya yükleme doğrulama — magic bytes, boyut, uzantı.
+    bytes veya memoryview kabul eder; tampon kopyalanmaz.
 
     Returns:
         (geçerli_mi, hata_mesajı)
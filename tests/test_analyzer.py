@@ -8,12 +8,29 @@ Mock OpenAI API kullanarak test eder — gerçek API çağrısı yapmaz.
 Tests using Mock OpenAI API — no real API calls are made.
 """
 
+import asyncio
 import json
+import os
+import threading
+import time
 import pytest
 from datetime import datetime
 from unittest.mock import patch, MagicMock, AsyncMock
 
+import numpy as np
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
 from src.ai_engine.analyzer import IhaleAnalizAI, AnalysisResult
+from src.ai_engine.embedding_cache import CachedEmbeddings, EmbeddingCache
+from src.ai_engine.embedding_stage import EmbeddingStage, plan_batches
+from src.ai_engine.vector_cache import VectorStoreCache
+from src.ai_engine.rate_limiter import (
+    LLMRateLimiter,
+    RateLimits,
+    TokenBucket,
+    get_rate_limiter,
+    is_rate_limit_error,
+)
 from src.ai_engine.prompts import (
     get_prompt,
     get_query,
@@ -389,6 +406,256 @@ class TestVectorStoreCreation:
             analyzer.create_vector_store("   \n\n   ")
 
 
+class TestVectorStoreCache:
+    """FAISS indeks önbelleği testleri / FAISS index cache tests."""
+
+    TEXT = "Madde 1 - Konu\nYazılım geliştirme hizmeti.\n\nMadde 2 - Süre\n365 takvim günü."
+
+    class CountingEmbedding(DeterministicFakeEmbedding):
+        """Embedding isteklerini sayar / Counts embedding requests."""
+
+        requests: int = 0
+
+        def embed_documents(self, texts: list[str]) -> list[list[float]]:
+            self.requests += 1
+            return super().embed_documents(texts)
+
+    def _create_analyzer(self, cache: VectorStoreCache, chunk_size: int = 40) -> IhaleAnalizAI:
+        """Sahte embedding ile analyzer / Analyzer with fake embeddings."""
+        with patch("src.ai_engine.analyzer.ChatOpenAI"), \
+                patch("src.ai_engine.analyzer.OpenAIEmbeddings"), \
+                patch("src.ai_engine.analyzer.tiktoken"):
+            analyzer = IhaleAnalizAI(openai_api_key="test-key", chunk_size=chunk_size, chunk_overlap=0,
+                                     vector_cache=cache)
+        analyzer._embeddings = self.CountingEmbedding(size=16)
+        return analyzer
+
+    def test_hit_skips_embedding(self, tmp_path) -> None:
+        """İkinci analizde embedding yapılmaz / The second analysis embeds nothing."""
+        cache = VectorStoreCache(tmp_path)
+        first = self._create_analyzer(cache).create_vector_store(self.TEXT)
+
+        analyzer = self._create_analyzer(cache)
+        second = analyzer.create_vector_store(self.TEXT)
+
+        assert analyzer._embeddings.requests == 0
+        assert second.index.ntotal == first.index.ntotal
+        query = "Süre kaç gün?"
+        assert [doc.page_content for doc in second.similarity_search(query, k=2)] == \
+            [doc.page_content for doc in first.similarity_search(query, k=2)]
+
+    def test_settings_change_misses(self, tmp_path) -> None:
+        """Farklı chunk ayarı yeni indeks oluşturur / A different chunker builds a new index."""
+        cache = VectorStoreCache(tmp_path)
+        self._create_analyzer(cache).create_vector_store(self.TEXT)
+
+        analyzer = self._create_analyzer(cache, chunk_size=80)
+        analyzer.create_vector_store(self.TEXT)
+
+        assert analyzer._embeddings.requests == 1
+        assert len(list(tmp_path.iterdir())) == 2
+
+    def test_corrupt_entry_is_rebuilt(self, tmp_path) -> None:
+        """Bozuk kayıt silinir ve yeniden oluşturulur / A corrupt entry is removed and rebuilt."""
+        cache = VectorStoreCache(tmp_path)
+        self._create_analyzer(cache).create_vector_store(self.TEXT)
+        (entry,) = tmp_path.iterdir()
+        (entry / "index.faiss").write_bytes(b"bozuk")
+
+        analyzer = self._create_analyzer(cache)
+        vector_store = analyzer.create_vector_store(self.TEXT)
+
+        assert analyzer._embeddings.requests == 1
+        assert cache.get(entry.name, analyzer._embeddings).index.ntotal == vector_store.index.ntotal
+
+    def test_lru_eviction_and_clear(self, tmp_path) -> None:
+        """Sınır aşılınca en eski kayıt silinir / The oldest entry is evicted over the limit."""
+        analyzer = self._create_analyzer(VectorStoreCache(tmp_path))
+        texts = [f"{self.TEXT}\n\nMadde 3 - Ek {i}" for i in range(3)]
+        for text in texts:
+            # Önceki kayıtları eskit / Age the earlier entries
+            for entry in tmp_path.iterdir():
+                os.utime(entry, (entry.stat().st_atime, entry.stat().st_mtime - 10))
+            analyzer.create_vector_store(text)
+        oldest = min(tmp_path.iterdir(), key=lambda entry: entry.stat().st_mtime)
+        entry_size = max(VectorStoreCache._entry_size(entry) for entry in tmp_path.iterdir())
+
+        cache = VectorStoreCache(tmp_path, max_size_mb=2.5 * entry_size / (1024 * 1024))
+        assert cache.prune() == 1
+        assert not oldest.exists()
+        assert len(cache._entries()) == 2
+        assert cache.clear() == 2
+        assert not any(tmp_path.iterdir())
+
+
+class TestEmbeddingCache:
+    """İhaleler arası embedding önbelleği testleri / Cross-tender embedding cache tests."""
+
+    class RecordingEmbedding(DeterministicFakeEmbedding):
+        """Embed edilen metinleri kaydeder / Records embedded texts."""
+
+        embedded: list = []
+
+        def embed_documents(self, texts: list[str]) -> list[list[float]]:
+            self.embedded = self.embedded + list(texts)
+            return super().embed_documents(texts)
+
+    def _embeddings(self, cache: EmbeddingCache, model: str = "test-model") -> CachedEmbeddings:
+        return CachedEmbeddings(self.RecordingEmbedding(size=8), cache, model=model)
+
+    def test_shared_chunks_are_embedded_once(self, tmp_path) -> None:
+        """Ortak maddeler ikinci ihalede embed edilmez / Shared clauses are not embedded again."""
+        cache = EmbeddingCache(tmp_path / "emb.sqlite3")
+        boilerplate = ["4734 sayılı Kamu İhale Kanunu", "Gecikme cezası binde 1"]
+        first = self._embeddings(cache)
+        first_vectors = first.embed_documents(boilerplate + ["İhale A teknik şartı"])
+
+        second = self._embeddings(cache)
+        second_vectors = second.embed_documents(boilerplate + ["İhale B teknik şartı"])
+
+        assert second.embeddings.embedded == ["İhale B teknik şartı"]
+        assert np.allclose(second_vectors[:2], first_vectors[:2], atol=1e-6)
+
+    def test_normalized_text_hits(self, tmp_path) -> None:
+        """Boşluk farkları aynı anahtarı verir / Whitespace differences share a key."""
+        cache = EmbeddingCache(tmp_path / "emb.sqlite3")
+        self._embeddings(cache).embed_documents(["Madde 1 -  Konu\nYazılım"])
+
+        embeddings = self._embeddings(cache)
+        embeddings.embed_documents([" Madde 1 - Konu Yazılım ", "Madde 1 - Konu Yazılım"])
+
+        assert embeddings.embeddings.embedded == []
+
+    def test_model_is_part_of_key(self, tmp_path) -> None:
+        """Farklı model önbelleği paylaşmaz / A different model does not share entries."""
+        cache = EmbeddingCache(tmp_path / "emb.sqlite3")
+        self._embeddings(cache).embed_documents(["Madde 1"])
+
+        other = self._embeddings(cache, model="other-model")
+        other.embed_documents(["Madde 1"])
+
+        assert other.embeddings.embedded == ["Madde 1"]
+
+    def test_vectors_stored_as_float32(self, tmp_path) -> None:
+        """Vektörler float32 blob olarak saklanır / Vectors are stored as float32 blobs."""
+        cache = EmbeddingCache(tmp_path / "emb.sqlite3")
+        cache.put_many({"k": [0.5, -1.25, 3.0]})
+        (blob,) = cache._conn.execute("SELECT vector FROM embeddings").fetchone()
+
+        assert len(blob) == 3 * 4
+        assert cache.get_many(["k", "yok"]) == {"k": [0.5, -1.25, 3.0]}
+
+    def test_database_error_is_a_miss(self, tmp_path) -> None:
+        """Okunamayan veritabanı ıska sayılır, analiz sürer / An unreadable database is a miss."""
+        cache = EmbeddingCache(tmp_path / "emb.sqlite3")
+        embeddings = self._embeddings(cache)
+        embeddings.embed_documents(["Madde 1"])
+        cache._conn.close()
+
+        vectors = embeddings.embed_documents(["Madde 1", "Madde 2"])
+
+        assert cache.get_many(["yok"]) == {}
+        assert len(vectors) == 2
+        assert embeddings.embeddings.embedded == ["Madde 1", "Madde 1", "Madde 2"]
+        assert len(embeddings.embed_query("Süre kaç gün?")) == 8
+
+    def test_lru_eviction(self, tmp_path) -> None:
+        """Sınır aşılınca en eski vektör silinir / The oldest vector is evicted over the limit."""
+        cache = EmbeddingCache(tmp_path / "emb.sqlite3", max_size_mb=2.5 * 400 / (1024 * 1024))
+        cache.put_many({"a": [0.0] * 100})
+        cache.put_many({"b": [0.0] * 100})
+        cache.get_many(["a"])
+        cache.put_many({"c": [0.0] * 100})
+
+        assert len(cache) == 2
+        assert set(cache.get_many(["a", "b", "c"])) == {"a", "c"}
+
+    def test_analyzer_uses_cache(self, tmp_path) -> None:
+        """embedding_cache verilince embedding'ler sarmalanır / embedding_cache wraps the embeddings."""
+        cache = EmbeddingCache(tmp_path / "emb.sqlite3")
+        with patch("src.ai_engine.analyzer.ChatOpenAI"), \
+                patch("src.ai_engine.analyzer.OpenAIEmbeddings") as mock_embeddings, \
+                patch("src.ai_engine.analyzer.tiktoken"):
+            mock_embeddings.return_value.model = "text-embedding-3-small"
+            analyzer = IhaleAnalizAI(openai_api_key="test-key", embedding_cache=cache)
+
+        assert isinstance(analyzer._embeddings, CachedEmbeddings)
+        assert analyzer._embeddings.model == "text-embedding-3-small"
+
+
+class TestEmbeddingStage:
+    """Partili, eşzamanlı embedding testleri / Batched, concurrent embedding tests."""
+
+    class FlakyEmbedding(DeterministicFakeEmbedding):
+        """Gecikmeli; belirli partiler ilk denemelerde hata verir / Delayed; given batches fail at first."""
+
+        delay: float = 0.0
+        failures: dict = {}
+        calls: list = []
+
+        def embed_documents(self, texts: list[str]) -> list[list[float]]:
+            self.calls.append(texts[0])
+            time.sleep(self.delay * (2 if texts[0].endswith("0") else 1))
+            if self.failures.get(texts[0], 0) > 0:
+                self.failures[texts[0]] -= 1
+                raise ConnectionError("bağlantı koptu")
+            return super().embed_documents(texts)
+
+    TEXTS = [f"Madde {i}" for i in range(20)]
+
+    def _stage(self, embeddings, **kwargs) -> EmbeddingStage:
+        return EmbeddingStage(embeddings, count_tokens=lambda text: 10, max_batch_tokens=40,
+                              retry_base_seconds=0.0, **kwargs)
+
+    def test_plan_batches_by_tokens(self) -> None:
+        """Partiler token bütçesine ve boyuta uyar / Batches respect the token budget and size."""
+        assert plan_batches([10, 10, 10, 50, 5, 5], max_tokens=25, max_size=10) == [
+            (0, 2), (2, 3), (3, 4), (4, 6),
+        ]
+        assert plan_batches([1] * 5, max_tokens=100, max_size=2) == [(0, 2), (2, 4), (4, 5)]
+        assert plan_batches([], max_tokens=10, max_size=10) == []
+
+    def test_index_order_matches_chunks(self) -> None:
+        """Partiler sırasız bitse de indeks chunk sırasındadır / The index follows chunk order."""
+        embeddings = self.FlakyEmbedding(size=8, delay=0.02, calls=[])
+        vector_store = self._stage(embeddings, max_concurrency=4).build(self.TEXTS)
+
+        ids = [vector_store.index_to_docstore_id[i] for i in range(vector_store.index.ntotal)]
+        assert [vector_store.docstore.search(doc_id).page_content for doc_id in ids] == self.TEXTS
+        expected = np.array(embeddings.embed_query("Madde 7"), dtype=np.float32)
+        assert np.allclose(vector_store.index.reconstruct(7), expected, atol=1e-6)
+
+    def test_concurrent_batches(self) -> None:
+        """Partiler eşzamanlı gönderilir / Batches are sent concurrently."""
+        embeddings = self.FlakyEmbedding(size=8, delay=0.05, calls=[])
+
+        start = time.perf_counter()
+        self._stage(embeddings, max_concurrency=5).build(self.TEXTS)
+        elapsed = time.perf_counter() - start
+
+        assert len(embeddings.calls) == 5
+        assert elapsed < 3 * 0.05  # sıralı / sequential: ~6 x 0.05
+
+    def test_only_failed_batch_is_retried(self) -> None:
+        """Yalnızca hata veren parti yeniden denenir / Only the failing batch is retried."""
+        embeddings = self.FlakyEmbedding(size=8, calls=[], failures={"Madde 8": 2})
+        stage = self._stage(embeddings, max_concurrency=2)
+
+        vector_store = stage.build(self.TEXTS)
+
+        assert vector_store.index.ntotal == len(self.TEXTS)
+        assert sorted(embeddings.calls) == sorted(["Madde 0", "Madde 4", "Madde 8", "Madde 8", "Madde 8",
+                                                   "Madde 12", "Madde 16"])
+        assert stage.stats.retried_batches == 1
+        assert stage.stats.failed_attempts == 2
+
+    def test_exhausted_batch_raises(self) -> None:
+        """Denemeler biterse RuntimeError / RuntimeError once attempts run out."""
+        embeddings = self.FlakyEmbedding(size=8, calls=[], failures={"Madde 4": 5})
+        with pytest.raises(RuntimeError, match="batch 1"):
+            self._stage(embeddings, max_attempts=3).build(self.TEXTS)
+
+
 class TestAnalyzeEmptyDocument:
     """Boş doküman analizi testleri / Empty document analysis tests."""
 
@@ -402,3 +669,220 @@ class TestAnalyzeEmptyDocument:
         result = await analyzer.analyze(doc)
         assert isinstance(result, AnalysisResult)
         assert result.risk_analysis == {}
+
+
+class TestConcurrentAnalyze:
+    """Eşzamanlı analiz testleri / Concurrent analysis tests."""
+
+    STEP_DELAY = 0.1
+
+    def _create_analyzer(self, **kwargs) -> IhaleAnalizAI:
+        """Mock LLM ile analyzer; her çağrı STEP_DELAY sürer / Analyzer with a mock LLM; each call takes STEP_DELAY."""
+        with patch("src.ai_engine.analyzer.ChatOpenAI"), \
+                patch("src.ai_engine.analyzer.OpenAIEmbeddings"), \
+                patch("src.ai_engine.analyzer.tiktoken"):
+            analyzer = IhaleAnalizAI(openai_api_key="test-key", **kwargs)
+
+        analyzer.in_flight = analyzer.peak_in_flight = 0
+
+        async def ainvoke(messages):
+            analyzer.in_flight += 1
+            analyzer.peak_in_flight = max(analyzer.peak_in_flight, analyzer.in_flight)
+            await asyncio.sleep(self.STEP_DELAY)
+            analyzer.in_flight -= 1
+            return MagicMock(content='{"risk_skoru": 40}')
+
+        analyzer._llm.ainvoke = ainvoke
+        analyzer._count_tokens = lambda text: len(text) // 4
+        vector_store = MagicMock()
+        vector_store.asimilarity_search = AsyncMock(return_value=[])
+        analyzer.create_vector_store = MagicMock(return_value=vector_store)
+        return analyzer
+
+    @staticmethod
+    def _document() -> ParsedDocument:
+        return ParsedDocument(full_text="Madde 1 - Konu\nYazilim", metadata=DocumentMetadata())
+
+    @pytest.mark.asyncio
+    async def test_steps_run_concurrently(self) -> None:
+        """Beş adım birlikte çalışır, özet sonra gelir / Five steps run together, the summary after."""
+        analyzer = self._create_analyzer()
+
+        start = time.perf_counter()
+        result = await analyzer.analyze(self._document())
+        elapsed = time.perf_counter() - start
+
+        assert analyzer.peak_in_flight == 5
+        assert elapsed < 4 * self.STEP_DELAY  # sıralı / sequential: 6 x STEP_DELAY
+        assert result.risk_analysis == {"risk_skoru": 40}
+        assert result.timeline_analysis == {"risk_skoru": 40}
+        assert result.executive_summary == {"risk_skoru": 40}
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self) -> None:
+        """max_concurrency aynı anda çalışan adımları sınırlar / max_concurrency bounds running steps."""
+        analyzer = self._create_analyzer(max_concurrency=2)
+
+        await analyzer.analyze(self._document())
+
+        assert analyzer.max_concurrency == 2
+        assert analyzer.peak_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_step_is_isolated(self) -> None:
+        """Bir adımın hatası diğerlerini etkilemez / One step's failure does not affect the others."""
+        analyzer = self._create_analyzer()
+        penalty_prompt = get_prompt("penalty_clauses")
+
+        async def query(vector_store, prompt, query, extra_context=""):
+            if prompt == penalty_prompt:
+                raise RuntimeError("rate limit")
+            return '{"ok": true}'
+
+        analyzer._query_with_prompt = query
+        result = await analyzer.analyze(self._document())
+
+        assert result.penalty_clauses == {"error": "rate limit"}
+        assert result.risk_analysis == {"ok": True}
+        assert result.financial_summary == {"ok": True}
+        assert result.executive_summary == {"ok": True}
+
+
+# ============================================================
+# Hız Sınırlayıcı Testleri / Rate Limiter Tests
+# ============================================================
+
+
+class TestTokenBucket:
+    """Token kovası testleri / Token bucket tests."""
+
+    def test_reservations_queue_in_order(self) -> None:
+        """Boş kovada beklemeler birikir / Waits accumulate on an empty bucket."""
+        now = [0.0]
+        bucket = TokenBucket(per_minute=60, clock=lambda: now[0])  # 1/sn / 1 per second
+
+        assert bucket.reserve(60) == 0.0
+        assert bucket.reserve(1) == pytest.approx(1.0)
+        assert bucket.reserve(2) == pytest.approx(3.0)
+        now[0] = 3.0
+        assert bucket.reserve(0) == 0.0
+
+    def test_drain_delays_next_reservation(self) -> None:
+        """drain sonraki rezervasyonu geciktirir / drain delays the next reservation."""
+        now = [0.0]
+        bucket = TokenBucket(per_minute=60, clock=lambda: now[0])
+
+        bucket.drain(10)
+
+        assert bucket.reserve(1) == pytest.approx(11.0)
+
+
+class TestLLMRateLimiter:
+    """Paylaşılan hız sınırlayıcı testleri / Shared rate limiter tests."""
+
+    @staticmethod
+    def _limiter(max_in_flight: int) -> LLMRateLimiter:
+        return LLMRateLimiter(
+            "test", "model",
+            RateLimits(requests_per_minute=6000, tokens_per_minute=1_000_000, max_in_flight=max_in_flight),
+        )
+
+    def test_in_flight_limit_across_threads(self) -> None:
+        """Kapı iş parçacıkları arasında sınırlar / The gate limits across threads."""
+        limiter = self._limiter(max_in_flight=2)
+        active = [0, 0]  # şu an, en yüksek / current, peak
+        lock = threading.Lock()
+
+        def call() -> None:
+            with limiter.acquire(100):
+                with lock:
+                    active[0] += 1
+                    active[1] = max(active[1], active[0])
+                time.sleep(0.05)
+                with lock:
+                    active[0] -= 1
+
+        threads = [threading.Thread(target=call) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        metrics = limiter.metrics()
+        assert active[1] == 2
+        assert metrics.calls == 6
+        assert metrics.queue_depth == 0
+        assert metrics.in_flight == 0
+        assert metrics.waited_calls >= 4
+        assert metrics.max_wait_seconds >= 0.04
+
+    def test_async_callers_share_gate_across_event_loops(self) -> None:
+        """Ayrı olay döngüleri aynı kapıyı paylaşır / Separate event loops share the gate."""
+        limiter = self._limiter(max_in_flight=1)
+        active = [0, 0]
+
+        async def call() -> None:
+            async with limiter.acquire_async(100):
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+                await asyncio.sleep(0.03)
+                active[0] -= 1
+
+        async def session() -> None:
+            await asyncio.gather(call(), call())
+
+        threads = [threading.Thread(target=asyncio.run, args=(session(),)) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert active[1] == 1
+        assert limiter.metrics().calls == 4
+
+    def test_throttle_makes_callers_wait(self) -> None:
+        """429 sonrası çağıranlar kuyrukta bekler / After a 429 callers wait in the queue."""
+        limiter = self._limiter(max_in_flight=2)
+
+        limiter.throttle(0.2)
+        start = time.perf_counter()
+        with limiter.acquire():
+            pass
+
+        assert time.perf_counter() - start >= 0.19
+        assert limiter.metrics().throttled == 1
+
+    def test_registry_shares_limiters(self) -> None:
+        """Aynı sağlayıcı + model aynı sınırlayıcıyı alır / Same provider + model gets the same limiter."""
+        limiter = get_rate_limiter("openai", "test-model")
+
+        assert get_rate_limiter("openai", "test-model") is limiter
+        assert get_rate_limiter("gemini", "test-model") is not limiter
+
+    def test_rate_limit_error_detection(self) -> None:
+        """429 hataları tanınır / 429 errors are recognised."""
+        error = Exception("boom")
+        error.status_code = 429
+
+        assert is_rate_limit_error(error)
+        assert is_rate_limit_error(Exception("429 RESOURCE_EXHAUSTED"))
+        assert not is_rate_limit_error(ValueError("invalid json"))
+
+    def test_gemini_waits_in_queue_instead_of_sleeping(self) -> None:
+        """Gemini 429'da kuyruğu durdurur, time.sleep çağırmaz / Gemini pauses the queue on 429, no time.sleep."""
+        from src.ai_engine.gemini_analyzer import GeminiAnalizAI
+
+        limiter = MagicMock()
+        with patch("src.ai_engine.gemini_analyzer.genai.Client") as client:
+            client.return_value.models.generate_content.side_effect = [
+                Exception("429 RESOURCE_EXHAUSTED"),
+                MagicMock(text='{"risk_skoru": 40}'),
+            ]
+            analyzer = GeminiAnalizAI(gemini_api_key="test-key", rate_limiter=limiter)
+            with patch("time.sleep") as sleep:
+                result = analyzer._analyze_step("risk_analysis", "prompt", "metin")
+
+        assert result == {"risk_skoru": 40}
+        limiter.throttle.assert_called_once_with(30.0)
+        assert limiter.acquire.call_count == 2
+        sleep.assert_not_called()
@@ -8,6 +8,7 @@ fpdf2 ile gerçek PDF oluşturarak test eder — harici dosya bağımlılığı
 Tests with real PDFs generated via fpdf2 — no external file dependency.
 """
 
+import os
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -22,7 +23,25 @@ from src.pdf_parser.parser import (
     Section,
     DocumentMetadata,
     SECTION_KEYWORDS,
+    _information_score,
+    _mark_low_info_pages,
+    _normalize_page,
+    _split_page_ranges,
+    _SectionDetector,
+    _is_table_candidate,
+    _sample_indices,
+    _TextSpool,
 )
+from src.pdf_parser.backends import (
+    PdfiumFastBackend,
+    PdfplumberBackend,
+    TextBackend,
+    select_text_backend,
+)
+from src.pdf_parser.cache import ParseCache
+from src.pdf_parser.classifier import SectionClassifier
+from src.pdf_parser.ocr import OCRBackend, OCRCache, OCRStage
+from src.pdf_parser.package import DEFAULT_ROLE, classify_role
 
 
 # ============================================================
@@ -87,6 +106,41 @@ def _create_table_pdf(tmp_path: Path, filename: str = "table.pdf") -> Path:
     return file_path
 
 
+def _create_boxed_pdf(tmp_path: Path, rows: list[str], filename: str = "boxed.pdf") -> Path:
+    """Tek sütunlu kutu içinde satırlar / Rows inside a single-column box."""
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_font("Helvetica", size=10)
+    for row in rows:
+        pdf.cell(180, 8, row, border=1, new_x="LMARGIN", new_y="NEXT")
+    file_path = tmp_path / filename
+    pdf.output(str(file_path))
+    return file_path
+
+
+def _create_scanned_pdf(
+    tmp_path: Path, pages: list[str | None], filename: str = "scanned.pdf"
+) -> Path:
+    """
+    Görüntü (None) ve metin sayfalarından PDF oluştur.
+    Create a PDF from image (None) and text pages.
+    """
+    from PIL import Image
+
+    image = Image.new("L", (200, 280), color=200)
+    pdf = FPDF()
+    pdf.set_font("Helvetica", size=11)
+    for page_text in pages:
+        pdf.add_page()
+        if page_text is None:
+            pdf.image(image, x=0, y=0, w=210, h=297)
+        else:
+            pdf.cell(0, 8, page_text, new_x="LMARGIN", new_y="NEXT")
+    file_path = tmp_path / filename
+    pdf.output(str(file_path))
+    return file_path
+
+
 def _create_empty_pdf(tmp_path: Path, filename: str = "empty.pdf") -> Path:
     """Boş PDF oluştur / Create empty PDF."""
     pdf = FPDF()
@@ -96,6 +150,30 @@ def _create_empty_pdf(tmp_path: Path, filename: str = "empty.pdf") -> Path:
     return file_path
 
 
+def _create_package_zip(tmp_path: Path, members: dict[str, bytes], filename: str = "paket.zip") -> Path:
+    """Üyelerden ZIP paketi oluştur / Create a ZIP package from members."""
+    import zipfile
+
+    file_path = tmp_path / filename
+    with zipfile.ZipFile(file_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return file_path
+
+
+class _FakeOCRBackend(OCRBackend):
+    """Sabit metin döndüren test motoru / Test backend returning fixed text."""
+
+    name = "fake"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def recognize(self, image) -> str:
+        self.calls += 1
+        return f"Madde 9 - Teminat\nTanınan metin {image.size[0]}"
+
+
 # ============================================================
 # Dataclass Testleri / Dataclass Tests
 # ============================================================
@@ -158,6 +236,117 @@ class TestDataclasses:
         assert section.page_num == 3
 
 
+class TestCompactDocument:
+    """Tek metin tamponlu doküman testleri / Single text buffer document tests."""
+
+    def test_pages_and_sections_share_full_text(self, tmp_path: Path) -> None:
+        """Sayfa ve bölüm metni full_text aralığı olmalı / Texts should be ranges of full_text."""
+        pdf_path = _create_multipage_pdf(tmp_path, [
+            "Madde 1 - Konu\nIhale konusu yazilim gelistirme",
+            "Madde 2 - Sure\nIs 120 gunde bitirilecek",
+        ])
+        result = IhalePDFParser().parse(pdf_path)
+
+        assert result.pages and result.sections
+        for record in result.pages + result.sections:
+            assert record._buffer is result.full_text
+        assert "Ihale konusu" in result.pages[0].text
+        assert result.sections[1].content == "Is 120 gunde bitirilecek"
+
+    def test_records_outside_full_text_keep_own_text(self) -> None:
+        """full_text'te olmayan metin korunmalı / Text missing from full_text is kept."""
+        doc = ParsedDocument(
+            full_text="Birinci sayfa\n\nIkinci sayfa",
+            pages=[
+                PageContent(page_num=1, text="Birinci sayfa"),
+                PageContent(page_num=2, text="Baska metin"),
+                PageContent(page_num=3, text="Ikinci sayfa"),
+            ],
+        )
+
+        assert [page.text for page in doc.pages] == ["Birinci sayfa", "Baska metin", "Ikinci sayfa"]
+        assert doc.pages[0]._buffer is doc.full_text
+        assert doc.pages[1]._buffer is not doc.full_text
+        assert doc.pages[2]._buffer is doc.full_text
+
+    def test_replace_and_to_dict(self) -> None:
+        """replace tamponu paylaşmalı, to_dict alanları vermeli / replace shares, to_dict lists fields."""
+        doc = ParsedDocument(
+            full_text="Madde 1 - Konu\nIcerik",
+            sections=[Section(title="Madde 1 - Konu", content="Icerik", page_num=1)],
+        )
+        moved = doc.sections[0].replace(page_num=4)
+
+        assert moved._buffer is doc.full_text
+        assert moved.to_dict() == {
+            "title": "Madde 1 - Konu", "content": "Icerik", "page_num": 4, "section_type": "genel",
+        }
+        assert moved != doc.sections[0]
+        assert moved.replace(page_num=1) == doc.sections[0]
+
+
+class TestDocumentSerialization:
+    """İkili doküman biçimi testleri / Binary document format tests."""
+
+    @staticmethod
+    def _document() -> ParsedDocument:
+        """Türkçe karakterli örnek doküman / Sample document with Turkish characters."""
+        return ParsedDocument(
+            full_text="Giriş metni\n\nMadde 1 - Şartlar\nİçerik: ğüşıöç",
+            pages=[
+                PageContent(page_num=1, text="Giriş metni", content_hash="a" * 64),
+                PageContent(page_num=2, text="Madde 1 - Şartlar\nİçerik: ğüşıöç", has_table=True),
+                PageContent(page_num=3, text="full_text dışında", is_scanned=True, info_score=0.1, is_low_info=True),
+            ],
+            tables=[TableContent(page_num=2, headers=["Kalem"], rows=[["Çimento"]])],
+            sections=[Section(title="Madde 1 - Şartlar", content="İçerik: ğüşıöç", page_num=2, section_type="idari")],
+            metadata=DocumentMetadata(total_pages=3, scanned_pages=[3], header_lines=["ikn #"]),
+        )
+
+    @pytest.mark.parametrize("compression", ["none", "zlib", "zstd"])
+    def test_round_trip(self, compression: str) -> None:
+        """Gidiş-dönüş aynı dokümanı vermeli / Round trip should give the same document."""
+        document = self._document()
+
+        loaded = ParsedDocument.from_bytes(document.to_bytes(compression))
+
+        assert loaded == document
+        assert loaded.pages[1]._buffer is loaded.full_text
+
+    def test_round_trip_of_parsed_pdf(self, tmp_path: Path) -> None:
+        """Ayrıştırılmış PDF gidiş-dönüşü / Round trip of a parsed PDF."""
+        pdf_path = _create_multipage_pdf(tmp_path, ["Madde 1 - Konu\nYazilim", "Madde 2 - Sure\n90 gun"])
+        document = IhalePDFParser().parse(pdf_path)
+
+        assert ParsedDocument.from_bytes(document.to_bytes()) == document
+
+    def test_loading_is_lazy(self) -> None:
+        """Metinler erişilene kadar çözülmemeli / Texts stay encoded until accessed."""
+        loaded = ParsedDocument.from_bytes(self._document().to_bytes())
+
+        assert "_encoded_text" in loaded.__dict__
+        assert isinstance(loaded.sections[0]._buffer, bytes)
+        assert loaded.sections[0].content == "İçerik: ğüşıöç"
+        assert "_encoded_text" in loaded.__dict__
+
+        assert loaded.full_text.startswith("Giriş")
+        assert "_encoded_text" not in loaded.__dict__
+        assert loaded.sections[0]._buffer is loaded.full_text
+
+    def test_invalid_data_raises_value_error(self) -> None:
+        """Geçersiz veri ValueError vermeli / Invalid data should raise ValueError."""
+        data = self._document().to_bytes()
+
+        for broken in (b"", b"not a document", data[:4] + b"\x63" + data[5:], data[:-10]):
+            with pytest.raises(ValueError):
+                ParsedDocument.from_bytes(broken)
+
+    def test_unknown_compression_rejected(self) -> None:
+        """Bilinmeyen sıkıştırma reddedilmeli / Unknown compression should be rejected."""
+        with pytest.raises(ValueError):
+            ParsedDocument().to_bytes("lz4")
+
+
 # ============================================================
 # IhalePDFParser Testleri / IhalePDFParser Tests
 # ============================================================
@@ -170,6 +359,68 @@ class TestIhalePDFParserInit:
         """Parser başlatma / Initialize parser."""
         parser = IhalePDFParser()
         assert parser is not None
+        assert parser.max_workers >= 1
+
+    def test_parser_init_with_workers(self) -> None:
+        """Worker sayısı ayarlanabilmeli / Worker count should be configurable."""
+        parser = IhalePDFParser(max_workers=3, parallel_min_pages=10)
+        assert parser.max_workers == 3
+        assert parser.parallel_min_pages == 10
+
+
+class TestParallelExtraction:
+    """Paralel sayfa çıkarma testleri / Parallel page extraction tests."""
+
+    def test_parallel_matches_serial(self, tmp_path: Path) -> None:
+        """Paralel ve seri çıktı aynı olmalı / Parallel and serial output should match."""
+        pages = [f"Madde {i} - Konu {i}\nSayfa {i} icerigi" for i in range(1, 9)]
+        pdf_path = _create_multipage_pdf(tmp_path, pages)
+
+        serial = IhalePDFParser(max_workers=1).parse(pdf_path)
+        parallel = IhalePDFParser(max_workers=2, parallel_min_pages=1).parse(pdf_path)
+
+        assert [p.page_num for p in parallel.pages] == list(range(1, 9))
+        assert [p.text for p in parallel.pages] == [p.text for p in serial.pages]
+        assert parallel.full_text == serial.full_text
+        assert [s.title for s in parallel.sections] == [s.title for s in serial.sections]
+
+    def test_parallel_with_bytes_input(self, tmp_path: Path) -> None:
+        """Bytes girdi paralel modda çalışmalı / Bytes input should work in parallel mode."""
+        pages = [f"Sayfa {i}" for i in range(1, 5)]
+        pdf_bytes = _create_multipage_pdf(tmp_path, pages).read_bytes()
+
+        result = IhalePDFParser(max_workers=2, parallel_min_pages=1).parse(pdf_bytes)
+
+        assert result.metadata.total_pages == 4
+        assert "Sayfa 4" in result.full_text
+
+    def test_small_document_uses_serial_mode(self, tmp_path: Path) -> None:
+        """Küçük doküman seri işlenmeli / Small document should be processed serially."""
+        pdf_path = _create_multipage_pdf(tmp_path, ["Sayfa 1", "Sayfa 2"])
+        parser = IhalePDFParser(max_workers=4, parallel_min_pages=40)
+
+        with patch("src.pdf_parser.parser.ProcessPoolExecutor") as mock_pool:
+            result = parser.parse(pdf_path)
+
+        mock_pool.assert_not_called()
+        assert result.metadata.total_pages == 2
+
+    def test_pool_failure_falls_back_to_serial(self, tmp_path: Path) -> None:
+        """Havuz hatasında seri moda dönmeli / Should fall back to serial on pool failure."""
+        pdf_path = _create_multipage_pdf(tmp_path, ["Sayfa 1", "Sayfa 2", "Sayfa 3"])
+        parser = IhalePDFParser(max_workers=2, parallel_min_pages=1)
+
+        with patch("src.pdf_parser.parser.ProcessPoolExecutor", side_effect=OSError("no fork")):
+            result = parser.parse(pdf_path)
+
+        assert result.metadata.total_pages == 3
+        assert "Sayfa 3" in result.full_text
+
+    def test_split_page_ranges(self) -> None:
+        """Aralıklar tüm sayfaları sırayla kapsamalı / Ranges should cover all pages in order."""
+        ranges = _split_page_ranges(10, 3)
+        assert ranges == [(0, 4), (4, 7), (7, 10)]
+        assert _split_page_ranges(2, 8) == [(0, 1), (1, 2)]
 
 
 class TestParseTextPDF:
@@ -235,6 +486,274 @@ class TestParseWithBytes:
         assert result.metadata.file_name == "bytes_input.pdf"
         assert result.metadata.total_pages >= 1
 
+    def test_parse_from_memoryview_and_bytearray(self, tmp_path: Path) -> None:
+        """memoryview/bytearray girdisi bytes ile aynı sonucu verir / Same result as bytes."""
+        pdf_path = _create_multipage_pdf(tmp_path, ["Madde 1 - Konu\nMetin", "Madde 2 - Teminat"])
+        pdf_bytes = pdf_path.read_bytes()
+        parser = IhalePDFParser()
+
+        expected = parser.parse(pdf_bytes)
+        from_view = parser.parse(memoryview(pdf_bytes))
+        from_array = parser.parse(bytearray(pdf_bytes))
+
+        assert from_view.full_text == expected.full_text
+        assert from_array.sections == expected.sections
+        assert from_view.metadata.file_size_mb == expected.metadata.file_size_mb
+
+    def test_memoryview_parallel_uses_single_temp_file(self, tmp_path: Path) -> None:
+        """Paralel modda tampon bir kez diske yazılır ve silinir / Buffer is spilled once, then removed."""
+        import tempfile
+
+        pdf_path = _create_multipage_pdf(tmp_path, [f"Sayfa {i}" for i in range(6)])
+        parser = IhalePDFParser(max_workers=2, parallel_min_pages=2)
+        spill_dir = tmp_path / "spill"
+        spill_dir.mkdir()
+
+        with patch.object(tempfile, "tempdir", str(spill_dir)):
+            result = parser.parse(memoryview(pdf_path.read_bytes()))
+
+        assert result.metadata.total_pages == 6
+        assert list(spill_dir.iterdir()) == []
+
+    def test_parse_spooled_temp_file_path(self, tmp_path: Path) -> None:
+        """Uzantısız geçici dosya yolu PDF imzasıyla kabul edilir / A suffix-less temp path is accepted."""
+        pdf_bytes = _create_text_pdf(tmp_path, "Gecici dosya").read_bytes()
+        temp_path = tmp_path / "tmpabc123"
+        temp_path.write_bytes(pdf_bytes)
+
+        result = IhalePDFParser().parse(temp_path)
+
+        assert "Gecici dosya" in result.full_text
+
+    def test_content_hash_same_for_path_and_buffer(self, tmp_path: Path) -> None:
+        """Yol (mmap) ve tampon özeti aynı / Path (mmap) and buffer hashes match."""
+        pdf_path = _create_text_pdf(tmp_path, "Ozet")
+        pdf_bytes = pdf_path.read_bytes()
+
+        assert IhalePDFParser._content_hash(pdf_path) == IhalePDFParser._content_hash(
+            memoryview(pdf_bytes)
+        )
+
+
+class TestStreamingAPI:
+    """Akış API'si testleri / Streaming API tests."""
+
+    _PAGES = [
+        "Giris metni\nMadde 1 - Konu\nBu ihale konusu hakkindadir.",
+        "Devam eden metin\nMadde 2 - Ceza Hukumleri\nGecikme halinde ceza uygulanir.",
+        "Ceza devam\nEK-1 Fiyat Tablosu\nFiyat bilgileri burada.",
+    ]
+
+    def test_iter_pages_is_lazy_generator(self, tmp_path: Path) -> None:
+        """iter_pages ilk sayfayı hemen vermeli / iter_pages should yield the first page immediately."""
+        pdf_path = _create_multipage_pdf(tmp_path, self._PAGES)
+        parser = IhalePDFParser()
+
+        stream = parser.iter_pages(pdf_path)
+        first = next(stream)
+
+        assert first.page_num == 1
+        assert "Madde 1" in first.text
+        assert [page.page_num for page in stream] == [2, 3]
+
+    def test_iter_sections_matches_parse(self, tmp_path: Path) -> None:
+        """
+        iter_sections parse ile aynı (başlık/altbilgiden arındırılmış) bölümleri vermeli.
+        iter_sections should yield the same (header/footer-stripped) sections as parse.
+        """
+        page_texts = [
+            f"T.C. Ornek Belediyesi - IKN 2024/123456\n{text}\nSayfa {i} / {len(self._PAGES)}"
+            for i, text in enumerate(self._PAGES, start=1)
+        ]
+        pdf_path = _create_multipage_pdf(tmp_path, page_texts)
+        parser = IhalePDFParser()
+
+        streamed = list(parser.iter_sections(pdf_path))
+        parsed = parser.parse(pdf_path)
+
+        assert [(s.title, s.content, s.page_num, s.section_type) for s in streamed] == [
+            (s.title, s.content, s.page_num, s.section_type) for s in parsed.sections
+        ]
+        assert [s.page_num for s in streamed] == [1, 2, 3]
+        assert parsed.metadata.header_lines and parsed.metadata.footer_lines
+        for section in streamed:
+            assert "IKN" not in section.content
+            assert "Sayfa" not in section.content
+        assert "IKN" not in parsed.full_text
+
+    def test_parse_sections_match_full_text_detection(self, tmp_path: Path) -> None:
+        """Akış bölümleri tam metin tespitiyle aynı olmalı / Stream sections should match full-text detection."""
+        pdf_path = _create_multipage_pdf(tmp_path, self._PAGES)
+        parser = IhalePDFParser()
+        parsed = parser.parse(pdf_path)
+
+        detected = parser.detect_sections(parsed.full_text)
+
+        assert [(s.title, s.content, s.section_type) for s in detected] == [
+            (s.title, s.content, s.section_type) for s in parsed.sections
+        ]
+
+    def test_section_detector_spans_page_boundary(self) -> None:
+        """Sayfa sınırını aşan bölüm içeriği birleşmeli / Content spanning pages should be joined."""
+        parser = IhalePDFParser()
+        detector = _SectionDetector(parser._classify_section_type)
+
+        first = detector.feed("Madde 1 - Konu\nilk sayfa", 1)
+        second = detector.feed("ikinci sayfa\nMadde 2 - Tanimlar\ntanim", 2)
+        rest = detector.finish()
+
+        assert first == []
+        assert [s.title for s in second] == ["Madde 1 - Konu"]
+        assert second[0].content == "ilk sayfa\n\nikinci sayfa"
+        assert [(s.title, s.page_num) for s in rest] == [("Madde 2 - Tanimlar", 2)]
+
+
+class TestParseCache:
+    """Parse önbelleği testleri / Parse cache tests."""
+
+    def test_cache_hit_returns_same_document(self, tmp_path: Path) -> None:
+        """İkinci parse önbellekten gelmeli / Second parse should come from cache."""
+        pdf_path = _create_multipage_pdf(tmp_path, ["Madde 1 - Konu\nIcerik", "Sayfa 2"])
+        parser = IhalePDFParser(cache=ParseCache(tmp_path / "cache"))
+
+        first = parser.parse(pdf_path)
+        with patch.object(parser, "_stream") as mock_stream:
+            second = parser.parse(pdf_path.read_bytes())
+
+        mock_stream.assert_not_called()
+        assert first.metadata.cache_hit is False
+        assert second.metadata.cache_hit is True
+        assert second.full_text == first.full_text
+        assert second.pages == first.pages
+        assert second.sections == first.sections
+        assert second.metadata.file_name == "bytes_input.pdf"
+
+    def test_different_content_misses(self, tmp_path: Path) -> None:
+        """Farklı içerik önbellekten gelmemeli / Different content should miss."""
+        cache = ParseCache(tmp_path / "cache")
+        parser = IhalePDFParser(cache=cache)
+
+        parser.parse(_create_text_pdf(tmp_path, "Birinci", filename="a.pdf"))
+        result = parser.parse(_create_text_pdf(tmp_path, "Ikinci", filename="b.pdf"))
+
+        assert result.metadata.cache_hit is False
+        assert "Ikinci" in result.full_text
+
+    def test_key_contains_parser_version(self) -> None:
+        """Anahtar parser sürümünü içermeli / Key should include the parser version."""
+        from src.pdf_parser.parser import PARSER_VERSION
+
+        key = ParseCache.make_key("abc123")
+        assert key == f"abc123-v{PARSER_VERSION}"
+        assert ParseCache.make_key("abc123", "tables-never").endswith("-tables-never")
+
+    def test_lru_eviction_keeps_size_bounded(self, tmp_path: Path) -> None:
+        """Boyut sınırı aşılınca en eski kayıt silinmeli / Oldest entry evicted over limit."""
+        import os
+
+        cache = ParseCache(tmp_path / "cache", max_size_mb=0.001)  # ~1 KB
+
+        cache.put("old", ParsedDocument(full_text=os.urandom(400).hex()))
+        os.utime(cache._path_for("old"), (1, 1))
+        cache.put("new", ParsedDocument(full_text=os.urandom(400).hex()))
+
+        assert cache.get("old") is None
+        assert cache.get("new") is not None
+
+    def test_corrupt_entry_is_ignored(self, tmp_path: Path) -> None:
+        """Bozuk kayıt None döndürmeli / Corrupt entry should return None."""
+        cache = ParseCache(tmp_path / "cache")
+        cache._path_for("bad").write_bytes(b"not gzip")
+
+        assert cache.get("bad") is None
+        assert not cache._path_for("bad").exists()
+
+
+class TestIncrementalParse:
+    """Artımlı parse testleri / Incremental parse tests."""
+
+    @staticmethod
+    def _pages(changed: dict[int, str] | None = None) -> list[str]:
+        pages = [
+            f"Madde {i} - Teslim suresi\nIs {i} gun icinde teslim edilir." for i in range(1, 7)
+        ]
+        for index, text in (changed or {}).items():
+            pages[index] = text
+        return pages
+
+    def test_changed_page_matches_full_parse(self, tmp_path: Path) -> None:
+        """Artımlı sonuç tam parse ile aynı / Incremental result equals a full parse."""
+        original = _create_multipage_pdf(tmp_path, self._pages(), "v1.pdf")
+        revised = _create_multipage_pdf(
+            tmp_path, self._pages({2: "Madde 3 - Ceza\nGecikme cezasi uygulanir."}), "v2.pdf"
+        )
+        parser = IhalePDFParser()
+
+        previous = parser.parse(original)
+        incremental = parser.parse_incremental(revised, previous)
+        full = parser.parse(revised)
+
+        assert incremental.full_text == full.full_text
+        assert incremental.sections == full.sections
+        assert incremental.metadata.changed_pages == [3]
+        assert incremental.metadata.reused_pages == 5
+        assert incremental.metadata.changed_sections == [2]
+        assert incremental.sections[2].section_type == "ceza"
+
+    def test_only_changed_pages_are_extracted(self, tmp_path: Path) -> None:
+        """Değişmeyen sayfalar yeniden çıkarılmaz / Unchanged pages are not re-extracted."""
+        original = _create_multipage_pdf(tmp_path, self._pages(), "v1.pdf")
+        revised = _create_multipage_pdf(tmp_path, self._pages({4: "Madde 5 - Yeni"}), "v2.pdf")
+        parser = IhalePDFParser()
+        previous = parser.parse(original)
+
+        from src.pdf_parser import parser as parser_module
+
+        with patch.object(
+            parser_module, "_iter_pages", wraps=parser_module._iter_pages
+        ) as mock_iter:
+            parser.parse_incremental(revised, previous)
+
+        assert mock_iter.call_count == 1
+
+    def test_inserted_page_shifts_following_sections(self, tmp_path: Path) -> None:
+        """Araya sayfa eklenince sonraki bölümler kayar / An inserted page shifts later sections."""
+        pages = self._pages()
+        original = _create_multipage_pdf(tmp_path, pages, "v1.pdf")
+        revised = _create_multipage_pdf(
+            tmp_path, pages[:2] + ["Madde 2.1 - Ek madde\nZeyilname"] + pages[2:], "v2.pdf"
+        )
+        parser = IhalePDFParser()
+
+        incremental = parser.parse_incremental(revised, parser.parse(original))
+        full = parser.parse(revised)
+
+        assert incremental.sections == full.sections
+        assert incremental.metadata.changed_pages == [3]
+        assert incremental.sections[-1].page_num == 7
+
+    def test_unchanged_document_reports_no_changes(self, tmp_path: Path) -> None:
+        """Aynı doküman için değişiklik raporlanmaz / No changes reported for the same document."""
+        pdf_path = _create_multipage_pdf(tmp_path, self._pages())
+        parser = IhalePDFParser()
+
+        result = parser.parse_incremental(pdf_path, parser.parse(pdf_path))
+
+        assert result.metadata.changed_pages == []
+        assert result.metadata.changed_sections == []
+        assert result.metadata.reused_pages == 6
+
+    def test_previous_without_hashes_falls_back_to_full_parse(self, tmp_path: Path) -> None:
+        """Sayfa özeti olmayan önceki sonuçta tam parse / Full parse without page hashes."""
+        pdf_path = _create_text_pdf(tmp_path, "Madde 1 - Konu")
+        parser = IhalePDFParser()
+        previous = ParsedDocument(pages=[PageContent(page_num=1, text="eski")])
+
+        with patch.object(parser, "parse", wraps=parser.parse) as mock_parse:
+            parser.parse_incremental(pdf_path, previous)
+
+        mock_parse.assert_called_once()
+
 
 class TestExtractText:
     """Metin çıkarma testleri / Text extraction tests."""
@@ -271,6 +790,365 @@ class TestExtractTables:
         assert tables == []
 
 
+class TestLowMemoryMode:
+    """Sınırlı bellek modu testleri / Bounded-memory mode tests."""
+
+    PAGES = [f"Madde {i} - {word}\n{word} hukumleri uygulanir." for i, word in
+             enumerate(["Teslim", "Teminat", "Odeme", "Ceza"], 1)]
+
+    def test_output_matches_default(self, tmp_path: Path) -> None:
+        """Metin ve bölümler aynı, metin bütçesi aşılsa da / Same output even past the text budget."""
+        pdf_path = _create_multipage_pdf(tmp_path, self.PAGES)
+        default = IhalePDFParser().parse(pdf_path)
+        bounded = IhalePDFParser(low_memory=True, text_budget_mb=0.00003).parse(pdf_path)
+
+        assert bounded.full_text == default.full_text
+        assert bounded.sections == default.sections
+        assert [page.text for page in bounded.pages] == [page.text for page in default.pages]
+
+    def test_raw_table_data_only_on_request(self, tmp_path: Path) -> None:
+        """raw_data düşük bellek modunda boş / raw_data is empty in low-memory mode."""
+        pdf_path = _create_table_pdf(tmp_path)
+        default = IhalePDFParser(tables="always").parse(pdf_path)
+        bounded = IhalePDFParser(tables="always", low_memory=True).parse(pdf_path)
+        requested = IhalePDFParser(
+            tables="always", low_memory=True, keep_raw_tables=True
+        ).parse(pdf_path)
+
+        if not default.tables:
+            pytest.skip("pdfplumber tabloyu tespit etmedi / pdfplumber found no table")
+        assert default.tables[0].raw_data
+        assert bounded.tables[0].raw_data == []
+        assert bounded.tables[0].rows == default.tables[0].rows
+        assert requested.tables[0].raw_data == default.tables[0].raw_data
+
+    def test_caches_flushed_per_page(self, tmp_path: Path) -> None:
+        """Doküman önbelleği sayfa başına boşaltılır / Document cache is flushed per page."""
+        pdf_path = _create_multipage_pdf(tmp_path, self.PAGES)
+        from src.pdf_parser import parser as parser_module
+
+        with patch.object(parser_module, "_flush_document_cache") as flush:
+            IhalePDFParser(scan_sample_pages=0).parse(pdf_path)
+            assert flush.call_count == 0
+            IhalePDFParser(scan_sample_pages=0, low_memory=True).parse(pdf_path)
+            assert flush.call_count == len(self.PAGES)
+
+    def test_text_spool_spills_past_budget(self) -> None:
+        """Bütçeyi aşan metin dosyaya yazılır / Text beyond the budget goes to a file."""
+        spool = _TextSpool(budget_bytes=10)
+        spool.put("a", "kısa")
+        spool.put("b", "şartname metni bütçeyi aşar")
+        try:
+            assert spool.spilled_bytes == len("şartname metni bütçeyi aşar".encode("utf-8"))
+            assert spool.take("b") == "şartname metni bütçeyi aşar"
+            assert spool.take("a") == "kısa"
+        finally:
+            spool.close()
+
+
+class TestTablePrefilter:
+    """Tablo ön filtresi testleri / Table prefilter tests."""
+
+    def test_auto_mode_keeps_ruled_table(self, tmp_path: Path) -> None:
+        """Çizgili tablo auto modda da çıkarılır / A ruled table is still extracted in auto mode."""
+        pdf_path = _create_table_pdf(tmp_path)
+        parser = IhalePDFParser()
+
+        auto = parser.parse(pdf_path)
+        always = parser.parse(pdf_path, tables="always")
+
+        assert auto.tables == always.tables
+        assert auto.metadata.total_tables >= 1
+        assert auto.metadata.table_pages_skipped == 0
+
+    def test_auto_mode_skips_text_pages(self, tmp_path: Path) -> None:
+        """Düz metin sayfaları atlanır / Plain text pages are skipped."""
+        pdf_path = _create_multipage_pdf(tmp_path, ["Sayfa bir", "Sayfa iki", "Sayfa uc"])
+        parser = IhalePDFParser()
+
+        with patch.object(
+            IhalePDFParser, "_extract_tables_from_page", return_value=[]
+        ) as mock_extract:
+            result = parser.parse(pdf_path)
+
+        mock_extract.assert_not_called()
+        assert result.metadata.table_pages_skipped == 3
+
+    def test_always_and_never_modes(self, tmp_path: Path) -> None:
+        """always her sayfayı dener, never hiç denemez / always tries every page, never none."""
+        pdf_path = _create_multipage_pdf(tmp_path, ["Sayfa bir", "Sayfa iki"])
+
+        always = IhalePDFParser(tables="always").parse(pdf_path)
+        never = IhalePDFParser(tables="never").parse(_create_table_pdf(tmp_path))
+
+        assert always.metadata.table_pages_skipped == 0
+        assert never.tables == []
+        assert never.metadata.table_pages_skipped == 0
+
+    def test_invalid_mode_raises(self, tmp_path: Path) -> None:
+        """Geçersiz mod ValueError verir / An invalid mode raises ValueError."""
+        with pytest.raises(ValueError):
+            IhalePDFParser(tables="sometimes")
+        with pytest.raises(ValueError):
+            IhalePDFParser().parse(_create_text_pdf(tmp_path, "Metin"), tables="sometimes")
+
+    def test_boxed_prose_is_not_a_candidate(self, tmp_path: Path) -> None:
+        """Tek sütunlu düz metin kutusu aday değildir / A single-column prose box is no candidate."""
+        import pdfplumber
+
+        prose = _create_boxed_pdf(tmp_path, ["Teklifler kapali zarf ile verilir."] * 4)
+        columns = _create_boxed_pdf(
+            tmp_path, [f"Kalem {i}                              {i * 10} Adet" for i in range(4)],
+            filename="columns.pdf",
+        )
+
+        with pdfplumber.open(prose) as pdf:
+            assert _is_table_candidate(pdf.pages[0]) is False
+        with pdfplumber.open(columns) as pdf:
+            assert _is_table_candidate(pdf.pages[0]) is True
+
+    def test_cache_key_depends_on_mode(self, tmp_path: Path) -> None:
+        """Farklı tablo modları ayrı önbellek kaydı kullanır / Table modes use separate cache entries."""
+        pdf_path = _create_table_pdf(tmp_path)
+        parser = IhalePDFParser(cache=ParseCache(tmp_path / "cache"))
+
+        parser.parse(pdf_path)
+        never = parser.parse(pdf_path, tables="never")
+
+        assert never.metadata.cache_hit is False
+        assert never.tables == []
+
+
+class TestTextBackends:
+    """Metin motoru testleri / Text backend tests."""
+
+    def test_pdfium_fast_matches_pdfplumber(self, tmp_path: Path) -> None:
+        """pdfium-fast aynı metni, tabloları ve sayfa özetlerini verir / Same text, tables and hashes."""
+        pages = ["Madde 1 - Genel\nIhale konusu is", "Madde 2 - Teminat\nKesin teminat %6", "Son sayfa"]
+        for pdf_path in (_create_multipage_pdf(tmp_path, pages), _create_table_pdf(tmp_path)):
+            reference = IhalePDFParser(text_backend="pdfplumber").parse(pdf_path)
+            fast = IhalePDFParser(text_backend="pdfium-fast").parse(pdf_path)
+
+            assert fast.full_text == reference.full_text
+            assert fast.sections == reference.sections
+            assert fast.tables == reference.tables
+            assert [page.content_hash for page in fast.pages] == [
+                page.content_hash for page in reference.pages
+            ]
+
+    def test_pdfium_fast_skips_pdfplumber_on_text_pages(self, tmp_path: Path) -> None:
+        """Çizimsiz sayfalarda pdfplumber ön filtresi çalışmaz / No pdfplumber prefilter on pages without paths."""
+        pdf_path = _create_multipage_pdf(tmp_path, ["Sayfa bir", "Sayfa iki"])
+
+        with patch("src.pdf_parser.backends._is_table_candidate") as mock_candidate:
+            result = IhalePDFParser(text_backend="pdfium-fast").parse(pdf_path)
+
+        mock_candidate.assert_not_called()
+        assert result.metadata.table_pages_skipped == 2
+
+    def test_pdfium_fast_flags_scanned_pages(self, tmp_path: Path) -> None:
+        """Taranmış sayfalar PDFium görüntü kaplamasıyla işaretlenir / Scanned pages flagged via PDFium image coverage."""
+        text = "Madde 1 - Genel hukumler ve ihale konusu hakkinda aciklamalar"
+        pdf_path = _create_scanned_pdf(tmp_path, [text, text, text, None, text, None])
+
+        result = IhalePDFParser(text_backend="pdfium-fast").parse(pdf_path)
+
+        assert result.metadata.scanned_pages == [4, 6]
+
+    def test_pdfium_fast_in_workers(self, tmp_path: Path) -> None:
+        """Paralel çıkarma seri ile aynıdır / Parallel extraction equals serial."""
+        pdf_path = _create_multipage_pdf(tmp_path, [f"Madde {i} - Kosul\nMetin {i}" for i in range(1, 7)])
+
+        serial = IhalePDFParser(text_backend="pdfium-fast", max_workers=1).parse(pdf_path)
+        parallel = IhalePDFParser(
+            text_backend="pdfium-fast", max_workers=2, parallel_min_pages=2
+        ).parse(pdf_path.read_bytes())
+
+        assert parallel.full_text == serial.full_text
+        assert parallel.pages == serial.pages
+
+    def test_auto_selects_by_page_count(self) -> None:
+        """auto eşikten itibaren pdfium-fast seçer / auto picks pdfium-fast from the threshold on."""
+        assert select_text_backend("auto", 9, fast_min_pages=10).name == "pdfplumber"
+        assert select_text_backend("auto", 10, fast_min_pages=10).name == "pdfium-fast"
+        assert isinstance(select_text_backend("pdfium-fast", 1), PdfiumFastBackend)
+
+    def test_per_call_backend(self, tmp_path: Path) -> None:
+        """parse çağrısı parser varsayılanını geçersiz kılar / The parse call overrides the default."""
+        pdf_path = _create_text_pdf(tmp_path, "Madde 1 - Genel")
+        parser = IhalePDFParser()
+
+        with patch.object(PdfiumFastBackend, "open", side_effect=PdfiumFastBackend.open, autospec=True) as mock_open:
+            parser.parse(pdf_path)
+            mock_open.assert_not_called()
+            parser.parse(pdf_path, text_backend="pdfium-fast")
+            mock_open.assert_called_once()
+
+    def test_unavailable_backend_falls_back(self) -> None:
+        """Kullanılamayan motor yerine pdfplumber seçilir / An unavailable backend falls back to pdfplumber."""
+
+        class _MissingBackend(TextBackend):
+            name = "missing"
+
+            def is_available(self) -> bool:
+                return False
+
+        assert isinstance(select_text_backend(_MissingBackend(), 1), PdfplumberBackend)
+
+    def test_invalid_backend_raises(self, tmp_path: Path) -> None:
+        """Bilinmeyen motor ValueError verir / An unknown backend raises ValueError."""
+        with pytest.raises(ValueError):
+            IhalePDFParser(text_backend="pdfminer")
+        with pytest.raises(ValueError):
+            IhalePDFParser().parse(_create_text_pdf(tmp_path, "Metin"), text_backend="pdfminer")
+
+    def test_backend_is_part_of_cache_key(self, tmp_path: Path) -> None:
+        """Motorlar ayrı önbellek kayıtları kullanır / Backends use separate cache entries."""
+        pdf_path = _create_text_pdf(tmp_path, "Madde 1 - Genel")
+        parser = IhalePDFParser(cache=ParseCache(tmp_path / "cache"))
+
+        assert parser._cache_key(pdf_path, "auto") != parser._cache_key(pdf_path, "auto", "pdfium-fast")
+        assert parser._cache_key(pdf_path, "auto") == parser._cache_key(pdf_path, "auto", PdfplumberBackend())
+
+
+    def test_incremental_result_cached_under_backend_key(self, tmp_path: Path) -> None:
+        """Artımlı sonuç parser'ın motor anahtarıyla saklanır / The incremental result uses the parser's backend key."""
+        pages = [f"Madde {i} - Kosul\nMetin {i}" for i in range(1, 5)]
+        original = _create_multipage_pdf(tmp_path, pages, "v1.pdf")
+        revised = _create_multipage_pdf(tmp_path, pages[:2] + ["Madde 3 - Ceza\nYeni metin"] + pages[3:], "v2.pdf")
+        parser = IhalePDFParser(cache=ParseCache(tmp_path / "cache"), text_backend="pdfium-fast")
+
+        parser.parse_incremental(revised, parser.parse(original))
+
+        assert not parser.parse(revised, text_backend="pdfplumber").metadata.cache_hit
+        assert parser.parse(revised).metadata.cache_hit
+
+
+def _crash_member(parser: IhalePDFParser, pdf_path: str) -> bytes:
+    """Worker'ı öldürür (BrokenProcessPool) / Kills the worker (BrokenProcessPool)."""
+    os._exit(1)
+
+
+class TestTenderPackage:
+    """ZIP ihale paketi testleri / ZIP tender package tests."""
+
+    @staticmethod
+    def _members(tmp_path: Path) -> dict[str, bytes]:
+        """İdari, teknik, sözleşme ve ek PDF'leri / Administrative, technical, contract and annex PDFs."""
+        texts = {
+            "Ihale/Idari_Sartname.pdf": "IDARI SARTNAME\nMadde 1 - Idarenin adi",
+            "Ihale/Teknik Şartname.pdf": "Madde 1 - Isin konusu\nTeknik ozellikler",
+            "Ihale/Sozlesme_Tasarisi.pdf": "Madde 1 - Taraflar",
+            "Ihale/EK-3 Liste.pdf": "Liste",
+        }
+        return {
+            name: _create_text_pdf(tmp_path, text, filename=f"member{index}.pdf").read_bytes()
+            for index, (name, text) in enumerate(texts.items())
+        }
+
+    def test_groups_documents_by_role(self, tmp_path: Path) -> None:
+        """PDF üyeleri role göre gruplanır, diğerleri atlanır / PDFs grouped by role, others skipped."""
+        members = self._members(tmp_path)
+        members["Ihale/okubeni.txt"] = b"EKAP"
+        zip_path = _create_package_zip(tmp_path, members)
+
+        package = IhalePDFParser(max_workers=1).parse_package(zip_path)
+
+        groups = package.by_role()
+        assert list(groups) == ["idari_sartname", "teknik_sartname", "sozlesme_tasarisi", DEFAULT_ROLE]
+        assert groups["idari_sartname"][0].metadata.file_name == "Idari_Sartname.pdf"
+        assert "Madde 1 - Taraflar" in groups["sozlesme_tasarisi"][0].full_text
+        assert package.skipped == ["Ihale/okubeni.txt"]
+        assert package.failed == []
+
+    def test_parallel_matches_serial(self, tmp_path: Path) -> None:
+        """Paralel paket ayrıştırma seri ile aynıdır / Parallel package parsing equals serial."""
+        zip_bytes = _create_package_zip(tmp_path, self._members(tmp_path)).read_bytes()
+
+        serial = IhalePDFParser(max_workers=1).parse_package(zip_bytes)
+        parallel = IhalePDFParser(max_workers=2).parse_package(bytearray(zip_bytes))
+
+        assert [item.role for item in parallel.documents] == [item.role for item in serial.documents]
+        assert [item.document.full_text for item in parallel.documents] == [
+            item.document.full_text for item in serial.documents
+        ]
+
+    def test_broken_member_does_not_stop_package(self, tmp_path: Path) -> None:
+        """Bozuk üye yalnızca kendisini etkiler / A broken member only affects itself."""
+        members = self._members(tmp_path)
+        members["Ihale/bozuk.pdf"] = b"%PDF-1.4 bozuk"
+        zip_path = _create_package_zip(tmp_path, members)
+
+        package = IhalePDFParser(max_workers=2).parse_package(zip_path)
+
+        assert [item.name for item in package.failed] == ["Ihale/bozuk.pdf"]
+        assert package.failed[0].error
+        assert len(package.documents) == 5
+
+    def test_member_size_limit(self, tmp_path: Path) -> None:
+        """Sınırı aşan üyeler atlanır / Members over the limit are skipped."""
+        zip_path = _create_package_zip(tmp_path, self._members(tmp_path))
+
+        package = IhalePDFParser(max_workers=1).parse_package(zip_path, max_member_mb=0.0001)
+
+        assert package.documents == []
+        assert len(package.skipped) == 4
+
+    def test_invalid_zip_raises(self, tmp_path: Path) -> None:
+        """ZIP olmayan girdi ValueError verir / A non-ZIP input raises ValueError."""
+        with pytest.raises(ValueError):
+            IhalePDFParser().parse_package(b"PK degil")
+        with pytest.raises(FileNotFoundError):
+            IhalePDFParser().parse_package(tmp_path / "yok.zip")
+
+    def test_parallel_bounds_members_on_disk(self, tmp_path: Path) -> None:
+        """Diskte en fazla `workers` üye bulunur / At most `workers` members are on disk."""
+        members = self._members(tmp_path)
+        members.update({f"Ihale/EK-{i}.pdf": members["Ihale/EK-3 Liste.pdf"] for i in range(4, 8)})
+        zip_path = _create_package_zip(tmp_path, members)
+        on_disk: list[int] = []
+
+        from src.pdf_parser import package as package_module
+
+        def spool(archive, info, path):
+            on_disk.append(len(list(path.parent.glob("member_*.pdf"))))
+            return _spool_member(archive, info, path)
+
+        _spool_member = package_module._spool_member
+        with patch.object(package_module, "_spool_member", side_effect=spool):
+            package = IhalePDFParser(max_workers=2).parse_package(zip_path)
+
+        assert len(package.documents) == 8 and package.failed == []
+        assert len(on_disk) == 8
+        assert max(on_disk) < 2
+
+    def test_broken_pool_removes_temp_files(self, tmp_path: Path) -> None:
+        """Havuz çökünce geçici dosyalar silinir, üyeler seri işlenir / A broken pool leaves no temp files."""
+        zip_path = _create_package_zip(tmp_path, self._members(tmp_path))
+        leftovers: list[int] = []
+
+        from src.pdf_parser import package as package_module
+
+        def serial(parser, archive, item, info, path):
+            leftovers.append(len(list(path.parent.glob("member_*.pdf"))))
+            return _parse_serial(parser, archive, item, info, path)
+
+        _parse_serial = package_module._parse_serial
+        with patch.object(package_module, "_parse_member", _crash_member), \
+                patch.object(package_module, "_parse_serial", side_effect=serial):
+            package = IhalePDFParser(max_workers=2).parse_package(zip_path)
+
+        assert len(package.documents) == 4 and package.failed == []
+        assert leftovers and leftovers[0] == 0
+
+    def test_classify_role(self) -> None:
+        """Rol dosya adından, yoksa metinden belirlenir / Role from the file name, else the text."""
+        assert classify_role("İDARİ ŞARTNAME.pdf", "") == "idari_sartname"
+        assert classify_role("01.pdf", "Zeyilname No: 1") == "zeyilname"
+        assert classify_role("EK-2 Birim_Fiyat_Cetveli.pdf", "") == "birim_fiyat"
+        assert classify_role("belge.pdf", "Genel bilgiler") == DEFAULT_ROLE
+
+
 class TestExtractMetadata:
     """Metadata çıkarma testleri / Metadata extraction tests."""
 
@@ -286,6 +1164,56 @@ class TestExtractMetadata:
         assert "author" in meta
 
 
+class TestPageRangeParse:
+    """Sayfa aralığı ve hızlı ön izleme testleri / Page-range and quick-preview tests."""
+
+    WORDS = ["Teslim", "Teminat", "Odeme", "Ceza", "Fesih", "Garanti"]
+    PAGES = [f"Madde {i} - {word}\n{word} hukumleri uygulanir." for i, word in enumerate(WORDS, 1)]
+
+    def test_parse_page_range(self, tmp_path: Path) -> None:
+        """Yalnızca istenen sayfalar işlenir / Only the requested pages are processed."""
+        pdf_path = _create_multipage_pdf(tmp_path, self.PAGES)
+        result = IhalePDFParser().parse(pdf_path, pages=range(0, 3))
+
+        assert [page.page_num for page in result.pages] == [1, 2, 3]
+        assert result.metadata.total_pages == 3
+        assert "Odeme hukumleri" in result.full_text
+        assert "Ceza hukumleri" not in result.full_text
+        assert [section.page_num for section in result.sections] == [1, 2, 3]
+
+    def test_parse_page_selection_ignores_out_of_range(self, tmp_path: Path) -> None:
+        """Aralık dışı indeksler yok sayılır / Out-of-range indices are ignored."""
+        pdf_path = _create_multipage_pdf(tmp_path, self.PAGES)
+        result = IhalePDFParser().parse(pdf_path, pages=[5, 1, 99, 1])
+
+        assert [page.page_num for page in result.pages] == [2, 6]
+
+    def test_page_range_not_cached(self, tmp_path: Path) -> None:
+        """Kısmi sonuç önbelleğe yazılmaz / Partial results are not cached."""
+        pdf_path = _create_multipage_pdf(tmp_path, self.PAGES)
+        parser = IhalePDFParser(cache=ParseCache(tmp_path / "cache"))
+
+        parser.parse(pdf_path, pages=range(0, 2))
+        full = parser.parse(pdf_path)
+
+        assert full.metadata.cache_hit is False
+        assert full.metadata.total_pages == 6
+
+    def test_quick_preview(self, tmp_path: Path) -> None:
+        """Sayfa sayısı, meta veri ve ilk sayfa metni / Page count, metadata and first page text."""
+        pdf_path = _create_multipage_pdf(tmp_path, self.PAGES)
+        parser = IhalePDFParser()
+
+        with patch.object(parser, "_extract_tables_from_page") as extract_tables:
+            preview = parser.quick_preview(pdf_path.read_bytes())
+
+        extract_tables.assert_not_called()
+        assert preview["total_pages"] == 6
+        assert "producer" in preview
+        assert "Teslim hukumleri" in preview["preview_text"]
+        assert "Teminat" not in preview["preview_text"]
+
+
 class TestSectionDetection:
     """Bölüm tespiti testleri / Section detection tests."""
 
@@ -332,6 +1260,34 @@ class TestSectionDetection:
         assert len(sections) >= 2
         assert "EK" in sections[0].title
 
+    def test_page_numbers_correct_after_cleaning(self) -> None:
+        """Temizleme metni kısaltsa da sayfa doğru olmalı / Pages stay correct after cleaning shrinks text."""
+        parser = IhalePDFParser()
+        pages = [
+            PageContent(page_num=1, text="Giris" + " " * 400 + "metni\n\n\n\n\n" + "   \n" * 50),
+            PageContent(page_num=2, text=""),
+            PageContent(page_num=3, text="Madde 1 - Konu\nIcerik"),
+            PageContent(page_num=4, text="Madde 2 - Tanimlar\nTanim"),
+        ]
+        full_text = "\n\n".join(
+            parser.clean_text(page.text) for page in pages if parser.clean_text(page.text)
+        )
+
+        sections = parser.detect_sections(full_text, pages)
+
+        assert [(s.title, s.page_num) for s in sections] == [
+            ("Madde 1 - Konu", 3),
+            ("Madde 2 - Tanimlar", 4),
+        ]
+
+    def test_heading_spilling_to_next_line_keeps_next_heading(self) -> None:
+        """Alt satıra taşan başlık sonraki başlığı gizlememeli / Spilling heading must not hide the next one."""
+        parser = IhalePDFParser()
+        sections = parser.detect_sections("BÖLÜM 2\nMadde 3 - Ceza\nGecikme cezasi")
+
+        assert [s.title for s in sections] == ["BÖLÜM 2 - Madde 3 - Ceza", "Madde 3 - Ceza"]
+        assert sections[1].content == "Gecikme cezasi"
+
     def test_empty_text_returns_no_sections(self) -> None:
         """Boş metin bölüm döndürmemeli / Empty text should return no sections."""
         parser = IhalePDFParser()
@@ -384,6 +1340,30 @@ class TestSectionTypeClassification:
         )
         assert section_type == "genel"
 
+    def test_overlapping_keywords_all_scored(self) -> None:
+        """Çakışan anahtar kelimeler ayrı sayılır / Overlapping keywords are each counted."""
+        classifier = SectionClassifier({"a": ["kesin teminat", "teminat"], "b": ["kesin", "nat"]})
+        # a: "kesin teminat" + "teminat" = 6, b: "kesin" + "nat" = 6 → sözlük sırası / dict order
+        assert classifier.classify("Kesin Teminat", "") == "a"
+        assert classifier.classify("Madde 1", "kesin teminat") == "a"
+        # Başlık sınırını aşan eşleşme içerik sayılır / A match crossing the title counts as content
+        assert classifier.classify("Kesin", "teminat nat") == "b"
+
+    def test_batch_matches_single(self) -> None:
+        """Toplu sınıflandırma tekli ile aynı / Batch classification equals single."""
+        parser = IhalePDFParser()
+        pairs = [
+            ("Madde 10 - Ceza Hukumleri", "Gecikme halinde ceza uygulanir."),
+            ("Madde 5 - Odeme Kosullari", "Teminat miktari ve odeme plani."),
+            ("Madde 3 - Teknik Sartname", "Malzeme standartlari asagidadir."),
+            ("Madde 99 - Diger", "Herhangi bir icerik."),
+            ("MADDE 7 - İHALE", "Teslim tarihi ve süre."),
+            ("", ""),
+        ]
+        expected = [parser._classify_section_type(title, content) for title, content in pairs]
+        assert parser.classify_sections(pairs) == expected
+        assert expected[:4] == ["ceza", "mali", "teknik", "genel"]
+
 
 class TestCleanText:
     """Metin temizleme testleri / Text cleaning tests."""
@@ -420,6 +1400,201 @@ class TestCleanText:
         assert "Madde 1" in result
         assert "ihale" in result
 
+    def test_matches_line_by_line_reference(self) -> None:
+        """Satır satır referans temizlikle aynı sonuç / Same result as the line-by-line reference."""
+        import random
+        import re
+
+        def reference(text: str) -> str:
+            cleaned = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]", "", text)
+            cleaned = re.sub(r"[^\S\n]+", " ", cleaned)
+            cleaned = "\n".join(line.strip() for line in cleaned.split("\n"))
+            return re.sub(r"\n{3,}", "\n\n", cleaned).strip()
+
+        parser = IhalePDFParser()
+        rng = random.Random(0)
+        alphabet = [" ", " ", "\n", "\n", "\t", "\r", "\x00", "\x0b", "\x1f", "\x7f", "\xa0", "a", "ş", "İ"]
+        for _ in range(5000):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 25)))
+            assert parser.clean_text(text) == reference(text), repr(text)
+
+    def test_clean_text_is_not_copied(self) -> None:
+        """Temiz metin kopyalanmamalı / Already clean text should not be copied."""
+        text = "Madde 1 - Konu\n\nYüklenici işi 90 günde bitirir."
+        assert IhalePDFParser().clean_text(text) is text
+
+    def test_pages_are_cleaned_during_extraction(self, tmp_path: Path) -> None:
+        """Sayfalar çıkarma sırasında temizlenmeli / Pages are cleaned during extraction."""
+        pdf_path = _create_text_pdf(tmp_path, "Madde 1 -   Konu")
+        parser = IhalePDFParser()
+
+        with patch.object(IhalePDFParser, "clean_text", side_effect=AssertionError) as clean:
+            pages = list(parser.iter_pages(pdf_path))
+
+        clean.assert_not_called()
+        assert pages[0].text == "Madde 1 - Konu"
+
+
+class TestHeaderFooterStripping:
+    """Tekrarlı başlık/altbilgi silme testleri / Repeated header/footer stripping tests."""
+
+    HEADER = "T.C. Ornek Belediyesi - IKN 2024/123456"
+
+    BODIES = ["Teslim suresi", "Teminat tutari", "Odeme kosullari", "Ceza", "Fesih", "Garanti"]
+
+    @classmethod
+    def _pages(cls, count: int = 5) -> list[str]:
+        return [
+            f"{cls.HEADER}\nMadde {i} - {cls.BODIES[i - 1]}\n{cls.BODIES[i - 1]} hukumleri."
+            f"\nSayfa {i} / {count}"
+            for i in range(1, count + 1)
+        ]
+
+    def test_repeated_lines_removed(self, tmp_path: Path) -> None:
+        """Başlık ve sayfa numarası silinir / Header and page number are removed."""
+        pdf_path = _create_multipage_pdf(tmp_path, self._pages())
+        result = IhalePDFParser().parse(pdf_path)
+
+        assert "IKN" not in result.full_text
+        assert "Sayfa" not in result.full_text
+        assert "IKN" not in result.pages[0].text
+        assert result.metadata.header_lines == ["t.c. ornek belediyesi - ikn #/#"]
+        assert result.metadata.footer_lines == ["sayfa # / #"]
+        assert len(result.sections) == 5
+
+    def test_removed_bytes_and_tokens_reported(self, tmp_path: Path) -> None:
+        """Silinen bayt ve token tahmini raporlanır / Removed bytes and token estimate reported."""
+        pdf_path = _create_multipage_pdf(tmp_path, self._pages())
+        stripped = IhalePDFParser().parse(pdf_path)
+        kept = IhalePDFParser(strip_headers=False).parse(pdf_path)
+
+        removed = sum(len(self.HEADER) + len(f"Sayfa {i} / 5") for i in range(1, 6))
+        assert stripped.metadata.header_footer_bytes_removed == removed
+        assert stripped.metadata.header_footer_tokens_saved == removed // 4
+        assert len(kept.full_text) > len(stripped.full_text)
+        assert kept.metadata.header_footer_bytes_removed == 0
+        assert self.HEADER in kept.full_text
+
+    def test_section_headings_never_removed(self, tmp_path: Path) -> None:
+        """Her sayfada tekrarlanan başlık kalıbı korunur / Repeated heading lines are kept."""
+        pages = [f"Madde 1 - Genel\nMetin {word}" for word in ("bir", "iki", "uc", "dort")]
+        pdf_path = _create_multipage_pdf(tmp_path, pages)
+        result = IhalePDFParser().parse(pdf_path)
+
+        assert result.full_text.count("Madde 1 - Genel") == 4
+        assert result.metadata.header_lines == []
+
+    def test_too_few_pages_not_stripped(self, tmp_path: Path) -> None:
+        """İki sayfalık dokümanda tekrar aranmaz / Two-page documents are not stripped."""
+        pdf_path = _create_multipage_pdf(tmp_path, self._pages(2))
+        result = IhalePDFParser().parse(pdf_path)
+
+        assert self.HEADER in result.full_text
+        assert result.metadata.header_footer_bytes_removed == 0
+
+    def test_incremental_applies_previous_lines(self, tmp_path: Path) -> None:
+        """Artımlı parse aynı satırları siler / Incremental parse removes the same lines."""
+        pages = self._pages()
+        original = _create_multipage_pdf(tmp_path, pages, "v1.pdf")
+        pages[2] = pages[2].replace("Odeme kosullari", "Ek odeme")
+        revised = _create_multipage_pdf(tmp_path, pages, "v2.pdf")
+        parser = IhalePDFParser()
+
+        incremental = parser.parse_incremental(revised, parser.parse(original))
+        full = parser.parse(revised)
+
+        assert incremental.metadata.reused_pages == 4
+        assert incremental.full_text == full.full_text
+        assert incremental.sections == full.sections
+        assert (
+            incremental.metadata.header_footer_bytes_removed
+            == full.metadata.header_footer_bytes_removed
+        )
+
+
+class TestLowInformationPages:
+    """Düşük bilgili sayfa filtresi testleri / Low-information page filter tests."""
+
+    BODY = (
+        "Yuklenici, isin yurutulmesi sirasinda idarenin onayi olmadan alt yuklenici\n"
+        "calistiramaz. Aksi halde sozlesme bedelinin yuzde besi oraninda ceza kesilir.\n"
+        "Teslim suresi on iki aydir; sure uzatimi yalnizca mucbir sebep hallerinde\n"
+        "verilir. Is programina uyulmamasi durumunda gunluk gecikme cezasi uygulanir."
+    )
+    COVER = "T.C.\nORNEK BELEDIYESI\nYOL YAPIM ISI\nTEKNIK SARTNAME\n2024/123456"
+    BLANK = "BU SAYFA BILEREK BOS BIRAKILMISTIR"
+    SIGNATURE = "Adi Soyadi: ....................\nImza / Kase\nTarih: ..../..../2024"
+
+    def _pages(self) -> list[str]:
+        return [self.COVER, f"Madde 1 - Genel\n{self.BODY}", self.BLANK, self.BODY, self.SIGNATURE]
+
+    def test_cover_blank_and_signature_pages_flagged(self, tmp_path: Path) -> None:
+        """Kapak, boş ve imza sayfaları işaretlenir / Cover, blank and signature pages are flagged."""
+        pdf_path = _create_multipage_pdf(tmp_path, self._pages())
+        result = IhalePDFParser().parse(pdf_path)
+
+        assert [page.is_low_info for page in result.pages] == [True, False, True, False, True]
+        assert result.metadata.low_info_pages == [1, 3, 5]
+        assert result.metadata.low_info_chars == sum(
+            len(result.pages[i].text) for i in (0, 2, 4)
+        )
+        assert all(0.0 <= page.info_score <= 1.0 for page in result.pages)
+
+    def test_indexable_text_skips_flagged_pages(self, tmp_path: Path) -> None:
+        """İndekslenecek metin işaretli sayfaları içermez / Indexable text leaves flagged pages out."""
+        pdf_path = _create_multipage_pdf(tmp_path, self._pages())
+        result = IhalePDFParser().parse(pdf_path)
+        indexable = result.indexable_text()
+
+        assert "BILEREK" in result.full_text
+        assert "BILEREK" not in indexable
+        assert "SARTNAME" not in indexable
+        assert "Madde 1 - Genel" in indexable
+        assert len(indexable) < len(result.full_text)
+
+    def test_indexable_text_is_full_text_without_flags(self) -> None:
+        """İşaretli sayfa yoksa tam metin döner / Without flagged pages the full text is returned."""
+        document = ParsedDocument(full_text="Metin", pages=[PageContent(page_num=1, text="Metin")])
+
+        assert document.indexable_text() is document.full_text
+
+    def test_short_pages_with_heading_or_table_kept(self) -> None:
+        """Başlık veya tablo içeren kısa sayfa işaretlenmez / Short pages with a heading or table are kept."""
+        pages = [
+            PageContent(page_num=1, text="Madde 9 - Yururluk"),
+            PageContent(page_num=2, text="Birim fiyat", has_table=True),
+            PageContent(page_num=3, text="", is_scanned=True),
+            PageContent(page_num=4, text=""),
+        ]
+
+        assert _mark_low_info_pages(pages) == ([4], 0)
+
+    def test_repeated_and_boilerplate_lines_lower_score(self) -> None:
+        """Tekrarlı ve kalıp satırlar puanı düşürür / Repeated and boilerplate lines lower the score."""
+        body = _normalize_page(self.BODY)
+        score = _information_score(body, set())
+        repeated = {body.split("\n")[-1]}
+
+        assert score > 0.7
+        assert _information_score(body, repeated) < score
+        assert _information_score(_normalize_page(self.BLANK), set()) == 0.0
+        assert _information_score(_normalize_page(self.SIGNATURE), set()) == 0.0
+        assert _information_score(_normalize_page("İmza Kaşe " * 40), set()) < score
+
+    def test_incremental_matches_full_parse(self, tmp_path: Path) -> None:
+        """Artımlı parse aynı sayfaları işaretler / Incremental parse flags the same pages."""
+        pages = self._pages()
+        original = _create_multipage_pdf(tmp_path, pages, "v1.pdf")
+        pages[3] = pages[3].replace("on iki", "on sekiz")
+        revised = _create_multipage_pdf(tmp_path, pages, "v2.pdf")
+        parser = IhalePDFParser()
+
+        incremental = parser.parse_incremental(revised, parser.parse(original))
+        full = parser.parse(revised)
+
+        assert incremental.metadata.low_info_pages == full.metadata.low_info_pages
+        assert incremental.indexable_text() == full.indexable_text()
+
 
 class TestScannedPDFDetection:
     """Taranmış PDF tespiti testleri / Scanned PDF detection tests."""
@@ -448,6 +1623,112 @@ class TestScannedPDFDetection:
         parser = IhalePDFParser()
         assert parser._detect_scanned_pdf([]) is False
 
+    def test_scanned_document_short_circuits(self, tmp_path: Path) -> None:
+        """Tümü görüntü olan doküman tam çıkarmaya girmez / An all-image document skips extraction."""
+        pdf_path = _create_scanned_pdf(tmp_path, [None] * 12)
+        parser = IhalePDFParser()
+
+        with patch.object(parser, "_stream") as mock_stream:
+            result = parser.parse(pdf_path)
+
+        mock_stream.assert_not_called()
+        assert result.metadata.is_scanned is True
+        assert result.metadata.total_pages == 12
+        assert result.metadata.scanned_pages == list(range(1, 13))
+        assert all(page.is_scanned for page in result.pages)
+
+    def test_mixed_document_flags_scanned_pages(self, tmp_path: Path) -> None:
+        """Karışık dokümanda taranmış ek sayfaları ayrı işaretlenir / Scanned annex pages are flagged."""
+        text = "Madde 1 - Genel hukumler ve ihale konusu hakkinda aciklamalar"
+        pdf_path = _create_scanned_pdf(tmp_path, [text, text, text, None, text, None])
+        parser = IhalePDFParser()
+
+        result = parser.parse(pdf_path)
+
+        assert result.metadata.is_scanned is False
+        assert result.metadata.scanned_pages == [4, 6]
+        assert [page.is_scanned for page in result.pages] == [
+            False, False, False, True, False, True,
+        ]
+
+    def test_blank_page_is_not_scanned(self, tmp_path: Path) -> None:
+        """Görüntüsüz boş sayfa taranmış değildir / A blank page without images is not scanned."""
+        result = IhalePDFParser().parse(_create_empty_pdf(tmp_path))
+        assert result.metadata.scanned_pages == []
+
+    def test_sample_indices_are_spread(self) -> None:
+        """Örnek sayfalar doküman boyunca yayılır / Sample pages spread across the document."""
+        assert _sample_indices(100, 5) == [0, 25, 50, 74, 99]
+        assert _sample_indices(3, 5) == [0, 1, 2]
+        assert _sample_indices(0, 5) == []
+
+
+class TestOCRStage:
+    """OCR aşaması testleri / OCR stage tests."""
+
+    def test_ocr_text_merges_into_pages_and_sections(self, tmp_path: Path) -> None:
+        """OCR metni sayfalara ve bölümlere yansır / OCR text reaches pages and sections."""
+        text = "Madde 1 - Genel hukumler ve ihale konusu hakkinda aciklamalar"
+        pdf_path = _create_scanned_pdf(tmp_path, [text, None])
+        backend = _FakeOCRBackend()
+        parser = IhalePDFParser(ocr=OCRStage(backend, max_workers=1, resolution=20))
+
+        result = parser.parse(pdf_path)
+
+        assert backend.calls == 1
+        assert result.metadata.ocr_pages == [2]
+        assert "Tanınan metin" in result.pages[1].text
+        assert "Tanınan metin" in result.full_text
+        assert [section.title for section in result.sections] == [
+            "Madde 1 - Genel hukumler ve ihale konusu hakkinda aciklamalar",
+            "Madde 9 - Teminat",
+        ]
+        assert result.sections[1].page_num == 2
+
+    def test_only_scanned_pages_are_recognised(self, tmp_path: Path) -> None:
+        """Metin sayfaları OCR'a gönderilmez / Text pages are not sent to OCR."""
+        pdf_path = _create_multipage_pdf(tmp_path, ["Sayfa bir", "Sayfa iki"])
+        backend = _FakeOCRBackend()
+        result = IhalePDFParser(ocr=OCRStage(backend, max_workers=1)).parse(pdf_path)
+
+        assert backend.calls == 0
+        assert result.metadata.ocr_pages == []
+
+    def test_ocr_cache_by_page_hash(self, tmp_path: Path) -> None:
+        """Aynı sayfa ikinci kez tanınmaz / The same page is not recognised twice."""
+        pdf_path = _create_scanned_pdf(tmp_path, [None, None])
+        backend = _FakeOCRBackend()
+        stage = OCRStage(backend, cache=OCRCache(tmp_path / "ocr"), max_workers=1, resolution=20)
+
+        first = stage.run(str(pdf_path), [1, 2])
+        second = stage.run(str(pdf_path), [1, 2])
+
+        assert first == second
+        # İki sayfa aynı görüntüyü taşır → tek özet / Both pages carry the same image → one hash
+        assert backend.calls == 2
+        assert len(list((tmp_path / "ocr").glob("*.txt"))) == 1
+
+    def test_ocr_in_worker_pool(self, tmp_path: Path) -> None:
+        """Süreç havuzunda sonuçlar sayfa sırasıyla döner / Pool results come back in page order."""
+        pdf_path = _create_scanned_pdf(tmp_path, [None, None, None])
+        stage = OCRStage(_FakeOCRBackend(), max_workers=2, resolution=20)
+
+        results = stage.run(str(pdf_path), [1, 2, 3])
+
+        assert sorted(results) == [1, 2, 3]
+        assert all("Tanınan metin" in text for text in results.values())
+
+    def test_unavailable_backend_skips_ocr(self, tmp_path: Path) -> None:
+        """Motor yoksa parse yine tamamlanır / Parse still completes without a backend."""
+        pdf_path = _create_scanned_pdf(tmp_path, [None])
+        backend = _FakeOCRBackend()
+        with patch.object(_FakeOCRBackend, "is_available", return_value=False):
+            result = IhalePDFParser(ocr=OCRStage(backend)).parse(pdf_path)
+
+        assert backend.calls == 0
+        assert result.metadata.is_scanned is True
+        assert result.metadata.ocr_pages == []
+
 
 class TestFileValidation:
     """Dosya doğrulama testleri / File validation tests."""
@@ -11,9 +11,60 @@ import streamlit as st
 
 from ui.components.header import render_header
 from src.utils.helpers import risk_color_hex, safe_json_parse, format_file_size
+from src.utils.security import validate_upload
 from src.utils.demo_data import DEMO_ANALYSIS_RESULT
 
 
+@st.cache_resource
+def _get_parser():
+    """Parse önbellekli, oturumlar arası paylaşılan parser."""
+    from config.settings import settings
+    from src.pdf_parser import (
+        IhalePDFParser, OCRCache, OCRStage, ParseCache, TesseractOCRBackend,
+    )
+
+    cache = ParseCache(settings.PARSE_CACHE_DIR, max_size_mb=settings.PARSE_CACHE_MAX_MB)
+    ocr = None
+    if settings.OCR_ENABLED:
+        ocr = OCRStage(
+            TesseractOCRBackend(lang=settings.OCR_LANG),
+            cache=OCRCache(settings.OCR_CACHE_DIR),
+        )
+    return IhalePDFParser(
+        cache=cache,
+        ocr=ocr,
+        low_memory=settings.PARSE_LOW_MEMORY,
+        text_budget_mb=settings.PARSE_TEXT_BUDGET_MB,
+        text_backend=settings.PARSE_TEXT_BACKEND,
+        fast_backend_min_pages=settings.PARSE_FAST_BACKEND_MIN_PAGES,
+    )
+
+
+@st.cache_resource
+def _get_vector_cache():
+    """Oturumlar arası paylaşılan FAISS indeks önbelleği."""
+    from config.settings import settings
+    from src.ai_engine import VectorStoreCache
+
+    return VectorStoreCache(settings.VECTOR_CACHE_DIR, max_size_mb=settings.VECTOR_CACHE_MAX_MB)
+
+
+@st.cache_resource
+def _get_embedding_cache():
+    """İhaleler arası paylaşılan chunk embedding önbelleği."""
+    from config.settings import settings
+    from src.ai_engine import EmbeddingCache
+
+    return EmbeddingCache(settings.EMBEDDING_CACHE_PATH, max_size_mb=settings.EMBEDDING_CACHE_MAX_MB)
+
+
+def _max_upload_mb() -> float:
+    """Yükleme boyut sınırı (MB)."""
+    from config.settings import settings
+
+    return float(settings.MAX_FILE_SIZE_MB)
+
+
 def render_analysis() -> None:
     """Analiz sayfası render."""
     render_header("🔍 Yeni Analiz", "Şartname PDF'inizi yükleyin ve AI ile analiz edin")
@@ -84,7 +135,13 @@ def _single_upload() -> None:
     uploaded = st.file_uploader("PDF Yükle", type=["pdf"], label_visibility="collapsed", key="pdf_uploader")
 
     if uploaded:
-        size_mb = len(uploaded.getvalue()) / (1024 * 1024)
+        # Tek tampon: yükleme → doğrulama → hash → parse boyunca kopyalanmaz
+        buffer = uploaded.getbuffer()
+        size_mb = buffer.nbytes / (1024 * 1024)
+        valid, error = validate_upload(buffer, uploaded.name, max_mb=_max_upload_mb())
+        if not valid:
+            st.error(f"❌ {error}")
+            return
         c1, c2, c3 = st.columns(3)
         with c1:
             st.markdown(
@@ -110,18 +167,17 @@ def _single_upload() -> None:
 
         with st.expander("📖 Ön İzleme"):
             try:
-                from src.pdf_parser.parser import IhalePDFParser
-                preview_parser = IhalePDFParser()
-                preview_doc = preview_parser.parse(uploaded.getvalue())
-                st.caption(f"📄 {preview_doc.metadata.total_pages} sayfa, {preview_doc.metadata.total_tables} tablo")
-                st.text(preview_doc.full_text[:500] + "..." if len(preview_doc.full_text) > 500 else preview_doc.full_text)
+                preview = _get_parser().quick_preview(buffer)
+                preview_text = preview["preview_text"]
+                st.caption(f"📄 {preview['total_pages']} sayfa")
+                st.text(preview_text[:500] + "..." if len(preview_text) > 500 else preview_text)
             except Exception as e:
                 st.info(f"Ön izleme yüklenemedi: {e}")
 
         st.markdown("<br>", unsafe_allow_html=True)
 
         if st.button("🚀 AI Analizi Başlat", type="primary", use_container_width=True):
-            st.session_state["uploaded_file_bytes"] = uploaded.getvalue()
+            st.session_state["uploaded_file_bytes"] = buffer
             st.session_state["uploaded_file_name"] = uploaded.name
             st.session_state["uploaded_file_size"] = size_mb
             st.session_state["analysis_state"] = "analyzing"
@@ -145,8 +201,9 @@ def _batch_upload(plan: str, count: int, limit: int) -> None:
 
         # Dosya kartları
         st.markdown(f"##### 📋 {len(uploaded_files)} Dosya Seçildi")
-        for i, f in enumerate(uploaded_files):
-            size_mb = len(f.getvalue()) / (1024 * 1024)
+        buffers = [f.getbuffer() for f in uploaded_files]
+        for f, buffer in zip(uploaded_files, buffers):
+            size_mb = buffer.nbytes / (1024 * 1024)
             st.markdown(
                 f'<div class="analysis-card" style="border-left-color:#667eea;">'
                 f'<div class="card-header">'
@@ -161,11 +218,15 @@ def _batch_upload(plan: str, count: int, limit: int) -> None:
         if st.button("🚀 Toplu AI Analizi Başlat", type="primary", use_container_width=True):
             # Store all files for batch processing
             batch_items = []
-            for f in uploaded_files:
+            for f, buffer in zip(uploaded_files, buffers):
+                valid, error = validate_upload(buffer, f.name, max_mb=_max_upload_mb())
+                if not valid:
+                    st.warning(f"⚠️ {f.name[:35]} atlandı: {error}")
+                    continue
                 batch_items.append({
                     "name": f.name,
-                    "bytes": f.getvalue(),
-                    "size_mb": len(f.getvalue()) / (1024 * 1024),
+                    "bytes": buffer,
+                    "size_mb": buffer.nbytes / (1024 * 1024),
                 })
             st.session_state["batch_items"] = batch_items
             st.session_state["analysis_state"] = "batch_analyzing"
@@ -218,9 +279,7 @@ def _stage_batch_analyzing() -> None:
 
         try:
             # Parse
-            from src.pdf_parser.parser import IhalePDFParser
-            parser = IhalePDFParser()
-            doc = parser.parse(file_bytes)
+            doc = _get_parser().parse(file_bytes)
 
             # AI Analysis — same fallback chain
             result = None
@@ -395,9 +454,9 @@ def _stage_analyzing() -> None:
     model_used = "demo"
 
     try:
-        # Parse
-        from src.pdf_parser.parser import IhalePDFParser
-        parser = IhalePDFParser()
+        # Parse — ön izleme yalnızca ilk sayfayı okur, önbelleği doldurmaz;
+        # yalnızca daha önce analiz edilen dosyalar ParseCache'ten gelir
+        parser = _get_parser()
 
         for pct, msg in steps[:3]:
             progress.progress(pct / 100)
@@ -433,7 +492,14 @@ def _stage_analyzing() -> None:
                         status.caption(msg)
 
                     from src.ai_engine.analyzer import IhaleAnalizAI
-                    engine = IhaleAnalizAI(openai_api_key=settings.OPENAI_API_KEY)
+                    engine = IhaleAnalizAI(
+                        openai_api_key=settings.OPENAI_API_KEY,
+                        max_concurrency=settings.ANALYSIS_MAX_CONCURRENCY,
+                        vector_cache=_get_vector_cache(),
+                        embedding_cache=_get_embedding_cache(),
+                        embedding_concurrency=settings.EMBEDDING_MAX_CONCURRENCY,
+                        embedding_batch_tokens=settings.EMBEDDING_BATCH_TOKENS,
+                    )
                     result = asyncio.run(engine.analyze(parsed_doc))
                     model_used = "gpt-4o"
 